@@ -0,0 +1,60 @@
+"""
+Leaf update cost of the hierarchical allocation tree.
+
+Builds an asset class -> region -> sector -> asset tree and compares
+updating single leaves (re-aggregating ancestors only) with re-summing
+every asset ratio after each change.
+
+Usage:
+    python benchmarks/bench_allocation_tree.py --assets 100000 --updates 100000
+"""
+
+import argparse
+import math
+import random
+import time
+
+from portfotrack.domain.allocation_tree import AllocationTree
+from portfotrack.domain.asset import Asset
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--assets", type=int, default=100_000)
+    parser.add_argument("--updates", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    ratio = 1.0 / args.assets
+    band = {"lower": 0.0, "upper": 1.0}
+    tree = AllocationTree()
+    start = time.perf_counter()
+    for i in range(args.assets):
+        group = (f"class-{i % 4}", f"region-{i % 7}", f"sector-{i % 11}")
+        tree.add_asset(group, Asset(f"asset-{i}", f"Asset {i}", "core"), ratio, band)
+    build = time.perf_counter() - start
+    print(f"build    assets={args.assets:,} time={build:.3f}s")
+
+    ids = [f"asset-{rng.randrange(args.assets)}" for _ in range(args.updates)]
+    values = [ratio * rng.uniform(0.5, 1.5) for _ in range(args.updates)]
+    start = time.perf_counter()
+    for asset_id, value in zip(ids, values, strict=True):
+        tree.update_ratio(asset_id, value)
+    elapsed = time.perf_counter() - start
+    print(
+        f"update   {args.updates:,} updates "
+        f"{args.updates / elapsed:>10,.0f} updates/s (total={tree.total_ratio():.6f})"
+    )
+
+    ratios = list(tree.columns().ratios)
+    sample = min(args.updates, 200)
+    start = time.perf_counter()
+    for k in range(sample):
+        ratios[k] = values[k]
+        math.fsum(ratios)
+    elapsed = time.perf_counter() - start
+    print(f"resum    {sample:,} updates {sample / elapsed:>10,.0f} updates/s")
+
+
+if __name__ == "__main__":
+    main()
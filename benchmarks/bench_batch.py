@@ -0,0 +1,43 @@
+"""
+Throughput of the non-interactive batch command runner.
+
+Generates a script of init-target/add-asset commands, runs it through
+run_batch into an in-memory sink and reports commands per second.
+
+Usage:
+    python benchmarks/bench_batch.py --commands 100000
+"""
+
+import argparse
+import io
+import time
+
+from portfotrack.cli.target_cli import run_batch
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--commands", type=int, default=100_000)
+    args = parser.parse_args()
+
+    ratio = 1.0 / args.commands
+    script = ["init-target"] + [
+        f'add-asset asset-{i} "Asset {i}" core '
+        f"--ratio {ratio!r} --lower 0 --upper 1"
+        for i in range(args.commands - 1)
+    ]
+
+    out = io.StringIO()
+    start = time.perf_counter()
+    code = run_batch(script, out)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"commands={args.commands:,} exit={code} elapsed={elapsed:.2f}s "
+        f"rate={args.commands / elapsed:,.0f} commands/s "
+        f"output={len(out.getvalue()) / 2**20:.1f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Scaling of multi-process mandate evaluation.
+
+Builds many columnar target allocations with random holdings and times
+evaluate_mandates for an increasing number of worker processes.
+
+Usage:
+    python benchmarks/bench_batch_runner.py --mandates 20000 --assets 50 --workers 1 2 4
+"""
+
+import argparse
+import random
+import time
+
+from portfotrack.domain.target_allocation import ColumnarTargetAllocation
+from portfotrack.services.batch_runner import Mandate, evaluate_mandates
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mandates", type=int, default=20_000)
+    parser.add_argument("--assets", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--shard-size", type=int, default=500)
+    args = parser.parse_args()
+
+    ids = [f"asset-{i}" for i in range(args.assets)]
+    ratio = 1.0 / args.assets
+    target = ColumnarTargetAllocation.from_columns(
+        ids,
+        ids,
+        ["core"] * args.assets,
+        [ratio] * args.assets,
+        [ratio * 0.8] * args.assets,
+        [ratio * 1.2] * args.assets,
+    )
+    rng = random.Random(0)
+    mandates = [
+        Mandate(f"m{i}", target, {a: rng.uniform(50.0, 150.0) for a in ids})
+        for i in range(args.mandates)
+    ]
+
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        report = evaluate_mandates(
+            mandates, max_workers=workers, shard_size=args.shard_size
+        )
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers:<3} mandates={len(report):,} assets={args.assets} "
+            f"time={elapsed:.3f}s rate={len(report) / elapsed:>9,.0f}/s "
+            f"speedup={baseline / elapsed:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
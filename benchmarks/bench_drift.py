@@ -0,0 +1,59 @@
+"""
+Throughput of batch drift detection.
+
+Evaluates many holdings snapshots against one target allocation with
+detect_drift_batch and reports accounts per second, plus the projected
+wall time for one million accounts.
+
+Usage:
+    python benchmarks/bench_drift.py --assets 50 --accounts 100000
+"""
+
+import argparse
+import random
+import time
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.drift import detect_drift_batch
+from portfotrack.domain.target_allocation import ColumnarTargetAllocation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--assets", type=int, default=50)
+    parser.add_argument("--accounts", type=int, default=100_000)
+    args = parser.parse_args()
+
+    target = ColumnarTargetAllocation()
+    ratio = 1.0 / args.assets
+    for i in range(args.assets):
+        target.add_asset(
+            Asset(f"asset-{i}", f"Asset {i}", "core"),
+            ratio,
+            {"lower": ratio * 0.9, "upper": ratio * 1.1},
+        )
+
+    rng = random.Random(0)
+    ids = target.ids
+    snapshots = [
+        {asset_id: rng.uniform(50.0, 150.0) for asset_id in ids}
+        for _ in range(args.accounts)
+    ]
+
+    start = time.perf_counter()
+    out_of_band = sum(
+        len(report.out_of_band()) for report in detect_drift_batch(target, snapshots)
+    )
+    elapsed = time.perf_counter() - start
+
+    rate = args.accounts / elapsed
+    print(
+        f"assets={args.assets} accounts={args.accounts:,} "
+        f"elapsed={elapsed:.2f}s rate={rate:,.0f} accounts/s "
+        f"out_of_band={out_of_band:,} "
+        f"projected_1M={1_000_000 / rate / 60:.1f} min"
+    )
+
+
+if __name__ == "__main__":
+    main()
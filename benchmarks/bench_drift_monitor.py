@@ -0,0 +1,73 @@
+"""
+Tick throughput of the incremental drift monitor.
+
+Replays random-walk price ticks against a DriftMonitor and compares it
+with recomputing full-portfolio drift on every tick.
+
+Usage:
+    python benchmarks/bench_drift_monitor.py --assets 1000 --ticks 200000
+"""
+
+import argparse
+import random
+import time
+
+from portfotrack.domain.drift import DriftMonitor, compute_drift
+from portfotrack.domain.target_allocation import ColumnarTargetAllocation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--assets", type=int, default=1_000)
+    parser.add_argument("--ticks", type=int, default=200_000)
+    parser.add_argument("--hysteresis", type=float, default=0.0001)
+    args = parser.parse_args()
+
+    n = args.assets
+    ids = [f"asset-{i}" for i in range(n)]
+    ratio = 1.0 / n
+    target = ColumnarTargetAllocation.from_columns(
+        ids, ids, ["core"] * n, [ratio] * n, [ratio * 0.9] * n, [ratio * 1.1] * n
+    )
+    rng = random.Random(0)
+    prices = dict.fromkeys(ids, 100.0)
+    ticks = []
+    for _ in range(args.ticks):
+        asset_id = rng.choice(ids)
+        prices[asset_id] *= rng.uniform(0.99, 1.01)
+        ticks.append((asset_id, prices[asset_id]))
+
+    monitor = DriftMonitor(
+        target,
+        dict.fromkeys(ids, 1.0),
+        dict.fromkeys(ids, 100.0),
+        hysteresis=args.hysteresis,
+    )
+    tick = monitor.tick
+    events = 0
+    start = time.perf_counter()
+    for asset_id, price in ticks:
+        events += len(tick(asset_id, price))
+    elapsed = time.perf_counter() - start
+    print(
+        f"monitor   assets={n:,} ticks={args.ticks:,} "
+        f"rate={args.ticks / elapsed:>10,.0f} ticks/s events={events:,}"
+    )
+
+    columns = target.columns()
+    row = {asset_id: i for i, asset_id in enumerate(ids)}
+    values = [100.0] * n
+    sample = ticks[: min(len(ticks), 2_000)]
+    start = time.perf_counter()
+    for asset_id, price in sample:
+        values[row[asset_id]] = price
+        compute_drift(columns, values)
+    elapsed = time.perf_counter() - start
+    print(
+        f"recompute assets={n:,} ticks={len(sample):,} "
+        f"rate={len(sample) / elapsed:>10,.0f} ticks/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
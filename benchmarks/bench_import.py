@@ -0,0 +1,59 @@
+"""
+Throughput and memory of the streaming target importer.
+
+Writes a synthetic CSV file with the given number of rows, then reports:
+- peak traced memory of the read/parse pipeline alone, which must stay
+  flat regardless of file size
+- end-to-end import throughput into a TargetAllocation
+
+Usage:
+    python benchmarks/bench_import.py --rows 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from portfotrack.services.import_services import (
+    import_target_file,
+    iter_records,
+    parse_row,
+)
+from portfotrack.services.target_services import init_target
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    ratio = 1.0 / args.rows
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "targets.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("asset_id,asset_name,purpose,target_ratio,lower,upper\n")
+            for i in range(args.rows):
+                f.write(f"asset-{i},Asset {i},core,{ratio!r},0,1\n")
+        size = os.path.getsize(path)
+
+        tracemalloc.start()
+        for _, values in iter_records(path):
+            parse_row(values)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        report = import_target_file(init_target(), path)
+        elapsed = time.perf_counter() - start
+
+    print(
+        f"rows={args.rows:,} file={size / 2**20:.1f} MiB "
+        f"pipeline_peak={peak / 2**10:.1f} KiB "
+        f"import={report.imported / elapsed:,.0f} rows/s ({elapsed:.2f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Per-call overhead of the instrumented() wrapper.
+
+Adds assets one by one to a TargetAllocation (an instrumented mutator)
+with instrumentation disabled and enabled. Methods are only wrapped while
+instrumentation is enabled, so the disabled run should match the
+undecorated method.
+
+Usage:
+    python benchmarks/bench_instrumentation.py --assets 200000
+"""
+
+import argparse
+import time
+
+from portfotrack.common.instrumentation import INSTRUMENTATION
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation import TargetAllocation
+
+
+def _time_adds(add, assets: list[Asset]) -> float:
+    target = TargetAllocation()
+    tolerance = {"lower": 0.0, "upper": 1.0}
+    start = time.perf_counter()
+    for asset in assets:
+        add(target, asset, 0.0, tolerance)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--assets", type=int, default=200_000)
+    args = parser.parse_args()
+
+    assets = [Asset(f"asset-{i}", f"Asset {i}", "core") for i in range(args.assets)]
+    INSTRUMENTATION.disable()
+    timings = {"disabled": _time_adds(TargetAllocation.add_asset, assets)}
+    INSTRUMENTATION.enable()
+    timings["enabled"] = _time_adds(TargetAllocation.add_asset, assets)
+    INSTRUMENTATION.disable()
+
+    base = timings["disabled"]
+    for label, elapsed in timings.items():
+        print(
+            f"{label:<10} calls={args.assets:,} "
+            f"per_call={elapsed / args.assets * 1e9:>7.0f} ns "
+            f"overhead={(elapsed - base) / args.assets * 1e9:>+6.0f} ns"
+        )
+    print(INSTRUMENTATION.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Append throughput and crash-recovery time of the session journal.
+
+Journals one init-target followed by N add-asset operations with group
+commit, then times recovery by replaying the whole journal, and again
+after a checkpoint.
+
+Usage:
+    python benchmarks/bench_journal.py --ops 1000000 --group-size 1024
+"""
+
+import argparse
+import tempfile
+import time
+
+from portfotrack.domain.asset import Asset
+from portfotrack.storage.journal import open_session
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=1_000_000)
+    parser.add_argument("--group-size", type=int, default=1024)
+    parser.add_argument("--no-sync", action="store_true")
+    args = parser.parse_args()
+
+    ratio = 1.0 / args.ops
+    assets = [
+        Asset(f"asset-{i}", f"Asset {i}", ("core", "growth", "income")[i % 3])
+        for i in range(args.ops)
+    ]
+    group_size, sync = args.group_size, not args.no_sync
+
+    with tempfile.TemporaryDirectory() as directory:
+        journal, _ = open_session(directory, group_size=group_size, sync=sync)
+        t0 = time.perf_counter()
+        journal.log_init_target()
+        for asset in assets:
+            journal.log_add_asset(asset, ratio, 0.0, 1.0)
+        journal.close()
+        t1 = time.perf_counter()
+        print(
+            f"append   {args.ops:,} ops, {journal.commits:,} commits, "
+            f"{args.ops / (t1 - t0):,.0f} ops/s"
+        )
+
+        t0 = time.perf_counter()
+        journal, recovery = open_session(directory, group_size=group_size, sync=sync)
+        t1 = time.perf_counter()
+        print(f"replay   {recovery.replayed:,} records in {t1 - t0:.2f}s")
+
+        journal.checkpoint(recovery.target)
+        journal.close()
+        t0 = time.perf_counter()
+        journal, recovery = open_session(directory, group_size=group_size, sync=sync)
+        t1 = time.perf_counter()
+        journal.close()
+        print(
+            f"restore  {recovery.checkpoint_rows:,} checkpoint rows "
+            f"in {t1 - t0:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
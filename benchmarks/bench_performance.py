@@ -0,0 +1,76 @@
+"""
+Year-to-date return and attribution queries across many accounts.
+
+Builds a PerformanceHistory per account from random-walk daily
+snapshots with occasional deposits, then times YTD and sub-range report
+queries over all accounts.
+
+Usage:
+    python benchmarks/bench_performance.py --accounts 10000 --days 252 --assets 10
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from portfotrack.domain.performance import PerformanceHistory, report_batch
+from portfotrack.domain.snapshot import HoldingsSnapshot
+
+
+def _account(
+    rng: random.Random, days: list[date], ids: list[str]
+) -> tuple[list[HoldingsSnapshot], dict[date, dict[str, float]]]:
+    values = dict.fromkeys(ids, 1_000.0)
+    snapshots = [HoldingsSnapshot(days[0], dict(values))]
+    flows: dict[date, dict[str, float]] = {}
+    for day in days[1:]:
+        for asset_id in ids:
+            values[asset_id] *= 1.0 + rng.gauss(0.0003, 0.01)
+        if rng.random() < 0.05:
+            flows[day] = {ids[0]: 500.0}
+            values[ids[0]] += 500.0
+        snapshots.append(HoldingsSnapshot(day, dict(values)))
+    return snapshots, flows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--accounts", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=252)
+    parser.add_argument("--assets", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    days = [date(2024, 12, 31) + timedelta(days=i) for i in range(args.days)]
+    ids = [f"asset-{i}" for i in range(args.assets)]
+    purposes = {asset_id: ("core", "income")[i % 2] for i, asset_id in enumerate(ids)}
+    # One simulated account reused for every history; building is what is timed.
+    snapshots, flows = _account(rng, days, ids)
+
+    start = time.perf_counter()
+    histories = [
+        PerformanceHistory(snapshots, flows, purposes) for _ in range(args.accounts)
+    ]
+    build = time.perf_counter() - start
+    print(
+        f"build     accounts={args.accounts:,} days={args.days} assets={args.assets} "
+        f"elapsed={build:.2f}s per_account={build / args.accounts * 1e3:.3f} ms"
+    )
+
+    for label, lo, hi in (
+        ("ytd", date(2025, 1, 1), None),
+        ("range", days[len(days) // 4], days[3 * len(days) // 4]),
+    ):
+        start = time.perf_counter()
+        reports = list(report_batch(histories, lo, hi))
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<9} accounts={len(reports):,} elapsed={elapsed * 1e3:.1f} ms "
+            f"per_account={elapsed / len(reports) * 1e6:.1f} us "
+            f"twr={reports[0].twr:+.4f} mwr={reports[0].mwr:+.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
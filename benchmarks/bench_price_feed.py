@@ -0,0 +1,47 @@
+"""
+Latency of fetching many quotes through PriceFeed.
+
+Uses FixturePriceProvider with a simulated per-request latency, so the
+result shows how well batching and concurrency overlap round trips:
+with enough concurrency the wall time approaches one request latency.
+
+Usage:
+    python benchmarks/bench_price_feed.py --ids 10000 --batch-size 500 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+
+from portfotrack.pricing import FixturePriceProvider, PriceFeed
+
+
+async def run(args: argparse.Namespace) -> None:
+    prices = {f"asset-{i}": float(i) for i in range(args.ids)}
+    provider = FixturePriceProvider.from_prices(
+        prices, max_batch_size=args.batch_size, latency=args.latency
+    )
+
+    for concurrency in args.concurrency:
+        feed = PriceFeed(provider, max_concurrency=concurrency)
+        start = time.perf_counter()
+        quotes = await feed.get_quotes(prices)
+        elapsed = time.perf_counter() - start
+        print(
+            f"concurrency={concurrency:<4} quotes={len(quotes):,} "
+            f"requests={feed.stats.requests} time={elapsed:.3f}s "
+            f"({elapsed / args.latency:.1f}x request latency)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ids", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 32])
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Throughput of the rebalancing engine.
+
+Computes trade plans for many accounts against one target allocation
+with rebalance_batch and reports accounts per second for each policy.
+
+Usage:
+    python benchmarks/bench_rebalance.py --assets 50 --accounts 20000
+"""
+
+import argparse
+import random
+import time
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.rebalance import RebalancePolicy, rebalance_batch
+from portfotrack.domain.target_allocation import ColumnarTargetAllocation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--assets", type=int, default=50)
+    parser.add_argument("--accounts", type=int, default=20_000)
+    args = parser.parse_args()
+
+    ratio = 1.0 / args.assets
+    target = ColumnarTargetAllocation()
+    target.add_assets(
+        (Asset(f"asset-{i}", f"Asset {i}", "core"), ratio, ratio * 0.8, ratio * 1.2)
+        for i in range(args.assets)
+    )
+
+    rng = random.Random(0)
+    holdings = [
+        {asset_id: rng.uniform(50.0, 150.0) for asset_id in target.ids}
+        for _ in range(args.accounts)
+    ]
+    flows = [rng.uniform(-500.0, 500.0) for _ in range(args.accounts)]
+
+    for policy in RebalancePolicy:
+        start = time.perf_counter()
+        turnover = sum(
+            plan.turnover
+            for plan in rebalance_batch(target, holdings, flows, policy=policy)
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{policy:<13} assets={args.assets} accounts={args.accounts:,} "
+            f"rate={args.accounts / elapsed:>9,.0f} accounts/s "
+            f"mean_turnover={turnover / args.accounts:,.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Range-query cost of the segment-based snapshot store.
+
+Writes several years of daily holdings snapshots, compacts them, then
+times the history of one asset against materializing every snapshot.
+
+Usage:
+    python benchmarks/bench_snapshot_store.py --years 5 --assets 200
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from portfotrack.domain.snapshot import HoldingsSnapshot
+from portfotrack.storage.snapshots import SnapshotStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--assets", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    ids = [f"asset-{i}" for i in range(args.assets)]
+    start = date(2020, 1, 1)
+    days = 365 * args.years
+
+    with tempfile.TemporaryDirectory() as directory:
+        with SnapshotStore(directory) as store:
+            t0 = time.perf_counter()
+            for day in range(days):
+                holdings = {a: rng.uniform(0.0, 1000.0) for a in ids}
+                store.append(HoldingsSnapshot(start + timedelta(days=day), holdings))
+            store.flush()
+            t1 = time.perf_counter()
+            removed = store.compact()
+            t2 = time.perf_counter()
+            print(
+                f"append   days={days:,} assets={args.assets} "
+                f"{days / (t1 - t0):,.0f} snapshots/s"
+            )
+            print(f"compact  merged {removed} segments in {t2 - t1:.3f}s")
+
+        with SnapshotStore(directory) as store:
+            t0 = time.perf_counter()
+            history = store.history(ids[0])
+            t1 = time.perf_counter()
+            year = store.history(ids[0], date(2021, 1, 1), date(2021, 12, 31))
+            t2 = time.perf_counter()
+            scan = [s.holdings[ids[0]] for s in store.snapshots()]
+            t3 = time.perf_counter()
+            print(f"history  {len(history):,} days in {(t1 - t0) * 1e3:.2f} ms")
+            print(f"one year {len(year):,} days in {(t2 - t1) * 1e3:.2f} ms")
+            print(f"scan     {len(scan):,} days in {(t3 - t2) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Bulk upsert throughput and indexed lookup latency of the SQLite backend.
+
+Upserts N assets and a target allocation over all of them, plus a daily
+holdings history, then times point and range lookups through the
+indexes.
+
+Usage:
+    python benchmarks/bench_sqlite_storage.py --assets 1000000 --days 250
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.snapshot import HoldingsSnapshot
+from portfotrack.domain.target_allocation import TargetAllocation
+from portfotrack.storage.sqlite import SqliteStorage
+
+PURPOSES = [f"purpose-{i}" for i in range(1000)]
+
+
+def _lookup_us(fn, keys: list) -> float:
+    samples = []
+    for key in keys:
+        t0 = time.perf_counter_ns()
+        fn(key)
+        samples.append(time.perf_counter_ns() - t0)
+    return statistics.median(samples) / 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--assets", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=250)
+    parser.add_argument("--held", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    assets = [
+        Asset(f"asset-{i:08d}", f"Asset {i}", PURPOSES[i % len(PURPOSES)])
+        for i in range(args.assets)
+    ]
+    target = TargetAllocation()
+    ratio = 1.0 / args.assets
+    target.add_assets((a, ratio, 0.0, 1.0) for a in assets)
+    held = [a.id for a in assets[: args.held]]
+    start = date(2024, 1, 1)
+    snapshots = [
+        HoldingsSnapshot(
+            start + timedelta(days=d), {a: rng.uniform(0, 1000) for a in held}
+        )
+        for d in range(args.days)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "portfotrack.db")
+        with SqliteStorage(path, sync=False) as storage:
+            t0 = time.perf_counter()
+            storage.assets.upsert_many(assets)
+            t1 = time.perf_counter()
+            storage.targets.save("main", target)
+            t2 = time.perf_counter()
+            storage.holdings.extend(snapshots)
+            t3 = time.perf_counter()
+            rows = args.days * args.held
+            print(f"assets   {args.assets / (t1 - t0):,.0f} upserts/s")
+            print(f"target   {args.assets / (t2 - t1):,.0f} entries/s")
+            print(f"holdings {rows / (t3 - t2):,.0f} rows/s")
+
+            ids = [rng.choice(assets).id for _ in range(1000)]
+            purposes = rng.sample(PURPOSES, 100)
+            q0, q1 = start + timedelta(days=30), start + timedelta(days=60)
+            get_us = _lookup_us(storage.assets.get, ids)
+            purpose_us = _lookup_us(storage.assets.by_purpose, purposes)
+            holding_us = _lookup_us(storage.targets.holding, ids)
+            history_us = _lookup_us(
+                lambda a: storage.holdings.history(a, q0, q1), held[:1000]
+            )
+            per_purpose = args.assets // len(PURPOSES)
+            print(f"get            median {get_us:8.1f} us")
+            print(f"by_purpose     median {purpose_us:8.1f} us ({per_purpose:,} rows)")
+            print(f"holding        median {holding_us:8.1f} us")
+            print(f"history 30d    median {history_us:8.1f} us")
+
+            t0 = time.perf_counter()
+            loaded = storage.targets.load("main")
+            t1 = time.perf_counter()
+            print(f"load     {len(loaded.target_assets):,} entries in {t1 - t0:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
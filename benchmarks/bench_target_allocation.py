@@ -0,0 +1,73 @@
+"""
+Memory and throughput comparison of TargetAllocation backings.
+
+Builds the same allocation with the dict-backed TargetAllocation and the
+array-backed ColumnarTargetAllocation and reports, for each backing:
+- peak traced memory while building the allocation
+- add_asset throughput
+- total_ratio / validate_total latency
+
+Usage:
+    python benchmarks/bench_target_allocation.py --size 100000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+)
+
+
+def _build(factory: Callable[[], object], assets: list[Asset], ratio: float):
+    target = factory()
+    for asset in assets:
+        target.add_asset(asset, ratio, {"lower": 0.0, "upper": 1.0})
+    return target
+
+
+def _measure(name: str, factory: Callable[[], object], size: int) -> None:
+    ratio = 1.0 / size
+    assets = [Asset(f"asset-{i}", f"Asset {i}", "core") for i in range(size)]
+
+    gc.collect()
+    start = time.perf_counter()
+    target = _build(factory, assets, ratio)
+    elapsed = time.perf_counter() - start
+
+    del target
+    gc.collect()
+    tracemalloc.start()
+    target = _build(factory, assets, ratio)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    target.validate_total()
+    validate_elapsed = time.perf_counter() - start
+
+    print(
+        f"{name:<10} size={size:>9,} "
+        f"add={size / elapsed:>12,.0f} ops/s "
+        f"memory={current / 2**20:>8.1f} MiB "
+        f"({current / size:>6.1f} B/asset) "
+        f"validate_total={validate_elapsed * 1e3:>8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    _measure("dict", TargetAllocation, args.size)
+    _measure("columnar", ColumnarTargetAllocation, args.size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Binary (mmap) versus JSON persistence of a target allocation.
+
+For an allocation of the given size this reports file size, save time,
+time to open the file and read one row, and time to open and compute the
+ratio total.
+
+Usage:
+    python benchmarks/bench_target_storage.py --size 1000000
+"""
+
+import argparse
+import json
+import math
+import os
+import tempfile
+import time
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation import ColumnarTargetAllocation
+from portfotrack.storage.binary import open_target, save_target
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _save_json(target: ColumnarTargetAllocation, path: str) -> None:
+    rows = [
+        [i, n, p, r, lo, hi]
+        for i, n, p, r, lo, hi in zip(
+            target.ids,
+            target.names,
+            target.purposes,
+            target.ratios,
+            target.lowers,
+            target.uppers,
+            strict=True,
+        )
+    ]
+    with open(path, "w") as f:
+        json.dump(rows, f)
+
+
+def _load_json(path: str) -> ColumnarTargetAllocation:
+    with open(path) as f:
+        rows = json.load(f)
+    return ColumnarTargetAllocation.from_columns(*zip(*rows, strict=True))
+
+
+def _report(name: str, path: str, save: float, row: float, total: float) -> None:
+    print(
+        f"{name:<7} size={os.path.getsize(path) / 2**20:>8.1f} MiB "
+        f"save={save * 1e3:>9.1f} ms "
+        f"open+row={row * 1e3:>9.3f} ms "
+        f"open+total={total * 1e3:>9.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    ratio = 1.0 / args.size
+    target = ColumnarTargetAllocation()
+    target.add_assets(
+        (Asset(f"asset-{i}", f"Asset {i}", "core"), ratio, 0.0, 1.0)
+        for i in range(args.size)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bin_path = os.path.join(tmp, "target.pfta")
+        json_path = os.path.join(tmp, "target.json")
+
+        _, save = _timed(lambda: save_target(target, bin_path))
+
+        def _bin_row() -> str:
+            with open_target(bin_path) as mapped:
+                return mapped.ids[args.size // 2]
+
+        def _bin_total() -> float:
+            with open_target(bin_path) as mapped:
+                return mapped.total_ratio()
+
+        _, row = _timed(_bin_row)
+        _, total = _timed(_bin_total)
+        _report("binary", bin_path, save, row, total)
+
+        _, save = _timed(lambda: _save_json(target, json_path))
+        _, row = _timed(lambda: _load_json(json_path).ids[args.size // 2])
+        _, total = _timed(lambda: math.fsum(_load_json(json_path).ratios))
+        _report("json", json_path, save, row, total)
+
+
+if __name__ == "__main__":
+    main()
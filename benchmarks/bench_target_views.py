@@ -0,0 +1,53 @@
+"""
+Cost of cached derived views versus rebuilding them on every read.
+
+Usage:
+    python benchmarks/bench_target_views.py --assets 100000 --reads 1000
+"""
+
+import argparse
+import time
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation import TargetAllocation
+from portfotrack.domain.target_allocation.views import (
+    band_widths,
+    purpose_totals,
+    ratios_descending,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--assets", type=int, default=100_000)
+    parser.add_argument("--reads", type=int, default=1_000)
+    args = parser.parse_args()
+
+    n = args.assets
+    target = TargetAllocation()
+    target.add_assets(
+        (Asset(f"asset-{i}", f"Asset {i}", f"purpose-{i % 8}"), 1.0 / n, 0.0, 1.0)
+        for i in range(n)
+    )
+
+    for build in (purpose_totals, ratios_descending, band_widths):
+        start = time.perf_counter()
+        build(target)
+        rebuild = time.perf_counter() - start
+
+        views = target.views
+        views.get(build)
+        start = time.perf_counter()
+        for _ in range(args.reads):
+            views.get(build)
+        cached = (time.perf_counter() - start) / args.reads
+
+        print(
+            f"{build.__name__:<18} assets={n:,} rebuild={rebuild * 1e3:>8.2f} ms "
+            f"cached={cached * 1e9:>6.0f} ns speedup={rebuild / cached:>10,.0f}x"
+        )
+    print(target.views.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Memory and time of deriving many what-if variants of a large allocation.
+
+Compares structurally shared AllocationVersion variants with full
+TargetAllocation copies, measured with tracemalloc. A third run derives
+each version from the previous one and keeps only the last, which shows
+what a long edit chain retains (versions do not keep ancestors alive).
+
+Usage:
+    python benchmarks/bench_versioned_target.py --assets 100000 --variants 1000 --changes 10
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation import AllocationVersion, TargetAllocation
+
+
+def measure(label: str, build, count: int) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    variants = build(count)
+    elapsed = time.perf_counter() - start
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<10} variants={len(variants):,} time={elapsed:.3f}s "
+        f"({elapsed / count * 1e6:,.1f} us/variant) "
+        f"memory={used / 2**20:,.1f} MiB ({used / count / 1024:,.1f} KiB/variant)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--assets", type=int, default=100_000)
+    parser.add_argument("--variants", type=int, default=1_000)
+    parser.add_argument("--changes", type=int, default=10)
+    parser.add_argument(
+        "--copy-variants",
+        type=int,
+        default=20,
+        help="full copies to measure (they are O(n) each, so keep this small)",
+    )
+    args = parser.parse_args()
+
+    assets = [Asset(f"asset-{i}", f"Asset {i}", "core") for i in range(args.assets)]
+    ratio = 1.0 / args.assets
+    target = TargetAllocation()
+    target.add_assets((a, ratio, 0.0, 1.0) for a in assets)
+    base = AllocationVersion.from_target(target)
+    rng = random.Random(0)
+
+    def versions(count: int) -> list[AllocationVersion]:
+        return [
+            base.with_assets(
+                (a, ratio * rng.uniform(0.5, 1.5), 0.0, 1.0)
+                for a in rng.sample(assets, args.changes)
+            )
+            for _ in range(count)
+        ]
+
+    def chain(count: int) -> list[AllocationVersion]:
+        version = base
+        for _ in range(count):
+            version = version.with_assets(
+                (a, ratio * rng.uniform(0.5, 1.5), 0.0, 1.0)
+                for a in rng.sample(assets, args.changes)
+            )
+        return [version]
+
+    def copies(count: int) -> list[TargetAllocation]:
+        result = []
+        for _ in range(count):
+            variant = TargetAllocation(target_assets=target.target_assets)
+            for a in rng.sample(assets, args.changes):
+                variant.target_assets[a] = (ratio, {"lower": 0.0, "upper": 1.0})
+            result.append(variant)
+        return result
+
+    print(f"base assets={args.assets:,} changes/variant={args.changes}")
+    measure("versioned", versions, args.variants)
+    measure("chained", chain, args.variants)
+    measure("full copy", copies, args.copy_variants)
+
+
+if __name__ == "__main__":
+    main()
@@ -29,5 +29,14 @@ def print_help() -> None:
         "  add-asset <id> <name> <purpose> --ratio <r> --lower <l> --upper <u>\n"
         "      Add an asset to the current target allocation.\n"
         "      Example:\n"
-        '        add-asset us-stock "US Equity" core --ratio 0.4 --lower 0.35 --upper 0.45\n'
+        '        add-asset us-stock "US Equity" core --ratio 0.4 --lower 0.35 --upper 0.45\n\n'
+        "  import-target <path.csv|path.jsonl>\n"
+        "      Stream assets from a CSV or JSON Lines file into the current target.\n"
+        "      Columns: asset_id, asset_name, purpose, target_ratio, lower, upper.\n\n"
+        "  instrument <on|off|reset|report>\n"
+        "      Record per-command latency histograms and print them.\n\n"
+        "  profile <start|stop>\n"
+        "      Capture a cProfile run; 'stop' prints the hottest functions.\n\n"
+        "  trace-memory <start|stop>\n"
+        "      Trace allocations; 'stop' prints the largest allocation sites.\n"
     )
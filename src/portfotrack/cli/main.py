@@ -1,28 +1,125 @@
 """
-Interactive CLI entry point for PortfoTrack.
+CLI entry point for PortfoTrack.
 
 This module serves as the top-level entry point for the PortfoTrack application.
-When executed, it launches an interactive, REPL-style command-line interface
-that guides the user through managing target portfolio allocations.
+By default it launches an interactive, REPL-style command-line interface
+that guides the user through managing target portfolio allocations. With
+``--script FILE`` (or ``--script -`` for stdin) it instead runs the commands
+non-interactively and prints one JSON result per command; ``--errors FILE``
+additionally writes every collected error, including rejected import rows,
+to FILE as JSON Lines. ``--journal DIR`` makes either mode durable: the
+session is restored from DIR's last checkpoint and journal on startup, and
+every change is journaled there.
 
 Design notes:
 - All business logic is delegated to service-layer functions.
 - This module is intentionally minimal and only wires program startup
-  to the interactive CLI loop.
+  to the interactive CLI loop or the batch runner.
+- It is the ``portfotrack`` console script and runs once per cron or shell
+  invocation, so startup cost matters: the command modules are imported
+  only after the arguments are parsed, and subsystems that only some
+  commands need (the file import pipeline, profiling, storage, pricing)
+  are imported by those commands. tests/cli/test_startup.py enforces this.
 """
 
-from portfotrack.cli.target_cli.target import run_repl
+import argparse
+import sys
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from portfotrack.cli.state import ReplState
 
-def main() -> int:
+SCRIPT_BUFFER_SIZE = 1 << 20
+
+
+def main(argv: Sequence[str] | None = None) -> int:
     """
-    Start the interactive PortfoTrack CLI.
+    Start the PortfoTrack CLI.
+
+    Args:
+        argv: Command-line arguments. Defaults to ``sys.argv[1:]``.
 
     Returns:
-        int: Process exit code. Returns 0 on normal termination.
+        int: Process exit code. Returns 0 on normal termination, or 1 when
+            a batch script had failed commands or the journal could not be
+            opened.
     """
-    return run_repl()
+    parser = argparse.ArgumentParser(prog="portfotrack")
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="run commands from FILE ('-' for stdin) and print JSON results",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="with --script, stop at the first failed command",
+    )
+    parser.add_argument(
+        "--errors",
+        metavar="FILE",
+        help="with --script, write all collected errors to FILE as JSON Lines",
+    )
+    parser.add_argument(
+        "--journal",
+        metavar="DIR",
+        help="restore the session from DIR and journal every change to it",
+    )
+    args = parser.parse_args(argv)
+    if args.script is None and (args.errors is not None or args.fail_fast):
+        parser.error("--errors and --fail-fast require --script")
+
+    from portfotrack.cli.state import ReplState
+    from portfotrack.common.errors import AppError
+
+    state = ReplState()
+    if args.journal is not None:
+        from portfotrack.storage.journal import open_session
+
+        try:
+            state.journal, recovery = open_session(args.journal, state.registry)
+        except (AppError, OSError) as e:
+            print(
+                f"portfotrack: cannot open journal {args.journal}: {e}", file=sys.stderr
+            )
+            return 1
+        state.target = recovery.target
+        if args.script is None and recovery.target is not None:
+            print(
+                f"Restored {len(recovery.target.target_assets):,} assets from "
+                f"{args.journal} ({recovery.replayed:,} journaled operations)."
+            )
+    try:
+        code = _run(args, state)
+    finally:
+        if state.journal is not None:
+            state.journal.checkpoint(state.target)
+            state.journal.close()
+    return code
+
+
+def _run(args: argparse.Namespace, state: "ReplState") -> int:
+    if args.script is None:
+        from portfotrack.cli.target_cli.target import run_repl
+
+        return run_repl(state)
+
+    from portfotrack.cli.target_cli.batch import run_batch
+    from portfotrack.common.error_collector import ErrorCollector
+
+    if args.errors is not None:
+        state.errors = ErrorCollector()
+    if args.script == "-":
+        code = run_batch(sys.stdin, sys.stdout, state=state, fail_fast=args.fail_fast)
+    else:
+        with open(args.script, encoding="utf-8", buffering=SCRIPT_BUFFER_SIZE) as f:
+            code = run_batch(f, sys.stdout, state=state, fail_fast=args.fail_fast)
+    if state.errors is not None:
+        with open(args.errors, "w", encoding="utf-8") as f:
+            state.errors.write_jsonl(f)
+    return code
 
 
 if __name__ == "__main__":
-    SystemExit(main())
+    raise SystemExit(main())
@@ -1,18 +1,33 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
+from portfotrack.domain.asset import AssetRegistry
 from portfotrack.domain.target_allocation import TargetAllocation
 
+if TYPE_CHECKING:
+    from portfotrack.common.error_collector import ErrorCollector
+    from portfotrack.storage.journal import SessionJournal
+
 
 @dataclass(slots=True)
 class ReplState:
     """In-memory state for the PortfoTrack REPL session.
 
-    This state is ephemeral (not persisted automatically). Command handlers
+    This state is ephemeral unless a journal is attached. Command handlers
     mutate this object to reflect the current interactive session context.
 
     Attributes:
         target: The currently active target allocation. None means no target
             has been initialized or loaded yet.
+        registry: Asset registry shared by every command of the session, so
+            assets are interned once per target. init-target clears it.
+        errors: Optional collector of the session's errors. When set, failed
+            batch commands and rejected import rows are recorded in it.
+        journal: Optional write-ahead journal of the session. When set,
+            every change to ``target`` is journaled once it succeeds.
     """
 
     target: TargetAllocation | None = None
+    registry: AssetRegistry = field(default_factory=AssetRegistry)
+    errors: "ErrorCollector | None" = None
+    journal: "SessionJournal | None" = None
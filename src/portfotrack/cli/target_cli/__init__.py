@@ -1,3 +1,4 @@
+from portfotrack.cli.target_cli.batch import run_batch
 from portfotrack.cli.target_cli.target import run_repl
 
-__all__ = ["run_repl"]
+__all__ = ["run_batch", "run_repl"]
@@ -0,0 +1,115 @@
+import json
+from collections.abc import Iterable
+from typing import Any, TextIO
+
+from portfotrack.cli.state import ReplState
+from portfotrack.cli.target_cli.errors import CommandFailedError
+from portfotrack.cli.target_cli.target import handle_command
+from portfotrack.common.errors import AppError
+
+FLUSH_EVERY = 4096
+"""Number of result records buffered before each write to the output."""
+
+
+def _flush(buffer: list[str], out: TextIO, state: ReplState) -> None:
+    """Writes buffered result lines once the changes they report are durable."""
+    if state.journal is not None:
+        state.journal.commit()
+    out.write("\n".join(buffer) + "\n")
+    buffer.clear()
+
+
+def run_batch(
+    lines: Iterable[str],
+    out: TextIO,
+    *,
+    state: ReplState | None = None,
+    fail_fast: bool = False,
+) -> int:
+    """
+    Run PortfoTrack commands non-interactively.
+
+    Each non-empty, non-comment (``#``) line is dispatched through the same
+    command table as the REPL, without prompts or a banner. One JSON object
+    is written per command, followed by a final summary object::
+
+        {"line": 2, "command": "init-target", "ok": true, "message": "..."}
+        {"line": 3, "command": "add-asset", "ok": false,
+         "error": {"code": "...", "message": "...", "details": {...}}}
+        {"summary": {"commands": 2, "ok": 1, "failed": 1}}
+
+    Results are buffered and written in chunks to keep per-command I/O
+    overhead out of the hot loop. If ``state.errors`` is set, failed
+    commands (and rows rejected by ``import-target``) are also collected
+    there, and the summary gains an ``errors_by_code`` count. With
+    ``state.journal`` set, pending journal records are committed before
+    each chunk of results is written. A command that fails with an
+    unexpected exception is reported as failed with code
+    ``CLI.COMMAND_FAILED`` and the run continues.
+
+    Args:
+        lines: Command lines, e.g. an open script file or ``sys.stdin``.
+        out: Text stream that receives the JSON Lines results.
+        state: Session state to run against. A fresh state is used if None.
+        fail_fast: Stop at the first failed command.
+
+    Returns:
+        Process exit code: 0 if every command succeeded, 1 otherwise.
+    """
+    state = ReplState() if state is None else state
+    buffer: list[str] = []
+    succeeded = failed = 0
+    dumps = json.dumps
+
+    try:
+        for line_no, raw in enumerate(lines, 1):
+            raw = raw.strip()
+            if not raw or raw.startswith("#"):
+                continue
+            if raw in {"quit", "exit"}:
+                break
+
+            command = raw.split(None, 1)[0]
+            record: dict[str, Any] = {"line": line_no, "command": command}
+            try:
+                record["message"] = handle_command(raw, state)
+                record["ok"] = True
+                succeeded += 1
+            except Exception as e:
+                error = (
+                    e
+                    if isinstance(e, AppError)
+                    else CommandFailedError(command=command, cause=e)
+                )
+                record["ok"] = False
+                record["error"] = {
+                    "code": error.code,
+                    "message": error.message,
+                    "details": error.details,
+                }
+                failed += 1
+                if state.errors is not None:
+                    state.errors.add(error, line=line_no)
+
+            buffer.append(dumps(record, default=str))
+            if len(buffer) >= FLUSH_EVERY:
+                _flush(buffer, out, state)
+            if fail_fast and not record["ok"]:
+                break
+    finally:
+        # Results of commands that already ran are never dropped, even if
+        # reading the script or an interrupt ends the run early.
+        if buffer:
+            _flush(buffer, out, state)
+
+    summary: dict[str, Any] = {
+        "commands": succeeded + failed,
+        "ok": succeeded,
+        "failed": failed,
+    }
+    if state.errors is not None:
+        summary["errors_by_code"] = state.errors.count_by_code()
+    buffer.append(dumps({"summary": summary}))
+    _flush(buffer, out, state)
+    out.flush()
+    return 0 if failed == 0 else 1
@@ -3,3 +3,6 @@ from enum import StrEnum
 
 class CliErrorCode(StrEnum):
     CLI_INVALID_COMMAND = "CLI.INVALID_COMMAND"
+    CLI_INVALID_ARGUMENTS = "CLI.INVALID_ARGUMENTS"
+    CLI_NO_TARGET = "CLI.NO_TARGET"
+    CLI_COMMAND_FAILED = "CLI.COMMAND_FAILED"
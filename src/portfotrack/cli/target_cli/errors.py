@@ -24,3 +24,69 @@ class InvalidCommandError(CliError):
             cause=cause,
         )
         self.details.update({"command": command})
+
+
+class InvalidArgumentsError(CliError):
+    """
+    Error raised when a known command is given malformed arguments.
+    """
+
+    def __init__(
+        self,
+        *,
+        command: str,
+        usage: str | None = None,
+        reason: str | None = None,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        parts = [f"{reason}." if reason else "", f"Usage: {usage}" if usage else ""]
+        super().__init__(
+            code=CliErrorCode.CLI_INVALID_ARGUMENTS,
+            message=" ".join(p for p in parts if p) or "Invalid arguments.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"command": command, "usage": usage, "reason": reason})
+
+
+class NoActiveTargetError(CliError):
+    """
+    Error raised when a command needs a target allocation but none is active.
+    """
+
+    def __init__(
+        self,
+        *,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=CliErrorCode.CLI_NO_TARGET,
+            message="No target. Run `init-target` first.",
+            details=details,
+            cause=cause,
+        )
+
+
+class CommandFailedError(CliError):
+    """
+    Error recorded when a command fails with an unexpected, non-AppError
+    exception, which is kept as the cause.
+    """
+
+    def __init__(
+        self,
+        *,
+        command: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        reason = f": {type(cause).__name__}: {cause}" if cause is not None else "."
+        super().__init__(
+            code=CliErrorCode.CLI_COMMAND_FAILED,
+            message=f"Command '{command}' failed unexpectedly{reason}",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"command": command})
@@ -0,0 +1,135 @@
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from portfotrack.cli.target_cli.errors import InvalidArgumentsError
+
+_TOKEN_RE = re.compile(r'"((?:[^"\\]|\\.)*)"|\'([^\']*)\'|(\S+)')
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+
+def tokenize(raw: str) -> list[str]:
+    """Splits a command line into tokens with shell-style quoting.
+
+    Double-quoted tokens may contain spaces and backslash escapes
+    (``\\"``, ``\\\\``); single-quoted tokens are taken literally.
+
+    Args:
+        raw: The raw command line.
+
+    Returns:
+        The list of tokens, with quotes removed.
+
+    Raises:
+        InvalidArgumentsError: If a quote is not terminated.
+    """
+    if '"' not in raw and "'" not in raw:
+        return raw.split()
+
+    tokens: list[str] = []
+    for double, single, bare in _TOKEN_RE.findall(raw):
+        if bare:
+            if bare[0] in "\"'":
+                raise InvalidArgumentsError(
+                    command=tokens[0] if tokens else "", reason="Unterminated quote"
+                )
+            tokens.append(bare)
+        elif "\\" in double:
+            tokens.append(_ESCAPE_RE.sub(r"\1", double))
+        else:
+            tokens.append(double or single)
+    return tokens
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedCommand:
+    """A command line parsed against its CommandSpec.
+
+    Attributes:
+        name: The command name.
+        args: Positional arguments, in declaration order.
+        options: Converted option values keyed by option name (without
+            the leading ``--``).
+    """
+
+    name: str
+    args: tuple[str, ...]
+    options: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class CommandSpec:
+    """Declarative grammar of one CLI command.
+
+    Lookup tables and the usage string are derived once at construction,
+    so parsing a command line is a single linear pass over its tokens.
+
+    Attributes:
+        name: The command name.
+        positionals: Names of the required positional arguments.
+        options: Option name (without ``--``) to value converter. Every
+            option is required.
+        usage: Usage string shown on argument errors (derived).
+    """
+
+    name: str
+    positionals: tuple[str, ...] = ()
+    options: Mapping[str, Callable[[str], Any]] = field(default_factory=dict)
+    usage: str = field(init=False)
+    _flags: dict[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        parts = [self.name, *(f"<{p}>" for p in self.positionals)]
+        parts.extend(f"--{o} <{o[0]}>" for o in self.options)
+        object.__setattr__(self, "usage", " ".join(parts))
+        object.__setattr__(self, "_flags", {f"--{o}": o for o in self.options})
+
+    def _error(self, reason: str) -> InvalidArgumentsError:
+        return InvalidArgumentsError(command=self.name, usage=self.usage, reason=reason)
+
+    def parse(self, tokens: list[str]) -> ParsedCommand:
+        """Parses the argument tokens (excluding the command name).
+
+        Options may be written as ``--name value`` or ``--name=value``.
+
+        Raises:
+            InvalidArgumentsError: On a wrong number of positionals, an
+                unknown, repeated, missing or valueless option, or a value
+                that cannot be converted.
+        """
+        args: list[str] = []
+        options: dict[str, Any] = {}
+        flags = self._flags
+        i, n = 0, len(tokens)
+        while i < n:
+            token = tokens[i]
+            i += 1
+            if not token.startswith("--"):
+                args.append(token)
+                continue
+
+            flag, eq, value = token.partition("=")
+            name = flags.get(flag)
+            if name is None:
+                raise self._error(f"Unknown option {flag}")
+            if name in options:
+                raise self._error(f"Repeated option {flag}")
+            if not eq:
+                if i == n:
+                    raise self._error(f"Missing value for {flag}")
+                value = tokens[i]
+                i += 1
+            try:
+                options[name] = self.options[name](value)
+            except ValueError as e:
+                raise self._error(f"Invalid value for {flag}: '{value}'") from e
+
+        if len(args) != len(self.positionals):
+            raise self._error(
+                f"Expected {len(self.positionals)} argument(s), got {len(args)}"
+            )
+        missing = [f"--{o}" for o in self.options if o not in options]
+        if missing:
+            raise self._error(f"Missing option(s) {', '.join(missing)}")
+        return ParsedCommand(self.name, tuple(args), options)
@@ -1,21 +1,40 @@
+import math
 from collections.abc import Callable
 
 from portfotrack.cli.io import print_banner, print_help
 from portfotrack.cli.state import ReplState
-from portfotrack.cli.target_cli.errors import InvalidCommandError
+from portfotrack.cli.target_cli.errors import (
+    InvalidArgumentsError,
+    InvalidCommandError,
+    NoActiveTargetError,
+)
+from portfotrack.cli.target_cli.parser import CommandSpec, ParsedCommand, tokenize
 from portfotrack.common.errors import AppError
-from portfotrack.services.target_services import init_target
+from portfotrack.common.instrumentation import (
+    INSTRUMENTATION,
+    PROFILER,
+    instrumented,
+)
+from portfotrack.domain.target_allocation import TargetAllocation
+from portfotrack.services.target_services import add_asset_to_target, init_target
 
 PROMPT = "portfotrack> "
-CommandHandler = Callable[[ReplState, list[str]], None]
+_MAX_PRINTED_ERRORS = 20
+CommandHandler = Callable[[ReplState, ParsedCommand], str]
+"""A command handler mutates the state and returns a human-readable result."""
 
 
-def run_repl() -> int:
+def run_repl(state: ReplState | None = None) -> int:
     """
     Run the interactive PortfoTrack command loop.
+
+    Args:
+        state: Session state to run against. A fresh state is used if None.
+            If it has a journal, the journal is committed after every
+            command, so an acknowledged change survives a crash.
     """
 
-    state = ReplState()
+    state = ReplState() if state is None else state
     print_banner()
 
     while True:
@@ -25,6 +44,9 @@ def run_repl() -> int:
             print("\nBye.")
             return 0
 
+        if not raw:
+            continue
+
         if raw in {"quit", "exit"}:
             print("Bye.")
             return 0
@@ -34,42 +56,180 @@ def run_repl() -> int:
             continue
 
         try:
-            handle_command(raw, state)
+            print(handle_command(raw, state))
         except AppError as e:
             print(e)
+        if state.journal is not None:
+            state.journal.commit()
 
 
-def _run_init_target(state: ReplState, args: list[str]) -> None:
-    """Initialize and set the active target allocation in REPL state."""
-    state.target = init_target()
-    print("Target initialized.")
+def _require_target(state: ReplState) -> TargetAllocation:
+    if state.target is None:
+        raise NoActiveTargetError()
+    return state.target
 
 
-def _run_add_asset(state: ReplState, args: list[str]) -> None:
-    if state.target is None:
-        print("No target. Run `init-target` first.")
-        return
+def _finite_float(value: str) -> float:
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(value)
+    return number
+
 
-    if len(args) < 3:
-        print(
-            "Usage: add-asset <id> <name> <purpose> --ratio <r> --lower <l> --upper <u>"
+def _action(cmd: ParsedCommand, choices: tuple[str, ...]) -> str:
+    action = cmd.args[0]
+    if action not in choices:
+        raise InvalidArgumentsError(
+            command=cmd.name,
+            usage=COMMAND_SPECS[cmd.name].usage,
+            reason=f"Unknown action '{action}', expected one of {', '.join(choices)}",
         )
-        return
+    return action
 
-    # add_asset_to_target()
 
+@instrumented("cli.init-target")
+def _run_init_target(state: ReplState, cmd: ParsedCommand) -> str:
+    """Initialize and set the active target allocation in REPL state."""
+    state.target = init_target()
+    # Names of a previous target's assets must not outlive it.
+    state.registry.rollback(0)
+    if state.journal is not None:
+        state.journal.log_init_target()
+    return "Target initialized."
+
+
+@instrumented("cli.add-asset")
+def _run_add_asset(state: ReplState, cmd: ParsedCommand) -> str:
+    """Add one asset to the active target allocation."""
+    target = _require_target(state)
+    asset_id, asset_name, purpose = cmd.args
+    ratio, lower, upper = (cmd.options[o] for o in ("ratio", "lower", "upper"))
+
+    add_asset_to_target(
+        target, asset_id, asset_name, purpose, ratio, lower, upper, state.registry
+    )
+    asset = state.registry.get(asset_id)
+    if state.journal is not None:
+        state.journal.log_add_asset(asset, ratio, lower, upper)
+    return f"Added asset '{asset.id}' (ratio={ratio}, lower={lower}, upper={upper})."
+
+
+@instrumented("cli.import-target")
+def _run_import_target(state: ReplState, cmd: ParsedCommand) -> str:
+    """Stream a CSV/JSONL file into the active target allocation."""
+    # Imported on use so the CSV/JSON pipeline stays out of CLI startup.
+    from portfotrack.services.import_services import import_target_file
+
+    target = _require_target(state)
+    version = target.version
+    try:
+        report = import_target_file(
+            target, cmd.args[0], registry=state.registry, errors=state.errors
+        )
+    finally:
+        # One checkpoint instead of a journal record per imported row. Rows
+        # added before a mid-file failure stay in the target, so they are
+        # checkpointed too.
+        if state.journal is not None and target.version != version:
+            state.journal.checkpoint(target)
+    lines = [f"Imported {report.imported:,} rows, rejected {report.rejected:,}."]
+    lines.extend(f"  {error}" for error in report.errors[:_MAX_PRINTED_ERRORS])
+    if report.rejected > _MAX_PRINTED_ERRORS:
+        lines.append(f"  ... and {report.rejected - _MAX_PRINTED_ERRORS:,} more")
+    return "\n".join(lines)
+
+
+@instrumented("cli.instrument")
+def _run_instrument(state: ReplState, cmd: ParsedCommand) -> str:
+    """Switch latency recording on or off, reset it, or print the report."""
+    action = _action(cmd, ("on", "off", "reset", "report"))
+    if action == "on":
+        INSTRUMENTATION.enable()
+        return "Instrumentation enabled."
+    if action == "off":
+        INSTRUMENTATION.disable()
+        return "Instrumentation disabled."
+    if action == "reset":
+        INSTRUMENTATION.reset()
+        return "Instrumentation reset."
+    return INSTRUMENTATION.report()
+
+
+@instrumented("cli.profile")
+def _run_profile(state: ReplState, cmd: ParsedCommand) -> str:
+    """Start a cProfile capture, or stop it and print the hottest functions."""
+    if _action(cmd, ("start", "stop")) == "start":
+        PROFILER.start_profile()
+        return "Profiler started."
+    return PROFILER.stop_profile()
+
+
+@instrumented("cli.trace-memory")
+def _run_trace_memory(state: ReplState, cmd: ParsedCommand) -> str:
+    """Start tracing allocations, or stop and print the largest sites."""
+    if _action(cmd, ("start", "stop")) == "start":
+        PROFILER.start_tracemalloc()
+        return "Memory tracing started."
+    return PROFILER.stop_tracemalloc()
+
+
+COMMAND_SPECS: dict[str, CommandSpec] = {
+    spec.name: spec
+    for spec in (
+        CommandSpec("init-target"),
+        CommandSpec(
+            "add-asset",
+            positionals=("id", "name", "purpose"),
+            options={
+                "ratio": _finite_float,
+                "lower": _finite_float,
+                "upper": _finite_float,
+            },
+        ),
+        CommandSpec("import-target", positionals=("path",)),
+        CommandSpec("instrument", positionals=("action",)),
+        CommandSpec("profile", positionals=("action",)),
+        CommandSpec("trace-memory", positionals=("action",)),
+    )
+}
+"""Grammar of every command, compiled once at import time."""
 
 COMMAND_DICT: dict[str, CommandHandler] = {
     "init-target": _run_init_target,
     "add-asset": _run_add_asset,
+    "import-target": _run_import_target,
+    "instrument": _run_instrument,
+    "profile": _run_profile,
+    "trace-memory": _run_trace_memory,
 }
 
 
-def handle_command(raw: str, state: ReplState) -> None:
-    tokens = raw.split()
-    cmd, args = tokens[0], tokens[1:]
+@instrumented("cli.handle_command")
+def handle_command(raw: str, state: ReplState) -> str:
+    """
+    Parse one command line and dispatch it to its handler.
+
+    Handlers journal their changes to ``state.journal`` when one is set;
+    once enough records have accumulated, a checkpoint is taken here.
 
-    if cmd not in COMMAND_DICT:
-        raise InvalidCommandError(command=cmd)
+    Returns:
+        The handler's human-readable result message.
 
-    COMMAND_DICT[cmd](state, args)
+    Raises:
+        InvalidCommandError: If the command is empty or unknown.
+        InvalidArgumentsError: If the arguments do not match the command grammar.
+        AppError: Any error raised by the command handler.
+    """
+    tokens = tokenize(raw)
+    if not tokens:
+        raise InvalidCommandError(command=raw)
+    name = tokens[0]
+
+    spec = COMMAND_SPECS.get(name)
+    if spec is None:
+        raise InvalidCommandError(command=name)
+
+    result = COMMAND_DICT[name](state, spec.parse(tokens[1:]))
+    if state.journal is not None and state.journal.checkpoint_due:
+        state.journal.checkpoint(state.target)
+    return result
@@ -0,0 +1,183 @@
+"""
+Compact aggregation of AppErrors for bulk runs.
+
+Keeping AppError instances alive during a large import also keeps their
+tracebacks, frames and causes alive, and printing each one as it occurs
+puts formatting and I/O in the hot loop. ErrorCollector instead reduces
+every error to a plain tuple of the interned code, the message, and the
+details as an interned key tuple plus a value tuple, so errors of the
+same kind share their code and key strings. Plain tuples are cheap to
+build, and ErrorRecord views are built only when the records are read.
+Tuples holding only atomic values (strings, numbers, None) are untracked
+by the cyclic garbage collector, so most records add nothing to
+collection time; a record whose details hold a list or dict (such as
+the ``rows`` of a BulkValidationError) stays tracked. Counts per code
+are exact even when only the first ``max_records`` records are kept.
+
+Collected errors are serialized afterwards as JSON Lines, written in
+batches of many lines per ``write`` call::
+
+    {"code": "...", "message": "...", "details": {...},
+     "source": "targets.csv", "line": 12}
+"""
+
+import json
+import sys
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, TextIO
+
+from portfotrack.common.errors import AppError
+
+WRITE_BATCH = 4096
+"""Default number of JSON lines joined into each write."""
+
+
+@dataclass(frozen=True, slots=True)
+class ErrorRecord:
+    """Compact, traceback-free form of one AppError.
+
+    Attributes:
+        code: The error code (interned).
+        message: The human-readable message.
+        keys: Detail keys, shared between records with the same key set.
+        values: Detail values, aligned with ``keys``.
+        source: Optional input (e.g. a file path) the error belongs to.
+        line: Optional one-based line of ``source`` the error belongs to.
+    """
+
+    code: str
+    message: str
+    keys: tuple[str, ...]
+    values: tuple[Any, ...]
+    source: str | None = None
+    line: int | None = None
+
+    @property
+    def details(self) -> dict[str, Any]:
+        """The details as a dict, rebuilt on access."""
+        return dict(zip(self.keys, self.values, strict=True))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the JSON-serializable form of the record."""
+        record: dict[str, Any] = {
+            "code": self.code,
+            "message": self.message,
+            "details": self.details,
+        }
+        if self.source is not None:
+            record["source"] = self.source
+        if self.line is not None:
+            record["line"] = self.line
+        return record
+
+
+class ErrorCollector:
+    """Collects AppErrors as ErrorRecords and aggregates them by code.
+
+    Attributes:
+        max_records: Maximum number of records kept, or None for no limit.
+            Errors past the limit are still counted.
+    """
+
+    def __init__(self, max_records: int | None = 100_000) -> None:
+        self.max_records = max_records
+        self._records: list[tuple[Any, ...]] = []
+        self._counts: Counter[str] = Counter()
+        self._shapes: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        """Total number of collected errors, including dropped ones."""
+        return self._counts.total()
+
+    def __bool__(self) -> bool:
+        return bool(self._counts)
+
+    @property
+    def records(self) -> list[ErrorRecord]:
+        """The kept records, in collection order (built on access)."""
+        return [ErrorRecord(*row) for row in self._records]
+
+    @property
+    def dropped(self) -> int:
+        """Number of errors counted but not kept because of ``max_records``."""
+        return len(self) - len(self._records)
+
+    def _shape(self, keys: tuple[str, ...]) -> tuple[str, ...]:
+        shape = self._shapes.get(keys)
+        if shape is None:
+            shape = self._shapes[keys] = tuple(map(sys.intern, keys))
+        return shape
+
+    def add(
+        self, error: AppError, *, source: str | None = None, line: int | None = None
+    ) -> None:
+        """Collects one error.
+
+        Args:
+            error: The error to collect. Only its code, message and details
+                are kept; the exception itself is not referenced.
+            source: Optional input (e.g. a file path) the error belongs to.
+            line: Optional one-based line of ``source`` the error belongs to.
+        """
+        code = sys.intern(error.code)
+        self._counts[code] += 1
+        if self.max_records is not None and len(self._records) >= self.max_records:
+            return
+        details = error.details
+        self._records.append(
+            (
+                code,
+                error.message,
+                self._shape(tuple(details)),
+                tuple(details.values()),
+                None if source is None else sys.intern(source),
+                line,
+            )
+        )
+
+    def count_by_code(self) -> dict[str, int]:
+        """Returns the number of errors per code, most frequent first."""
+        return dict(self._counts.most_common())
+
+    def group_by_code(self) -> dict[str, list[ErrorRecord]]:
+        """Returns the kept records grouped by code, in collection order."""
+        groups: dict[str, list[ErrorRecord]] = {}
+        for record in self.records:
+            groups.setdefault(record.code, []).append(record)
+        return groups
+
+    def iter_jsonl(self) -> Iterator[str]:
+        """Yields one JSON line (without newline) per kept record."""
+        dumps = json.dumps
+        for row in self._records:
+            yield dumps(ErrorRecord(*row).to_dict(), default=str)
+
+    def write_jsonl(self, out: TextIO, *, batch_size: int = WRITE_BATCH) -> int:
+        """Writes the kept records as JSON Lines in batches.
+
+        Args:
+            out: Text stream receiving the lines.
+            batch_size: Number of lines joined into each write call.
+
+        Returns:
+            Number of lines written.
+        """
+        batch: list[str] = []
+        written = 0
+        for line in self.iter_jsonl():
+            batch.append(line)
+            if len(batch) >= batch_size:
+                out.write("\n".join(batch) + "\n")
+                written += len(batch)
+                batch.clear()
+        if batch:
+            out.write("\n".join(batch) + "\n")
+            written += len(batch)
+        return written
+
+    def clear(self) -> None:
+        """Drops every record and count."""
+        self._records.clear()
+        self._counts.clear()
@@ -0,0 +1,326 @@
+"""
+Opt-in latency instrumentation and runtime profiling hooks.
+
+Hot-path functions across the CLI, service and domain layers are wrapped
+with ``instrumented``. Once ``INSTRUMENTATION.enable()`` is called, every
+call records its latency in a per-operation histogram.
+
+While instrumentation is disabled (the default), methods cost nothing:
+the decorator leaves them unwrapped and ``enable()`` installs the timing
+wrapper on the owning class, which ``disable()`` removes again. Plain
+functions are often bound elsewhere by ``from`` imports or dispatch
+tables, so they keep one wrapper that checks the flag on every call.
+
+Histograms use fixed log-scale buckets (four per power of two of
+nanoseconds), so recording is O(1), memory per operation is constant and
+percentiles are accurate to within about 19%.
+
+``Profiler`` wraps cProfile and tracemalloc so a capture can be switched
+on and off at runtime (e.g. from the REPL) without restarting. Both are
+imported on first use, keeping them out of CLI startup.
+"""
+
+import functools
+import math
+import sys
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    import cProfile
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_SUBBUCKETS = 4
+_BUCKETS = 64 * _SUBBUCKETS
+
+
+def _bucket(ns: int) -> int:
+    if ns <= 0:
+        return 0
+    return min(int(math.log2(ns) * _SUBBUCKETS), _BUCKETS - 1)
+
+
+def _bucket_upper_ns(bucket: int) -> float:
+    return 2.0 ** ((bucket + 1) / _SUBBUCKETS)
+
+
+class Histogram:
+    """Log-bucketed latency histogram of one operation.
+
+    Attributes:
+        count: Number of recorded calls.
+        errors: Number of calls that raised.
+        total_ns: Sum of all latencies, in nanoseconds.
+        min_ns: Smallest latency, in nanoseconds.
+        max_ns: Largest latency, in nanoseconds.
+    """
+
+    __slots__ = ("count", "errors", "total_ns", "min_ns", "max_ns", "_buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self._buckets = [0] * _BUCKETS
+
+    def record(self, ns: int, failed: bool = False) -> None:
+        """Adds one latency sample, in nanoseconds."""
+        if self.count == 0 or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.count += 1
+        self.total_ns += ns
+        self.errors += failed
+        self._buckets[_bucket(ns)] += 1
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean latency in nanoseconds (0.0 when empty)."""
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Returns the approximate ``q``-th percentile latency in nanoseconds.
+
+        The upper edge of the bucket holding the percentile is returned,
+        clamped to the observed maximum.
+
+        Raises:
+            ValueError: If ``q`` is outside [0, 100].
+        """
+        if not 0.0 <= q <= 100.0:
+            raise ValueError("q must be within [0, 100]")
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100.0))
+        seen = 0
+        for bucket, n in enumerate(self._buckets):
+            seen += n
+            if seen >= rank:
+                return min(_bucket_upper_ns(bucket), float(self.max_ns))
+        return float(self.max_ns)
+
+    def summary(self) -> dict[str, float]:
+        """Returns count, errors and latency statistics in microseconds."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_us": self.total_ns / 1e3,
+            "mean_us": self.mean_ns / 1e3,
+            "min_us": self.min_ns / 1e3,
+            "p50_us": self.percentile(50) / 1e3,
+            "p99_us": self.percentile(99) / 1e3,
+            "max_us": self.max_ns / 1e3,
+        }
+
+
+class Instrumentation:
+    """Registry of per-operation latency histograms.
+
+    Attributes:
+        enabled: Whether instrumented functions record their latency.
+        histograms: Histogram per operation name.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.histograms: dict[str, Histogram] = {}
+        self._methods: list[tuple[Callable[..., object], Callable[..., object]]] = []
+
+    def enable(self) -> None:
+        """Starts recording latencies and installs the method wrappers."""
+        self.enabled = True
+        for method, wrapper in self._methods:
+            _install(method, wrapper)
+
+    def disable(self) -> None:
+        """Stops recording latencies. Recorded data is kept."""
+        self.enabled = False
+        for method, _ in self._methods:
+            _install(method, method)
+
+    def add_method(
+        self, method: Callable[..., object], wrapper: Callable[..., object]
+    ) -> None:
+        """Registers a timing wrapper to install on a method while enabled.
+
+        Args:
+            method: Function defined in a class body.
+            wrapper: Timing wrapper of ``method``.
+        """
+        self._methods.append((method, wrapper))
+
+    def reset(self) -> None:
+        """Drops every recorded histogram."""
+        self.histograms.clear()
+
+    def record(self, name: str, ns: int, failed: bool = False) -> None:
+        """Records one call of operation ``name`` that took ``ns`` nanoseconds."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.record(ns, failed)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Returns the summary of every operation, keyed by name."""
+        return {name: h.summary() for name, h in sorted(self.histograms.items())}
+
+    def report(self) -> str:
+        """Formats the recorded histograms as a table, slowest total first."""
+        if not self.histograms:
+            return "No operations recorded."
+        rows = sorted(
+            self.histograms.items(), key=lambda item: item[1].total_ns, reverse=True
+        )
+        width = max(len(name) for name, _ in rows)
+        lines = [
+            f"{'operation':<{width}} {'count':>9} {'errors':>7} {'total ms':>10} "
+            f"{'mean us':>9} {'p50 us':>9} {'p99 us':>9} {'max us':>9}"
+        ]
+        for name, h in rows:
+            lines.append(
+                f"{name:<{width}} {h.count:>9,} {h.errors:>7,} "
+                f"{h.total_ns / 1e6:>10.3f} {h.mean_ns / 1e3:>9.2f} "
+                f"{h.percentile(50) / 1e3:>9.2f} {h.percentile(99) / 1e3:>9.2f} "
+                f"{h.max_ns / 1e3:>9.2f}"
+            )
+        return "\n".join(lines)
+
+
+INSTRUMENTATION = Instrumentation()
+"""Process-wide instrumentation registry used by ``instrumented``."""
+
+
+def _install(method: Callable[..., object], value: Callable[..., object]) -> None:
+    """Binds ``value`` under ``method``'s name on the class defining it."""
+    owner: object = sys.modules[method.__module__]
+    *path, attr = method.__qualname__.split(".")
+    for part in path:
+        owner = getattr(owner, part)
+    setattr(owner, attr, value)
+
+
+def instrumented(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorates a function so its latency is recorded under ``name``.
+
+    Instrumentation can be switched on and off at runtime. A method (a
+    function defined directly in a class body) is returned unwrapped and
+    only replaced by its timing wrapper while instrumentation is enabled,
+    so it runs at full speed otherwise. Any other function gets a wrapper
+    that checks whether instrumentation is enabled on every call.
+
+    Args:
+        name: Operation name, e.g. ``"services.add_asset_to_target"``.
+    """
+
+    def decorate(fn: Callable[P, R]) -> Callable[P, R]:
+        registry = INSTRUMENTATION
+        clock = time.perf_counter_ns
+
+        @functools.wraps(fn)
+        def timed(*args: P.args, **kwargs: P.kwargs) -> R:
+            start = clock()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                registry.record(name, clock() - start, failed=True)
+                raise
+            registry.record(name, clock() - start)
+            return result
+
+        if "." in fn.__qualname__ and "<locals>" not in fn.__qualname__:
+            registry.add_method(fn, timed)
+            return timed if registry.enabled else fn
+
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not registry.enabled:
+                return fn(*args, **kwargs)
+            return timed(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+class Profiler:
+    """Runtime-switchable cProfile and tracemalloc captures."""
+
+    def __init__(self) -> None:
+        self._profile: cProfile.Profile | None = None
+
+    @property
+    def profiling(self) -> bool:
+        """Whether a cProfile capture is running."""
+        return self._profile is not None
+
+    @property
+    def tracing_memory(self) -> bool:
+        """Whether a tracemalloc capture is running."""
+        import tracemalloc
+
+        return tracemalloc.is_tracing()
+
+    def start_profile(self) -> None:
+        """Starts a cProfile capture. No-op if one is already running."""
+        if self._profile is None:
+            import cProfile
+
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stop_profile(self, limit: int = 20) -> str:
+        """Stops the cProfile capture and formats its hottest functions.
+
+        Args:
+            limit: Number of functions to list, by cumulative time.
+
+        Returns:
+            The pstats report, or a notice if no capture was running.
+        """
+        if self._profile is None:
+            return "Profiler is not running."
+        import io
+        import pstats
+
+        profile, self._profile = self._profile, None
+        profile.disable()
+        out = io.StringIO()
+        pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(limit)
+        return out.getvalue().strip()
+
+    def start_tracemalloc(self, frames: int = 1) -> None:
+        """Starts tracing memory allocations. No-op if already tracing."""
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def stop_tracemalloc(self, limit: int = 10) -> str:
+        """Stops tracing and formats the largest allocation sites.
+
+        Args:
+            limit: Number of allocation sites to list.
+
+        Returns:
+            The report, or a notice if tracing was not running.
+        """
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            return "Memory tracing is not running."
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        lines = [f"Traced memory: current={current:,} B, peak={peak:,} B"]
+        lines.extend(str(stat) for stat in snapshot.statistics("lineno")[:limit])
+        return "\n".join(lines)
+
+
+PROFILER = Profiler()
+"""Process-wide profiler controlled from the REPL."""
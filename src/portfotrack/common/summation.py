@@ -0,0 +1,64 @@
+import math
+from collections.abc import Iterable
+
+
+class ExactSum:
+    """Incrementally maintained, correctly rounded floating-point sum.
+
+    Values are accumulated into a short list of non-overlapping partial
+    sums (Shewchuk's algorithm, the same one behind ``math.fsum``), so the
+    running total carries no accumulated rounding error no matter how many
+    values are added or subtracted. The partial list stays small (a few
+    entries for typical data), so every update and read is effectively
+    constant time.
+
+    ``value`` is always equal to ``math.fsum`` over every value that was
+    added, with subtracted values negated.
+    """
+
+    __slots__ = ("_partials", "_value")
+
+    def __init__(self, values: Iterable[float] = ()) -> None:
+        self._partials: list[float] = []
+        self._value: float | None = 0.0
+        self.extend(values)
+
+    def add(self, x: float) -> None:
+        """Adds a value to the running total."""
+        partials = self._partials
+        i = 0
+        for y in partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            hi = x + y
+            lo = y - (hi - x)
+            if lo:
+                partials[i] = lo
+                i += 1
+            x = hi
+        partials[i:] = [x]
+        self._value = None
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Adds every value of an iterable to the running total."""
+        add = self.add
+        for value in values:
+            add(value)
+
+    def subtract(self, x: float) -> None:
+        """Subtracts a value from the running total."""
+        self.add(-x)
+
+    @property
+    def value(self) -> float:
+        """The correctly rounded running total."""
+        if self._value is None:
+            self._value = math.fsum(self._partials)
+        return self._value
+
+    def copy(self) -> "ExactSum":
+        """Returns an independent copy of this running total."""
+        clone = ExactSum()
+        clone._partials = self._partials.copy()
+        clone._value = self._value
+        return clone
@@ -0,0 +1,8 @@
+from portfotrack.domain.allocation_tree.tree import (
+    AllocationGroup,
+    AllocationLeaf,
+    AllocationNode,
+    AllocationTree,
+)
+
+__all__ = ["AllocationGroup", "AllocationLeaf", "AllocationNode", "AllocationTree"]
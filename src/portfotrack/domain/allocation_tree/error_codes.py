@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class AllocationTreeErrorCode(StrEnum):
+    TREE_NODE_NOT_FOUND = "TREE.NODE_NOT_FOUND"
+    TREE_NODE_CONFLICT = "TREE.NODE_CONFLICT"
+    TREE_GROUP_RATIO_MISMATCH = "TREE.GROUP_RATIO_MISMATCH"
@@ -0,0 +1,94 @@
+from typing import Any
+
+from portfotrack.domain.allocation_tree.error_codes import AllocationTreeErrorCode
+from portfotrack.domain.errors import DomainError
+
+
+class AllocationTreeError(DomainError):
+    """Base error for the hierarchical allocation domain."""
+
+
+class NodeNotFoundError(AllocationTreeError):
+    """Raised when a path does not name a node of the allocation tree.
+
+    Attributes:
+        details: Contains:
+            - path: The requested path, as a list of keys.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: list[str],
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=AllocationTreeErrorCode.TREE_NODE_NOT_FOUND,
+            message=f"No allocation node at {'/'.join(path) or '<root>'}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"path": path})
+
+
+class NodeConflictError(AllocationTreeError):
+    """Raised when a node would be created where it conflicts with another.
+
+    Typical causes are adding a child below an asset leaf, or adding an
+    asset whose id is already used by a leaf or a group.
+
+    Attributes:
+        details: Contains:
+            - path: The conflicting path, as a list of keys.
+            - reason: Short description of the conflict.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: list[str],
+        reason: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=AllocationTreeErrorCode.TREE_NODE_CONFLICT,
+            message=f"Cannot create {'/'.join(path)}: {reason}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"path": path, "reason": reason})
+
+
+class GroupRatioMismatchError(AllocationTreeError):
+    """Raised when the children of a group do not sum to the group's target.
+
+    Attributes:
+        details: Contains:
+            - path: Path of the group, as a list of keys.
+            - expected: Declared target ratio of the group.
+            - actual: Sum of the children's ratios.
+            - eps: Allowed numerical tolerance.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: list[str],
+        expected: float,
+        actual: float,
+        eps: float,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=AllocationTreeErrorCode.TREE_GROUP_RATIO_MISMATCH,
+            message=f"Children of {'/'.join(path) or '<root>'} sum to {actual}, "
+            f"expected {expected} (eps={eps}).",
+            details=details,
+            cause=cause,
+        )
+        self.details.update(
+            {"path": path, "expected": expected, "actual": actual, "eps": eps}
+        )
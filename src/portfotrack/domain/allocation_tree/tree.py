@@ -0,0 +1,412 @@
+"""
+Hierarchical target allocation (e.g. asset class -> region -> sector -> asset).
+
+Leaves are assets with a target ratio and tolerance; inner nodes are
+groups. Every group keeps an ExactSum of its children's ratios, so its
+aggregated ratio is always available in constant time. Changing a leaf
+pushes the old/new difference up the ancestor chain only, so an update
+costs O(depth) instead of re-summing the whole portfolio.
+
+A group may declare its own target ratio and tolerance. Validation is
+per level: the children of a declared group must sum to its target, and
+the root (the whole portfolio) must sum to 1.0. Groups whose children do
+not add up are tracked incrementally as updates propagate, so checking
+the tree is proportional to the number of mismatches, not its size.
+"""
+
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+
+from portfotrack.common.summation import ExactSum
+from portfotrack.domain.allocation_tree.errors import (
+    GroupRatioMismatchError,
+    NodeConflictError,
+    NodeNotFoundError,
+)
+from portfotrack.domain.asset.asset import Asset
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+    TargetColumns,
+    Tolerance,
+)
+from portfotrack.domain.target_allocation.errors import (
+    AssetNotFoundError,
+    DuplicateAssetError,
+    TotalRatioMismatchError,
+)
+from portfotrack.domain.target_allocation.target import validate_entry
+
+
+class AllocationNode:
+    """A group or asset leaf of an AllocationTree.
+
+    Attributes:
+        key: Name of the node within its parent (the asset id for leaves).
+        parent: The parent group, or None for the root.
+        depth: Distance from the root (the root is at depth 0).
+    """
+
+    __slots__ = ("key", "parent", "depth")
+
+    def __init__(self, key: str, parent: "AllocationGroup | None" = None) -> None:
+        self.key = key
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={self.path!r}, ratio={self.ratio!r})"
+
+    @property
+    def is_leaf(self) -> bool:
+        """Whether this node is an asset leaf."""
+        return isinstance(self, AllocationLeaf)
+
+    @property
+    def path(self) -> tuple[str, ...]:
+        """Keys from the root (excluded) down to this node."""
+        keys: list[str] = []
+        node: AllocationNode | None = self
+        while node is not None and node.parent is not None:
+            keys.append(node.key)
+            node = node.parent
+        return tuple(reversed(keys))
+
+    @property
+    def ratio(self) -> float:
+        """Aggregated ratio: the leaf's target, or the sum of the children."""
+        raise NotImplementedError
+
+    def leaves(self) -> Iterator["AllocationLeaf"]:
+        """Iterates over the asset leaves below this node, depth first."""
+        stack: list[AllocationNode] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, AllocationLeaf):
+                yield node
+            elif isinstance(node, AllocationGroup):
+                stack.extend(reversed(node.children.values()))
+
+
+class AllocationGroup(AllocationNode):
+    """An inner node of an AllocationTree.
+
+    Attributes:
+        children: Child nodes by key.
+        target_ratio: Declared target ratio, or None if the group has none.
+        tolerance: Declared tolerance bounds, or None.
+    """
+
+    __slots__ = ("children", "target_ratio", "tolerance", "_sum")
+
+    def __init__(self, key: str, parent: "AllocationGroup | None" = None) -> None:
+        super().__init__(key, parent)
+        self.children: dict[str, AllocationNode] = {}
+        self.target_ratio: float | None = None
+        self.tolerance: Tolerance | None = None
+        self._sum = ExactSum()
+
+    @property
+    def ratio(self) -> float:
+        """Sum of the children's ratios."""
+        return self._sum.value
+
+
+class AllocationLeaf(AllocationNode):
+    """An asset leaf of an AllocationTree.
+
+    Attributes:
+        asset: The asset of the leaf.
+        target_ratio: Target ratio of the asset (of the whole portfolio).
+        tolerance: Acceptable allocation bounds for the asset.
+    """
+
+    __slots__ = ("asset", "target_ratio", "tolerance")
+
+    def __init__(
+        self,
+        key: str,
+        parent: AllocationGroup,
+        asset: Asset,
+        target_ratio: float,
+        tolerance: Tolerance,
+    ) -> None:
+        super().__init__(key, parent)
+        self.asset = asset
+        self.target_ratio = target_ratio
+        self.tolerance = tolerance
+
+    @property
+    def ratio(self) -> float:
+        """The leaf's target ratio."""
+        return self.target_ratio
+
+
+class AllocationTree:
+    """Tree-structured target allocation with incrementally aggregated ratios.
+
+    Attributes:
+        root: The root group, representing the whole portfolio.
+        eps: Numerical tolerance used when checking group sums.
+    """
+
+    def __init__(self, eps: float = 1e-6) -> None:
+        self.root = AllocationGroup("")
+        self.eps = eps
+        self._leaves: dict[str, AllocationLeaf] = {}
+        self._mismatched: set[AllocationGroup] = set()
+        self._check(self.root)
+
+    @classmethod
+    def from_target(
+        cls,
+        target: TargetAllocation | ColumnarTargetAllocation,
+        group_by: Callable[[Asset], Sequence[str]] = lambda asset: (asset.purpose,),
+        eps: float = 1e-6,
+    ) -> "AllocationTree":
+        """Builds a tree from a flat target allocation.
+
+        Args:
+            target: The flat allocation.
+            group_by: Returns the group path of an asset. Defaults to one
+                level of groups named after ``Asset.purpose``.
+            eps: Numerical tolerance used when checking group sums.
+
+        Returns:
+            A tree whose groups have no declared targets.
+        """
+        tree = cls(eps)
+        for asset, (ratio, tolerance) in target.target_assets.items():
+            tree.add_asset(group_by(asset), asset, ratio, tolerance)
+        return tree
+
+    def __len__(self) -> int:
+        return len(self._leaves)
+
+    def __contains__(self, asset: object) -> bool:
+        if isinstance(asset, Asset):
+            asset = asset.id
+        return asset in self._leaves
+
+    def node(self, path: Sequence[str]) -> AllocationNode:
+        """Returns the node at ``path`` (the root for an empty path).
+
+        Raises:
+            NodeNotFoundError: If no node exists at the path.
+        """
+        node: AllocationNode = self.root
+        for key in path:
+            child = (
+                node.children.get(key) if isinstance(node, AllocationGroup) else None
+            )
+            if child is None:
+                raise NodeNotFoundError(path=list(path))
+            node = child
+        return node
+
+    def leaf(self, asset_id: str) -> AllocationLeaf:
+        """Returns the leaf of an asset.
+
+        Raises:
+            AssetNotFoundError: If the asset is not in the tree.
+        """
+        leaf = self._leaves.get(asset_id)
+        if leaf is None:
+            raise AssetNotFoundError(asset_id=asset_id)
+        return leaf
+
+    def _group(self, path: Sequence[str]) -> AllocationGroup:
+        node = self.root
+        for i, key in enumerate(path):
+            child = node.children.get(key)
+            if child is None:
+                child = node.children[key] = AllocationGroup(key, node)
+            elif not isinstance(child, AllocationGroup):
+                raise NodeConflictError(
+                    path=list(path[: i + 1]), reason="an asset cannot have children"
+                )
+            node = child
+        return node
+
+    def add_asset(
+        self,
+        group: Sequence[str],
+        asset: Asset,
+        target_ratio: float,
+        tolerance: Tolerance,
+    ) -> AllocationLeaf:
+        """Adds an asset leaf under a group, creating missing groups.
+
+        Args:
+            group: Path of the parent group (empty for the root).
+            asset: Asset to add; its id becomes the leaf key.
+            target_ratio: Target ratio of the asset (of the whole portfolio).
+            tolerance: Acceptable allocation bounds for the asset.
+
+        Returns:
+            The new leaf.
+
+        Raises:
+            DuplicateAssetError: If the asset is already in the tree.
+            InvalidTargetRatioError: If target_ratio is outside [0.0, 1.0].
+            InvalidToleranceBoundsError: If the tolerance bounds are invalid.
+            NodeConflictError: If the group path runs through a leaf, or
+                the group already has a child group named like the asset.
+        """
+        if asset.id in self._leaves:
+            raise DuplicateAssetError(asset_id=asset.id, asset_name=asset.name)
+        validate_entry(target_ratio, tolerance["lower"], tolerance["upper"])
+
+        parent = self._group(group)
+        if asset.id in parent.children:
+            raise NodeConflictError(
+                path=[*group, asset.id], reason="a group with this key exists"
+            )
+        leaf = AllocationLeaf(asset.id, parent, asset, target_ratio, tolerance)
+        parent.children[asset.id] = leaf
+        self._leaves[asset.id] = leaf
+        self._propagate(leaf, 0.0, target_ratio)
+        return leaf
+
+    def set_group_target(
+        self,
+        path: Sequence[str],
+        target_ratio: float,
+        tolerance: Tolerance,
+    ) -> AllocationGroup:
+        """Declares the target of a group, creating it if missing.
+
+        Raises:
+            InvalidTargetRatioError: If target_ratio is outside [0.0, 1.0].
+            InvalidToleranceBoundsError: If the tolerance bounds are invalid.
+            NodeConflictError: If the path names or runs through a leaf.
+        """
+        validate_entry(target_ratio, tolerance["lower"], tolerance["upper"])
+        group = self._group(path)
+        group.target_ratio = target_ratio
+        group.tolerance = tolerance
+        self._check(group)
+        return group
+
+    def update_ratio(self, asset_id: str, target_ratio: float) -> None:
+        """Changes the target ratio of one asset.
+
+        Only the leaf and its ancestors are touched.
+
+        Raises:
+            AssetNotFoundError: If the asset is not in the tree.
+            InvalidTargetRatioError: If target_ratio is outside [0.0, 1.0].
+        """
+        leaf = self.leaf(asset_id)
+        validate_entry(target_ratio, leaf.tolerance["lower"], leaf.tolerance["upper"])
+        old = leaf.target_ratio
+        leaf.target_ratio = target_ratio
+        self._propagate(leaf, old, target_ratio)
+
+    def remove_asset(self, asset_id: str) -> None:
+        """Removes an asset leaf, pruning groups left empty and undeclared.
+
+        Raises:
+            AssetNotFoundError: If the asset is not in the tree.
+        """
+        leaf = self.leaf(asset_id)
+        self._propagate(leaf, leaf.target_ratio, 0.0)
+        del self._leaves[asset_id]
+
+        node: AllocationNode = leaf
+        while node.parent is not None:
+            if isinstance(node, AllocationGroup):
+                if node.children or node.target_ratio is not None:
+                    break
+                self._mismatched.discard(node)
+            del node.parent.children[node.key]
+            node = node.parent
+
+    def _propagate(self, node: AllocationNode, old: float, new: float) -> None:
+        parent = node.parent
+        while parent is not None:
+            parent_old = parent._sum.value
+            parent._sum.add(new)
+            parent._sum.subtract(old)
+            parent_new = parent._sum.value
+            self._check(parent)
+            if parent_new == parent_old:
+                break
+            old, new = parent_old, parent_new
+            parent = parent.parent
+
+    def _expected(self, group: AllocationGroup) -> float | None:
+        return 1.0 if group.parent is None else group.target_ratio
+
+    def _check(self, group: AllocationGroup) -> None:
+        expected = self._expected(group)
+        if expected is not None and abs(group._sum.value - expected) > self.eps:
+            self._mismatched.add(group)
+        else:
+            self._mismatched.discard(group)
+
+    def total_ratio(self) -> float:
+        """Returns the sum of all asset target ratios in constant time."""
+        return self.root.ratio
+
+    def mismatches(self) -> list[GroupRatioMismatchError]:
+        """Returns one error per group whose children do not sum to its target.
+
+        The root counts as a group with a target of 1.0. Errors are ordered
+        level by level, from the root down.
+        """
+        errors = []
+        for group in sorted(self._mismatched, key=lambda g: (g.depth, g.path)):
+            expected = self._expected(group)
+            # Groups without a target are never tracked as mismatched.
+            assert expected is not None
+            errors.append(
+                GroupRatioMismatchError(
+                    path=list(group.path),
+                    expected=expected,
+                    actual=group.ratio,
+                    eps=self.eps,
+                )
+            )
+        return errors
+
+    def validate(self) -> None:
+        """Validates every level of the tree.
+
+        Raises:
+            GroupRatioMismatchError: For the shallowest group whose children
+                do not sum to its declared target (or the root, to 1.0).
+        """
+        errors = self.mismatches()
+        if errors:
+            raise errors[0]
+
+    def validate_total(self, eps: float = 1e-6) -> None:
+        """Validates that the asset ratios sum to 1.0, like TargetAllocation.
+
+        Raises:
+            TotalRatioMismatchError: If the total deviates from 1.0 beyond eps.
+        """
+        total = self.total_ratio()
+        if abs(total - 1.0) > eps:
+            raise TotalRatioMismatchError(total=total, expected=1.0, eps=eps)
+
+    def columns(self) -> TargetColumns:
+        """Returns the column view of the asset leaves, in tree order."""
+        ids: list[str] = []
+        ratios, lowers, uppers = array("d"), array("d"), array("d")
+        for leaf in self.root.leaves():
+            ids.append(leaf.key)
+            ratios.append(leaf.target_ratio)
+            lowers.append(leaf.tolerance["lower"])
+            uppers.append(leaf.tolerance["upper"])
+        return TargetColumns(ids, ratios, lowers, uppers)
+
+    def to_target(self) -> TargetAllocation:
+        """Flattens the asset leaves into a TargetAllocation."""
+        return TargetAllocation(
+            target_assets={
+                leaf.asset: (leaf.target_ratio, leaf.tolerance)
+                for leaf in self.root.leaves()
+            }
+        )
@@ -1,3 +1,4 @@
 from portfotrack.domain.asset.asset import Asset
+from portfotrack.domain.asset.registry import AssetRegistry, normalize_asset_id
 
-__all__ = ["Asset"]
+__all__ = ["Asset", "AssetRegistry", "normalize_asset_id"]
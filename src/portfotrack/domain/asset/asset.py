@@ -34,7 +34,9 @@ class Asset:
         """Checks equality with another Asset.
 
         Two Asset objects are considered equal if and only if their
-        `id` fields are identical.
+        `id` fields are identical. Identical objects (e.g. canonical
+        instances handed out by AssetRegistry) short-circuit without
+        comparing ids.
 
         Args:
             other: Object to compare against.
@@ -43,6 +45,8 @@ class Asset:
             True if the other object is an Asset with the same id;
             False otherwise.
         """
+        if self is other:
+            return True
         if not isinstance(other, Asset):
             return NotImplemented
         return self.id == other.id
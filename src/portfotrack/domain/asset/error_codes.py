@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class AssetErrorCode(StrEnum):
+    ASSET_UNKNOWN = "ASSET.UNKNOWN"
+    ASSET_ALIAS_CONFLICT = "ASSET.ALIAS_CONFLICT"
@@ -0,0 +1,63 @@
+from typing import Any
+
+from portfotrack.domain.asset.error_codes import AssetErrorCode
+from portfotrack.domain.errors import DomainError
+
+
+class AssetError(DomainError):
+    """Base error for asset domain."""
+
+
+class UnknownAssetError(AssetError):
+    """Raised when an asset id is not registered in the asset registry.
+
+    Attributes:
+        details: Contains:
+            - asset_id: The identifier that could not be resolved.
+    """
+
+    def __init__(
+        self,
+        *,
+        asset_id: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=AssetErrorCode.ASSET_UNKNOWN,
+            message=f"Asset {asset_id} is not registered.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"asset_id": asset_id})
+
+
+class AliasConflictError(AssetError):
+    """Raised when an alias is already bound to a different asset.
+
+    Attributes:
+        details: Contains:
+            - alias: The alias being registered.
+            - asset_id: The asset the alias was meant to point to.
+            - existing_id: The asset the alias (or id) already refers to.
+    """
+
+    def __init__(
+        self,
+        *,
+        alias: str,
+        asset_id: str,
+        existing_id: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=AssetErrorCode.ASSET_ALIAS_CONFLICT,
+            message=f"Alias {alias} cannot point to {asset_id}; "
+            f"it already refers to {existing_id}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update(
+            {"alias": alias, "asset_id": asset_id, "existing_id": existing_id}
+        )
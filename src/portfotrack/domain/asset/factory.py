@@ -1,18 +1,22 @@
-from portfotrack.domain.asset import Asset
+from portfotrack.domain.asset import Asset, AssetRegistry
 
 
-def create_asset(asset_id: str, asset_name: str, purpose: str) -> Asset:
+def create_asset(
+    asset_id: str,
+    asset_name: str,
+    purpose: str,
+    registry: AssetRegistry | None = None,
+) -> Asset:
     """
     Create an Asset instance from raw input values.
 
     This factory function serves as the single creation entry point for
-    Asset objects within the application. Although it currently delegates
-    directly to the Asset constructor, it intentionally exists to
-    centralize asset creation logic.
+    Asset objects within the application. Without a registry it delegates
+    directly to the Asset constructor. With a registry, the id is
+    normalized, aliases are resolved, and the registry's canonical
+    (interned) Asset instance is returned instead of a new object.
 
     In the future, this function may be extended to handle:
-    - Asset ID normalization or alias resolution
-    - Lookup from a predefined asset catalog or registry
     - Default name or purpose inference
     - Backward compatibility for persisted asset definitions
 
@@ -20,8 +24,12 @@ def create_asset(asset_id: str, asset_name: str, purpose: str) -> Asset:
         asset_id: Stable identifier of the asset (used for equality and persistence).
         asset_name: Human-readable name of the asset.
         purpose: High-level investment purpose (e.g. growth, income, hedge).
+        registry: Optional asset registry to intern the asset through.
 
     Returns:
-        A newly created Asset instance.
+        A newly created Asset instance, or the canonical registered instance
+        when a registry is given.
     """
+    if registry is not None:
+        return registry.intern(asset_id, asset_name, purpose)
     return Asset(asset_id, asset_name, purpose)
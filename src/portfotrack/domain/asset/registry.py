@@ -0,0 +1,127 @@
+import sys
+
+from portfotrack.domain.asset.asset import Asset
+from portfotrack.domain.asset.errors import AliasConflictError, UnknownAssetError
+
+
+def normalize_asset_id(asset_id: str) -> str:
+    """Normalizes a raw asset id into its canonical registry key.
+
+    Surrounding whitespace is stripped and the id is lower-cased, so
+    ``" US-Stock"`` and ``"us-stock"`` refer to the same asset. The result
+    is interned so every canonical id shares a single string object.
+
+    Args:
+        asset_id: Raw asset identifier.
+
+    Returns:
+        The normalized, interned asset id.
+    """
+    return sys.intern(asset_id.strip().lower())
+
+
+class AssetRegistry:
+    """Interning catalog of canonical Asset instances.
+
+    The registry hands out exactly one Asset object per normalized id. The
+    first registration of an id defines its name and purpose; later
+    requests for the same id (or any of its aliases) return that same
+    object. Because targets and snapshots built through one registry share
+    Asset instances, equality checks between them usually succeed on the
+    identity fast path, and repeated lots do not each carry an Asset copy.
+    """
+
+    __slots__ = ("_assets", "_aliases")
+
+    def __init__(self) -> None:
+        self._assets: dict[str, Asset] = {}
+        self._aliases: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    def __contains__(self, asset_id: object) -> bool:
+        if not isinstance(asset_id, str):
+            return False
+        return self.resolve_id(asset_id) in self._assets
+
+    def resolve_id(self, asset_id: str) -> str:
+        """Maps a raw id or alias to its canonical (normalized) id.
+
+        The returned id is not guaranteed to be registered.
+        """
+        key = normalize_asset_id(asset_id)
+        return self._aliases.get(key, key)
+
+    def intern(self, asset_id: str, asset_name: str, purpose: str) -> Asset:
+        """Returns the canonical Asset for an id, registering it if needed.
+
+        The first registration wins: if the id (or an alias of it) is
+        already registered, the registered Asset is returned unchanged and
+        ``asset_name`` and ``purpose`` are ignored, even if they differ.
+
+        Args:
+            asset_id: Raw asset id or alias.
+            asset_name: Name used if the asset is registered by this call.
+            purpose: Purpose used if the asset is registered by this call.
+
+        Returns:
+            The canonical Asset instance for the id.
+        """
+        key = self.resolve_id(asset_id)
+        asset = self._assets.get(key)
+        if asset is None:
+            asset = self._assets[key] = Asset(key, asset_name, purpose)
+        return asset
+
+    def rollback(self, size: int) -> None:
+        """Unregisters every asset interned after the registry held ``size``.
+
+        Callers take ``len(registry)`` before interning a batch of assets and
+        roll back to it if the batch is rejected, so assets that never made
+        it into a target do not stay registered. Aliases of the removed
+        assets are dropped as well.
+
+        Args:
+            size: Number of assets to keep, in registration order.
+        """
+        if len(self._assets) <= size:
+            return
+        while len(self._assets) > size:
+            self._assets.popitem()
+        self._aliases = {
+            alias: key for alias, key in self._aliases.items() if key in self._assets
+        }
+
+    def get(self, asset_id: str) -> Asset:
+        """Looks up a registered asset by id or alias.
+
+        Raises:
+            UnknownAssetError: If the id is not registered.
+        """
+        asset = self._assets.get(self.resolve_id(asset_id))
+        if asset is None:
+            raise UnknownAssetError(asset_id=asset_id)
+        return asset
+
+    def add_alias(self, alias: str, asset_id: str) -> None:
+        """Registers an alternative id that resolves to a registered asset.
+
+        Args:
+            alias: Alternative identifier (normalized like asset ids).
+            asset_id: Id or alias of the registered target asset.
+
+        Raises:
+            UnknownAssetError: If asset_id is not registered.
+            AliasConflictError: If the alias is already a canonical id or an
+                alias of a different asset.
+        """
+        canonical = self.get(asset_id).id
+        key = normalize_asset_id(alias)
+        existing = key if key in self._assets else self._aliases.get(key)
+        if existing is not None and existing != canonical:
+            raise AliasConflictError(
+                alias=alias, asset_id=canonical, existing_id=existing
+            )
+        if key != canonical:
+            self._aliases[key] = canonical
@@ -0,0 +1,19 @@
+from portfotrack.domain.drift.drift import (
+    DriftReport,
+    align_holdings,
+    compute_drift,
+    detect_drift,
+    detect_drift_batch,
+)
+from portfotrack.domain.drift.monitor import BandEvent, BandState, DriftMonitor
+
+__all__ = [
+    "BandEvent",
+    "BandState",
+    "DriftMonitor",
+    "DriftReport",
+    "align_holdings",
+    "compute_drift",
+    "detect_drift",
+    "detect_drift_batch",
+]
@@ -0,0 +1,162 @@
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
+from itertools import compress, repeat
+from operator import and_, le, sub, truediv
+
+from portfotrack.domain.drift.errors import (
+    EmptyPortfolioError,
+    SnapshotShapeMismatchError,
+    UnknownHoldingAssetError,
+)
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+    TargetColumns,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DriftReport:
+    """Per-asset drift of a holdings snapshot against a target allocation.
+
+    All columns are row-aligned with ``ids`` (the target allocation rows).
+
+    Attributes:
+        ids: Asset identifiers, one per row.
+        total: Total holdings value the actual ratios are relative to.
+        actual: Actual allocation ratio of each asset.
+        deviation: ``actual - target_ratio`` for each asset.
+        in_band: Whether each actual ratio lies within its tolerance
+            bounds (inclusive).
+    """
+
+    ids: Sequence[str]
+    total: float
+    actual: array
+    deviation: array
+    in_band: list[bool]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def out_of_band(self) -> list[str]:
+        """Returns the ids of assets whose actual ratio is outside its band."""
+        return list(compress(self.ids, map(_not, self.in_band)))
+
+
+def _not(value: bool) -> bool:
+    return not value
+
+
+def align_holdings(
+    columns: TargetColumns,
+    holdings: Mapping[str, float],
+    known_ids: AbstractSet[str] | None = None,
+) -> array:
+    """Aligns a holdings snapshot to the rows of a target allocation.
+
+    Assets of the target that are missing from the snapshot are treated
+    as holding a value of 0.0.
+
+    Args:
+        columns: Column view of the target allocation.
+        holdings: Current holding value per asset id.
+        known_ids: Optional precomputed set of ``columns.ids``. Pass it when
+            aligning many snapshots against the same target.
+
+    Returns:
+        A float64 column of holding values, row-aligned with ``columns``.
+
+    Raises:
+        UnknownHoldingAssetError: If holdings contain ids absent from the target.
+    """
+    if known_ids is None:
+        known_ids = frozenset(columns.ids)
+    unknown = holdings.keys() - known_ids
+    if unknown:
+        raise UnknownHoldingAssetError(asset_ids=sorted(unknown))
+    return array("d", map(holdings.get, columns.ids, repeat(0.0)))
+
+
+def compute_drift(columns: TargetColumns, values: Sequence[float]) -> DriftReport:
+    """Computes drift for a row-aligned holdings column.
+
+    This is the vectorized kernel behind ``detect_drift``: every step is a
+    single pass over whole columns using C-level ``map`` over ``operator``
+    functions, with no per-asset Python code.
+
+    Args:
+        columns: Column view of the target allocation.
+        values: Holding value per row, aligned with ``columns``.
+
+    Returns:
+        The drift report of the snapshot.
+
+    Raises:
+        SnapshotShapeMismatchError: If ``values`` and ``columns`` differ in length.
+        EmptyPortfolioError: If the total holdings value is not positive.
+    """
+    if len(values) != len(columns.ids):
+        raise SnapshotShapeMismatchError(expected=len(columns.ids), actual=len(values))
+
+    total = math.fsum(values)
+    if not total > 0.0:
+        raise EmptyPortfolioError(total=total)
+
+    actual = array("d", map(truediv, values, repeat(total)))
+    deviation = array("d", map(sub, actual, columns.ratios))
+    in_band = list(
+        map(and_, map(le, columns.lowers, actual), map(le, actual, columns.uppers))
+    )
+    return DriftReport(columns.ids, total, actual, deviation, in_band)
+
+
+def detect_drift(
+    target: TargetAllocation | ColumnarTargetAllocation,
+    holdings: Mapping[str, float],
+) -> DriftReport:
+    """Detects drift of a holdings snapshot against a target allocation.
+
+    Args:
+        target: Target allocation to compare against.
+        holdings: Current holding value per asset id.
+
+    Returns:
+        The drift report of the snapshot.
+
+    Raises:
+        UnknownHoldingAssetError: If holdings contain ids absent from the target.
+        EmptyPortfolioError: If the total holdings value is not positive.
+    """
+    columns = target.columns()
+    return compute_drift(columns, align_holdings(columns, holdings))
+
+
+def detect_drift_batch(
+    target: TargetAllocation | ColumnarTargetAllocation,
+    snapshots: Iterable[Mapping[str, float]],
+) -> Iterator[DriftReport]:
+    """Detects drift of many holdings snapshots against one target allocation.
+
+    The target columns and id set are built once and shared by every
+    snapshot, and reports are yielded lazily so arbitrarily many accounts
+    can be streamed through with bounded memory.
+
+    Args:
+        target: Target allocation shared by all snapshots.
+        snapshots: Holdings snapshots, one per account.
+
+    Yields:
+        One drift report per snapshot, in input order.
+
+    Raises:
+        UnknownHoldingAssetError: If a snapshot contains ids absent from the target.
+        EmptyPortfolioError: If a snapshot's total holdings value is not positive.
+    """
+    columns = target.columns()
+    known_ids = frozenset(columns.ids)
+    for holdings in snapshots:
+        yield compute_drift(columns, align_holdings(columns, holdings, known_ids))
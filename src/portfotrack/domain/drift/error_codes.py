@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class DriftErrorCode(StrEnum):
+    DRIFT_UNKNOWN_ASSET = "DRIFT.UNKNOWN_ASSET"
+    DRIFT_EMPTY_PORTFOLIO = "DRIFT.EMPTY_PORTFOLIO"
+    DRIFT_SHAPE_MISMATCH = "DRIFT.SHAPE_MISMATCH"
@@ -0,0 +1,84 @@
+from typing import Any
+
+from portfotrack.domain.drift.error_codes import DriftErrorCode
+from portfotrack.domain.errors import DomainError
+
+
+class DriftError(DomainError):
+    """Base error for drift detection domain."""
+
+
+class UnknownHoldingAssetError(DriftError):
+    """Raised when a holdings snapshot contains assets absent from the target.
+
+    Attributes:
+        details: Contains:
+            - asset_ids: Sorted identifiers of the unknown assets.
+    """
+
+    def __init__(
+        self,
+        *,
+        asset_ids: list[str],
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=DriftErrorCode.DRIFT_UNKNOWN_ASSET,
+            message=f"Holdings contain assets not in the target allocation: {asset_ids}",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"asset_ids": asset_ids})
+
+
+class EmptyPortfolioError(DriftError):
+    """Raised when the total holdings value is not positive.
+
+    Actual allocation ratios are undefined for an empty portfolio.
+
+    Attributes:
+        details: Contains:
+            - total: The computed total holdings value.
+    """
+
+    def __init__(
+        self,
+        *,
+        total: float,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=DriftErrorCode.DRIFT_EMPTY_PORTFOLIO,
+            message=f"Total holdings value must be positive, but got {total}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"total": total})
+
+
+class SnapshotShapeMismatchError(DriftError):
+    """Raised when an aligned holdings column does not match the target rows.
+
+    Attributes:
+        details: Contains:
+            - expected: Number of rows in the target allocation.
+            - actual: Number of values in the holdings column.
+    """
+
+    def __init__(
+        self,
+        *,
+        expected: int,
+        actual: int,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=DriftErrorCode.DRIFT_SHAPE_MISMATCH,
+            message=f"Holdings column must have {expected} values, but got {actual}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"expected": expected, "actual": actual})
@@ -0,0 +1,299 @@
+"""
+Streaming drift monitoring driven by price ticks.
+
+A tick changes the value of one asset and therefore the portfolio total
+``T``, which moves the ratio of *every* asset. Recomputing all ratios on
+each tick is O(n); DriftMonitor instead turns each asset's next band
+crossing into a threshold on ``T``:
+
+* an in-band asset drops below its lower bound once ``T > v / lower``
+  and rises above its upper bound once ``T < v / upper``;
+* an out-of-band asset re-enters its band only after moving
+  ``hysteresis`` past the bound it crossed, i.e. once
+  ``T < v / (lower + hysteresis)`` or ``T > v / (upper - hysteresis)``.
+
+Thresholds that fire when ``T`` rises live in a min-heap and those that
+fire when it falls in a max-heap. A tick updates the ticked asset and
+the exact running total, then pops only the thresholds that ``T``
+actually passed, so its cost is O(log n) plus the number of assets that
+cross a bound. Superseded heap entries are skipped lazily and the heaps
+are rebuilt once stale entries dominate.
+"""
+
+import heapq
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+
+from portfotrack.common.summation import ExactSum
+from portfotrack.domain.drift.drift import DriftReport, align_holdings, compute_drift
+from portfotrack.domain.drift.errors import UnknownHoldingAssetError
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+)
+
+
+class BandState(StrEnum):
+    """Position of an asset's actual ratio relative to its tolerance band."""
+
+    IN_BAND = "in-band"
+    BELOW = "below"
+    ABOVE = "above"
+
+
+@dataclass(frozen=True, slots=True)
+class BandEvent:
+    """An asset moved into or out of its tolerance band.
+
+    Attributes:
+        asset_id: Identifier of the asset.
+        previous: State before the tick.
+        state: State after the tick.
+        ratio: Actual ratio of the asset after the tick.
+        total: Portfolio value after the tick.
+    """
+
+    asset_id: str
+    previous: BandState
+    state: BandState
+    ratio: float
+    total: float
+
+
+_IN, _BELOW, _ABOVE = BandState.IN_BAND, BandState.BELOW, BandState.ABOVE
+_REBUILD_SLACK = 1024
+
+
+class DriftMonitor:
+    """Incrementally maintained drift of a portfolio against a target allocation.
+
+    The monitor tracks a quantity and a price per target asset. ``tick``
+    (new price) and ``set_quantity`` (trade fill) update one asset and
+    return the band events they caused. Assets start in the state given
+    by their plain tolerance bands, without emitting events.
+
+    Attributes:
+        hysteresis: Ratio margin an out-of-band asset must move back inside
+            its band before it is reported as in band again.
+    """
+
+    def __init__(
+        self,
+        target: TargetAllocation | ColumnarTargetAllocation,
+        quantities: Mapping[str, float],
+        prices: Mapping[str, float],
+        *,
+        hysteresis: float = 0.001,
+    ) -> None:
+        """Initializes a DriftMonitor.
+
+        Args:
+            target: Target allocation providing the rows and tolerance bands.
+            quantities: Units held per asset id; missing assets hold 0.
+            prices: Price per asset id; missing assets are priced at 0.
+            hysteresis: Re-entry margin, as a ratio.
+
+        Raises:
+            ValueError: If ``hysteresis`` is negative.
+            UnknownHoldingAssetError: If quantities or prices contain ids
+                absent from the target.
+        """
+        if hysteresis < 0.0:
+            raise ValueError("hysteresis must not be negative")
+        columns = target.columns()
+        known_ids = frozenset(columns.ids)
+
+        self.hysteresis = hysteresis
+        self._columns = columns
+        self._ids = list(columns.ids)
+        self._index = {asset_id: row for row, asset_id in enumerate(self._ids)}
+        self._lowers = list(columns.lowers)
+        self._uppers = list(columns.uppers)
+        self._quantities = list(align_holdings(columns, quantities, known_ids))
+        self._prices = list(align_holdings(columns, prices, known_ids))
+        self._values = list(map(float.__mul__, self._quantities, self._prices))
+        self._sum = ExactSum(self._values)
+        self._total = self._sum.value
+        self._states = [_IN] * len(self._ids)
+        self._versions = [0] * len(self._ids)
+        self._rising: list[tuple[float, int, int]] = []
+        self._falling: list[tuple[float, int, int]] = []
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def total(self) -> float:
+        """Current portfolio value."""
+        return self._total
+
+    def _row(self, asset_id: str) -> int:
+        row = self._index.get(asset_id)
+        if row is None:
+            raise UnknownHoldingAssetError(asset_ids=[asset_id])
+        return row
+
+    def ratio(self, asset_id: str) -> float:
+        """Returns the current actual ratio of an asset (0.0 if T is not positive).
+
+        Raises:
+            UnknownHoldingAssetError: If the asset is not in the target.
+        """
+        row = self._row(asset_id)
+        return self._values[row] / self._total if self._total > 0.0 else 0.0
+
+    def state(self, asset_id: str) -> BandState:
+        """Returns the current band state of an asset.
+
+        Raises:
+            UnknownHoldingAssetError: If the asset is not in the target.
+        """
+        return self._states[self._row(asset_id)]
+
+    def out_of_band(self) -> list[str]:
+        """Returns the ids of assets currently reported out of band."""
+        states = self._states
+        return [self._ids[row] for row in range(len(states)) if states[row] is not _IN]
+
+    def report(self) -> DriftReport:
+        """Recomputes a full DriftReport from the current values.
+
+        This is O(n) and meant for periodic reconciliation, not per tick.
+
+        Raises:
+            EmptyPortfolioError: If the portfolio value is not positive.
+        """
+        return compute_drift(self._columns, self._values)
+
+    def tick(self, asset_id: str, price: float) -> list[BandEvent]:
+        """Applies a new price for one asset.
+
+        Args:
+            asset_id: The asset whose price changed.
+            price: The new price.
+
+        Returns:
+            Band events caused by the tick, possibly empty.
+
+        Raises:
+            UnknownHoldingAssetError: If the asset is not in the target.
+        """
+        row = self._row(asset_id)
+        self._prices[row] = price
+        return self._update(row, self._quantities[row] * price)
+
+    def set_quantity(self, asset_id: str, quantity: float) -> list[BandEvent]:
+        """Applies a new held quantity for one asset (e.g. after a trade).
+
+        Returns:
+            Band events caused by the change, possibly empty.
+
+        Raises:
+            UnknownHoldingAssetError: If the asset is not in the target.
+        """
+        row = self._row(asset_id)
+        self._quantities[row] = quantity
+        return self._update(row, quantity * self._prices[row])
+
+    def _update(self, row: int, value: float) -> list[BandEvent]:
+        old_total = self._total
+        self._sum.add(value)
+        self._sum.subtract(self._values[row])
+        self._values[row] = value
+        total = self._total = self._sum.value
+
+        if not (old_total > 0.0 and total > 0.0):
+            return self._rebuild()
+
+        events: list[BandEvent] = []
+        self._reclassify(row, total, events)
+
+        candidates: list[int] = []
+        versions = self._versions
+        if total > old_total:
+            heap = self._rising
+            while heap and heap[0][0] <= total:
+                _, r, version = heapq.heappop(heap)
+                if versions[r] == version:
+                    candidates.append(r)
+        elif total < old_total:
+            heap = self._falling
+            while heap and -heap[0][0] >= total:
+                _, r, version = heapq.heappop(heap)
+                if versions[r] == version:
+                    candidates.append(r)
+        for r in candidates:
+            self._reclassify(r, total, events)
+
+        if len(self._rising) + len(self._falling) > 4 * len(self._ids) + _REBUILD_SLACK:
+            self._compact_heaps()
+        return events
+
+    def _classify(self, row: int, total: float) -> BandState:
+        value = self._values[row]
+        lower, upper = self._lowers[row], self._uppers[row]
+        state = self._states[row]
+        if state is _BELOW and value < (lower + self.hysteresis) * total:
+            return _BELOW
+        if state is _ABOVE and value > (upper - self.hysteresis) * total:
+            return _ABOVE
+        if value < lower * total:
+            return _BELOW
+        if value > upper * total:
+            return _ABOVE
+        return _IN
+
+    def _reclassify(self, row: int, total: float, events: list[BandEvent]) -> None:
+        previous = self._states[row]
+        state = self._states[row] = self._classify(row, total)
+        if state is not previous:
+            events.append(
+                BandEvent(
+                    self._ids[row], previous, state, self._values[row] / total, total
+                )
+            )
+        self._versions[row] += 1
+        self._push(row)
+
+    def _push(self, row: int) -> None:
+        """Pushes the thresholds at which ``row`` may next change state."""
+        value = self._values[row]
+        if value <= 0.0:
+            return
+        version = self._versions[row]
+        state = self._states[row]
+        lower, upper = self._lowers[row], self._uppers[row]
+        if state is _IN:
+            if lower > 0.0:
+                heapq.heappush(self._rising, (value / lower, row, version))
+            if upper > 0.0:
+                heapq.heappush(self._falling, (-value / upper, row, version))
+        elif state is _BELOW:
+            heapq.heappush(
+                self._falling, (-value / (lower + self.hysteresis), row, version)
+            )
+        else:
+            reentry = upper - self.hysteresis
+            if reentry > 0.0:
+                heapq.heappush(self._rising, (value / reentry, row, version))
+
+    def _rebuild(self) -> list[BandEvent]:
+        """Reclassifies every asset from scratch and rebuilds both heaps."""
+        self._rising.clear()
+        self._falling.clear()
+        events: list[BandEvent] = []
+        total = self._total
+        if total > 0.0:
+            for row in range(len(self._ids)):
+                self._reclassify(row, total, events)
+        return events
+
+    def _compact_heaps(self) -> None:
+        """Drops superseded heap entries."""
+        versions = self._versions
+        self._rising = [e for e in self._rising if versions[e[1]] == e[2]]
+        self._falling = [e for e in self._falling if versions[e[1]] == e[2]]
+        heapq.heapify(self._rising)
+        heapq.heapify(self._falling)
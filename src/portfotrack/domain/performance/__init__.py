@@ -0,0 +1,13 @@
+from portfotrack.domain.performance.performance import (
+    UNCLASSIFIED,
+    PerformanceHistory,
+    PerformanceReport,
+    report_batch,
+)
+
+__all__ = [
+    "UNCLASSIFIED",
+    "PerformanceHistory",
+    "PerformanceReport",
+    "report_batch",
+]
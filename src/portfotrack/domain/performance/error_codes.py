@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class PerformanceErrorCode(StrEnum):
+    PERFORMANCE_UNORDERED_HISTORY = "PERFORMANCE.UNORDERED_HISTORY"
+    PERFORMANCE_INVALID_PERIOD = "PERFORMANCE.INVALID_PERIOD"
+    PERFORMANCE_NON_POSITIVE_VALUE = "PERFORMANCE.NON_POSITIVE_VALUE"
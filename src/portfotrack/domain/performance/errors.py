@@ -0,0 +1,104 @@
+from datetime import date
+from typing import Any
+
+from portfotrack.domain.errors import DomainError
+from portfotrack.domain.performance.error_codes import PerformanceErrorCode
+
+
+class PerformanceError(DomainError):
+    """Base error for performance measurement domain."""
+
+
+class UnorderedHistoryError(PerformanceError):
+    """Raised when snapshots are not in strictly increasing date order.
+
+    Attributes:
+        details: Contains:
+            - as_of: ISO date of the offending snapshot.
+            - previous: ISO date of the snapshot before it.
+    """
+
+    def __init__(
+        self,
+        *,
+        as_of: date,
+        previous: date,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=PerformanceErrorCode.PERFORMANCE_UNORDERED_HISTORY,
+            message=(
+                f"Snapshot of {as_of.isoformat()} does not follow "
+                f"{previous.isoformat()}; history must be in increasing date order."
+            ),
+            details=details,
+            cause=cause,
+        )
+        self.details.update(
+            {"as_of": as_of.isoformat(), "previous": previous.isoformat()}
+        )
+
+
+class InvalidPeriodError(PerformanceError):
+    """Raised when a requested period is not covered by the history.
+
+    Attributes:
+        details: Contains:
+            - start: ISO start date of the period, or None.
+            - end: ISO end date of the period, or None.
+            - reason: Short description of the problem.
+    """
+
+    def __init__(
+        self,
+        *,
+        start: date | None,
+        end: date | None,
+        reason: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        period = f"{start or 'beginning'} .. {end or 'latest'}"
+        super().__init__(
+            code=PerformanceErrorCode.PERFORMANCE_INVALID_PERIOD,
+            message=f"Invalid performance period {period}: {reason}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update(
+            {
+                "start": start.isoformat() if start else None,
+                "end": end.isoformat() if end else None,
+                "reason": reason,
+            }
+        )
+
+
+class NonPositiveValueError(PerformanceError):
+    """Raised when a return is undefined because its base value is not positive.
+
+    Attributes:
+        details: Contains:
+            - as_of: ISO date the base value belongs to.
+            - value: The non-positive base value.
+    """
+
+    def __init__(
+        self,
+        *,
+        as_of: date,
+        value: float,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=PerformanceErrorCode.PERFORMANCE_NON_POSITIVE_VALUE,
+            message=(
+                f"Return base value on {as_of.isoformat()} must be positive, "
+                f"but got {value}."
+            ),
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"as_of": as_of.isoformat(), "value": value})
@@ -0,0 +1,15 @@
+from portfotrack.domain.rebalance.rebalance import (
+    RebalancePolicy,
+    TradePlan,
+    compute_trades,
+    rebalance,
+    rebalance_batch,
+)
+
+__all__ = [
+    "RebalancePolicy",
+    "TradePlan",
+    "compute_trades",
+    "rebalance",
+    "rebalance_batch",
+]
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class RebalanceErrorCode(StrEnum):
+    REBALANCE_INSUFFICIENT_FUNDS = "REBALANCE.INSUFFICIENT_FUNDS"
+    REBALANCE_CASH_FLOW_COUNT_MISMATCH = "REBALANCE.CASH_FLOW_COUNT_MISMATCH"
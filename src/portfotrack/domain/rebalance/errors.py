@@ -0,0 +1,60 @@
+from typing import Any
+
+from portfotrack.domain.errors import DomainError
+from portfotrack.domain.rebalance.error_codes import RebalanceErrorCode
+
+
+class RebalanceError(DomainError):
+    """Base error for rebalancing domain."""
+
+
+class InsufficientFundsError(RebalanceError):
+    """Raised when a cash outflow exceeds the total holdings value.
+
+    Attributes:
+        details: Contains:
+            - holdings_value: Total value of current holdings.
+            - cash_flow: The requested cash flow (negative for outflows).
+    """
+
+    def __init__(
+        self,
+        *,
+        holdings_value: float,
+        cash_flow: float,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=RebalanceErrorCode.REBALANCE_INSUFFICIENT_FUNDS,
+            message=f"Cash outflow {-cash_flow} exceeds holdings value {holdings_value}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"holdings_value": holdings_value, "cash_flow": cash_flow})
+
+
+class CashFlowCountMismatchError(RebalanceError):
+    """Raised when a batch has a different number of cash flows than accounts.
+
+    Attributes:
+        details: Contains:
+            - expected: Number of accounts (holdings snapshots) in the batch.
+            - actual: Number of cash flows given.
+    """
+
+    def __init__(
+        self,
+        *,
+        expected: int,
+        actual: int,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=RebalanceErrorCode.REBALANCE_CASH_FLOW_COUNT_MISMATCH,
+            message=f"Expected {expected} cash flows, one per account, but got {actual}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"expected": expected, "actual": actual})
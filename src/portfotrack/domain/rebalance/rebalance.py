@@ -0,0 +1,246 @@
+import math
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from itertools import compress, repeat
+from operator import add, mul, sub
+
+from portfotrack.domain.drift import align_holdings
+from portfotrack.domain.drift.errors import SnapshotShapeMismatchError
+from portfotrack.domain.rebalance.errors import (
+    CashFlowCountMismatchError,
+    InsufficientFundsError,
+)
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+    TargetColumns,
+)
+
+
+class RebalancePolicy(StrEnum):
+    """How far a rebalance moves holdings.
+
+    Members:
+        TO_TARGET: Trade every asset to exactly its target ratio.
+        TO_BAND_EDGE: Trade only out-of-band assets, to the nearest edge of
+            their tolerance band; cash flows go toward target ratios.
+        CASH_ONLY: Never trade against the cash flow: an inflow only buys
+            (underweight assets first) and an outflow only sells
+            (overweight assets first).
+    """
+
+    TO_TARGET = "to-target"
+    TO_BAND_EDGE = "to-band-edge"
+    CASH_ONLY = "cash-only"
+
+
+@dataclass(frozen=True, slots=True)
+class TradePlan:
+    """Per-asset trade amounts that rebalance one account.
+
+    Attributes:
+        ids: Asset identifiers, one per row.
+        policy: The policy the plan was computed with.
+        total: Portfolio value after the cash flow and all trades.
+        trades: Signed trade amount per row: positive buys, negative sells.
+            Trades always net to the cash flow.
+    """
+
+    ids: Sequence[str]
+    policy: RebalancePolicy
+    total: float
+    trades: array
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def turnover(self) -> float:
+        """Sum of absolute trade amounts."""
+        return math.fsum(map(abs, self.trades))
+
+    def nonzero(self) -> list[tuple[str, float]]:
+        """Returns ``(asset_id, amount)`` for every asset that trades."""
+        return list(compress(zip(self.ids, self.trades, strict=True), self.trades))
+
+
+Weights = Callable[[array], Iterable[float]]
+
+
+def _scaled(values: Iterable[float], factor: float) -> Iterator[float]:
+    return map(mul, values, repeat(factor))
+
+
+def _clipped_diff(a: Iterable[float], b: Iterable[float]) -> Iterator[float]:
+    """Element-wise ``max(a - b, 0)``."""
+    return map(max, map(sub, a, b), repeat(0.0))
+
+
+def _fill(desired: array, residual: float, stages: list[Weights]) -> array:
+    """Moves ``residual`` into ``desired`` in capacity-limited stages.
+
+    Each stage yields per-row capacities (in the direction of the
+    residual) and absorbs as much of the residual as it can,
+    proportionally to those capacities. Whatever is left after the last
+    bounded stage is spread without limit: inflows by target ratio through
+    the caller's final stage, outflows pro rata to current amounts.
+    """
+    for weights_of in stages:
+        weights = list(weights_of(desired))
+        capacity = math.fsum(weights)
+        if capacity <= 0.0:
+            continue
+        take = (
+            residual if abs(residual) <= capacity else math.copysign(capacity, residual)
+        )
+        desired = array("d", map(add, desired, _scaled(weights, take / capacity)))
+        residual -= take
+
+    if residual < 0.0:
+        held = math.fsum(desired)
+        if held > 0.0:
+            desired = array("d", _scaled(desired, (held + residual) / held))
+    return desired
+
+
+def compute_trades(
+    columns: TargetColumns,
+    values: Sequence[float],
+    cash_flow: float = 0.0,
+    policy: RebalancePolicy = RebalancePolicy.TO_TARGET,
+) -> TradePlan:
+    """Computes the trades that rebalance one row-aligned holdings column.
+
+    This is the vectorized kernel behind ``rebalance``: each step is a
+    whole-column pass using ``map`` over builtins and ``operator``
+    functions. Target ratios are assumed to sum to 1.0.
+
+    Args:
+        columns: Column view of the target allocation.
+        values: Current holding value per row, aligned with ``columns``.
+        cash_flow: Cash added to (positive) or withdrawn from (negative)
+            the account as part of the rebalance.
+        policy: Rebalancing policy.
+
+    Returns:
+        The trade plan. Its trades sum to ``cash_flow``.
+
+    Raises:
+        SnapshotShapeMismatchError: If ``values`` and ``columns`` differ in length.
+        InsufficientFundsError: If the outflow exceeds the holdings value.
+    """
+    if len(values) != len(columns.ids):
+        raise SnapshotShapeMismatchError(expected=len(columns.ids), actual=len(values))
+
+    held = math.fsum(values)
+    total = held + cash_flow
+    if total < 0.0:
+        raise InsufficientFundsError(holdings_value=held, cash_flow=cash_flow)
+
+    goal = array("d", _scaled(columns.ratios, total))
+
+    def toward_goal(desired: array) -> Iterator[float]:
+        return _clipped_diff(goal, desired)
+
+    def from_goal(desired: array) -> Iterator[float]:
+        return _clipped_diff(desired, goal)
+
+    def by_target(desired: array) -> array:
+        return goal
+
+    if policy is RebalancePolicy.TO_TARGET:
+        desired = goal
+    elif policy is RebalancePolicy.TO_BAND_EDGE:
+        floor = array("d", _scaled(columns.lowers, total))
+        ceil = array("d", _scaled(columns.uppers, total))
+        desired = array("d", map(min, map(max, values, floor), ceil))
+        residual = total - math.fsum(desired)
+        if residual >= 0.0:
+            stages = [toward_goal, lambda d: _clipped_diff(ceil, d), by_target]
+        else:
+            stages = [from_goal, lambda d: _clipped_diff(d, floor)]
+        desired = _fill(desired, residual, stages)
+    else:
+        desired = array("d", values)
+        if cash_flow >= 0.0:
+            desired = _fill(desired, cash_flow, [toward_goal, by_target])
+        else:
+            desired = _fill(desired, cash_flow, [from_goal])
+
+    trades = array("d", map(sub, desired, values))
+    return TradePlan(columns.ids, policy, total, trades)
+
+
+def rebalance(
+    target: TargetAllocation | ColumnarTargetAllocation,
+    holdings: Mapping[str, float],
+    cash_flow: float = 0.0,
+    policy: RebalancePolicy = RebalancePolicy.TO_TARGET,
+) -> TradePlan:
+    """Computes the trades that rebalance one account to a target allocation.
+
+    Args:
+        target: Target allocation. Its ratios must sum to 1.0.
+        holdings: Current holding value per asset id.
+        cash_flow: Cash added (positive) or withdrawn (negative).
+        policy: Rebalancing policy.
+
+    Returns:
+        The trade plan.
+
+    Raises:
+        TotalRatioMismatchError: If the target ratios do not sum to 1.0.
+        UnknownHoldingAssetError: If holdings contain ids absent from the target.
+        InsufficientFundsError: If the outflow exceeds the holdings value.
+    """
+    target.validate_total()
+    columns = target.columns()
+    return compute_trades(columns, align_holdings(columns, holdings), cash_flow, policy)
+
+
+def rebalance_batch(
+    target: TargetAllocation | ColumnarTargetAllocation,
+    holdings: Iterable[Mapping[str, float]],
+    cash_flows: Iterable[float] | None = None,
+    policy: RebalancePolicy = RebalancePolicy.TO_TARGET,
+) -> Iterator[TradePlan]:
+    """Computes trade plans for many accounts sharing one target allocation.
+
+    The target is validated and its columns are built once for the whole
+    batch; plans are yielded lazily in input order. When cash flows are
+    given, both inputs are read into lists first so their lengths can be
+    checked before any plan is computed.
+
+    Args:
+        target: Target allocation shared by all accounts.
+        holdings: Holdings snapshot of each account.
+        cash_flows: Cash flow of each account, or None for no flows.
+        policy: Rebalancing policy.
+
+    Yields:
+        One trade plan per account.
+
+    Raises:
+        TotalRatioMismatchError: If the target ratios do not sum to 1.0.
+        UnknownHoldingAssetError: If a snapshot contains ids absent from the target.
+        InsufficientFundsError: If an outflow exceeds the account's holdings value.
+        CashFlowCountMismatchError: If ``cash_flows`` and ``holdings`` differ in
+            length; raised before any plan is yielded.
+    """
+    if cash_flows is None:
+        accounts = zip(holdings, repeat(0.0))
+    else:
+        holdings, cash_flows = list(holdings), list(cash_flows)
+        if len(cash_flows) != len(holdings):
+            raise CashFlowCountMismatchError(
+                expected=len(holdings), actual=len(cash_flows)
+            )
+        accounts = zip(holdings, cash_flows, strict=True)
+    target.validate_total()
+    columns = target.columns()
+    known_ids = frozenset(columns.ids)
+    for account, cash_flow in accounts:
+        values = align_holdings(columns, account, known_ids)
+        yield compute_trades(columns, values, cash_flow, policy)
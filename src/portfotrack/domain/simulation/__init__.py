@@ -0,0 +1,31 @@
+from portfotrack.domain.simulation.simulation import (
+    BandResult,
+    BandSetting,
+    BatchTotals,
+    ReturnModel,
+    SimulationPlan,
+    SimulationReport,
+    absolute_bands,
+    current_bands,
+    plan_simulation,
+    relative_bands,
+    simulate,
+    simulate_batch,
+    summarize,
+)
+
+__all__ = [
+    "BandResult",
+    "BandSetting",
+    "BatchTotals",
+    "ReturnModel",
+    "SimulationPlan",
+    "SimulationReport",
+    "absolute_bands",
+    "current_bands",
+    "plan_simulation",
+    "relative_bands",
+    "simulate",
+    "simulate_batch",
+    "summarize",
+]
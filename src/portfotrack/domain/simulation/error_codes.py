@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class SimulationErrorCode(StrEnum):
+    SIMULATION_INVALID_MODEL = "SIMULATION.INVALID_MODEL"
+    SIMULATION_INVALID_BANDS = "SIMULATION.INVALID_BANDS"
+    SIMULATION_INVALID_SETTING = "SIMULATION.INVALID_SETTING"
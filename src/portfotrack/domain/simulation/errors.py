@@ -0,0 +1,88 @@
+from typing import Any
+
+from portfotrack.domain.errors import DomainError
+from portfotrack.domain.simulation.error_codes import SimulationErrorCode
+
+
+class SimulationError(DomainError):
+    """Base error for allocation simulation domain."""
+
+
+class InvalidReturnModelError(SimulationError):
+    """Raised when a return model is inconsistent or unusable.
+
+    Typical causes are a covariance matrix whose shape does not match the
+    assets, one that is not symmetric positive semidefinite, or a target
+    asset the model has no parameters for.
+
+    Attributes:
+        details: Contains:
+            - reason: Short description of the problem.
+    """
+
+    def __init__(
+        self,
+        *,
+        reason: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=SimulationErrorCode.SIMULATION_INVALID_MODEL,
+            message=f"Invalid return model: {reason}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"reason": reason})
+
+
+class InvalidBandSettingError(SimulationError):
+    """Raised when a band setting does not fit the simulated allocation.
+
+    Attributes:
+        details: Contains:
+            - label: Label of the offending band setting.
+            - reason: Short description of the problem.
+    """
+
+    def __init__(
+        self,
+        *,
+        label: str,
+        reason: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=SimulationErrorCode.SIMULATION_INVALID_BANDS,
+            message=f"Invalid band setting '{label}': {reason}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"label": label, "reason": reason})
+
+
+class InvalidSimulationSettingError(SimulationError):
+    """Raised when a simulation count setting is not a positive integer.
+
+    Attributes:
+        details: Contains:
+            - name: Name of the setting (e.g. ``paths``, ``max_workers``).
+            - value: The rejected value.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        value: int,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=SimulationErrorCode.SIMULATION_INVALID_SETTING,
+            message=f"Simulation setting '{name}' must be positive, got {value}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"name": name, "value": value})
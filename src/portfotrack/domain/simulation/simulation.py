@@ -0,0 +1,534 @@
+"""
+Monte Carlo simulation of allocation drift under tolerance bands.
+
+Asset prices follow a correlated geometric Brownian motion. Each path
+starts at the target weights and lets them drift step by step; whenever
+any weight leaves its band, the path is rebalanced back to target. Every
+band setting is run on the same simulated returns (common random
+numbers), so differences between settings are not sampling noise. For
+each setting the simulation reports:
+
+* rebalances per year: how often the bands are breached,
+* breach probability: the share of paths that breach at least once,
+* turnover per year: one-way traded fraction of the portfolio,
+* tracking error: annualized standard deviation of the banded
+  portfolio's per-step return minus that of a portfolio rebalanced to
+  target every step (the cost of letting weights drift).
+
+Paths are simulated in batches, and within a batch every quantity is a
+column over the batch's paths, updated with ``map`` over ``operator``
+and ``math`` functions so the per-element work runs in C. Normal draws
+come from a Box-Muller transform of ``random.Random`` uniforms. Each batch
+seeds its own generator from ``(seed, batch)``, so results depend only on
+the plan, not on which process or in which order batches run.
+"""
+
+import math
+import random
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from itertools import compress, repeat, starmap
+from math import fsum
+from operator import add, mul, or_, sub, truediv
+
+from portfotrack.domain.simulation.errors import (
+    InvalidBandSettingError,
+    InvalidReturnModelError,
+    InvalidSimulationSettingError,
+)
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+)
+
+_SYMMETRY_EPS = 1e-12
+
+
+def _cholesky(matrix: Sequence[Sequence[float]]) -> tuple[tuple[float, ...], ...]:
+    """Lower-triangular ``L`` with ``L @ L.T == matrix``, for a PSD matrix.
+
+    Raises:
+        InvalidReturnModelError: If the matrix is not positive semidefinite.
+    """
+    n = len(matrix)
+    lower = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1):
+            s = matrix[i][j] - fsum(lower[i][k] * lower[j][k] for k in range(j))
+            if i == j:
+                if s < -_SYMMETRY_EPS * max(abs(matrix[i][i]), 1.0):
+                    raise InvalidReturnModelError(
+                        reason="covariance is not positive semidefinite"
+                    )
+                lower[i][i] = math.sqrt(max(s, 0.0))
+            elif lower[j][j] > 0.0:
+                lower[i][j] = s / lower[j][j]
+    return tuple(map(tuple, lower))
+
+
+class ReturnModel:
+    """Correlated log-normal model of annual asset returns.
+
+    Attributes:
+        ids: Asset ids the model has parameters for.
+        mean: Expected annual (arithmetic) return per asset.
+        covariance: Annual covariance matrix of log returns, row-aligned
+            with ``ids``.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        mean: Sequence[float],
+        covariance: Sequence[Sequence[float]],
+    ) -> None:
+        """Validates and stores the model.
+
+        Raises:
+            InvalidReturnModelError: If ids repeat, shapes disagree, a value
+                is not finite, an expected return is -100% or less, or the
+                covariance is not symmetric positive semidefinite.
+        """
+        n = len(ids)
+        if len(set(ids)) != n:
+            raise InvalidReturnModelError(reason="asset ids must be unique")
+        if (
+            len(mean) != n
+            or len(covariance) != n
+            or any(len(row) != n for row in covariance)
+        ):
+            raise InvalidReturnModelError(
+                reason=f"mean and covariance must cover exactly {n} assets"
+            )
+        self.ids = tuple(ids)
+        self.mean = tuple(map(float, mean))
+        self.covariance = tuple(tuple(map(float, row)) for row in covariance)
+        values = [*self.mean, *(c for row in self.covariance for c in row)]
+        if not all(map(math.isfinite, values)):
+            raise InvalidReturnModelError(reason="parameters must be finite")
+        if any(m <= -1.0 for m in self.mean):
+            raise InvalidReturnModelError(reason="expected returns must be above -100%")
+        for i in range(n):
+            for j in range(i):
+                a, b = self.covariance[i][j], self.covariance[j][i]
+                if abs(a - b) > _SYMMETRY_EPS * max(abs(a), abs(b), 1.0):
+                    raise InvalidReturnModelError(reason="covariance is not symmetric")
+        _cholesky(self.covariance)
+
+    def volatility(self) -> dict[str, float]:
+        """Returns the annual volatility per asset id."""
+        return {
+            asset_id: math.sqrt(self.covariance[i][i])
+            for i, asset_id in enumerate(self.ids)
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BandSetting:
+    """One choice of tolerance bands, row-aligned with the target's columns.
+
+    Attributes:
+        label: Name of the setting in the report.
+        lowers: Lower weight bound per target row.
+        uppers: Upper weight bound per target row.
+    """
+
+    label: str
+    lowers: tuple[float, ...]
+    uppers: tuple[float, ...]
+
+
+def current_bands(
+    target: TargetAllocation | ColumnarTargetAllocation, label: str = "current"
+) -> BandSetting:
+    """Band setting of the target's own tolerances."""
+    columns = target.columns()
+    return BandSetting(label, tuple(columns.lowers), tuple(columns.uppers))
+
+
+def absolute_bands(
+    target: TargetAllocation | ColumnarTargetAllocation,
+    half_width: float,
+    label: str | None = None,
+) -> BandSetting:
+    """Band setting of ``ratio ± half_width`` for every row, clipped to [0, 1]."""
+    ratios = target.columns().ratios
+    return BandSetting(
+        f"±{half_width:g}" if label is None else label,
+        tuple(max(r - half_width, 0.0) for r in ratios),
+        tuple(min(r + half_width, 1.0) for r in ratios),
+    )
+
+
+def relative_bands(
+    target: TargetAllocation | ColumnarTargetAllocation,
+    fraction: float,
+    label: str | None = None,
+) -> BandSetting:
+    """Band setting of ``ratio * (1 ± fraction)`` for every row, clipped to [0, 1]."""
+    ratios = target.columns().ratios
+    return BandSetting(
+        f"±{fraction:.0%} of target" if label is None else label,
+        tuple(max(r * (1.0 - fraction), 0.0) for r in ratios),
+        tuple(min(r * (1.0 + fraction), 1.0) for r in ratios),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationPlan:
+    """A fully resolved simulation, ready to run batch by batch.
+
+    Plans are plain data and pickle cheaply, so batches can be run in
+    worker processes. Build them with ``plan_simulation``.
+
+    Attributes:
+        ids: Simulated asset ids, in target row order.
+        ratios: Target weight per row.
+        drifts: Log drift per row and step.
+        shocks: Cholesky factor of the per-step covariance, row-aligned.
+        bands: Band settings to compare.
+        paths: Total number of simulated paths.
+        years: Simulated horizon in years.
+        steps_per_year: Simulation steps per year (252 for trading days).
+        seed: Seed of the run.
+        batch_size: Paths per batch.
+    """
+
+    ids: tuple[str, ...]
+    ratios: tuple[float, ...]
+    drifts: tuple[float, ...]
+    shocks: tuple[tuple[float, ...], ...]
+    bands: tuple[BandSetting, ...]
+    paths: int
+    years: int
+    steps_per_year: int
+    seed: int
+    batch_size: int
+
+    @property
+    def batches(self) -> int:
+        """Number of batches the paths are split into."""
+        return -(-self.paths // self.batch_size)
+
+    def batch_paths(self, batch: int) -> int:
+        """Number of paths in batch ``batch``."""
+        return min(self.batch_size, self.paths - batch * self.batch_size)
+
+
+def plan_simulation(
+    target: TargetAllocation | ColumnarTargetAllocation,
+    model: ReturnModel,
+    bands: Iterable[BandSetting],
+    *,
+    paths: int = 10_000,
+    years: int = 20,
+    steps_per_year: int = 252,
+    seed: int = 0,
+    batch_size: int = 1_000,
+    eps: float = 1e-6,
+) -> SimulationPlan:
+    """Resolves a target, a return model and band settings into a plan.
+
+    Args:
+        target: Allocation to simulate; its ratios must sum to 1.0.
+        model: Return model covering every asset of ``target``.
+        bands: Band settings to compare, row-aligned with ``target``.
+        paths: Number of simulated paths.
+        years: Horizon in years.
+        steps_per_year: Steps per year; bands are checked after each step.
+        seed: Seed making the run reproducible.
+        batch_size: Paths per batch. Larger batches amortize per-step
+            overhead; results depend on it, since each batch draws its
+            own random numbers.
+        eps: Allowed deviation of the target's ratio total from 1.0.
+
+    Raises:
+        InvalidSimulationSettingError: If a count is not positive.
+        TotalRatioMismatchError: If the target ratios do not sum to 1.0.
+        InvalidReturnModelError: If the model lacks an asset of the target.
+        InvalidBandSettingError: If a band setting has the wrong number of
+            rows, a repeated label, or does not contain its target ratio.
+    """
+    for name, value in (
+        ("paths", paths),
+        ("years", years),
+        ("steps_per_year", steps_per_year),
+        ("batch_size", batch_size),
+    ):
+        if value < 1:
+            raise InvalidSimulationSettingError(name=name, value=value)
+
+    target.validate_total(eps)
+    columns = target.columns()
+    ratios = tuple(columns.ratios)
+
+    index = {asset_id: i for i, asset_id in enumerate(model.ids)}
+    missing = [asset_id for asset_id in columns.ids if asset_id not in index]
+    if missing:
+        raise InvalidReturnModelError(reason=f"no parameters for asset '{missing[0]}'")
+    rows = [index[asset_id] for asset_id in columns.ids]
+
+    dt = 1.0 / steps_per_year
+    cov = model.covariance
+    drifts = tuple((math.log1p(model.mean[r]) - 0.5 * cov[r][r]) * dt for r in rows)
+    shocks = _cholesky([[cov[a][b] * dt for b in rows] for a in rows])
+
+    # Floats throughout: the kernel compares with bound ``float`` methods.
+    settings = tuple(
+        BandSetting(
+            band.label, tuple(map(float, band.lowers)), tuple(map(float, band.uppers))
+        )
+        for band in bands
+    )
+    labels = [band.label for band in settings]
+    for band in settings:
+        if labels.count(band.label) > 1:
+            raise InvalidBandSettingError(label=band.label, reason="label repeats")
+        if len(band.lowers) != len(ratios) or len(band.uppers) != len(ratios):
+            raise InvalidBandSettingError(
+                label=band.label, reason=f"expected {len(ratios)} rows"
+            )
+        for asset_id, ratio, lower, upper in zip(
+            columns.ids, ratios, band.lowers, band.uppers, strict=True
+        ):
+            if not lower <= ratio <= upper:
+                raise InvalidBandSettingError(
+                    label=band.label,
+                    reason=f"target {ratio} of '{asset_id}' is outside "
+                    f"[{lower}, {upper}]",
+                )
+
+    return SimulationPlan(
+        tuple(columns.ids),
+        ratios,
+        drifts,
+        shocks,
+        settings,
+        paths,
+        years,
+        steps_per_year,
+        seed,
+        batch_size,
+    )
+
+
+@dataclass(slots=True)
+class BatchTotals:
+    """Summed outcomes of some paths, one entry per band setting.
+
+    Attributes:
+        paths: Number of paths summed.
+        rebalances: Number of rebalances.
+        breached_paths: Number of paths that breached at least once.
+        turnover: Sum of one-way turnover over all rebalances.
+        tracking_error: Sum of the per-path annualized tracking errors.
+    """
+
+    paths: int
+    rebalances: list[int]
+    breached_paths: list[int]
+    turnover: list[float]
+    tracking_error: list[float]
+
+    def merge(self, other: "BatchTotals") -> None:
+        """Adds another batch's totals to these."""
+        self.paths += other.paths
+        for mine, theirs in (
+            (self.rebalances, other.rebalances),
+            (self.breached_paths, other.breached_paths),
+            (self.turnover, other.turnover),
+            (self.tracking_error, other.tracking_error),
+        ):
+            mine[:] = map(add, mine, theirs)
+
+
+def _normals(uniform: random.Random, count: int) -> list[float]:
+    """At least ``count`` standard normal draws (Box-Muller)."""
+    half = (count + 1) // 2
+    draw = uniform.random
+    # 1 - u lies in (0, 1], so the logarithm is always defined.
+    u1 = map(sub, repeat(1.0), starmap(draw, repeat((), half)))
+    radius = list(map(math.sqrt, map(mul, repeat(-2.0), map(math.log, u1))))
+    theta = list(map(mul, repeat(math.tau), starmap(draw, repeat((), half))))
+    normals = list(map(mul, radius, map(math.cos, theta)))
+    normals.extend(map(mul, radius, map(math.sin, theta)))
+    return normals
+
+
+def simulate_batch(plan: SimulationPlan, batch: int) -> BatchTotals:
+    """Simulates the paths of one batch of a plan.
+
+    Args:
+        plan: The simulation plan.
+        batch: Batch index, in ``range(plan.batches)``.
+
+    Returns:
+        The batch's totals per band setting.
+    """
+    k = plan.batch_paths(batch)
+    n = len(plan.ratios)
+    steps = plan.years * plan.steps_per_year
+    uniform = random.Random(f"{plan.seed}/{batch}")
+
+    weights = [[[ratio] * k for ratio in plan.ratios] for _ in plan.bands]
+    diff_sum = [[0.0] * k for _ in plan.bands]
+    diff_sq = [[0.0] * k for _ in plan.bands]
+    breached = [[False] * k for _ in plan.bands]
+    rebalances = [0] * len(plan.bands)
+    turnover: list[list[float]] = [[] for _ in plan.bands]
+    below = [[lower.__gt__ for lower in band.lowers] for band in plan.bands]
+    above = [[upper.__lt__ for upper in band.uppers] for band in plan.bands]
+
+    for _ in range(steps):
+        z = _normals(uniform, n * k)
+        draws = [z[j * k : (j + 1) * k] for j in range(n)]
+        growth = []
+        for drift, row in zip(plan.drifts, plan.shocks, strict=True):
+            log_growth = map(add, repeat(drift), map(mul, repeat(row[0]), draws[0]))
+            for j in range(1, n):
+                if row[j]:
+                    log_growth = map(
+                        add, log_growth, map(mul, repeat(row[j]), draws[j])
+                    )
+            growth.append(list(map(math.exp, log_growth)))
+
+        # Growth of a portfolio held at target weights through every step.
+        benchmark = map(mul, repeat(plan.ratios[0]), growth[0])
+        for ratio, column in zip(plan.ratios[1:], growth[1:], strict=True):
+            benchmark = map(add, benchmark, map(mul, repeat(ratio), column))
+        benchmark = list(benchmark)
+
+        for s, w in enumerate(weights):
+            grown = [list(map(mul, wi, gi)) for wi, gi in zip(w, growth, strict=True)]
+            total = grown[0]
+            for column in grown[1:]:
+                total = list(map(add, total, column))
+            w = [list(map(truediv, column, total)) for column in grown]
+
+            diff = list(map(sub, total, benchmark))
+            diff_sum[s] = list(map(add, diff_sum[s], diff))
+            diff_sq[s] = list(map(add, diff_sq[s], map(mul, diff, diff)))
+
+            # Breaches are rare: a min/max scan per column rules most steps
+            # out before the per-path breach flags are built.
+            band = plan.bands[s]
+            if any(
+                min(column) < lower or max(column) > upper
+                for column, lower, upper in zip(
+                    w, band.lowers, band.uppers, strict=True
+                )
+            ):
+                out = map(or_, map(below[s][0], w[0]), map(above[s][0], w[0]))
+                for i in range(1, n):
+                    out = map(or_, out, map(below[s][i], w[i]))
+                    out = map(or_, out, map(above[s][i], w[i]))
+                flags = breached[s]
+                for p in compress(range(k), out):
+                    turnover[s].append(
+                        0.5 * fsum(abs(w[i][p] - plan.ratios[i]) for i in range(n))
+                    )
+                    for i in range(n):
+                        w[i][p] = plan.ratios[i]
+                    flags[p] = True
+                    rebalances[s] += 1
+            weights[s] = w
+
+    scale = plan.steps_per_year
+    tracking = []
+    for sums, squares in zip(diff_sum, diff_sq, strict=True):
+        tracking.append(
+            fsum(
+                math.sqrt(max(sq / steps - (sm / steps) ** 2, 0.0) * scale)
+                for sm, sq in zip(sums, squares, strict=True)
+            )
+        )
+    return BatchTotals(
+        k,
+        rebalances,
+        [sum(flags) for flags in breached],
+        [fsum(amounts) for amounts in turnover],
+        tracking,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class BandResult:
+    """Simulated outcome of one band setting.
+
+    Attributes:
+        label: Label of the band setting.
+        rebalances_per_year: Mean number of band breaches (and thus
+            rebalances) per path and year.
+        breach_probability: Share of paths that breached at least once
+            over the horizon.
+        turnover_per_year: Mean one-way turnover per path and year, as a
+            fraction of portfolio value.
+        tracking_error: Mean annualized tracking error against a portfolio
+            rebalanced to target at every step.
+    """
+
+    label: str
+    rebalances_per_year: float
+    breach_probability: float
+    turnover_per_year: float
+    tracking_error: float
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationReport:
+    """Outcome of a simulation run.
+
+    Attributes:
+        paths: Number of simulated paths.
+        years: Simulated horizon in years.
+        steps_per_year: Simulation steps per year.
+        seed: Seed of the run.
+        bands: One result per band setting, in plan order.
+    """
+
+    paths: int
+    years: int
+    steps_per_year: int
+    seed: int
+    bands: tuple[BandResult, ...]
+
+    def by_label(self) -> dict[str, BandResult]:
+        """Returns the band results keyed by label."""
+        return {band.label: band for band in self.bands}
+
+
+def summarize(plan: SimulationPlan, batches: Iterable[BatchTotals]) -> SimulationReport:
+    """Merges batch totals, in the order given, into a report.
+
+    Args:
+        plan: The plan the batches were simulated from.
+        batches: Totals of every batch of the plan.
+    """
+    settings = len(plan.bands)
+    totals = BatchTotals(
+        0, [0] * settings, [0] * settings, [0.0] * settings, [0.0] * settings
+    )
+    for batch in batches:
+        totals.merge(batch)
+    path_years = totals.paths * plan.years
+    return SimulationReport(
+        plan.paths,
+        plan.years,
+        plan.steps_per_year,
+        plan.seed,
+        tuple(
+            BandResult(
+                band.label,
+                totals.rebalances[s] / path_years,
+                totals.breached_paths[s] / totals.paths,
+                totals.turnover[s] / path_years,
+                totals.tracking_error[s] / totals.paths,
+            )
+            for s, band in enumerate(plan.bands)
+        ),
+    )
+
+
+def simulate(plan: SimulationPlan) -> SimulationReport:
+    """Runs every batch of a plan in the calling process."""
+    return summarize(plan, (simulate_batch(plan, b) for b in range(plan.batches)))
@@ -0,0 +1,3 @@
+from portfotrack.domain.snapshot.snapshot import HoldingsSnapshot
+
+__all__ = ["HoldingsSnapshot"]
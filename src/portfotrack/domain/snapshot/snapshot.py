@@ -0,0 +1,36 @@
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import date
+
+
+@dataclass(frozen=True, slots=True)
+class HoldingsSnapshot:
+    """End-of-day holdings of a portfolio, keyed by ``Asset.id``.
+
+    Attributes:
+        as_of: The day the snapshot was taken.
+        holdings: Holding value per asset id. Assets that are not held
+            are simply absent.
+    """
+
+    as_of: date
+    holdings: Mapping[str, float] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.holdings)
+
+    def total(self) -> float:
+        """Returns the correctly rounded total value of all holdings."""
+        return math.fsum(self.holdings.values())
+
+    def allocation(self) -> dict[str, float]:
+        """Returns the share of the total value held in each asset.
+
+        Returns:
+            Ratio per asset id, or an empty dict if the total is not positive.
+        """
+        total = self.total()
+        if not total > 0.0:
+            return {}
+        return {asset_id: value / total for asset_id, value in self.holdings.items()}
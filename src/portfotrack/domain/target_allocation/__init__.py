@@ -1,3 +1,21 @@
-from portfotrack.domain.target_allocation.target import TargetAllocation, Tolerance
+from portfotrack.domain.target_allocation.columnar import ColumnarTargetAllocation
+from portfotrack.domain.target_allocation.target import (
+    TargetAllocation,
+    TargetColumns,
+    Tolerance,
+)
+from portfotrack.domain.target_allocation.versioned import (
+    AllocationDiff,
+    AllocationVersion,
+)
+from portfotrack.domain.target_allocation.views import DerivedViews
 
-__all__ = ["TargetAllocation", "Tolerance"]
+__all__ = [
+    "AllocationDiff",
+    "AllocationVersion",
+    "ColumnarTargetAllocation",
+    "DerivedViews",
+    "TargetAllocation",
+    "TargetColumns",
+    "Tolerance",
+]
@@ -0,0 +1,313 @@
+from array import array
+from collections.abc import Iterable
+from operator import attrgetter
+
+from portfotrack.common.instrumentation import instrumented
+from portfotrack.common.summation import ExactSum
+from portfotrack.domain.asset.asset import Asset
+from portfotrack.domain.target_allocation.errors import (
+    AssetNotFoundError,
+    BulkValidationError,
+    DuplicateAssetError,
+)
+from portfotrack.domain.target_allocation.target import (
+    TargetAllocation,
+    TargetColumns,
+    TargetEntry,
+    Tolerance,
+    transpose_entries,
+    validate_entries,
+    validate_entry,
+    validate_total_ratio,
+)
+from portfotrack.domain.target_allocation.views import DerivedViews
+
+
+class ColumnarTargetAllocation:
+    """Array-backed target allocation for very large portfolios.
+
+    This is an alternative backing for TargetAllocation that stores each
+    attribute in its own column instead of one ``(ratio, Tolerance)`` tuple
+    per Asset key. Assets are addressed by row through an ``id -> row``
+    index, and numeric values live in contiguous float64 arrays, so an
+    entry costs a handful of machine words rather than several Python
+    objects.
+
+    The public contract of ``add_asset``, ``total_ratio`` and
+    ``validate_total`` is identical to TargetAllocation, including the
+    raised errors and their order of evaluation. Like TargetAllocation, the
+    ratio total and ``version`` are maintained by the mutators, so the
+    columns must only be changed through ``add_asset``, ``add_assets`` and
+    ``remove_asset``.
+
+    Attributes:
+        ids: Asset identifiers, one per row.
+        names: Asset display names, one per row.
+        purposes: Asset purposes, one per row.
+        ratios: Target ratio column (float64).
+        lowers: Lower tolerance bound column (float64).
+        uppers: Upper tolerance bound column (float64).
+        version: Number of successful mutations so far.
+    """
+
+    __slots__ = (
+        "_index",
+        "_total",
+        "_views",
+        "version",
+        "ids",
+        "names",
+        "purposes",
+        "ratios",
+        "lowers",
+        "uppers",
+    )
+
+    def __init__(self) -> None:
+        self._index: dict[str, int] = {}
+        self._total = ExactSum()
+        self._views: DerivedViews | None = None
+        self.version = 0
+        self.ids: list[str] = []
+        self.names: list[str] = []
+        self.purposes: list[str] = []
+        self.ratios = array("d")
+        self.lowers = array("d")
+        self.uppers = array("d")
+
+    @classmethod
+    def from_target(cls, target: TargetAllocation) -> "ColumnarTargetAllocation":
+        """Builds a columnar allocation from a dict-backed TargetAllocation.
+
+        Args:
+            target: Source allocation. It is not modified.
+
+        Returns:
+            A new ColumnarTargetAllocation holding the same entries.
+        """
+        columnar = cls()
+        for asset, (ratio, tolerance) in target.target_assets.items():
+            columnar._append(asset, ratio, tolerance["lower"], tolerance["upper"])
+        return columnar
+
+    @classmethod
+    def from_columns(
+        cls,
+        ids: Iterable[str],
+        names: Iterable[str],
+        purposes: Iterable[str],
+        ratios: Iterable[float],
+        lowers: Iterable[float],
+        uppers: Iterable[float],
+    ) -> "ColumnarTargetAllocation":
+        """Builds a columnar allocation directly from trusted columns.
+
+        The columns are copied as-is without entry validation, so this is
+        meant for loading data that was validated when it was written
+        (e.g. by the storage layer). Use ``add_assets`` for untrusted input.
+
+        Returns:
+            A new ColumnarTargetAllocation holding the given rows.
+        """
+        columnar = cls()
+        columnar.ids.extend(ids)
+        columnar.names.extend(names)
+        columnar.purposes.extend(purposes)
+        columnar.ratios.extend(ratios)
+        columnar.lowers.extend(lowers)
+        columnar.uppers.extend(uppers)
+        columnar._index.update(zip(columnar.ids, range(len(columnar.ids)), strict=True))
+        columnar._total.extend(columnar.ratios)
+        return columnar
+
+    def to_target(self) -> TargetAllocation:
+        """Materializes this allocation as a dict-backed TargetAllocation.
+
+        Returns:
+            A new TargetAllocation holding the same entries.
+        """
+        return TargetAllocation(target_assets=self.target_assets)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, asset: object) -> bool:
+        if isinstance(asset, Asset):
+            return asset.id in self._index
+        return asset in self._index
+
+    def row_of(self, asset_id: str) -> int | None:
+        """Returns the row index of an asset id, or None if absent."""
+        return self._index.get(asset_id)
+
+    def asset_at(self, row: int) -> Asset:
+        """Rebuilds the Asset stored at the given row."""
+        return Asset(self.ids[row], self.names[row], self.purposes[row])
+
+    def get(self, asset: Asset) -> tuple[float, Tolerance] | None:
+        """Looks up the target entry of an asset.
+
+        Args:
+            asset: Asset to look up (matched by id).
+
+        Returns:
+            The ``(target_ratio, tolerance)`` pair, or None if absent.
+        """
+        row = self._index.get(asset.id)
+        if row is None:
+            return None
+        return self.ratios[row], {"lower": self.lowers[row], "upper": self.uppers[row]}
+
+    @property
+    def target_assets(self) -> dict[Asset, tuple[float, Tolerance]]:
+        """Mapping view equivalent to ``TargetAllocation.target_assets``.
+
+        The mapping is built on every access and is not shared with this
+        instance, so prefer the columns on hot paths.
+        """
+        return {
+            self.asset_at(row): (
+                self.ratios[row],
+                {"lower": self.lowers[row], "upper": self.uppers[row]},
+            )
+            for row in range(len(self.ids))
+        }
+
+    @instrumented("ColumnarTargetAllocation.add_asset")
+    def add_asset(
+        self, asset: Asset, target_ratio: float, tolerance: Tolerance
+    ) -> None:
+        """Adds a new asset target to the allocation.
+
+        Args:
+            asset: Asset to add to the target allocation.
+            target_ratio: Desired allocation ratio for the asset,
+                expressed as a float between 0.0 and 1.0.
+            tolerance: Acceptable allocation bounds for the asset.
+
+        Raises:
+            DuplicateAssetError: If the asset already exists in the allocation.
+            InvalidTargetRatioError: If target_ratio is outside [0.0, 1.0].
+            InvalidToleranceBoundsError: If tolerance.lower is greater than tolerance.upper.
+            InvalidToleranceBoundsError: If tolerance bounds are outside [0.0, 1.0].
+        """
+        if asset.id in self._index:
+            raise DuplicateAssetError(asset_id=asset.id, asset_name=asset.name)
+
+        lo, hi = tolerance["lower"], tolerance["upper"]
+        validate_entry(target_ratio, lo, hi)
+
+        self._append(asset, target_ratio, lo, hi)
+
+    @instrumented("ColumnarTargetAllocation.add_assets")
+    def add_assets(self, entries: Iterable[TargetEntry]) -> None:
+        """Adds many asset targets to the allocation atomically.
+
+        The whole batch is validated in a single pass before anything is
+        added, then appended column by column.
+
+        Args:
+            entries: Rows of ``(asset, target_ratio, lower, upper)``.
+
+        Raises:
+            BulkValidationError: If any row is invalid. No row is added.
+        """
+        assets, ratios, lowers, uppers = transpose_entries(entries)
+        ids = list(map(attrgetter("id"), assets))
+        row_errors = validate_entries(ids, assets, ratios, lowers, uppers, self._index)
+        if row_errors:
+            raise BulkValidationError(row_errors=row_errors)
+
+        start = len(self.ids)
+        self._index.update(zip(ids, range(start, start + len(ids)), strict=True))
+        self.ids.extend(ids)
+        self.names.extend(map(attrgetter("name"), assets))
+        self.purposes.extend(map(attrgetter("purpose"), assets))
+        self.ratios.extend(ratios)
+        self.lowers.extend(lowers)
+        self.uppers.extend(uppers)
+        self._total.extend(ratios)
+        self.version += 1
+
+    @instrumented("ColumnarTargetAllocation.remove_asset")
+    def remove_asset(self, asset: Asset) -> None:
+        """Removes an asset target from the allocation.
+
+        The last row is moved into the freed slot, so removal is constant
+        time but does not preserve row order.
+
+        Args:
+            asset: Asset to remove (matched by id).
+
+        Raises:
+            AssetNotFoundError: If the asset is not in the allocation.
+        """
+        row = self._index.pop(asset.id, None)
+        if row is None:
+            raise AssetNotFoundError(asset_id=asset.id)
+        self._total.subtract(self.ratios[row])
+
+        columns = (
+            self.ids,
+            self.names,
+            self.purposes,
+            self.ratios,
+            self.lowers,
+            self.uppers,
+        )
+        last = len(self.ids) - 1
+        if row != last:
+            for column in columns:
+                column[row] = column[last]
+            self._index[self.ids[row]] = row
+        for column in columns:
+            del column[last]
+        self.version += 1
+
+    def _append(self, asset: Asset, ratio: float, lower: float, upper: float) -> None:
+        self._index[asset.id] = len(self.ids)
+        self.ids.append(asset.id)
+        self.names.append(asset.name)
+        self.purposes.append(asset.purpose)
+        self.ratios.append(ratio)
+        self.lowers.append(lower)
+        self.uppers.append(upper)
+        self._total.add(ratio)
+        self.version += 1
+
+    @property
+    def views(self) -> DerivedViews:
+        """Cache of derived views, rebuilt lazily after each mutation."""
+        if self._views is None:
+            self._views = DerivedViews(self)
+        return self._views
+
+    def columns(self) -> TargetColumns:
+        """Returns the column-oriented view of the allocation.
+
+        The returned columns are the live backing storage and are not
+        copied; callers must treat them as read-only.
+        """
+        return TargetColumns(self.ids, self.ratios, self.lowers, self.uppers)
+
+    def total_ratio(self) -> float:
+        """Returns the sum of all target allocation ratios.
+
+        The sum is maintained incrementally and is correctly rounded, so
+        this is constant time.
+
+        Returns:
+            Sum of target ratios across all assets.
+        """
+        return self._total.value
+
+    def validate_total(self, eps: float = 1e-6) -> None:
+        """Validates that total target allocation sums to 1.0.
+
+        Args:
+            eps: Allowed numerical tolerance when comparing against 1.0.
+
+        Raises:
+            TotalRatioMismatchError: If the total allocation deviates from 1.0 beyond eps.
+        """
+        validate_total_ratio(self.total_ratio(), eps)
@@ -1,5 +1,6 @@
 from typing import Any
 
+from portfotrack.common.errors import AppError
 from portfotrack.domain.errors import DomainError
 from portfotrack.domain.target_allocation.error_codes import TargetErrorCode
 
@@ -34,6 +35,30 @@ class DuplicateAssetError(TargetAllocationError):
         self.details.update({"asset_id": asset_id, "asset_name": asset_name})
 
 
+class AssetNotFoundError(TargetAllocationError):
+    """Raised when referring to an asset that is not in the target allocation.
+
+    Attributes:
+        details: Contains:
+            - asset_id: The identifier of the missing asset.
+    """
+
+    def __init__(
+        self,
+        *,
+        asset_id: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=TargetErrorCode.TARGET_ASSET_NOT_FOUND,
+            message=f"Asset {asset_id} is not present in the target allocation.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"asset_id": asset_id})
+
+
 class InvalidTargetRatioError(TargetAllocationError):
     """Raised when a target allocation ratio is outside the valid range.
 
@@ -122,3 +147,46 @@ class TotalRatioMismatchError(TargetAllocationError):
             cause=cause,
         )
         self.details.update({"total": total, "expected": expected, "eps": eps})
+
+
+class BulkValidationError(TargetAllocationError):
+    """Raised when one or more rows of a bulk asset addition are invalid.
+
+    Every invalid row of the batch is reported, not only the first one, and
+    none of the rows is added to the target allocation.
+
+    Attributes:
+        details: Contains:
+            - error_count: Number of invalid rows.
+            - rows: One entry per invalid row, in row order, each with
+              ``row`` (zero-based index in the batch), ``code``, ``message``
+              and ``details`` of the row-level error.
+    """
+
+    def __init__(
+        self,
+        *,
+        row_errors: list[tuple[int, AppError]],
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=TargetErrorCode.TARGET_BULK_VALIDATION_FAILED,
+            message=f"{len(row_errors)} row(s) failed validation; no assets were added.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update(
+            {
+                "error_count": len(row_errors),
+                "rows": [
+                    {
+                        "row": row,
+                        "code": error.code,
+                        "message": error.message,
+                        "details": error.details,
+                    }
+                    for row, error in row_errors
+                ],
+            }
+        )
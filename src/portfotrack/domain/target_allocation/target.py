@@ -1,13 +1,26 @@
+from array import array
+from collections.abc import Container, Hashable, Iterable, Sequence
 from dataclasses import dataclass, field
+from itertools import compress, count, repeat
+from operator import and_, le, not_, or_
 from typing import TypedDict
 
+from portfotrack.common.instrumentation import instrumented
+from portfotrack.common.summation import ExactSum
 from portfotrack.domain.asset.asset import Asset
 from portfotrack.domain.target_allocation.errors import (
+    AssetNotFoundError,
+    BulkValidationError,
     DuplicateAssetError,
     InvalidTargetRatioError,
     InvalidToleranceBoundsError,
+    TargetAllocationError,
     TotalRatioMismatchError,
 )
+from portfotrack.domain.target_allocation.views import DerivedViews
+
+TargetEntry = tuple[Asset, float, float, float]
+"""A bulk-ingestion row: ``(asset, target_ratio, lower, upper)``."""
 
 
 class Tolerance(TypedDict):
@@ -27,6 +40,143 @@ class Tolerance(TypedDict):
     upper: float
 
 
+@dataclass(frozen=True, slots=True)
+class TargetColumns:
+    """Column-oriented view of a target allocation.
+
+    Rows are aligned across all columns: row ``i`` of every column
+    describes the asset ``ids[i]``. This is the input format of the
+    vectorized kernels (e.g. drift detection) so they can run without
+    touching per-asset objects. Numeric columns are float64 arrays, or
+    float64 memoryviews when backed by a memory-mapped file.
+
+    Attributes:
+        ids: Asset identifiers, one per row.
+        ratios: Target ratio column (float64).
+        lowers: Lower tolerance bound column (float64).
+        uppers: Upper tolerance bound column (float64).
+    """
+
+    ids: Sequence[str]
+    ratios: array | memoryview
+    lowers: array | memoryview
+    uppers: array | memoryview
+
+
+def validate_entry(target_ratio: float, lower: float, upper: float) -> None:
+    """Validates a single target ratio and its tolerance bounds.
+
+    Shared by every TargetAllocation backing so that all of them enforce
+    exactly the same entry-level contract.
+
+    Args:
+        target_ratio: Desired allocation ratio for the asset.
+        lower: Lower tolerance bound.
+        upper: Upper tolerance bound.
+
+    Raises:
+        InvalidTargetRatioError: If target_ratio is outside [0.0, 1.0].
+        InvalidToleranceBoundsError: If lower is greater than upper, or the
+            bounds are outside [0.0, 1.0] (NaN included).
+    """
+    if not (0.0 <= target_ratio <= 1.0):
+        raise InvalidTargetRatioError(target_ratio=target_ratio)
+
+    if not (0.0 <= lower <= upper <= 1.0):
+        raise InvalidToleranceBoundsError(lower=lower, upper=upper)
+
+
+def validate_total_ratio(total: float, eps: float = 1e-6) -> None:
+    """Validates that a total of target ratios is 1.0 within ``eps``.
+
+    Shared by every ``validate_total`` implementation and by callers that
+    hold only the ratio columns of an allocation.
+
+    Args:
+        total: Sum of the target ratios.
+        eps: Allowed numerical tolerance when comparing against 1.0.
+
+    Raises:
+        TotalRatioMismatchError: If the total deviates from 1.0 beyond eps.
+    """
+    if abs(total - 1.0) > eps:
+        raise TotalRatioMismatchError(total=total, expected=1.0, eps=eps)
+
+
+def _in_unit_interval(values: Sequence[float]) -> Iterable[bool]:
+    return map(and_, map(le, repeat(0.0), values), map(le, values, repeat(1.0)))
+
+
+def transpose_entries(
+    entries: Iterable[TargetEntry],
+) -> tuple[Sequence[Asset], Sequence[float], Sequence[float], Sequence[float]]:
+    """Splits bulk-ingestion rows into ``(assets, ratios, lowers, uppers)``."""
+    rows = list(entries)
+    if not rows:
+        return (), (), (), ()
+    assets, ratios, lowers, uppers = zip(*rows, strict=True)
+    return assets, ratios, lowers, uppers
+
+
+def validate_entries(
+    keys: Sequence[Hashable],
+    assets: Sequence[Asset],
+    target_ratios: Sequence[float],
+    lowers: Sequence[float],
+    uppers: Sequence[float],
+    existing: Container[Hashable],
+) -> list[tuple[int, TargetAllocationError]]:
+    """Validates a whole batch of target entries at once.
+
+    The range and ordering checks of ``validate_entry`` are evaluated over
+    entire columns in a single vectorized pass; per-row error objects are
+    only built for the rows that failed. A row is reported with the same
+    error ``add_asset`` would raise for it, checked in the same order.
+
+    Args:
+        keys: Row keys used for duplicate detection (e.g. assets or ids).
+        assets: Asset of each row, used for error details.
+        target_ratios: Target ratio of each row.
+        lowers: Lower tolerance bound of each row.
+        uppers: Upper tolerance bound of each row.
+        existing: Keys already present in the target allocation.
+
+    Returns:
+        ``(row, error)`` pairs for every invalid row, in row order. Empty if
+        the whole batch is valid.
+    """
+    valid = map(
+        and_,
+        map(and_, _in_unit_interval(target_ratios), map(le, lowers, uppers)),
+        map(and_, map(le, repeat(0.0), lowers), map(le, uppers, repeat(1.0))),
+    )
+    present = map(existing.__contains__, keys)
+    bad_rows = set(compress(count(), map(or_, present, map(not_, valid))))
+
+    duplicated_rows: set[int] = set()
+    if len(set(keys)) != len(keys):
+        seen: set[Hashable] = set()
+        for row, key in enumerate(keys):
+            if key in seen:
+                duplicated_rows.add(row)
+            seen.add(key)
+        bad_rows |= duplicated_rows
+
+    errors: list[tuple[int, TargetAllocationError]] = []
+    for row in sorted(bad_rows):
+        asset = assets[row]
+        if row in duplicated_rows or keys[row] in existing:
+            errors.append(
+                (row, DuplicateAssetError(asset_id=asset.id, asset_name=asset.name))
+            )
+            continue
+        try:
+            validate_entry(target_ratios[row], lowers[row], uppers[row])
+        except TargetAllocationError as e:
+            errors.append((row, e))
+    return errors
+
+
 @dataclass
 class TargetAllocation:
     """Represents the target asset allocation of the portfolio.
@@ -38,22 +188,37 @@ class TargetAllocation:
     On initialization, the internal target asset mapping is defensively
     copied to prevent external mutation from affecting this instance.
 
+    The total of all target ratios is maintained incrementally by the
+    mutators (``add_asset``, ``add_assets``, ``remove_asset``), so
+    ``total_ratio`` and ``validate_total`` are constant time. The mutators
+    also bump ``version``, which invalidates the cached ``views``.
+    ``target_assets`` must therefore only be changed through those methods.
+
     Attributes:
         target_assets: Mapping of Asset to a tuple of
             (target_ratio, tolerance). The mapping is copied on
             initialization and is not shared with external callers.
+        version: Number of successful mutations so far.
     """
 
     target_assets: dict[Asset, tuple[float, Tolerance]] = field(default_factory=dict)
+    version: int = field(default=0, init=False, repr=False, compare=False)
+    _total: ExactSum = field(init=False, repr=False, compare=False)
+    _views: DerivedViews | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Defensively copies the target asset mapping.
 
         This prevents external mutation of the dictionary passed at
-        construction time from affecting the internal state.
+        construction time from affecting the internal state, and seeds
+        the running total of target ratios.
         """
         self.target_assets = dict(self.target_assets)
+        self._total = ExactSum(r for r, _ in self.target_assets.values())
 
+    @instrumented("TargetAllocation.add_asset")
     def add_asset(
         self, asset: Asset, target_ratio: float, tolerance: Tolerance
     ) -> None:
@@ -78,24 +243,96 @@ class TargetAllocation:
         if asset in self.target_assets:
             raise DuplicateAssetError(asset_id=asset.id, asset_name=asset.name)
 
-        if not (0.0 <= target_ratio <= 1.0):
-            raise InvalidTargetRatioError(target_ratio=target_ratio)
-
-        lo, hi = tolerance["lower"], tolerance["upper"]
-        if lo > hi:
-            raise InvalidToleranceBoundsError(lower=lo, upper=hi)
-        if lo < 0.0 or hi > 1.0:
-            raise InvalidToleranceBoundsError(lower=lo, upper=hi)
+        validate_entry(target_ratio, tolerance["lower"], tolerance["upper"])
 
         self.target_assets[asset] = (target_ratio, tolerance)
+        self._total.add(target_ratio)
+        self.version += 1
+
+    @instrumented("TargetAllocation.add_assets")
+    def add_assets(self, entries: Iterable[TargetEntry]) -> None:
+        """Adds many asset targets to the allocation atomically.
+
+        The whole batch is validated in a single pass before anything is
+        added: either every row is added, or none is and every invalid
+        row is reported together.
+
+        Args:
+            entries: Rows of ``(asset, target_ratio, lower, upper)``.
+
+        Raises:
+            BulkValidationError: If any row is invalid. Its details list each
+                invalid row with the error ``add_asset`` would raise for it,
+                including duplicates within the batch itself.
+        """
+        assets, ratios, lowers, uppers = transpose_entries(entries)
+        row_errors = validate_entries(
+            assets, assets, ratios, lowers, uppers, self.target_assets
+        )
+        if row_errors:
+            raise BulkValidationError(row_errors=row_errors)
+
+        self.target_assets.update(
+            zip(
+                assets,
+                [
+                    (ratio, {"lower": lo, "upper": hi})
+                    for ratio, lo, hi in zip(ratios, lowers, uppers, strict=True)
+                ],
+                strict=True,
+            )
+        )
+        self._total.extend(ratios)
+        self.version += 1
+
+    @instrumented("TargetAllocation.remove_asset")
+    def remove_asset(self, asset: Asset) -> None:
+        """Removes an asset target from the allocation.
+
+        Args:
+            asset: Asset to remove (matched by id).
+
+        Raises:
+            AssetNotFoundError: If the asset is not in the allocation.
+        """
+        entry = self.target_assets.pop(asset, None)
+        if entry is None:
+            raise AssetNotFoundError(asset_id=asset.id)
+        self._total.subtract(entry[0])
+        self.version += 1
+
+    @property
+    def views(self) -> DerivedViews:
+        """Cache of derived views, rebuilt lazily after each mutation."""
+        if self._views is None:
+            self._views = DerivedViews(self)
+        return self._views
+
+    def columns(self) -> TargetColumns:
+        """Builds a column-oriented view of the allocation.
+
+        Returns:
+            TargetColumns with one row per asset, in insertion order.
+        """
+        ids: list[str] = []
+        ratios, lowers, uppers = array("d"), array("d"), array("d")
+        for asset, (ratio, tolerance) in self.target_assets.items():
+            ids.append(asset.id)
+            ratios.append(ratio)
+            lowers.append(tolerance["lower"])
+            uppers.append(tolerance["upper"])
+        return TargetColumns(ids, ratios, lowers, uppers)
 
     def total_ratio(self) -> float:
-        """Calculates the sum of all target allocation ratios.
+        """Returns the sum of all target allocation ratios.
+
+        The sum is maintained incrementally and is correctly rounded
+        (equal to ``math.fsum`` over the ratios), so this is constant time.
 
         Returns:
             Sum of target ratios across all assets.
         """
-        return sum(r for r, _ in self.target_assets.values())
+        return self._total.value
 
     def validate_total(self, eps: float = 1e-6) -> None:
         """Validates that total target allocation sums to 1.0.
@@ -110,6 +347,4 @@ class TargetAllocation:
         Raises:
             TotalRatioMismatchError: If the total allocation deviates from 1.0 beyond eps.
         """
-        total = self.total_ratio()
-        if abs(total - 1.0) > eps:
-            raise TotalRatioMismatchError(total=total, expected=1.0, eps=eps)
+        validate_total_ratio(self.total_ratio(), eps)
@@ -0,0 +1,311 @@
+"""
+Persistent, structurally shared target allocation versions.
+
+An AllocationVersion is an immutable target allocation. Deriving a new
+version (``with_asset``, ``with_assets``, ``without_asset``) never copies
+the unchanged entries: every version consists of a shared *base* mapping
+plus a small *overlay* of the entries that differ from it::
+
+    base (shared, n entries)  <-  overlay of version A   {x: new, y: removed}
+                              <-  overlay of version B   {z: new}
+
+Deriving copies only the parent's overlay and applies the changes, so it
+costs O(changes since the base) rather than O(n), and lookups stay O(1)
+(overlay first, then base). Once an overlay grows past a fraction of the
+base (see ``REBASE_FRACTION``) the version is flattened into a new base,
+which keeps long chains of edits from degrading. A version refers to its
+parent only weakly, so an old base is freed once no live version uses it.
+
+``diff`` between versions that share a base only inspects their overlays.
+"""
+
+import weakref
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from portfotrack.common.summation import ExactSum
+from portfotrack.domain.asset.asset import Asset
+from portfotrack.domain.target_allocation.columnar import ColumnarTargetAllocation
+from portfotrack.domain.target_allocation.errors import AssetNotFoundError
+from portfotrack.domain.target_allocation.target import (
+    TargetAllocation,
+    TargetColumns,
+    TargetEntry,
+    Tolerance,
+    validate_entry,
+    validate_total_ratio,
+)
+
+Entry = tuple[float, Tolerance]
+"""A stored target entry: ``(target_ratio, tolerance)``."""
+
+REBASE_MIN = 1_024
+"""Overlays up to this size are never flattened."""
+
+REBASE_FRACTION = 8
+"""An overlay larger than ``len(base) // REBASE_FRACTION`` is flattened."""
+
+
+@dataclass(frozen=True, slots=True)
+class AllocationDiff:
+    """Entry-level difference between two allocation versions.
+
+    Attributes:
+        added: Entries present only in the newer version.
+        removed: Entries present only in the older version.
+        changed: ``(old, new)`` entry pairs of assets present in both
+            versions with a different ratio or tolerance.
+    """
+
+    added: dict[Asset, Entry] = field(default_factory=dict)
+    removed: dict[Asset, Entry] = field(default_factory=dict)
+    changed: dict[Asset, tuple[Entry, Entry]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class AllocationVersion:
+    """Immutable target allocation that shares unchanged entries between versions.
+
+    The read-side contract matches TargetAllocation: ``target_assets``,
+    ``columns``, ``total_ratio`` and ``validate_total``, so a version can be
+    passed to drift detection and rebalancing directly. Tolerance dicts are
+    shared between versions and must be treated as read-only.
+
+    """
+
+    __slots__ = (
+        "_parent",
+        "_base",
+        "_overlay",
+        "_size",
+        "_total",
+        "_columns",
+        "__weakref__",
+    )
+
+    def __init__(self) -> None:
+        """Creates an empty root version."""
+        self._parent: weakref.ref[AllocationVersion] | None = None
+        self._base: dict[Asset, Entry] = {}
+        self._overlay: dict[Asset, Entry | None] = {}
+        self._size = 0
+        self._total = ExactSum()
+        self._columns: TargetColumns | None = None
+
+    @classmethod
+    def from_target(
+        cls, target: TargetAllocation | ColumnarTargetAllocation
+    ) -> "AllocationVersion":
+        """Creates a root version holding the entries of a target allocation.
+
+        This is the only O(n) step: the entries are copied once into the
+        base that every derived version shares.
+        """
+        root = cls()
+        root._base = dict(target.target_assets)
+        root._size = len(root._base)
+        root._total = ExactSum(ratio for ratio, _ in root._base.values())
+        return root
+
+    def _derive(self) -> "AllocationVersion":
+        child = AllocationVersion.__new__(AllocationVersion)
+        child._parent = weakref.ref(self)
+        child._base = self._base
+        child._overlay = self._overlay.copy()
+        child._size = self._size
+        child._total = self._total.copy()
+        child._columns = None
+        return child
+
+    @property
+    def parent(self) -> "AllocationVersion | None":
+        """The version this one was derived from.
+
+        None for a root, or once the parent is no longer referenced
+        elsewhere: versions do not keep their ancestors alive.
+        """
+        return None if self._parent is None else self._parent()
+
+    def _set(self, asset: Asset, entry: Entry | None) -> None:
+        """Applies one change to a freshly derived (still private) version."""
+        old = self.get(asset)
+        if old is not None:
+            self._total.subtract(old[0])
+            self._size -= 1
+        if entry is not None:
+            self._total.add(entry[0])
+            self._size += 1
+
+        base_entry = self._base.get(asset)
+        if base_entry is entry or (entry is None and base_entry is None):
+            self._overlay.pop(asset, None)
+        else:
+            self._overlay[asset] = entry
+
+    def _finish(self) -> "AllocationVersion":
+        if len(self._overlay) > max(REBASE_MIN, len(self._base) // REBASE_FRACTION):
+            self._base = dict(self.items())
+            self._overlay = {}
+        return self
+
+    def with_asset(
+        self, asset: Asset, target_ratio: float, tolerance: Tolerance
+    ) -> "AllocationVersion":
+        """Returns a version in which ``asset`` has the given target.
+
+        The asset is added if absent and replaced otherwise.
+
+        Raises:
+            InvalidTargetRatioError: If target_ratio is outside [0.0, 1.0].
+            InvalidToleranceBoundsError: If the tolerance bounds are invalid.
+        """
+        validate_entry(target_ratio, tolerance["lower"], tolerance["upper"])
+        child = self._derive()
+        child._set(asset, (target_ratio, tolerance))
+        return child._finish()
+
+    def with_assets(self, entries: Iterable[TargetEntry]) -> "AllocationVersion":
+        """Returns a version with many assets added or replaced.
+
+        Args:
+            entries: Rows of ``(asset, target_ratio, lower, upper)``.
+
+        Raises:
+            InvalidTargetRatioError: If a target ratio is outside [0.0, 1.0].
+            InvalidToleranceBoundsError: If tolerance bounds are invalid.
+        """
+        child = self._derive()
+        for asset, ratio, lower, upper in entries:
+            validate_entry(ratio, lower, upper)
+            child._set(asset, (ratio, {"lower": lower, "upper": upper}))
+        return child._finish()
+
+    def without_asset(self, asset: Asset) -> "AllocationVersion":
+        """Returns a version without ``asset``.
+
+        Raises:
+            AssetNotFoundError: If the asset is not in this version.
+        """
+        return self.without_assets([asset])
+
+    def without_assets(self, assets: Iterable[Asset]) -> "AllocationVersion":
+        """Returns a version without any of ``assets``.
+
+        Raises:
+            AssetNotFoundError: If an asset is not in this version.
+        """
+        child = self._derive()
+        for asset in assets:
+            if asset not in child:
+                raise AssetNotFoundError(asset_id=asset.id)
+            child._set(asset, None)
+        return child._finish()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, asset: object) -> bool:
+        return isinstance(asset, Asset) and self.get(asset) is not None
+
+    def get(self, asset: Asset) -> Entry | None:
+        """Looks up the ``(target_ratio, tolerance)`` entry of an asset."""
+        overlay = self._overlay
+        if asset in overlay:
+            return overlay[asset]
+        return self._base.get(asset)
+
+    def items(self) -> Iterator[tuple[Asset, Entry]]:
+        """Iterates over ``(asset, entry)`` pairs.
+
+        Base entries come first, in base order, followed by assets added
+        since the base.
+        """
+        overlay = self._overlay
+        if not overlay:
+            yield from self._base.items()
+            return
+        for asset, entry in self._base.items():
+            if asset in overlay:
+                changed = overlay[asset]
+                if changed is not None:
+                    yield asset, changed
+            else:
+                yield asset, entry
+        for asset, entry in overlay.items():
+            if entry is not None and asset not in self._base:
+                yield asset, entry
+
+    @property
+    def target_assets(self) -> dict[Asset, Entry]:
+        """Mapping view equivalent to ``TargetAllocation.target_assets``.
+
+        Built on every access; prefer ``get`` and ``items`` on hot paths.
+        """
+        return dict(self.items())
+
+    def to_target(self) -> TargetAllocation:
+        """Materializes this version as a mutable TargetAllocation."""
+        return TargetAllocation(target_assets=self.target_assets)
+
+    def columns(self) -> TargetColumns:
+        """Returns the column-oriented view of this version.
+
+        Built once per version on first use, since versions are immutable.
+        """
+        if self._columns is None:
+            ids: list[str] = []
+            ratios, lowers, uppers = array("d"), array("d"), array("d")
+            for asset, (ratio, tolerance) in self.items():
+                ids.append(asset.id)
+                ratios.append(ratio)
+                lowers.append(tolerance["lower"])
+                uppers.append(tolerance["upper"])
+            self._columns = TargetColumns(ids, ratios, lowers, uppers)
+        return self._columns
+
+    def total_ratio(self) -> float:
+        """Returns the correctly rounded sum of all target ratios.
+
+        Maintained incrementally across derivations, so this is constant time.
+        """
+        return self._total.value
+
+    def validate_total(self, eps: float = 1e-6) -> None:
+        """Validates that total target allocation sums to 1.0.
+
+        Raises:
+            TotalRatioMismatchError: If the total allocation deviates from 1.0 beyond eps.
+        """
+        validate_total_ratio(self.total_ratio(), eps)
+
+    def diff(self, other: "AllocationVersion") -> AllocationDiff:
+        """Computes the changes that turn this version into ``other``.
+
+        Versions derived from the same base are compared through their
+        overlays only, in O(overlay size). Otherwise every entry is
+        compared.
+        """
+        if self._base is other._base:
+            candidates: Iterable[Asset] = self._overlay.keys() | other._overlay.keys()
+        else:
+            candidates = dict.fromkeys(
+                asset for source in (self, other) for asset, _ in source.items()
+            )
+
+        result = AllocationDiff()
+        for asset in candidates:
+            old, new = self.get(asset), other.get(asset)
+            if old is None:
+                if new is not None:
+                    result.added[asset] = new
+            elif new is None:
+                result.removed[asset] = old
+            elif old is not new and old != new:
+                result.changed[asset] = (old, new)
+        return result
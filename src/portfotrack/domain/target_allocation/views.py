@@ -0,0 +1,158 @@
+"""
+Memoized derived views of a mutable target allocation.
+
+Consumers keep asking an allocation the same derived questions (ratio
+per purpose, assets sorted by ratio, band widths, ...). DerivedViews
+computes each view once and serves it from a cache until the allocation
+changes. Every mutator of TargetAllocation and ColumnarTargetAllocation
+bumps the allocation's ``version`` counter, and the cache is dropped as
+soon as that counter differs from the one it was built at. A read
+between mutations is an integer comparison plus a dict lookup.
+
+Any function of the allocation can be cached with ``get``; the builder
+itself is the cache key. Cached views are shared by every reader, so
+the built-in views are returned as tuples and read-only mappings.
+"""
+
+import math
+from collections.abc import Callable, Iterable
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+from portfotrack.domain.asset.asset import Asset
+
+if TYPE_CHECKING:
+    from portfotrack.domain.target_allocation.target import Tolerance
+
+V = TypeVar("V")
+
+
+class VersionedAllocation(Protocol):
+    """What DerivedViews needs from an allocation."""
+
+    @property
+    def version(self) -> int: ...
+
+    @property
+    def target_assets(self) -> dict[Asset, tuple[float, "Tolerance"]]: ...
+
+
+def _entries(
+    target: VersionedAllocation,
+) -> Iterable[tuple[Asset, float, "Tolerance"]]:
+    for asset, (ratio, tolerance) in target.target_assets.items():
+        yield asset, ratio, tolerance
+
+
+def purpose_groups(
+    target: VersionedAllocation,
+) -> MappingProxyType[str, tuple[str, ...]]:
+    """Asset ids per ``Asset.purpose``, in allocation order."""
+    groups: dict[str, list[str]] = {}
+    for asset, _, _ in _entries(target):
+        groups.setdefault(asset.purpose, []).append(asset.id)
+    return MappingProxyType({purpose: tuple(ids) for purpose, ids in groups.items()})
+
+
+def purpose_totals(target: VersionedAllocation) -> MappingProxyType[str, float]:
+    """Correctly rounded sum of target ratios per ``Asset.purpose``."""
+    ratios: dict[str, list[float]] = {}
+    for asset, ratio, _ in _entries(target):
+        ratios.setdefault(asset.purpose, []).append(ratio)
+    return MappingProxyType({p: math.fsum(rs) for p, rs in ratios.items()})
+
+
+def ratios_descending(target: VersionedAllocation) -> tuple[tuple[str, float], ...]:
+    """``(asset_id, target_ratio)`` pairs sorted by ratio, largest first.
+
+    Ties keep allocation order.
+    """
+    pairs = [(asset.id, ratio) for asset, ratio, _ in _entries(target)]
+    pairs.sort(key=lambda pair: pair[1], reverse=True)
+    return tuple(pairs)
+
+
+def band_widths(target: VersionedAllocation) -> MappingProxyType[str, float]:
+    """Width of the tolerance band (``upper - lower``) per asset id."""
+    return MappingProxyType(
+        {
+            asset.id: tolerance["upper"] - tolerance["lower"]
+            for asset, _, tolerance in _entries(target)
+        }
+    )
+
+
+class DerivedViews:
+    """Version-checked cache of views derived from one allocation.
+
+    Attributes:
+        hits: Reads served from the cache.
+        misses: Reads that had to build their view.
+        invalidations: Times the cache was dropped because the allocation
+            changed.
+    """
+
+    __slots__ = ("_target", "_version", "_cache", "hits", "misses", "invalidations")
+
+    def __init__(self, target: VersionedAllocation) -> None:
+        self._target = target
+        self._version = target.version
+        self._cache: dict[Callable[..., Any], Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        """Number of views cached for the current version."""
+        if self._version != self._target.version:
+            return 0
+        return len(self._cache)
+
+    def get(self, build: Callable[[Any], V]) -> V:
+        """Returns ``build(target)``, computing it at most once per version.
+
+        Args:
+            build: Pure function of the allocation. It is also the cache
+                key, so pass the same function object on every call.
+        """
+        version = self._target.version
+        if version != self._version:
+            self._cache.clear()
+            self._version = version
+            self.invalidations += 1
+        try:
+            view = self._cache[build]
+        except KeyError:
+            self.misses += 1
+            view = self._cache[build] = build(self._target)
+            return view
+        self.hits += 1
+        return view
+
+    def purpose_groups(self) -> MappingProxyType[str, tuple[str, ...]]:
+        """Cached ``purpose_groups`` view."""
+        return self.get(purpose_groups)
+
+    def purpose_totals(self) -> MappingProxyType[str, float]:
+        """Cached ``purpose_totals`` view."""
+        return self.get(purpose_totals)
+
+    def ratios_descending(self) -> tuple[tuple[str, float], ...]:
+        """Cached ``ratios_descending`` view."""
+        return self.get(ratios_descending)
+
+    def band_widths(self) -> MappingProxyType[str, float]:
+        """Cached ``band_widths`` view."""
+        return self.get(band_widths)
+
+    def stats(self) -> dict[str, int]:
+        """Returns the hit, miss and invalidation counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    def reset_stats(self) -> None:
+        """Zeroes the counters without dropping cached views."""
+        self.hits = self.misses = self.invalidations = 0
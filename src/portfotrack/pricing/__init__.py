@@ -0,0 +1,4 @@
+from portfotrack.pricing.feed import FeedStats, PriceFeed
+from portfotrack.pricing.provider import FixturePriceProvider, PriceProvider, Quote
+
+__all__ = ["FeedStats", "FixturePriceProvider", "PriceFeed", "PriceProvider", "Quote"]
@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class PricingErrorCode(StrEnum):
+    PRICING_QUOTE_NOT_FOUND = "PRICING.QUOTE_NOT_FOUND"
+    PRICING_PROVIDER_FAILED = "PRICING.PROVIDER_FAILED"
+    PRICING_INVALID_FIXTURE = "PRICING.INVALID_FIXTURE"
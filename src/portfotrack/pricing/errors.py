@@ -0,0 +1,90 @@
+from typing import Any
+
+from portfotrack.common.errors import AppError
+from portfotrack.pricing.error_codes import PricingErrorCode
+
+
+class PricingError(AppError):
+    """Base class for price ingestion errors."""
+
+    pass
+
+
+class QuoteNotFoundError(PricingError):
+    """Raised when the price provider has no quote for an asset.
+
+    Attributes:
+        details: Contains:
+            - asset_id: The identifier of the asset without a quote.
+    """
+
+    def __init__(
+        self,
+        *,
+        asset_id: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=PricingErrorCode.PRICING_QUOTE_NOT_FOUND,
+            message=f"No price quote is available for asset {asset_id}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"asset_id": asset_id})
+
+
+class PriceProviderError(PricingError):
+    """Raised when a price provider fails to serve a batch of quotes.
+
+    Attributes:
+        details: Contains:
+            - provider: Name of the failing provider.
+            - reason: Description of the failure.
+            - batch_size: Number of asset ids in the failed request.
+    """
+
+    def __init__(
+        self,
+        *,
+        provider: str,
+        reason: str,
+        batch_size: int,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=PricingErrorCode.PRICING_PROVIDER_FAILED,
+            message=f"Price provider {provider} failed: {reason}",
+            details=details,
+            cause=cause,
+        )
+        self.details.update(
+            {"provider": provider, "reason": reason, "batch_size": batch_size}
+        )
+
+
+class InvalidPriceFixtureError(PricingError):
+    """Raised when a price fixture file cannot be loaded.
+
+    Attributes:
+        details: Contains:
+            - path: The path of the fixture file.
+            - reason: Short description of the problem.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        reason: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=PricingErrorCode.PRICING_INVALID_FIXTURE,
+            message=f"Cannot load price fixture {path}: {reason}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"path": path, "reason": reason})
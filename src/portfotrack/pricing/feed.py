@@ -0,0 +1,237 @@
+"""
+Concurrent, cached price ingestion on top of a PriceProvider.
+
+``PriceFeed.get_quotes`` resolves a set of asset ids in three tiers:
+
+1. Fresh entries of the TTL cache are returned immediately.
+2. Ids that another caller is already fetching are *coalesced*: the
+   caller awaits the same in-flight future instead of issuing a second
+   request.
+3. The remaining ids are split into provider-sized batches that are all
+   started at once and gated by a semaphore of ``max_concurrency``.
+
+Because batches overlap, fetching N ids takes about
+``ceil(N / (batch_size * max_concurrency))`` round trips -- with enough
+concurrency, roughly the time of the slowest batch.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from portfotrack.common.errors import AppError
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+)
+from portfotrack.pricing.errors import PriceProviderError, QuoteNotFoundError
+from portfotrack.pricing.provider import PriceProvider, Quote
+
+
+@dataclass(slots=True)
+class FeedStats:
+    """Counters describing how a PriceFeed resolved requested ids.
+
+    Attributes:
+        cache_hits: Ids served from the TTL cache.
+        coalesced: Ids that joined an in-flight request.
+        fetched: Ids sent to the provider.
+        requests: Provider requests issued.
+    """
+
+    cache_hits: int = 0
+    coalesced: int = 0
+    fetched: int = 0
+    requests: int = 0
+
+
+class PriceFeed:
+    """Async price ingestion with concurrency limits, coalescing and a TTL cache.
+
+    A PriceFeed is bound to the event loop it is first used on.
+
+    Attributes:
+        provider: The underlying quote source.
+        batch_size: Ids per provider request.
+        ttl: Seconds a fetched quote stays fresh.
+        stats: Resolution counters.
+    """
+
+    def __init__(
+        self,
+        provider: PriceProvider,
+        *,
+        max_concurrency: int = 8,
+        batch_size: int | None = None,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes a PriceFeed.
+
+        Args:
+            provider: The quote source.
+            max_concurrency: Maximum number of provider requests in flight.
+            batch_size: Ids per request; defaults to and is capped at the
+                provider's ``max_batch_size``.
+            ttl: Seconds a fetched quote stays fresh. Use 0 to disable caching.
+            clock: Monotonic time source, injectable for tests.
+
+        Raises:
+            ValueError: If ``max_concurrency`` or ``batch_size`` is not positive.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        batch_size = min(batch_size or provider.max_batch_size, provider.max_batch_size)
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        self.provider = provider
+        self.batch_size = batch_size
+        self.ttl = ttl
+        self.stats = FeedStats()
+        self._clock = clock
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._cache: dict[str, tuple[float, Quote]] = {}
+        self._inflight: dict[str, asyncio.Future[Quote]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def cached(self, asset_id: str) -> Quote | None:
+        """Returns the fresh cached quote of an asset, or None."""
+        entry = self._cache.get(asset_id)
+        if entry is None or entry[0] <= self._clock():
+            return None
+        return entry[1]
+
+    def invalidate(self, asset_ids: Iterable[str] | None = None) -> None:
+        """Drops cached quotes, for the given ids or for every asset."""
+        if asset_ids is None:
+            self._cache.clear()
+        else:
+            for asset_id in asset_ids:
+                self._cache.pop(asset_id, None)
+
+    async def get_quote(self, asset_id: str) -> Quote:
+        """Returns the quote of one asset.
+
+        Raises:
+            QuoteNotFoundError: If the provider has no quote for the asset.
+            PriceProviderError: If the provider request failed.
+        """
+        quotes = await self._resolve([asset_id])
+        result = quotes[asset_id]
+        if isinstance(result, AppError):
+            raise result
+        return result
+
+    async def get_quotes(self, asset_ids: Iterable[str]) -> dict[str, Quote]:
+        """Returns the quotes of many assets.
+
+        Duplicate ids are requested once. Ids the provider does not know
+        are left out of the result.
+
+        Raises:
+            PriceProviderError: If any provider request failed.
+        """
+        quotes: dict[str, Quote] = {}
+        for asset_id, result in (await self._resolve(asset_ids)).items():
+            if isinstance(result, PriceProviderError):
+                raise result
+            if not isinstance(result, AppError):
+                quotes[asset_id] = result
+        return quotes
+
+    async def fetch_target(
+        self, target: TargetAllocation | ColumnarTargetAllocation
+    ) -> dict[str, Quote]:
+        """Returns the quotes of every asset in a target allocation.
+
+        Raises:
+            PriceProviderError: If any provider request failed.
+        """
+        return await self.get_quotes(target.columns().ids)
+
+    async def _resolve(self, asset_ids: Iterable[str]) -> dict[str, Quote | AppError]:
+        results: dict[str, Quote | AppError] = {}
+        waiting: dict[str, asyncio.Future[Quote]] = {}
+        missing: list[str] = []
+        now = self._clock()
+        stats = self.stats
+
+        for asset_id in dict.fromkeys(asset_ids):
+            entry = self._cache.get(asset_id)
+            if entry is not None and entry[0] > now:
+                results[asset_id] = entry[1]
+                stats.cache_hits += 1
+            elif asset_id in self._inflight:
+                waiting[asset_id] = self._inflight[asset_id]
+                stats.coalesced += 1
+            else:
+                missing.append(asset_id)
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            for asset_id in missing:
+                future = loop.create_future()
+                self._inflight[asset_id] = future
+                waiting[asset_id] = future
+            stats.fetched += len(missing)
+            for start in range(0, len(missing), self.batch_size):
+                batch = missing[start : start + self.batch_size]
+                task = loop.create_task(self._fetch_batch(batch))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+        if waiting:
+            # asyncio.wait (unlike gather) never cancels the futures it waits
+            # on, so a cancelled caller cannot cancel futures that coalesced
+            # callers are also awaiting.
+            pending = [future for future in waiting.values() if not future.done()]
+            if pending:
+                await asyncio.wait(pending)
+            for asset_id, future in waiting.items():
+                error = future.exception()
+                if error is None:
+                    results[asset_id] = future.result()
+                elif isinstance(error, AppError):
+                    results[asset_id] = error
+                else:
+                    raise error
+        return results
+
+    async def _fetch_batch(self, batch: list[str]) -> None:
+        futures = [self._inflight[asset_id] for asset_id in batch]
+        try:
+            async with self._semaphore:
+                self.stats.requests += 1
+                quotes = await self.provider.fetch_quotes(batch)
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            error = PriceProviderError(
+                provider=self.provider.name,
+                reason=str(e) or type(e).__name__,
+                batch_size=len(batch),
+                cause=e,
+            )
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            expires = self._clock() + self.ttl
+            for asset_id, future in zip(batch, futures, strict=True):
+                quote = quotes.get(asset_id)
+                if future.done():
+                    continue
+                if quote is None:
+                    future.set_exception(QuoteNotFoundError(asset_id=asset_id))
+                else:
+                    if self.ttl > 0:
+                        self._cache[asset_id] = (expires, quote)
+                    future.set_result(quote)
+        finally:
+            for asset_id, future in zip(batch, futures, strict=True):
+                if self._inflight.get(asset_id) is future:
+                    del self._inflight[asset_id]
@@ -0,0 +1,152 @@
+import asyncio
+import csv
+import json
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Protocol, runtime_checkable
+
+from portfotrack.pricing.errors import InvalidPriceFixtureError
+
+
+@dataclass(frozen=True, slots=True)
+class Quote:
+    """A market price for one asset.
+
+    Attributes:
+        asset_id: Identifier of the quoted asset.
+        price: Price per unit.
+        currency: ISO currency code of ``price``.
+    """
+
+    asset_id: str
+    price: float
+    currency: str = "USD"
+
+
+@runtime_checkable
+class PriceProvider(Protocol):
+    """Source of market quotes, e.g. a vendor API client.
+
+    Implementations fetch one batch per call and should not add their own
+    caching or concurrency control; PriceFeed takes care of both.
+
+    Attributes:
+        name: Short provider name used in error reports.
+        max_batch_size: Largest number of ids accepted by one request.
+    """
+
+    name: str
+    max_batch_size: int
+
+    async def fetch_quotes(self, asset_ids: Sequence[str]) -> Mapping[str, Quote]:
+        """Fetches quotes for a batch of distinct asset ids.
+
+        Args:
+            asset_ids: At most ``max_batch_size`` distinct asset ids.
+
+        Returns:
+            Quotes keyed by asset id. Ids the provider does not know are
+            omitted.
+        """
+        ...
+
+
+class FixturePriceProvider:
+    """Offline PriceProvider serving quotes from an in-memory table.
+
+    Meant for tests, demos and local runs. An optional ``latency``
+    simulates the round trip of a remote API, so concurrency behaviour can
+    be exercised without a network.
+
+    Attributes:
+        name: Provider name (``"fixture"``).
+        max_batch_size: Largest batch served per request.
+        latency: Seconds each request takes.
+        requests: Number of requests served so far.
+    """
+
+    name = "fixture"
+
+    def __init__(
+        self,
+        quotes: Iterable[Quote],
+        *,
+        max_batch_size: int = 500,
+        latency: float = 0.0,
+    ) -> None:
+        self._quotes = {quote.asset_id: quote for quote in quotes}
+        self.max_batch_size = max_batch_size
+        self.latency = latency
+        self.requests = 0
+
+    @classmethod
+    def from_prices(
+        cls, prices: Mapping[str, float], currency: str = "USD", **kwargs
+    ) -> "FixturePriceProvider":
+        """Builds a provider from an ``asset_id -> price`` mapping."""
+        return cls(
+            (Quote(asset_id, float(p), currency) for asset_id, p in prices.items()),
+            **kwargs,
+        )
+
+    @classmethod
+    def from_file(
+        cls, path: str | os.PathLike[str], **kwargs
+    ) -> "FixturePriceProvider":
+        """Loads a provider from a JSON or CSV fixture file.
+
+        JSON fixtures map asset ids to either a price or an object with
+        ``price`` and optional ``currency``. CSV fixtures have a header row
+        with ``asset_id``, ``price`` and optional ``currency`` columns.
+
+        Raises:
+            InvalidPriceFixtureError: If the file type is unsupported or the
+                content is malformed.
+        """
+        path = os.fspath(path)
+        suffix = os.path.splitext(path)[1].lower()
+        try:
+            with open(path, newline="", encoding="utf-8") as f:
+                if suffix == ".json":
+                    quotes = [_json_quote(k, v) for k, v in json.load(f).items()]
+                elif suffix == ".csv":
+                    quotes = [
+                        Quote(
+                            row["asset_id"],
+                            float(row["price"]),
+                            row.get("currency") or "USD",
+                        )
+                        for row in csv.DictReader(f)
+                    ]
+                else:
+                    raise InvalidPriceFixtureError(
+                        path=path, reason=f"unsupported file type '{suffix or path}'"
+                    )
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            raise InvalidPriceFixtureError(path=path, reason=str(e), cause=e) from e
+        return cls(quotes, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    async def fetch_quotes(self, asset_ids: Sequence[str]) -> dict[str, Quote]:
+        """Returns the known quotes among ``asset_ids`` after ``latency``."""
+        if len(asset_ids) > self.max_batch_size:
+            raise ValueError(
+                f"batch of {len(asset_ids)} exceeds max_batch_size "
+                f"{self.max_batch_size}"
+            )
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        quotes = self._quotes
+        return {i: quotes[i] for i in asset_ids if i in quotes}
+
+
+def _json_quote(asset_id: str, value: object) -> Quote:
+    if isinstance(value, Mapping):
+        return Quote(asset_id, float(value["price"]), value.get("currency", "USD"))
+    if isinstance(value, str | int | float):
+        return Quote(asset_id, float(value))
+    raise TypeError(f"price of '{asset_id}' is a {type(value).__name__}")
@@ -0,0 +1,378 @@
+"""
+Parallel evaluation of many target allocations across CPU cores.
+
+A *mandate* is one client's target allocation together with its current
+holdings and an optional cash flow. ``evaluate_mandates`` splits a
+collection of mandates into shards and evaluates each shard in a worker
+process::
+
+    pack shard -> [worker] validate total -> drift -> rebalance -> pack
+               -> merge results in input order
+
+A shard crosses the process boundary as a few flat buffers: string
+lists for the ids and float64 columns serialized with
+``array.tobytes()``. No Asset objects or per-row tuples are pickled, so
+the transfer cost grows with the number of buffers rather than the
+number of assets. Workers slice zero-copy ``memoryview`` columns out of
+those buffers and run the same vectorized kernels used in-process
+(``compute_drift`` and ``compute_trades``); results come back packed
+the same way and each mandate's columns are copied out of the returned
+buffers into its own ``array``, so no report keeps a shard alive.
+
+Shards are submitted through a bounded window, so the mandates and
+results in flight stay proportional to ``max_workers * shard_size``
+regardless of how many mandates are streamed through.
+``iter_mandate_results`` yields results as shards complete and keeps
+memory at that bound; ``evaluate_mandates`` collects every result into
+a BatchReport, which grows with the number of mandates.
+"""
+
+import math
+import os
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import Any
+
+from portfotrack.common.errors import AppError
+from portfotrack.domain.drift import DriftReport, align_holdings, compute_drift
+from portfotrack.domain.rebalance import RebalancePolicy, TradePlan, compute_trades
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+    TargetColumns,
+)
+from portfotrack.domain.target_allocation.target import validate_total_ratio
+
+
+@dataclass(frozen=True, slots=True)
+class Mandate:
+    """One client mandate to evaluate.
+
+    Attributes:
+        mandate_id: Caller-chosen identifier, echoed in the result.
+        target: Target allocation of the mandate.
+        holdings: Current holding value per asset id.
+        cash_flow: Cash added (positive) or withdrawn (negative) while
+            rebalancing.
+    """
+
+    mandate_id: str
+    target: TargetAllocation | ColumnarTargetAllocation
+    holdings: Mapping[str, float]
+    cash_flow: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class MandateResult:
+    """Outcome of evaluating one mandate.
+
+    Attributes:
+        mandate_id: Identifier of the evaluated mandate.
+        drift: Drift report, or None if the mandate failed.
+        plan: Rebalancing trade plan, or None if the mandate failed.
+        error: The error that failed the mandate, or None. Errors raised in
+            a worker are rebuilt as plain AppError instances carrying the
+            original code, message and details.
+    """
+
+    mandate_id: str
+    drift: DriftReport | None = None
+    plan: TradePlan | None = None
+    error: AppError | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the mandate was evaluated successfully."""
+        return self.error is None
+
+
+@dataclass(slots=True)
+class BatchReport:
+    """Merged outcome of a batch evaluation.
+
+    Attributes:
+        results: One result per mandate, in input order.
+        failed: Number of mandates whose evaluation raised an error.
+    """
+
+    results: list[MandateResult] = field(default_factory=list)
+    failed: int = 0
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def errors(self) -> list[MandateResult]:
+        """Returns the results of the failed mandates."""
+        return [result for result in self.results if result.error is not None]
+
+
+@dataclass(frozen=True, slots=True)
+class _Shard:
+    """Packed mandates: ``offsets[i]:offsets[i + 1]`` spans mandate ``i``."""
+
+    mandate_ids: list[str]
+    asset_ids: list[str]
+    offsets: bytes
+    ratios: bytes
+    lowers: bytes
+    uppers: bytes
+    holding_ids: list[str]
+    holding_offsets: bytes
+    holding_values: bytes
+    cash_flows: bytes
+
+
+@dataclass(frozen=True, slots=True)
+class _ShardResult:
+    """Packed results, row-aligned with the asset rows of their _Shard.
+
+    Rows of failed mandates are zero-filled so both share one offset table.
+    """
+
+    errors: list[tuple[int, str, str, dict[str, Any]]]
+    drift_totals: bytes
+    plan_totals: bytes
+    actual: bytes
+    deviation: bytes
+    in_band: bytes
+    trades: bytes
+
+
+def _pack_shard(mandates: Iterable[Mandate]) -> _Shard:
+    mandate_ids: list[str] = []
+    asset_ids: list[str] = []
+    offsets = array("q", [0])
+    ratios, lowers, uppers = array("d"), array("d"), array("d")
+    holding_ids: list[str] = []
+    holding_offsets = array("q", [0])
+    holding_values = array("d")
+    cash_flows = array("d")
+
+    for mandate in mandates:
+        columns = mandate.target.columns()
+        mandate_ids.append(mandate.mandate_id)
+        asset_ids.extend(columns.ids)
+        offsets.append(len(asset_ids))
+        ratios.extend(columns.ratios)
+        lowers.extend(columns.lowers)
+        uppers.extend(columns.uppers)
+        holding_ids.extend(mandate.holdings.keys())
+        holding_offsets.append(len(holding_ids))
+        holding_values.extend(mandate.holdings.values())
+        cash_flows.append(mandate.cash_flow)
+
+    return _Shard(
+        mandate_ids,
+        asset_ids,
+        offsets.tobytes(),
+        ratios.tobytes(),
+        lowers.tobytes(),
+        uppers.tobytes(),
+        holding_ids,
+        holding_offsets.tobytes(),
+        holding_values.tobytes(),
+        cash_flows.tobytes(),
+    )
+
+
+def _evaluate_shard(shard: _Shard, policy: RebalancePolicy, eps: float) -> _ShardResult:
+    """Worker entry point: evaluates every mandate of a packed shard."""
+    offsets = memoryview(shard.offsets).cast("q")
+    ratios = memoryview(shard.ratios).cast("d")
+    lowers = memoryview(shard.lowers).cast("d")
+    uppers = memoryview(shard.uppers).cast("d")
+    holding_offsets = memoryview(shard.holding_offsets).cast("q")
+    holding_values = memoryview(shard.holding_values).cast("d")
+    cash_flows = memoryview(shard.cash_flows).cast("d")
+
+    errors: list[tuple[int, str, str, dict[str, Any]]] = []
+    drift_totals, plan_totals = array("d"), array("d")
+    actual, deviation, trades = array("d"), array("d"), array("d")
+    in_band = array("b")
+
+    for i in range(len(shard.mandate_ids)):
+        start, stop = offsets[i], offsets[i + 1]
+        h_start, h_stop = holding_offsets[i], holding_offsets[i + 1]
+        columns = TargetColumns(
+            shard.asset_ids[start:stop],
+            ratios[start:stop],
+            lowers[start:stop],
+            uppers[start:stop],
+        )
+        holdings = dict(
+            zip(
+                shard.holding_ids[h_start:h_stop],
+                holding_values[h_start:h_stop],
+                strict=True,
+            )
+        )
+        try:
+            validate_total_ratio(math.fsum(columns.ratios), eps)
+            values = align_holdings(columns, holdings)
+            drift = compute_drift(columns, values)
+            plan = compute_trades(columns, values, cash_flows[i], policy)
+        except AppError as e:
+            errors.append((i, e.code, e.message, e.details))
+            width = stop - start
+            drift_totals.append(0.0)
+            plan_totals.append(0.0)
+            for column in (actual, deviation, trades):
+                column.frombytes(bytes(8 * width))
+            in_band.frombytes(bytes(width))
+            continue
+
+        drift_totals.append(drift.total)
+        plan_totals.append(plan.total)
+        actual.extend(drift.actual)
+        deviation.extend(drift.deviation)
+        in_band.extend(drift.in_band)
+        trades.extend(plan.trades)
+
+    return _ShardResult(
+        errors,
+        drift_totals.tobytes(),
+        plan_totals.tobytes(),
+        actual.tobytes(),
+        deviation.tobytes(),
+        in_band.tobytes(),
+        trades.tobytes(),
+    )
+
+
+def _merge_shard(
+    shard: _Shard, result: _ShardResult, policy: RebalancePolicy
+) -> Iterator[MandateResult]:
+    offsets = memoryview(shard.offsets).cast("q")
+    drift_totals = memoryview(result.drift_totals).cast("d")
+    plan_totals = memoryview(result.plan_totals).cast("d")
+    actual = memoryview(result.actual).cast("d")
+    deviation = memoryview(result.deviation).cast("d")
+    trades = memoryview(result.trades).cast("d")
+    errors = {
+        i: (code, message, details) for i, code, message, details in result.errors
+    }
+
+    for i, mandate_id in enumerate(shard.mandate_ids):
+        failure = errors.get(i)
+        if failure is not None:
+            code, message, details = failure
+            error = AppError(code=code, message=message, details=details)
+            yield MandateResult(mandate_id, error=error)
+            continue
+
+        start, stop = offsets[i], offsets[i + 1]
+        ids = shard.asset_ids[start:stop]
+        drift = DriftReport(
+            ids,
+            drift_totals[i],
+            array("d", actual[start:stop]),
+            array("d", deviation[start:stop]),
+            list(map(bool, result.in_band[start:stop])),
+        )
+        plan = TradePlan(ids, policy, plan_totals[i], array("d", trades[start:stop]))
+        yield MandateResult(mandate_id, drift, plan)
+
+
+def iter_mandate_results(
+    mandates: Iterable[Mandate],
+    *,
+    policy: RebalancePolicy = RebalancePolicy.TO_TARGET,
+    eps: float = 1e-6,
+    max_workers: int | None = None,
+    shard_size: int = 1_000,
+    executor: Executor | None = None,
+) -> Iterator[MandateResult]:
+    """
+    Validate, drift-check and rebalance many mandates in parallel, lazily.
+
+    Each mandate is evaluated independently: its target ratios must sum
+    to 1.0 within ``eps``, its holdings are checked for drift, and a trade
+    plan is computed with ``policy``. A mandate that raises an AppError
+    is reported as failed without affecting the rest of the batch.
+
+    Args:
+        mandates: The mandates to evaluate. Consumed lazily, one shard at
+            a time.
+        policy: Rebalancing policy applied to every mandate.
+        eps: Allowed deviation of each target's ratio total from 1.0.
+        max_workers: Number of worker processes. Defaults to the number of
+            CPUs. With 1, shards are evaluated in the calling process.
+        shard_size: Number of mandates per shard. Larger shards amortize
+            inter-process overhead; smaller shards balance load better.
+        executor: Optional existing executor to submit shards to instead
+            of starting a process pool. It is not shut down.
+
+    Yields:
+        One result per mandate, in input order.
+
+    Raises:
+        ValueError: If ``max_workers`` or ``shard_size`` is not positive.
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be positive")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive")
+
+    shards = map(_pack_shard, batched(mandates, shard_size))
+    if executor is None and max_workers == 1:
+        for shard in shards:
+            yield from _merge_shard(shard, _evaluate_shard(shard, policy, eps), policy)
+        return
+
+    pool = executor or ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        window: deque[tuple[_Shard, Future[_ShardResult]]] = deque()
+        for shard in shards:
+            window.append((shard, pool.submit(_evaluate_shard, shard, policy, eps)))
+            if len(window) >= 2 * max_workers:
+                shard, future = window.popleft()
+                yield from _merge_shard(shard, future.result(), policy)
+        while window:
+            shard, future = window.popleft()
+            yield from _merge_shard(shard, future.result(), policy)
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+
+
+def evaluate_mandates(
+    mandates: Iterable[Mandate],
+    *,
+    policy: RebalancePolicy = RebalancePolicy.TO_TARGET,
+    eps: float = 1e-6,
+    max_workers: int | None = None,
+    shard_size: int = 1_000,
+    executor: Executor | None = None,
+) -> BatchReport:
+    """
+    Validate, drift-check and rebalance many mandates into one report.
+
+    Collects ``iter_mandate_results``; see there for the evaluation and
+    the arguments. The report holds every result, so prefer the iterator
+    when streaming more mandates than fit in memory.
+
+    Returns:
+        The merged batch report, with results in input order.
+
+    Raises:
+        ValueError: If ``max_workers`` or ``shard_size`` is not positive.
+    """
+    report = BatchReport()
+    for result in iter_mandate_results(
+        mandates,
+        policy=policy,
+        eps=eps,
+        max_workers=max_workers,
+        shard_size=shard_size,
+        executor=executor,
+    ):
+        report.results.append(result)
+        if result.error is not None:
+            report.failed += 1
+    return report
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class ServiceErrorCode(StrEnum):
+    IMPORT_INVALID_FILE = "IMPORT.INVALID_FILE"
+    IMPORT_INVALID_ROW = "IMPORT.INVALID_ROW"
@@ -0,0 +1,75 @@
+from typing import Any
+
+from portfotrack.common.errors import AppError
+from portfotrack.services.error_codes import ServiceErrorCode
+
+
+class ServiceError(AppError):
+    """Base class for service-layer errors."""
+
+    pass
+
+
+class InvalidImportFileError(ServiceError):
+    """Raised when an import file cannot be read as a whole.
+
+    Typical causes are an unsupported file extension, a CSV header that
+    lacks required columns, or a file that cannot be opened or decoded.
+
+    Attributes:
+        details: Contains:
+            - path: The path of the import file.
+            - reason: Short description of the problem.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        reason: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=ServiceErrorCode.IMPORT_INVALID_FILE,
+            message=f"Cannot import {path}: {reason}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"path": path, "reason": reason})
+
+
+class InvalidImportRowError(ServiceError):
+    """Raised (or collected) for a single row that could not be imported.
+
+    Attributes:
+        details: Contains:
+            - path: The path of the import file.
+            - line: One-based line number where the row starts.
+            - reason: Description of why the row was rejected.
+            - cause_code: Error code of the underlying AppError, if any.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        line: int,
+        reason: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=ServiceErrorCode.IMPORT_INVALID_ROW,
+            message=f"{path}:{line}: {reason}",
+            details=details,
+            cause=cause,
+        )
+        self.details.update(
+            {
+                "path": path,
+                "line": line,
+                "reason": reason,
+                "cause_code": getattr(cause, "code", None),
+            }
+        )
@@ -0,0 +1,253 @@
+"""
+Streaming import of target allocations from CSV and JSONL files.
+
+Files are processed as a lazy generator pipeline::
+
+    read records -> parse into AssetRow -> add_asset_to_target()
+
+so only one row is held in memory at a time regardless of file size.
+Each record carries the one-based line number it starts on, which is
+attached to every rejected row.
+
+Both formats use the same fields: ``asset_id``, ``asset_name``,
+``purpose``, ``target_ratio``, ``lower`` and ``upper``. CSV files must
+start with a header row naming them (in any order; extra columns are
+ignored).
+"""
+
+import csv
+import json
+import math
+import os
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from operator import itemgetter
+
+from portfotrack.common.error_collector import ErrorCollector
+from portfotrack.common.errors import AppError
+from portfotrack.domain.asset import AssetRegistry
+from portfotrack.domain.target_allocation import TargetAllocation
+from portfotrack.services.errors import InvalidImportFileError, InvalidImportRowError
+from portfotrack.services.target_services import AssetRow, add_asset_to_target
+
+FIELDS = ("asset_id", "asset_name", "purpose", "target_ratio", "lower", "upper")
+CSV_SUFFIXES = frozenset({".csv"})
+JSONL_SUFFIXES = frozenset({".jsonl", ".ndjson"})
+
+Record = tuple[int, Sequence[object]]
+"""A raw record: ``(line, values)`` with values ordered as ``FIELDS``."""
+
+
+@dataclass(slots=True)
+class ImportReport:
+    """Outcome of a streaming import.
+
+    Attributes:
+        imported: Number of rows added to the target allocation.
+        rejected: Number of rows that were rejected.
+        errors: Rejected-row errors, in file order. At most ``max_errors``
+            are kept so memory stays bounded on very bad files; ``rejected``
+            always holds the full count.
+    """
+
+    imported: int = 0
+    rejected: int = 0
+    errors: list[InvalidImportRowError] = field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        """Number of rows read so far."""
+        return self.imported + self.rejected
+
+
+ProgressCallback = Callable[[ImportReport], None]
+
+
+def iter_csv_records(path: str) -> Iterator[Record]:
+    """Yields the records of a CSV file with a header row.
+
+    Raises:
+        InvalidImportFileError: If the header is missing required fields.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = {name.strip(): i for i, name in enumerate(header)}
+        missing = [name for name in FIELDS if name not in columns]
+        if missing:
+            raise InvalidImportFileError(
+                path=path, reason=f"missing CSV columns {missing}"
+            )
+        pick = itemgetter(*(columns[name] for name in FIELDS))
+        width = len(header)
+
+        start = reader.line_num + 1
+        for values in reader:
+            line, start = start, reader.line_num + 1
+            if not values:
+                continue
+            yield line, pick(values) if len(values) >= width else ()
+
+
+def iter_jsonl_records(path: str) -> Iterator[Record]:
+    """Yields the records of a JSON Lines file, one object per line."""
+    with open(path, encoding="utf-8") as f:
+        for line, text in enumerate(f, 1):
+            if not text.strip():
+                continue
+            try:
+                obj = json.loads(text)
+                values: Sequence[object] = tuple(obj[name] for name in FIELDS)
+            except (ValueError, TypeError, KeyError):
+                values = ()
+            yield line, values
+
+
+def iter_records(path: str) -> Iterator[Record]:
+    """Yields the records of an import file, chosen by file extension.
+
+    Raises:
+        InvalidImportFileError: If the extension is not supported, or the
+            file cannot be opened, decoded as UTF-8 or parsed as CSV.
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix in CSV_SUFFIXES:
+        records = iter_csv_records(path)
+    elif suffix in JSONL_SUFFIXES:
+        records = iter_jsonl_records(path)
+    else:
+        raise InvalidImportFileError(
+            path=path, reason=f"unsupported file type '{suffix or path}'"
+        )
+    return _read_errors_as_app_errors(path, records)
+
+
+def _read_errors_as_app_errors(
+    path: str, records: Iterator[Record]
+) -> Iterator[Record]:
+    # Reading happens lazily, so I/O and decoding errors surface mid-iteration.
+    try:
+        yield from records
+    except (OSError, UnicodeError, csv.Error) as e:
+        raise InvalidImportFileError(path=path, reason=str(e), cause=e) from e
+
+
+def _to_float(value: object) -> float:
+    # bool is an int subclass, but a JSON true/false is not a ratio.
+    if isinstance(value, bool) or not isinstance(value, str | int | float):
+        raise TypeError(f"expected a number, got {type(value).__name__}")
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"expected a finite number, got {value!r}")
+    return number
+
+
+def parse_row(values: Sequence[object]) -> AssetRow:
+    """Converts raw record values into a typed AssetRow.
+
+    Raises:
+        ValueError: If fields are missing, or numbers cannot be parsed or are
+            not finite (e.g. "nan", "inf").
+        TypeError: If a numeric field is not a number or string (e.g. null or
+            a boolean).
+    """
+    if len(values) != len(FIELDS):
+        raise ValueError(f"expected fields {list(FIELDS)}")
+    asset_id, asset_name, purpose, ratio, lower, upper = values
+    return (
+        str(asset_id),
+        str(asset_name),
+        str(purpose),
+        _to_float(ratio),
+        _to_float(lower),
+        _to_float(upper),
+    )
+
+
+def import_target_file(
+    target: TargetAllocation,
+    path: str | os.PathLike[str],
+    *,
+    registry: AssetRegistry | None = None,
+    on_progress: ProgressCallback | None = None,
+    progress_every: int = 100_000,
+    max_errors: int = 1_000,
+    errors: ErrorCollector | None = None,
+) -> ImportReport:
+    """
+    Stream a CSV or JSONL file into an existing TargetAllocation.
+
+    Every row goes through add_asset_to_target(), so the same domain
+    validation applies as for interactively added assets. Invalid rows
+    are rejected individually and reported with their line number; valid
+    rows are added as they are read.
+
+    Args:
+        target: The TargetAllocation to be updated.
+        path: Path of a ``.csv`` or ``.jsonl``/``.ndjson`` file.
+        registry: Optional asset registry to intern the assets through.
+        on_progress: Optional callback invoked with the running report every
+            ``progress_every`` rows and once at the end.
+        progress_every: Number of rows between progress callbacks.
+        max_errors: Maximum number of row errors kept in the report.
+        errors: Optional collector receiving every rejection, tagged with the
+            path and line: the domain error of the row, or an
+            InvalidImportRowError if the row could not be parsed.
+
+    Returns:
+        The import report.
+
+    Raises:
+        InvalidImportFileError: If the file type is unsupported, its header
+            is malformed, or the file cannot be read. Rows read before a
+            mid-file failure stay added; the error's ``imported`` and
+            ``rejected`` details count them.
+    """
+    path = os.fspath(path)
+    report = ImportReport()
+    next_progress = progress_every
+
+    try:
+        for line, values in iter_records(path):
+            try:
+                add_asset_to_target(target, *parse_row(values), registry=registry)
+                report.imported += 1
+            except (AppError, ValueError, TypeError) as e:
+                report.rejected += 1
+                if errors is not None:
+                    if isinstance(e, AppError):
+                        errors.add(e, source=path, line=line)
+                    else:
+                        errors.add(
+                            InvalidImportRowError(path=path, line=line, reason=str(e)),
+                            source=path,
+                            line=line,
+                        )
+                if len(report.errors) < max_errors:
+                    reason = e.message if isinstance(e, AppError) else str(e)
+                    report.errors.append(
+                        InvalidImportRowError(
+                            path=path, line=line, reason=reason, cause=e
+                        )
+                    )
+
+            if on_progress is not None and report.processed >= next_progress:
+                next_progress += progress_every
+                on_progress(report)
+    except InvalidImportFileError as e:
+        if not report.processed:
+            raise
+        # The rows before the failure stay added; say how many there were.
+        raise InvalidImportFileError(
+            path=path,
+            reason=f"{e.details['reason']} (after {report.imported:,} rows were "
+            f"imported and {report.rejected:,} rejected)",
+            details={"imported": report.imported, "rejected": report.rejected},
+            cause=e.cause,
+        ) from e
+
+    if on_progress is not None:
+        on_progress(report)
+    return report
@@ -0,0 +1,83 @@
+"""
+Parallel execution of Monte Carlo band simulations across CPU cores.
+
+A simulation plan is split into its path batches, and each batch runs
+in a worker process::
+
+    plan -> [worker] simulate_batch(plan, b) -> BatchTotals
+         -> summarize totals in batch order
+
+A batch result is a handful of per-band numbers, so the inter-process
+traffic is one pickled plan per batch (target ratios, Cholesky factor
+and band settings) plus a few floats back. Each batch seeds its own
+generator from the plan's seed and its index, and totals are merged in
+batch order, so a report is identical for any number of workers.
+
+Batches are submitted through a bounded window, as in batch_runner.
+"""
+
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+
+from portfotrack.common.instrumentation import instrumented
+from portfotrack.domain.simulation import (
+    BatchTotals,
+    SimulationPlan,
+    SimulationReport,
+    simulate_batch,
+    summarize,
+)
+from portfotrack.domain.simulation.errors import InvalidSimulationSettingError
+
+
+def _run_batches(
+    plan: SimulationPlan, pool: Executor, window_size: int
+) -> Iterator[BatchTotals]:
+    window: deque[Future[BatchTotals]] = deque()
+    for batch in range(plan.batches):
+        window.append(pool.submit(simulate_batch, plan, batch))
+        if len(window) >= window_size:
+            yield window.popleft().result()
+    while window:
+        yield window.popleft().result()
+
+
+@instrumented("services.run_simulation")
+def run_simulation(
+    plan: SimulationPlan,
+    *,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> SimulationReport:
+    """
+    Run every batch of a simulation plan in parallel.
+
+    Args:
+        plan: The simulation to run (see ``plan_simulation``).
+        max_workers: Number of worker processes. Defaults to the number of
+            CPUs. With 1, batches run in the calling process.
+        executor: Optional existing executor to submit batches to instead
+            of starting a process pool. It is not shut down.
+
+    Returns:
+        The simulation report, identical to ``simulate(plan)``.
+
+    Raises:
+        InvalidSimulationSettingError: If ``max_workers`` is not positive.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise InvalidSimulationSettingError(name="max_workers", value=max_workers)
+
+    if executor is None and max_workers == 1:
+        return summarize(plan, (simulate_batch(plan, b) for b in range(plan.batches)))
+
+    pool = executor or ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        return summarize(plan, _run_batches(plan, pool, 2 * max_workers))
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
@@ -1,7 +1,19 @@
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from portfotrack.common.instrumentation import instrumented
+from portfotrack.domain.asset import AssetRegistry
 from portfotrack.domain.asset.factory import create_asset
 from portfotrack.domain.target_allocation import TargetAllocation
 
+if TYPE_CHECKING:
+    from portfotrack.storage.repository import TargetRepository
+
+AssetRow = tuple[str, str, str, float, float, float]
+"""A raw asset row: ``(asset_id, asset_name, purpose, target_ratio, lower, upper)``."""
+
 
+@instrumented("services.init_target")
 def init_target() -> TargetAllocation:
     """
     Initialize a new, empty TargetAllocation.
@@ -22,6 +34,7 @@ def init_target() -> TargetAllocation:
     return TargetAllocation()
 
 
+@instrumented("services.add_asset_to_target")
 def add_asset_to_target(
     target: TargetAllocation,
     asset_id: str,
@@ -30,6 +43,7 @@ def add_asset_to_target(
     target_ratio: float,
     lower: float,
     upper: float,
+    registry: AssetRegistry | None = None,
 ) -> TargetAllocation:
     """
     Add an asset allocation entry to an existing TargetAllocation.
@@ -52,10 +66,106 @@ def add_asset_to_target(
         target_ratio: Desired allocation ratio (0.0 ~ 1.0).
         lower: Lower bound of the allowed tolerance.
         upper: Upper bound of the allowed tolerance.
+        registry: Optional asset registry to intern the asset through. If
+            the asset is rejected, an id it newly registered is rolled back.
+
+    Returns:
+        The updated TargetAllocation instance.
+    """
+    mark = 0 if registry is None else len(registry)
+    try:
+        asset = create_asset(asset_id, asset_name, purpose, registry)
+        target.add_asset(asset, target_ratio, {"lower": lower, "upper": upper})
+    except Exception:
+        if registry is not None:
+            registry.rollback(mark)
+        raise
+    return target
+
+
+@instrumented("services.add_assets_to_target")
+def add_assets_to_target(
+    target: TargetAllocation,
+    rows: Iterable[AssetRow],
+    registry: AssetRegistry | None = None,
+) -> TargetAllocation:
+    """
+    Add many asset allocation entries to an existing TargetAllocation.
+
+    This is the bulk counterpart of add_asset_to_target(). Assets are
+    created via the asset factory and the whole batch is handed to
+    TargetAllocation.add_assets(), which validates every row in a single
+    pass and adds either all rows or none.
+
+    Args:
+        target: The TargetAllocation to be updated.
+        rows: Raw rows of
+            ``(asset_id, asset_name, purpose, target_ratio, lower, upper)``.
+        registry: Optional asset registry to intern the assets through. If
+            the batch is rejected, ids it newly registered are rolled back.
 
     Returns:
         The updated TargetAllocation instance.
+
+    Raises:
+        BulkValidationError: If any row is invalid. Row numbers in its
+            details are zero-based positions in ``rows``.
     """
-    asset = create_asset(asset_id, asset_name, purpose)
-    target.add_asset(asset, target_ratio, {"lower": lower, "upper": upper})
+    mark = 0 if registry is None else len(registry)
+    try:
+        target.add_assets(
+            [
+                (
+                    create_asset(asset_id, asset_name, purpose, registry),
+                    target_ratio,
+                    lower,
+                    upper,
+                )
+                for asset_id, asset_name, purpose, target_ratio, lower, upper in rows
+            ]
+        )
+    except Exception:
+        if registry is not None:
+            registry.rollback(mark)
+        raise
     return target
+
+
+@instrumented("services.store_target")
+def store_target(
+    repository: "TargetRepository", name: str, target: TargetAllocation
+) -> None:
+    """
+    Persist a TargetAllocation under a name.
+
+    The repository decides where it is kept (e.g. SqliteStorage.targets),
+    so callers stay independent of the storage backend.
+
+    Args:
+        repository: Store of named target allocations.
+        name: Name to store the allocation under. An allocation already
+            stored under it is replaced.
+        target: The TargetAllocation to persist.
+    """
+    repository.save(name, target)
+
+
+@instrumented("services.fetch_target")
+def fetch_target(
+    repository: "TargetRepository", name: str, registry: AssetRegistry | None = None
+) -> TargetAllocation:
+    """
+    Load a TargetAllocation previously persisted with store_target().
+
+    Args:
+        repository: Store of named target allocations.
+        name: Name the allocation was stored under.
+        registry: Optional asset registry to intern the assets through.
+
+    Returns:
+        A new TargetAllocation with the stored entries, in stored order.
+
+    Raises:
+        TargetNotFoundError: If nothing is stored under ``name``.
+    """
+    return repository.load(name, registry)
@@ -0,0 +1,364 @@
+"""
+Compact binary on-disk format for target allocations.
+
+Layout (all integers and floats little-endian)::
+
+    header    magic "PFTA", u16 version, u16 flags, u64 row count,
+              u64 string blob size, 8 reserved bytes        (32 bytes)
+    ratios    float64[count]
+    lowers    float64[count]
+    uppers    float64[count]
+    offsets   uint64[3 * count + 1]   string k spans blob[off[k]:off[k + 1]]
+    blob      UTF-8 bytes of id, name, purpose for each row, interleaved
+
+Every section is 8-byte aligned, so a file opened through ``mmap`` exposes
+its numeric columns as float64 memoryviews without copying, and strings
+are only decoded when a row is actually read.
+"""
+
+import contextlib
+import math
+import mmap
+import operator
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from itertools import accumulate, chain, islice
+from types import TracebackType
+from typing import overload
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+    TargetColumns,
+    Tolerance,
+)
+from portfotrack.domain.target_allocation.target import validate_total_ratio
+from portfotrack.storage.errors import (
+    InvalidFileFormatError,
+    UnsupportedFormatVersionError,
+)
+
+MAGIC = b"PFTA"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHQQ8x")
+_FIELDS_PER_ROW = 3
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _to_le_bytes(values: array) -> bytes:
+    if _LITTLE_ENDIAN:
+        return values.tobytes()
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def save_target(
+    target: TargetAllocation | ColumnarTargetAllocation,
+    path: str | os.PathLike[str],
+    *,
+    sync: bool = True,
+) -> None:
+    """Writes a target allocation to ``path`` in the binary format.
+
+    The file is written to a temporary sibling and atomically moved into
+    place, so readers never observe a partially written file. With
+    ``sync``, the temporary file is fsynced before the move and the
+    directory after it, so after a power loss ``path`` holds either the
+    previous file or the complete new one.
+
+    Args:
+        target: Allocation to persist (either backing).
+        path: Destination file path.
+        sync: Whether to fsync the file and its directory.
+    """
+    if not isinstance(target, ColumnarTargetAllocation):
+        target = ColumnarTargetAllocation.from_target(target)
+
+    encoded = [
+        s.encode("utf-8")
+        for s in chain.from_iterable(
+            zip(target.ids, target.names, target.purposes, strict=True)
+        )
+    ]
+    offsets = array("Q", accumulate(map(len, encoded), initial=0))
+    blob = b"".join(encoded)
+    padding = b"\0" * (-len(blob) % 8)
+
+    path = os.fspath(path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(target), len(blob)))
+        f.write(_to_le_bytes(target.ratios))
+        f.write(_to_le_bytes(target.lowers))
+        f.write(_to_le_bytes(target.uppers))
+        f.write(_to_le_bytes(offsets))
+        f.write(blob)
+        f.write(padding)
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    if sync:
+        fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class _StringColumn(Sequence[str]):
+    """Lazily decoded view of one string field of every row."""
+
+    __slots__ = ("_blob", "_offsets", "_field", "_len")
+
+    def __init__(self, blob: memoryview, offsets: Sequence[int], field: int) -> None:
+        self._blob = blob
+        self._offsets = offsets
+        self._field = field
+        self._len = (len(offsets) - 1) // _FIELDS_PER_ROW
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[str]:
+        # Walks the offsets directly, without per-item bounds checks. No
+        # view is kept between items, so the file can be closed mid-way.
+        blob, offsets = self._blob, self._offsets
+        for k in range(self._field, self._len * _FIELDS_PER_ROW, _FIELDS_PER_ROW):
+            yield str(blob[offsets[k] : offsets[k + 1]], "utf-8")
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(islice(self, start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(index)
+        k = index * _FIELDS_PER_ROW + self._field
+        return str(self._blob[self._offsets[k] : self._offsets[k + 1]], "utf-8")
+
+
+class MappedTargetAllocation:
+    """Read-only target allocation backed by a memory-mapped binary file.
+
+    Opening only validates the header and the string offsets, then exposes
+    the sections as views over the mapping. Numeric columns are zero-copy
+    float64 memoryviews, strings are decoded on access, and the
+    ``id -> row`` index is only built on the first lookup by id.
+
+    Use as a context manager, or call ``close`` when done. Columns and
+    views obtained from this object must not be used after closing.
+
+    Attributes:
+        ids: Asset identifiers, one per row (decoded lazily).
+        names: Asset display names, one per row (decoded lazily).
+        purposes: Asset purposes, one per row (decoded lazily).
+        ratios: Target ratio column.
+        lowers: Lower tolerance bound column.
+        uppers: Upper tolerance bound column.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._file.close()
+            raise InvalidFileFormatError(
+                path=self.path, reason="file is empty", cause=e
+            ) from e
+        try:
+            self._map_sections()
+        except Exception:
+            self.close()
+            raise
+        self._index: dict[str, int] | None = None
+        self._total: float | None = None
+
+    def _map_sections(self) -> None:
+        self._views: list[memoryview] = []
+        size = len(self._mmap)
+        if size < _HEADER.size:
+            raise InvalidFileFormatError(path=self.path, reason="truncated header")
+
+        magic, version, _, count, blob_size = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise InvalidFileFormatError(path=self.path, reason="bad magic number")
+        if version != FORMAT_VERSION:
+            raise UnsupportedFormatVersionError(
+                path=self.path, version=version, supported=FORMAT_VERSION
+            )
+
+        n_offsets = count * _FIELDS_PER_ROW + 1
+        blob_start = _HEADER.size + 24 * count + 8 * n_offsets
+        if size != blob_start + blob_size + (-blob_size % 8):
+            raise InvalidFileFormatError(path=self.path, reason="unexpected file size")
+
+        view = memoryview(self._mmap)
+        self._views.append(view)
+        start = _HEADER.size
+        columns = []
+        sections = (("d", count), ("d", count), ("d", count), ("Q", n_offsets))
+        for typecode, length in sections:
+            end = start + 8 * length
+            columns.append(self._column(view[start:end], typecode))
+            start = end
+        self.ratios, self.lowers, self.uppers, offsets = columns
+
+        if offsets[0] != 0 or offsets[-1] != blob_size:
+            raise InvalidFileFormatError(
+                path=self.path, reason="string offsets do not span the blob"
+            )
+        if not all(map(operator.le, offsets, islice(offsets, 1, None))):
+            raise InvalidFileFormatError(
+                path=self.path, reason="string offsets are not increasing"
+            )
+        blob = view[blob_start : blob_start + blob_size]
+        self._views.append(blob)
+        self.ids = _StringColumn(blob, offsets, 0)
+        self.names = _StringColumn(blob, offsets, 1)
+        self.purposes = _StringColumn(blob, offsets, 2)
+
+    def _column(self, raw: memoryview, typecode: str) -> memoryview | array:
+        if _LITTLE_ENDIAN:
+            column = raw.cast(typecode)
+            self._views.extend((raw, column))
+            return column
+        values = array(typecode, raw.tobytes())
+        values.byteswap()
+        raw.release()
+        return values
+
+    def close(self) -> None:
+        """Releases the mapping and the underlying file.
+
+        The file is always closed. Views the caller still holds (e.g. a
+        slice of ``ratios``) pin the mapping, which then cannot be unmapped
+        here without raising BufferError; it is left to be unmapped once
+        the last such view is dropped.
+        """
+        try:
+            for view in reversed(getattr(self, "_views", [])):
+                with contextlib.suppress(BufferError):
+                    view.release()
+            self._views = []
+            with contextlib.suppress(BufferError):
+                self._mmap.close()
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> "MappedTargetAllocation":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, asset: object) -> bool:
+        if isinstance(asset, Asset):
+            asset = asset.id
+        return isinstance(asset, str) and self.row_of(asset) is not None
+
+    def row_of(self, asset_id: str) -> int | None:
+        """Returns the row index of an asset id, or None if absent."""
+        if self._index is None:
+            self._index = dict(zip(self.ids, range(len(self.ids)), strict=True))
+        return self._index.get(asset_id)
+
+    def asset_at(self, row: int) -> Asset:
+        """Builds the Asset stored at the given row."""
+        return Asset(self.ids[row], self.names[row], self.purposes[row])
+
+    def get(self, asset: Asset) -> tuple[float, Tolerance] | None:
+        """Looks up the target entry of an asset.
+
+        Returns:
+            The ``(target_ratio, tolerance)`` pair, or None if absent.
+        """
+        row = self.row_of(asset.id)
+        if row is None:
+            return None
+        return self.ratios[row], {"lower": self.lowers[row], "upper": self.uppers[row]}
+
+    def columns(self) -> TargetColumns:
+        """Returns the zero-copy column view of the allocation."""
+        return TargetColumns(self.ids, self.ratios, self.lowers, self.uppers)
+
+    def total_ratio(self) -> float:
+        """Returns the correctly rounded sum of all target ratios.
+
+        The file is read-only, so the sum is computed once and cached.
+        """
+        if self._total is None:
+            self._total = math.fsum(self.ratios)
+        return self._total
+
+    def validate_total(self, eps: float = 1e-6) -> None:
+        """Validates that total target allocation sums to 1.0.
+
+        Raises:
+            TotalRatioMismatchError: If the total allocation deviates from 1.0 beyond eps.
+        """
+        validate_total_ratio(self.total_ratio(), eps)
+
+    def to_columnar(self) -> ColumnarTargetAllocation:
+        """Copies the mapped data into an in-memory ColumnarTargetAllocation."""
+        return ColumnarTargetAllocation.from_columns(
+            self.ids, self.names, self.purposes, self.ratios, self.lowers, self.uppers
+        )
+
+
+def open_target(path: str | os.PathLike[str]) -> MappedTargetAllocation:
+    """Opens a binary target allocation file through ``mmap``.
+
+    Args:
+        path: File written by ``save_target``.
+
+    Returns:
+        A lazily loaded, read-only view of the allocation.
+
+    Raises:
+        InvalidFileFormatError: If the file is not a valid allocation file.
+        UnsupportedFormatVersionError: If the file format version is unknown.
+    """
+    return MappedTargetAllocation(path)
+
+
+def load_target(path: str | os.PathLike[str]) -> ColumnarTargetAllocation:
+    """Loads a binary target allocation file fully into memory.
+
+    Args:
+        path: File written by ``save_target``.
+
+    Returns:
+        An in-memory copy of the stored allocation.
+
+    Raises:
+        InvalidFileFormatError: If the file is not a valid allocation file.
+        UnsupportedFormatVersionError: If the file format version is unknown.
+    """
+    with open_target(path) as mapped:
+        return mapped.to_columnar()
@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class StorageErrorCode(StrEnum):
+    STORAGE_INVALID_FORMAT = "STORAGE.INVALID_FORMAT"
+    STORAGE_UNSUPPORTED_VERSION = "STORAGE.UNSUPPORTED_VERSION"
+    STORAGE_OUT_OF_ORDER = "STORAGE.OUT_OF_ORDER"
+    STORAGE_NOT_FOUND = "STORAGE.NOT_FOUND"
+    STORAGE_UNAVAILABLE = "STORAGE.UNAVAILABLE"
@@ -0,0 +1,148 @@
+from typing import Any
+
+from portfotrack.common.errors import AppError
+from portfotrack.storage.error_codes import StorageErrorCode
+
+
+class StorageError(AppError):
+    """Base class for storage-layer errors."""
+
+    pass
+
+
+class InvalidFileFormatError(StorageError):
+    """Raised when a file is not a well-formed PortfoTrack storage file.
+
+    Attributes:
+        details: Contains:
+            - path: The path of the offending file.
+            - reason: Short description of what is malformed.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        reason: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=StorageErrorCode.STORAGE_INVALID_FORMAT,
+            message=f"{path} is not a valid PortfoTrack file: {reason}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"path": path, "reason": reason})
+
+
+class UnsupportedFormatVersionError(StorageError):
+    """Raised when a storage file was written with an unsupported format version.
+
+    Attributes:
+        details: Contains:
+            - path: The path of the offending file.
+            - version: The format version found in the file.
+            - supported: The format version this build can read.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        version: int,
+        supported: int,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=StorageErrorCode.STORAGE_UNSUPPORTED_VERSION,
+            message=f"{path} uses format version {version}, "
+            f"but only version {supported} is supported.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"path": path, "version": version, "supported": supported})
+
+
+class SnapshotOrderError(StorageError):
+    """Raised when a snapshot is appended out of chronological order.
+
+    The snapshot store is append-only, so every snapshot must be dated
+    strictly after the last stored one.
+
+    Attributes:
+        details: Contains:
+            - as_of: ISO date of the rejected snapshot.
+            - last: ISO date of the last stored snapshot.
+    """
+
+    def __init__(
+        self,
+        *,
+        as_of: str,
+        last: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=StorageErrorCode.STORAGE_OUT_OF_ORDER,
+            message=f"Snapshot of {as_of} must be dated after the last "
+            f"stored snapshot ({last}).",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"as_of": as_of, "last": last})
+
+
+class TargetNotFoundError(StorageError):
+    """Raised when no target allocation is stored under the requested name.
+
+    Attributes:
+        details: Contains:
+            - name: The requested allocation name.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=StorageErrorCode.STORAGE_NOT_FOUND,
+            message=f"No target allocation is stored under '{name}'.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"name": name})
+
+
+class StorageUnavailableError(StorageError):
+    """Raised when no database connection can be handed out.
+
+    Typical causes are a connection pool that has been closed, or one
+    whose connections all stayed in use for the whole wait timeout.
+
+    Attributes:
+        details: Contains:
+            - path: Path of the database file.
+            - reason: Description of why no connection was available.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        reason: str,
+        details: dict[str, Any] | None = None,
+        cause: BaseException | None = None,
+    ) -> None:
+        super().__init__(
+            code=StorageErrorCode.STORAGE_UNAVAILABLE,
+            message=f"No connection to '{path}' is available: {reason}.",
+            details=details,
+            cause=cause,
+        )
+        self.details.update({"path": path, "reason": reason})
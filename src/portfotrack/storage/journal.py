@@ -0,0 +1,470 @@
+"""
+Write-ahead journal of REPL session changes, with checkpoints.
+
+A session directory holds one checkpoint and one journal per generation::
+
+    checkpoint-00000003.pfta   target allocation (binary.py format)
+    journal-00000003.pfjl      operations applied after that checkpoint
+
+Journal layout (little-endian)::
+
+    header    magic "PFJL", u16 version, u16 flags, u64 generation (16 bytes)
+    records   u32 payload size, u32 CRC-32 of payload, payload
+
+    init-target payload   u8 op = 1
+    add-asset payload     u8 op = 2, f64 ratio, f64 lower, f64 upper,
+                          u32 id size, u32 name size, u32 purpose size,
+                          UTF-8 id, name, purpose
+
+Records are buffered and written with a single ``write`` + ``fsync`` per
+group (group commit): once ``group_size`` records are pending, or on
+``commit``. A single background flusher thread per journal commits a
+group once its first record is ``max_delay`` seconds old, so a pending
+group is written even if no further record or explicit ``commit``
+follows. The flusher sleeps on a condition between groups, so commits
+do not start threads.
+
+A checkpoint writes the allocation to a temporary file, fsyncs it,
+renames it to ``checkpoint-<g+1>``, fsyncs the directory, and only then
+starts ``journal-<g+1>`` and removes generation ``g``. A journal without
+a same-generation checkpoint therefore means the session had no target
+at that checkpoint. A crash at any point leaves a complete generation
+to recover from.
+
+Recovery loads the newest checkpoint and replays its journal. Consecutive
+add-asset records are applied through one ``add_assets`` call. A torn
+record at the end of the journal (a crash mid-write, including a
+zero-filled tail) ends the replay and is truncated away.
+"""
+
+import gc
+import os
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from portfotrack.domain.asset import Asset, AssetRegistry
+from portfotrack.domain.target_allocation import TargetAllocation
+from portfotrack.domain.target_allocation.target import TargetEntry
+from portfotrack.storage.binary import open_target, save_target
+from portfotrack.storage.errors import (
+    InvalidFileFormatError,
+    UnsupportedFormatVersionError,
+)
+
+MAGIC = b"PFJL"
+FORMAT_VERSION = 1
+CHECKPOINT_SUFFIX = ".pfta"
+JOURNAL_SUFFIX = ".pfjl"
+
+OP_INIT_TARGET = 1
+OP_ADD_ASSET = 2
+
+_HEADER = struct.Struct("<4sHHQ")
+_FRAME = struct.Struct("<II")
+_ADD_ASSET = struct.Struct("<BdddIII")
+_INIT_TARGET = bytes([OP_INIT_TARGET])
+
+
+def _checkpoint_name(generation: int) -> str:
+    return f"checkpoint-{generation:08d}{CHECKPOINT_SUFFIX}"
+
+
+def _journal_name(generation: int) -> str:
+    return f"journal-{generation:08d}{JOURNAL_SUFFIX}"
+
+
+def _generation_of(name: str) -> int | None:
+    stem, suffix = os.path.splitext(name)
+    prefix, _, number = stem.partition("-")
+    if (prefix, suffix) not in (
+        ("checkpoint", CHECKPOINT_SUFFIX),
+        ("journal", JOURNAL_SUFFIX),
+    ):
+        return None
+    return int(number) if number.isdigit() else None
+
+
+def _fsync_path(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pauses cyclic garbage collection during a bulk load.
+
+    Recovery allocates millions of long-lived objects and no cycles, so
+    the collections their allocation triggers only rescan live data.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@dataclass(frozen=True, slots=True)
+class Recovery:
+    """Session state rebuilt from a session directory.
+
+    Attributes:
+        target: The recovered allocation, or None if no target was active.
+        generation: Generation of the checkpoint recovery started from.
+        checkpoint_rows: Number of assets loaded from the checkpoint.
+        replayed: Number of journal records applied on top of it.
+        discarded_bytes: Size of a torn record truncated from the journal.
+    """
+
+    target: TargetAllocation | None
+    generation: int
+    checkpoint_rows: int
+    replayed: int
+    discarded_bytes: int
+
+
+class SessionJournal:
+    """Append side of a session's write-ahead journal.
+
+    Use ``open_session`` to recover a session and obtain its journal.
+
+    Attributes:
+        directory: The session directory.
+        generation: Current checkpoint generation.
+        group_size: Pending records that trigger a commit.
+        max_delay: Age, in seconds, of the oldest pending record that
+            triggers a commit.
+        checkpoint_every: Records since the last checkpoint after which
+            ``checkpoint_due`` becomes true.
+        sync: Whether commits call ``fsync``.
+        records: Records appended since the last checkpoint.
+        commits: Number of group commits so far.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        generation: int,
+        *,
+        records: int = 0,
+        group_size: int = 1024,
+        max_delay: float = 0.05,
+        checkpoint_every: int = 1_000_000,
+        sync: bool = True,
+    ) -> None:
+        self.directory = directory
+        self.generation = generation
+        self.group_size = group_size
+        self.max_delay = max_delay
+        self.checkpoint_every = checkpoint_every
+        self.sync = sync
+        self.records = records
+        self.commits = 0
+        self._pending: list[bytes] = []
+        self._pending_since = 0.0
+        # Guards the pending group and the file against the flusher thread.
+        self._lock = threading.RLock()
+        self._group_started = threading.Condition(self._lock)
+        self._flusher: threading.Thread | None = None
+        self._fd = self._open(generation)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _open(self, generation: int) -> int:
+        path = self._path(_journal_name(generation))
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        if os.fstat(fd).st_size == 0:
+            os.write(fd, _HEADER.pack(MAGIC, FORMAT_VERSION, 0, generation))
+            if self.sync:
+                os.fsync(fd)
+                _fsync_path(self.directory)
+        return fd
+
+    def __enter__(self) -> "SessionJournal":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def checkpoint_due(self) -> bool:
+        """Whether enough records accumulated to warrant a checkpoint."""
+        return self.records >= self.checkpoint_every
+
+    def _flush_aged_groups(self) -> None:
+        """Body of the flusher thread: commits groups older than max_delay."""
+        with self._lock:
+            while self._fd >= 0:
+                if not self._pending:
+                    self._group_started.wait()
+                    continue
+                remaining = self._pending_since + self.max_delay - time.monotonic()
+                if remaining > 0:
+                    self._group_started.wait(remaining)
+                else:
+                    self.commit()
+
+    def _append(self, payload: bytes) -> None:
+        record = _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            if self.max_delay <= 0:
+                self._pending.append(record)
+                self.records += 1
+                self.commit()
+                return
+            if not self._pending:
+                self._pending_since = time.monotonic()
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_aged_groups,
+                        name="journal-flusher",
+                        daemon=True,
+                    )
+                    self._flusher.start()
+                self._group_started.notify()
+            self._pending.append(record)
+            self.records += 1
+            if len(self._pending) >= self.group_size:
+                self.commit()
+
+    def log_init_target(self) -> None:
+        """Journals that a new, empty target allocation became active."""
+        self._append(_INIT_TARGET)
+
+    def log_add_asset(
+        self, asset: Asset, target_ratio: float, lower: float, upper: float
+    ) -> None:
+        """Journals that an asset was added to the active target allocation."""
+        strings = [s.encode("utf-8") for s in (asset.id, asset.name, asset.purpose)]
+        self._append(
+            _ADD_ASSET.pack(
+                OP_ADD_ASSET, target_ratio, lower, upper, *map(len, strings)
+            )
+            + b"".join(strings)
+        )
+
+    def commit(self) -> None:
+        """Writes every pending record with one write and one fsync."""
+        with self._lock:
+            if not self._pending:
+                return
+            data = b"".join(self._pending)
+            self._pending.clear()
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._fd, view) :]
+            if self.sync:
+                os.fsync(self._fd)
+            self.commits += 1
+
+    def checkpoint(self, target: TargetAllocation | None) -> None:
+        """Persists ``target`` and starts a new, empty journal generation.
+
+        Args:
+            target: The session's current allocation, or None if no target
+                is active.
+        """
+        with self._lock:
+            self.commit()
+            generation = self.generation + 1
+            if target is not None:
+                save_target(
+                    target, self._path(_checkpoint_name(generation)), sync=self.sync
+                )
+            old_fd, old_generation = self._fd, self.generation
+            self._fd = self._open(generation)
+            self.generation = generation
+            self.records = 0
+            os.close(old_fd)
+        for name in (_checkpoint_name(old_generation), _journal_name(old_generation)):
+            try:
+                os.remove(self._path(name))
+            except FileNotFoundError:
+                pass
+
+    def close(self) -> None:
+        """Commits pending records, stops the flusher and closes the file."""
+        with self._lock:
+            if self._fd < 0:
+                return
+            self.commit()
+            os.close(self._fd)
+            self._fd = -1
+            self._group_started.notify()
+        if self._flusher is not None:
+            self._flusher.join()
+
+
+def _load_checkpoint(path: str, registry: AssetRegistry) -> TargetAllocation:
+    """Loads a checkpoint, interning its assets through ``registry``."""
+    target = TargetAllocation()
+    with open_target(path) as mapped:
+        assets = map(registry.intern, mapped.ids, mapped.names, mapped.purposes)
+        target.add_assets(
+            zip(assets, mapped.ratios, mapped.lowers, mapped.uppers, strict=True)
+        )
+    return target
+
+
+def _replay(
+    path: str,
+    data: bytes,
+    target: TargetAllocation | None,
+    registry: AssetRegistry,
+) -> tuple[TargetAllocation | None, int, int]:
+    """Applies the records in ``data``; returns (target, replayed, valid end)."""
+    rows: list[TargetEntry] = []
+
+    def flush() -> None:
+        if rows:
+            if target is None:
+                raise InvalidFileFormatError(
+                    path=path, reason="add-asset record before init-target"
+                )
+            target.add_assets(rows)
+            rows.clear()
+
+    intern = registry.intern
+    frame_size, add_size = _FRAME.size, _ADD_ASSET.size
+    unpack_frame, unpack_add = _FRAME.unpack_from, _ADD_ASSET.unpack_from
+    pos, end, replayed = _HEADER.size, len(data), 0
+    while pos + frame_size <= end:
+        size, crc = unpack_frame(data, pos)
+        start = pos + frame_size
+        payload = data[start : start + size]
+        # A zero-filled tail reads as size 0 and CRC 0, which is the CRC of
+        # b"": no record is empty, so it marks the end of valid data.
+        if size == 0 or len(payload) != size or zlib.crc32(payload) != crc:
+            break
+        op = payload[0]
+        if op == OP_ADD_ASSET:
+            if size < add_size:
+                break
+            _, ratio, lower, upper, n_id, n_name, n_purpose = unpack_add(payload)
+            if add_size + n_id + n_name + n_purpose > size:
+                break
+            a = add_size
+            b = a + n_id
+            c = b + n_name
+            asset = intern(
+                payload[a:b].decode("utf-8"),
+                payload[b:c].decode("utf-8"),
+                payload[c : c + n_purpose].decode("utf-8"),
+            )
+            rows.append((asset, ratio, lower, upper))
+        elif op == OP_INIT_TARGET:
+            flush()
+            target = TargetAllocation()
+            registry.rollback(0)
+        else:
+            raise InvalidFileFormatError(path=path, reason=f"unknown operation {op}")
+        pos = start + size
+        replayed += 1
+    flush()
+    return target, replayed, pos
+
+
+def open_session(
+    directory: str | os.PathLike[str],
+    registry: AssetRegistry | None = None,
+    *,
+    group_size: int = 1024,
+    max_delay: float = 0.05,
+    checkpoint_every: int = 1_000_000,
+    sync: bool = True,
+) -> tuple[SessionJournal, Recovery]:
+    """Recovers a session directory and opens its journal for appending.
+
+    Args:
+        directory: Session directory; created if missing.
+        registry: Registry the recovered assets are interned through. Like
+            the session registry, it is cleared at every init-target record.
+        group_size: Pending records that trigger a commit.
+        max_delay: Age, in seconds, of the oldest pending record that
+            triggers a commit.
+        checkpoint_every: Records since the last checkpoint after which
+            ``checkpoint_due`` becomes true.
+        sync: Whether commits and checkpoints call ``fsync``.
+
+    Returns:
+        The journal, positioned after the last valid record, and the
+        recovered state.
+
+    Raises:
+        InvalidFileFormatError: If a checkpoint or journal is malformed.
+        UnsupportedFormatVersionError: If a file format version is unknown.
+    """
+    directory = os.fspath(directory)
+    os.makedirs(directory, exist_ok=True)
+    registry = AssetRegistry() if registry is None else registry
+
+    generations: set[int] = set()
+    for name in os.listdir(directory):
+        if name.endswith(".tmp"):
+            os.remove(os.path.join(directory, name))
+            continue
+        generation = _generation_of(name)
+        if generation is not None:
+            generations.add(generation)
+    generation = max(generations, default=0)
+
+    target: TargetAllocation | None = None
+    checkpoint_rows = 0
+    checkpoint_path = os.path.join(directory, _checkpoint_name(generation))
+    if os.path.exists(checkpoint_path):
+        with _gc_paused():
+            target = _load_checkpoint(checkpoint_path, registry)
+        checkpoint_rows = len(target.target_assets)
+
+    journal_path = os.path.join(directory, _journal_name(generation))
+    replayed = discarded = 0
+    if os.path.exists(journal_path):
+        with open(journal_path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            # Crashed while writing the header: no record was committed.
+            os.remove(journal_path)
+        else:
+            magic, version, _, stored = _HEADER.unpack_from(data)
+            if magic != MAGIC or stored != generation:
+                raise InvalidFileFormatError(
+                    path=journal_path, reason="bad journal header"
+                )
+            if version != FORMAT_VERSION:
+                raise UnsupportedFormatVersionError(
+                    path=journal_path, version=version, supported=FORMAT_VERSION
+                )
+            with _gc_paused():
+                target, replayed, valid_end = _replay(
+                    journal_path, data, target, registry
+                )
+            discarded = len(data) - valid_end
+            if discarded:
+                os.truncate(journal_path, valid_end)
+
+    journal = SessionJournal(
+        directory,
+        generation,
+        records=replayed,
+        group_size=group_size,
+        max_delay=max_delay,
+        checkpoint_every=checkpoint_every,
+        sync=sync,
+    )
+    for stale in generations - {generation}:
+        for name in (_checkpoint_name(stale), _journal_name(stale)):
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                pass
+    return journal, Recovery(target, generation, checkpoint_rows, replayed, discarded)
@@ -0,0 +1,86 @@
+"""
+Repository interfaces between the service layer and storage backends.
+
+Services depend on these protocols rather than on a concrete store, so
+an allocation can be kept in the binary files, in SQLite (``sqlite.py``)
+or in a test double without the services changing. ``SnapshotStore``
+already satisfies ``HoldingsRepository``.
+"""
+
+from collections.abc import Iterable
+from datetime import date
+from typing import Protocol
+
+from portfotrack.domain.asset import Asset, AssetRegistry
+from portfotrack.domain.snapshot import HoldingsSnapshot
+from portfotrack.domain.target_allocation import TargetAllocation
+
+
+class AssetRepository(Protocol):
+    """Persistent catalog of assets, keyed by ``Asset.id``."""
+
+    def get(self, asset_id: str) -> Asset | None:
+        """Returns the stored asset with this id, or None."""
+        ...
+
+    def by_purpose(self, purpose: str) -> list[Asset]:
+        """Returns every stored asset with this purpose, ordered by id."""
+        ...
+
+    def upsert_many(self, assets: Iterable[Asset]) -> int:
+        """Inserts or updates assets in one transaction; returns the count."""
+        ...
+
+
+class TargetRepository(Protocol):
+    """Persistent, named target allocations."""
+
+    def names(self) -> list[str]:
+        """Returns the names of every stored allocation, sorted."""
+        ...
+
+    def save(self, name: str, target: TargetAllocation) -> None:
+        """Stores ``target`` under ``name``, replacing any previous one."""
+        ...
+
+    def load(
+        self, name: str, registry: AssetRegistry | None = None
+    ) -> TargetAllocation:
+        """Loads the allocation stored under ``name``.
+
+        Raises:
+            TargetNotFoundError: If no allocation is stored under ``name``.
+        """
+        ...
+
+    def delete(self, name: str) -> bool:
+        """Deletes the allocation stored under ``name``; False if absent."""
+        ...
+
+    def holding(self, asset_id: str) -> list[str]:
+        """Returns the names of the allocations that target ``asset_id``."""
+        ...
+
+
+class HoldingsRepository(Protocol):
+    """Persistent daily holdings snapshots."""
+
+    def extend(self, snapshots: Iterable[HoldingsSnapshot]) -> None:
+        """Stores many snapshots."""
+        ...
+
+    def last_date(self) -> date | None:
+        """Returns the date of the latest stored snapshot, if any."""
+        ...
+
+    def history(
+        self, asset_id: str, start: date | None = None, end: date | None = None
+    ) -> list[tuple[date, float]]:
+        """Returns ``(day, value)`` of one asset over an inclusive range."""
+        ...
+
+    def snapshots(
+        self, start: date | None = None, end: date | None = None
+    ) -> list[HoldingsSnapshot]:
+        """Returns the snapshots within an inclusive date range."""
+        ...
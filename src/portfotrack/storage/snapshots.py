@@ -0,0 +1,543 @@
+"""
+Append-only, segment-based store of daily holdings snapshots.
+
+Snapshots are buffered in memory and flushed as immutable *segments*,
+one file per contiguous run of days. Each segment is stored column-wise
+per asset, so the history of one asset within a segment is a single
+contiguous float64 run::
+
+    header    magic "PFSS", u16 version, u16 flags, i32 first day,
+              i32 last day, u32 day count, u32 asset count,
+              u64 string blob size                          (32 bytes)
+    days      int64[days]                 date ordinals, ascending
+    values    float64[assets * days]      asset-major; NaN = not held
+    offsets   uint64[assets + 1]          id k spans blob[off[k]:off[k + 1]]
+    blob      UTF-8 asset ids
+
+The first and last day of every segment are kept in memory (read from
+the headers when the store is opened), so a date-range query only
+touches the segments that overlap the range: "history of asset X over
+five years" is a handful of sequential reads, not a scan of every day.
+
+Frequent flushes produce many small segments. ``compact`` merges runs of
+adjacent small segments into segments of up to ``compact_days`` days; it
+can run on a background thread via ``start_compaction``. Merged segments
+are written next to their inputs and swapped in atomically, and a store
+reopened after an interrupted compaction discards whichever segments are
+covered by a merged one.
+"""
+
+import bisect
+import contextlib
+import math
+import mmap
+import os
+import struct
+import threading
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import date
+from itertools import accumulate
+from types import TracebackType
+
+from portfotrack.domain.snapshot import HoldingsSnapshot
+from portfotrack.storage.binary import _LITTLE_ENDIAN, _to_le_bytes
+from portfotrack.storage.errors import (
+    InvalidFileFormatError,
+    SnapshotOrderError,
+    UnsupportedFormatVersionError,
+)
+
+MAGIC = b"PFSS"
+FORMAT_VERSION = 1
+SEGMENT_SUFFIX = ".pfss"
+
+_HEADER = struct.Struct("<4sHHiiIIQ")
+_NAN = math.nan
+
+
+@dataclass(frozen=True, slots=True)
+class SegmentInfo:
+    """Summary of one on-disk segment.
+
+    Attributes:
+        path: Path of the segment file.
+        first: First day covered by the segment.
+        last: Last day covered by the segment.
+        days: Number of snapshots in the segment.
+        assets: Number of distinct assets in the segment.
+    """
+
+    path: str
+    first: date
+    last: date
+    days: int
+    assets: int
+
+
+class _Segment:
+    """An immutable segment file, memory-mapped on first read."""
+
+    __slots__ = (
+        "info",
+        "first",
+        "last",
+        "_mmap",
+        "_views",
+        "_days",
+        "_values",
+        "_index",
+    )
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            raw = f.read(_HEADER.size)
+        if len(raw) < _HEADER.size:
+            raise InvalidFileFormatError(path=path, reason="truncated header")
+        magic, version, _, first, last, n_days, n_assets, _ = _HEADER.unpack(raw)
+        if magic != MAGIC:
+            raise InvalidFileFormatError(path=path, reason="bad magic number")
+        if version != FORMAT_VERSION:
+            raise UnsupportedFormatVersionError(
+                path=path, version=version, supported=FORMAT_VERSION
+            )
+        self.first = first
+        self.last = last
+        self.info = SegmentInfo(
+            path, date.fromordinal(first), date.fromordinal(last), n_days, n_assets
+        )
+        self._mmap: mmap.mmap | None = None
+        self._views: list[memoryview] = []
+
+    def _load(self) -> None:
+        info = self.info
+        n_days, n_assets = info.days, info.assets
+        with open(info.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        self._views.append(view)
+        start = _HEADER.size
+        sections = (("q", n_days), ("d", n_days * n_assets), ("Q", n_assets + 1))
+        columns = []
+        for typecode, length in sections:
+            end = start + 8 * length
+            columns.append(self._column(view[start:end], typecode))
+            start = end
+        self._days, self._values, offsets = columns
+        blob = bytes(view[start:])
+        ids = [
+            blob[offsets[k] : offsets[k + 1]].decode("utf-8") for k in range(n_assets)
+        ]
+        self._index = dict(zip(ids, range(n_assets), strict=True))
+
+    def days(self) -> Sequence[int]:
+        if self._mmap is None:
+            self._load()
+        return self._days
+
+    def ids(self) -> list[str]:
+        if self._mmap is None:
+            self._load()
+        return list(self._index)
+
+    def column(self, asset_id: str) -> Sequence[float] | None:
+        """Returns the per-day values of one asset, or None if never held."""
+        if self._mmap is None:
+            self._load()
+        row = self._index.get(asset_id)
+        if row is None:
+            return None
+        n_days = self.info.days
+        return self._values[row * n_days : (row + 1) * n_days]
+
+    def columns(self) -> Iterator[tuple[str, Sequence[float]]]:
+        """Yields ``(asset_id, per-day values)`` of every held asset."""
+        if self._mmap is None:
+            self._load()
+        n_days = self.info.days
+        for asset_id, row in self._index.items():
+            yield asset_id, self._values[row * n_days : (row + 1) * n_days]
+
+    def _column(self, raw: memoryview, typecode: str) -> memoryview | array:
+        if _LITTLE_ENDIAN:
+            column = raw.cast(typecode)
+            self._views.extend((raw, column))
+            return column
+        values = array(typecode, raw.tobytes())
+        values.byteswap()
+        raw.release()
+        return values
+
+    def close(self) -> None:
+        """Unmaps the segment.
+
+        A reader may still hold a slice of a column (e.g. a query that has
+        left the store lock but not yet dropped its locals). Closing then
+        would raise BufferError, so the mapping is instead left to be
+        unmapped when the last such slice is dropped.
+        """
+        if self._mmap is not None:
+            for view in reversed(self._views):
+                with contextlib.suppress(BufferError):
+                    view.release()
+            self._views = []
+            with contextlib.suppress(BufferError):
+                self._mmap.close()
+            self._mmap = None
+
+
+def _write_segment(
+    directory: str, days: array, ids: list[str], columns: Iterable[array]
+) -> _Segment:
+    encoded = [asset_id.encode("utf-8") for asset_id in ids]
+    offsets = array("Q", accumulate(map(len, encoded), initial=0))
+    blob = b"".join(encoded)
+    first, last = days[0], days[-1]
+
+    path = os.path.join(directory, f"{first:07d}-{last:07d}{SEGMENT_SUFFIX}")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                MAGIC, FORMAT_VERSION, 0, first, last, len(days), len(ids), len(blob)
+            )
+        )
+        f.write(_to_le_bytes(days))
+        for column in columns:
+            f.write(_to_le_bytes(column))
+        f.write(_to_le_bytes(offsets))
+        f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    # Make the rename itself durable, or a crash could lose the segment.
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return _Segment(path)
+
+
+def _segment_from_snapshots(
+    directory: str, snapshots: Sequence[HoldingsSnapshot]
+) -> _Segment:
+    n_days = len(snapshots)
+    rows: dict[str, array] = {}
+    for day, snapshot in enumerate(snapshots):
+        for asset_id, value in snapshot.holdings.items():
+            column = rows.get(asset_id)
+            if column is None:
+                column = rows[asset_id] = array("d", [_NAN]) * n_days
+            column[day] = value
+    days = array("q", [s.as_of.toordinal() for s in snapshots])
+    return _write_segment(directory, days, list(rows), rows.values())
+
+
+def _merge_segments(directory: str, segments: Sequence[_Segment]) -> _Segment:
+    days = array("q")
+    ids: dict[str, None] = {}
+    for segment in segments:
+        days.extend(segment.days())
+        ids.update(dict.fromkeys(segment.ids()))
+
+    def merged_column(asset_id: str) -> array:
+        column = array("d")
+        for segment in segments:
+            part = segment.column(asset_id)
+            if part is None:
+                column.extend(array("d", [_NAN]) * segment.info.days)
+            else:
+                column.extend(part)
+        return column
+
+    return _write_segment(directory, days, list(ids), map(merged_column, ids))
+
+
+class SnapshotStore:
+    """Append-only store of daily HoldingsSnapshots in a directory.
+
+    Snapshots must be appended in strictly increasing date order. They are
+    buffered until ``segment_days`` have accumulated (or ``flush`` is
+    called) and then written as one segment. Queries see both flushed and
+    buffered snapshots.
+
+    The store is safe to use from one writer thread alongside the
+    background compaction thread. Use it as a context manager, or call
+    ``close`` to flush the buffer and stop compaction.
+
+    Attributes:
+        directory: Directory holding the segment files.
+        segment_days: Buffered snapshots per flushed segment.
+        compact_days: Target size, in days, of compacted segments.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        segment_days: int = 32,
+        compact_days: int = 366,
+    ) -> None:
+        """Opens (or creates) a snapshot store.
+
+        Args:
+            directory: Directory of the store; created if missing.
+            segment_days: Snapshots buffered before an automatic flush.
+            compact_days: Largest segment, in days, that compaction builds.
+
+        Raises:
+            ValueError: If ``segment_days`` or ``compact_days`` is not positive.
+            InvalidFileFormatError: If a segment file is malformed.
+            UnsupportedFormatVersionError: If a segment format version is unknown.
+        """
+        if segment_days < 1 or compact_days < 1:
+            raise ValueError("segment_days and compact_days must be positive")
+        self.directory = os.fspath(directory)
+        self.segment_days = segment_days
+        self.compact_days = compact_days
+        self._buffer: list[HoldingsSnapshot] = []
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._stop: threading.Event | None = None
+        self._thread: threading.Thread | None = None
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._segments = self._open_segments()
+
+    def _open_segments(self) -> list[_Segment]:
+        segments = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(f"{SEGMENT_SUFFIX}.tmp"):
+                os.remove(path)
+            elif name.endswith(SEGMENT_SUFFIX):
+                segments.append(_Segment(path))
+
+        # Leftovers of an interrupted compaction are covered by the merged
+        # segment that replaced them.
+        segments.sort(key=lambda s: (s.first, -s.last))
+        kept: list[_Segment] = []
+        for segment in segments:
+            if kept and segment.last <= kept[-1].last:
+                os.remove(segment.info.path)
+            else:
+                kept.append(segment)
+        return kept
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops background compaction, flushes the buffer and unmaps segments."""
+        self.stop_compaction()
+        self.flush()
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(s.info.days for s in self._segments) + len(self._buffer)
+
+    @property
+    def segments(self) -> list[SegmentInfo]:
+        """Summaries of the on-disk segments, in date order."""
+        with self._lock:
+            return [segment.info for segment in self._segments]
+
+    def last_date(self) -> date | None:
+        """Returns the date of the most recent snapshot, or None if empty."""
+        with self._lock:
+            return self._last_day()
+
+    def _last_day(self) -> date | None:
+        if self._buffer:
+            return self._buffer[-1].as_of
+        if self._segments:
+            return self._segments[-1].info.last
+        return None
+
+    def append(self, snapshot: HoldingsSnapshot) -> None:
+        """Appends the snapshot of the day after the last stored one.
+
+        Raises:
+            SnapshotOrderError: If the snapshot is not dated after the last
+                stored snapshot.
+        """
+        with self._lock:
+            last = self._last_day()
+            if last is not None and snapshot.as_of <= last:
+                raise SnapshotOrderError(
+                    as_of=snapshot.as_of.isoformat(), last=last.isoformat()
+                )
+            self._buffer.append(snapshot)
+            if len(self._buffer) >= self.segment_days:
+                self._flush_locked()
+
+    def extend(self, snapshots: Iterable[HoldingsSnapshot]) -> None:
+        """Appends many snapshots in order.
+
+        Raises:
+            SnapshotOrderError: If a snapshot is out of order. Snapshots
+                before it have already been appended.
+        """
+        for snapshot in snapshots:
+            self.append(snapshot)
+
+    def flush(self) -> None:
+        """Writes buffered snapshots as a new segment."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._buffer:
+            self._segments.append(_segment_from_snapshots(self.directory, self._buffer))
+            self._buffer = []
+
+    def _select(
+        self, start: date | None, end: date | None
+    ) -> tuple[list[_Segment], list[HoldingsSnapshot], int, int]:
+        lo = date.min.toordinal() if start is None else start.toordinal()
+        hi = date.max.toordinal() if end is None else end.toordinal()
+        segments = self._segments
+        first = bisect.bisect_left(segments, lo, key=lambda s: s.last)
+        stop = bisect.bisect_right(segments, hi, key=lambda s: s.first)
+        buffer = [s for s in self._buffer if lo <= s.as_of.toordinal() <= hi]
+        return segments[first:stop], buffer, lo, hi
+
+    def history(
+        self, asset_id: str, start: date | None = None, end: date | None = None
+    ) -> list[tuple[date, float]]:
+        """Returns the daily values of one asset within a date range.
+
+        Only segments overlapping ``[start, end]`` are read, and within each
+        one only the contiguous column of ``asset_id``.
+
+        Args:
+            asset_id: Asset to read.
+            start: First day to include, or None for the beginning.
+            end: Last day to include, or None for the latest snapshot.
+
+        Returns:
+            ``(day, value)`` pairs in date order, for the days the asset
+            was held.
+        """
+        result: list[tuple[date, float]] = []
+        with self._lock:
+            segments, buffer, lo, hi = self._select(start, end)
+            for segment in segments:
+                column = segment.column(asset_id)
+                if column is None:
+                    continue
+                days = segment.days()
+                i = bisect.bisect_left(days, lo)
+                j = bisect.bisect_right(days, hi)
+                result.extend(
+                    (date.fromordinal(day), value)
+                    for day, value in zip(days[i:j], column[i:j], strict=True)
+                    if not math.isnan(value)
+                )
+            result.extend(
+                (s.as_of, s.holdings[asset_id])
+                for s in buffer
+                if asset_id in s.holdings
+            )
+        return result
+
+    def snapshots(
+        self, start: date | None = None, end: date | None = None
+    ) -> list[HoldingsSnapshot]:
+        """Returns the full snapshots within a date range, in date order."""
+        result: list[HoldingsSnapshot] = []
+        with self._lock:
+            segments, buffer, lo, hi = self._select(start, end)
+            for segment in segments:
+                days = segment.days()
+                i = bisect.bisect_left(days, lo)
+                j = bisect.bisect_right(days, hi)
+                rows: list[dict[str, float]] = [{} for _ in range(i, j)]
+                for asset_id, column in segment.columns():
+                    for row, value in zip(rows, column[i:j], strict=True):
+                        if not math.isnan(value):
+                            row[asset_id] = value
+                result.extend(
+                    HoldingsSnapshot(date.fromordinal(day), row)
+                    for day, row in zip(days[i:j], rows, strict=True)
+                )
+            result.extend(buffer)
+        return result
+
+    def compact(self) -> int:
+        """Merges runs of adjacent small segments.
+
+        Segments are grouped greedily in date order while a group stays
+        within ``compact_days`` days; every group of two or more segments
+        is rewritten as one. The merge is written without blocking
+        appends or queries, and swapped in under the store lock.
+
+        Returns:
+            The number of segments removed by merging.
+        """
+        with self._compact_lock:
+            with self._lock:
+                segments = list(self._segments)
+                for segment in segments:
+                    segment.days()  # map while readers are excluded
+
+            groups: list[list[_Segment]] = [[]]
+            size = 0
+            for segment in segments:
+                if size + segment.info.days > self.compact_days:
+                    groups.append([])
+                    size = 0
+                groups[-1].append(segment)
+                size += segment.info.days
+
+            removed = 0
+            for group in groups:
+                if len(group) < 2:
+                    continue
+                merged = _merge_segments(self.directory, group)
+                with self._lock:
+                    at = self._segments.index(group[0])
+                    self._segments[at : at + len(group)] = [merged]
+                    for segment in group:
+                        segment.close()
+                        os.remove(segment.info.path)
+                removed += len(group) - 1
+            return removed
+
+    def start_compaction(self, interval: float = 60.0) -> None:
+        """Runs ``compact`` every ``interval`` seconds on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop = threading.Event()
+        stop = self._stop
+
+        def run() -> None:
+            while not stop.wait(interval):
+                self.compact()
+
+        self._thread = threading.Thread(
+            target=run, name="snapshot-compaction", daemon=True
+        )
+        self._thread.start()
+
+    def stop_compaction(self) -> None:
+        """Stops the background compaction thread, if running."""
+        if self._thread is None or self._stop is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._stop = None
@@ -0,0 +1,496 @@
+"""
+SQLite storage backend for assets, target allocations and holdings.
+
+A single local database file makes allocations and holdings queryable by
+other tools (``sqlite3``, BI tools, pandas) while PortfoTrack keeps
+writing to it. Schema::
+
+    assets          (id PK, name, purpose)          index on purpose, id, name
+    targets         (id PK, name UNIQUE)
+    target_entries  (target_id, position PK, asset_id, ratio, lower, upper)
+                                                    index on asset_id
+    holdings        (asset_id, day PK, value)       index on day
+
+``day`` is a ``date.toordinal()``. The asset, entry and holdings tables
+are ``WITHOUT ROWID``, so a lookup by primary key is a single B-tree
+descent, and every secondary lookup (assets by purpose, allocations
+holding an asset, snapshots of a day range) goes through an index; the
+purpose index covers every column it returns. Point lookups stay in the
+tens of microseconds, and range lookups cost per returned row rather
+than per stored row, as tables grow to millions of rows.
+
+The database runs in WAL mode, so readers never block the writer or each
+other. ConnectionPool hands out up to ``size`` reader connections to
+concurrent threads and serializes writes on one writer connection; each
+write is one ``BEGIN IMMEDIATE`` transaction. SQL text is constant per
+operation, so sqlite3's per-connection statement cache prepares each
+statement once, and bulk writes go through ``executemany``.
+"""
+
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import date
+from itertools import groupby
+from operator import itemgetter
+from os import PathLike, fspath
+from types import TracebackType
+
+from portfotrack.domain.asset import Asset, AssetRegistry
+from portfotrack.domain.snapshot import HoldingsSnapshot
+from portfotrack.domain.target_allocation import TargetAllocation
+from portfotrack.storage.errors import (
+    InvalidFileFormatError,
+    StorageUnavailableError,
+    TargetNotFoundError,
+    UnsupportedFormatVersionError,
+)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    id      TEXT PRIMARY KEY,
+    name    TEXT NOT NULL,
+    purpose TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS assets_purpose ON assets (purpose, id, name);
+
+CREATE TABLE IF NOT EXISTS targets (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS target_entries (
+    target_id INTEGER NOT NULL REFERENCES targets (id) ON DELETE CASCADE,
+    position  INTEGER NOT NULL,
+    asset_id  TEXT NOT NULL REFERENCES assets (id),
+    ratio     REAL NOT NULL,
+    lower     REAL NOT NULL,
+    upper     REAL NOT NULL,
+    PRIMARY KEY (target_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS target_entries_asset ON target_entries (asset_id);
+
+CREATE TABLE IF NOT EXISTS holdings (
+    asset_id TEXT NOT NULL,
+    day      INTEGER NOT NULL,
+    value    REAL NOT NULL,
+    PRIMARY KEY (asset_id, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS holdings_day ON holdings (day);
+"""
+
+_UPSERT_ASSET = """
+INSERT INTO assets (id, name, purpose) VALUES (?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET name = excluded.name, purpose = excluded.purpose
+"""
+_GET_ASSET = "SELECT id, name, purpose FROM assets WHERE id = ?"
+_ASSETS_BY_PURPOSE = (
+    "SELECT id, name, purpose FROM assets WHERE purpose = ? ORDER BY id"
+)
+
+_UPSERT_TARGET = """
+INSERT INTO targets (name) VALUES (?)
+ON CONFLICT (name) DO UPDATE SET name = excluded.name
+RETURNING id
+"""
+_TARGET_ID = "SELECT id FROM targets WHERE name = ?"
+_TARGET_NAMES = "SELECT name FROM targets ORDER BY name"
+_DELETE_TARGET = "DELETE FROM targets WHERE name = ?"
+_DELETE_ENTRIES = "DELETE FROM target_entries WHERE target_id = ?"
+_INSERT_ENTRY = """
+INSERT INTO target_entries (target_id, position, asset_id, ratio, lower, upper)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+_TARGET_ENTRIES = """
+SELECT a.id, a.name, a.purpose, e.ratio, e.lower, e.upper
+FROM target_entries AS e JOIN assets AS a ON a.id = e.asset_id
+WHERE e.target_id = ?
+ORDER BY e.position
+"""
+_TARGETS_HOLDING = """
+SELECT DISTINCT t.name
+FROM target_entries AS e JOIN targets AS t ON t.id = e.target_id
+WHERE e.asset_id = ?
+ORDER BY t.name
+"""
+
+_DELETE_DAY = "DELETE FROM holdings WHERE day = ?"
+_INSERT_HOLDING = "INSERT INTO holdings (asset_id, day, value) VALUES (?, ?, ?)"
+_LAST_DAY = "SELECT max(day) FROM holdings"
+_HISTORY = """
+SELECT day, value FROM holdings
+WHERE asset_id = ? AND day BETWEEN ? AND ?
+ORDER BY day
+"""
+_SNAPSHOTS = """
+SELECT day, asset_id, value FROM holdings
+WHERE day BETWEEN ? AND ?
+ORDER BY day
+"""
+
+_FIRST_DAY = date.min.toordinal()
+_FINAL_DAY = date.max.toordinal()
+
+
+def _day_range(start: date | None, end: date | None) -> tuple[int, int]:
+    return (
+        _FIRST_DAY if start is None else start.toordinal(),
+        _FINAL_DAY if end is None else end.toordinal(),
+    )
+
+
+class ConnectionPool:
+    """Reader connections for concurrent threads plus one writer connection.
+
+    Attributes:
+        path: Path of the database file.
+        size: Maximum number of reader connections.
+    """
+
+    def __init__(
+        self, path: str, size: int = 4, *, timeout: float = 5.0, sync: bool = True
+    ) -> None:
+        self.path = path
+        self.size = size
+        self._timeout = timeout
+        self._synchronous = "NORMAL" if sync else "OFF"
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._writer = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode: transactions are opened explicitly by ``writer``.
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self._timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(f"PRAGMA synchronous = {self._synchronous}")
+            conn.execute("PRAGMA foreign_keys = ON")
+        except sqlite3.DatabaseError as e:
+            conn.close()
+            raise InvalidFileFormatError(path=self.path, reason=str(e), cause=e) from e
+        return conn
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrows a reader connection, waiting if all of them are in use.
+
+        Raises:
+            StorageUnavailableError: If the pool is closed, or no reader
+                was returned within the pool's timeout.
+        """
+        if self._closed:
+            raise StorageUnavailableError(path=self.path, reason="the pool is closed")
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._readers_lock:
+                conn = None
+                if len(self._readers) < self.size:
+                    conn = self._connect()
+                    self._readers.append(conn)
+            if conn is None:
+                try:
+                    conn = self._idle.get(timeout=self._timeout)
+                except queue.Empty as e:
+                    raise StorageUnavailableError(
+                        path=self.path,
+                        reason=f"all {self.size} readers stayed busy for "
+                        f"{self._timeout}s",
+                        cause=e,
+                    ) from e
+        try:
+            yield conn
+        finally:
+            if not self._closed:
+                self._idle.put(conn)
+
+    @contextmanager
+    def snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Borrows a reader connection inside one read transaction.
+
+        Every query in the block sees the same committed state, even if
+        writers commit meanwhile.
+        """
+        with self.reader() as conn:
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            finally:
+                conn.execute("COMMIT")
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Runs a block as one write transaction on the writer connection.
+
+        The transaction commits when the block exits normally and rolls
+        back if it raises.
+        """
+        with self._write_lock:
+            conn = self._writer
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Closes every connection; later ``reader`` calls raise."""
+        with self._readers_lock:
+            self._closed = True
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+            while not self._idle.empty():
+                self._idle.get_nowait()
+        with self._write_lock:
+            self._writer.close()
+
+
+class SqliteAssetRepository:
+    """AssetRepository over the ``assets`` table."""
+
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
+
+    def __len__(self) -> int:
+        with self._pool.reader() as conn:
+            return conn.execute("SELECT count(*) FROM assets").fetchone()[0]
+
+    def get(self, asset_id: str) -> Asset | None:
+        """Returns the stored asset with this id, or None."""
+        with self._pool.reader() as conn:
+            row = conn.execute(_GET_ASSET, (asset_id,)).fetchone()
+        return None if row is None else Asset(*row)
+
+    def by_purpose(self, purpose: str) -> list[Asset]:
+        """Returns every stored asset with this purpose, ordered by id."""
+        with self._pool.reader() as conn:
+            rows = conn.execute(_ASSETS_BY_PURPOSE, (purpose,)).fetchall()
+        return [Asset(*row) for row in rows]
+
+    def upsert_many(self, assets: Iterable[Asset]) -> int:
+        """Inserts or updates assets in one transaction; returns the count."""
+        with self._pool.writer() as conn:
+            cursor = conn.executemany(
+                _UPSERT_ASSET, ((a.id, a.name, a.purpose) for a in assets)
+            )
+            return cursor.rowcount
+
+
+class SqliteTargetRepository:
+    """TargetRepository over the ``targets`` and ``target_entries`` tables.
+
+    Saving an allocation also upserts its assets.
+    """
+
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
+
+    def names(self) -> list[str]:
+        """Returns the names of every stored allocation, sorted."""
+        with self._pool.reader() as conn:
+            return [name for (name,) in conn.execute(_TARGET_NAMES)]
+
+    def save(self, name: str, target: TargetAllocation) -> None:
+        """Stores ``target`` under ``name``, replacing any previous one."""
+        entries = target.target_assets
+        with self._pool.writer() as conn:
+            conn.executemany(
+                _UPSERT_ASSET, ((a.id, a.name, a.purpose) for a in entries)
+            )
+            (target_id,) = conn.execute(_UPSERT_TARGET, (name,)).fetchone()
+            conn.execute(_DELETE_ENTRIES, (target_id,))
+            conn.executemany(
+                _INSERT_ENTRY,
+                (
+                    (target_id, position, a.id, ratio, tol["lower"], tol["upper"])
+                    for position, (a, (ratio, tol)) in enumerate(entries.items())
+                ),
+            )
+
+    def load(
+        self, name: str, registry: AssetRegistry | None = None
+    ) -> TargetAllocation:
+        """Loads the allocation stored under ``name``.
+
+        Args:
+            name: Name the allocation was saved under.
+            registry: Optional asset registry to intern the assets through.
+
+        Raises:
+            TargetNotFoundError: If no allocation is stored under ``name``.
+        """
+        with self._pool.snapshot() as conn:
+            row = conn.execute(_TARGET_ID, (name,)).fetchone()
+            if row is None:
+                raise TargetNotFoundError(name=name)
+            rows = conn.execute(_TARGET_ENTRIES, row).fetchall()
+        make = Asset if registry is None else registry.intern
+        target = TargetAllocation()
+        target.add_assets(
+            (make(asset_id, asset_name, purpose), ratio, lower, upper)
+            for asset_id, asset_name, purpose, ratio, lower, upper in rows
+        )
+        return target
+
+    def delete(self, name: str) -> bool:
+        """Deletes the allocation stored under ``name``; False if absent."""
+        with self._pool.writer() as conn:
+            return conn.execute(_DELETE_TARGET, (name,)).rowcount > 0
+
+    def holding(self, asset_id: str) -> list[str]:
+        """Returns the names of the allocations that target ``asset_id``."""
+        with self._pool.reader() as conn:
+            return [name for (name,) in conn.execute(_TARGETS_HOLDING, (asset_id,))]
+
+
+class SqliteHoldingsRepository:
+    """HoldingsRepository over the ``holdings`` table.
+
+    Unlike SnapshotStore, snapshots may be stored in any order; storing a
+    snapshot for a day that already has one replaces it.
+    """
+
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
+
+    def extend(self, snapshots: Iterable[HoldingsSnapshot]) -> None:
+        """Stores many snapshots in one transaction."""
+        snapshots = list(snapshots)
+        with self._pool.writer() as conn:
+            conn.executemany(_DELETE_DAY, ((s.as_of.toordinal(),) for s in snapshots))
+            conn.executemany(
+                _INSERT_HOLDING,
+                (
+                    (asset_id, day, value)
+                    for s in snapshots
+                    for day in (s.as_of.toordinal(),)
+                    for asset_id, value in s.holdings.items()
+                ),
+            )
+
+    def last_date(self) -> date | None:
+        """Returns the date of the latest stored snapshot, if any."""
+        with self._pool.reader() as conn:
+            (day,) = conn.execute(_LAST_DAY).fetchone()
+        return None if day is None else date.fromordinal(day)
+
+    def history(
+        self, asset_id: str, start: date | None = None, end: date | None = None
+    ) -> list[tuple[date, float]]:
+        """Returns ``(day, value)`` of one asset over an inclusive range."""
+        with self._pool.reader() as conn:
+            rows = conn.execute(
+                _HISTORY, (asset_id, *_day_range(start, end))
+            ).fetchall()
+        fromordinal = date.fromordinal
+        return [(fromordinal(day), value) for day, value in rows]
+
+    def snapshots(
+        self, start: date | None = None, end: date | None = None
+    ) -> list[HoldingsSnapshot]:
+        """Returns the snapshots within an inclusive date range."""
+        with self._pool.reader() as conn:
+            rows = conn.execute(_SNAPSHOTS, _day_range(start, end)).fetchall()
+        return [
+            HoldingsSnapshot(
+                date.fromordinal(day), {asset_id: value for _, asset_id, value in group}
+            )
+            for day, group in groupby(rows, key=itemgetter(0))
+        ]
+
+
+class SqliteStorage:
+    """SQLite database holding assets, target allocations and holdings.
+
+    Attributes:
+        path: Path of the database file.
+        assets: Repository of the stored assets.
+        targets: Repository of the stored target allocations.
+        holdings: Repository of the stored holdings snapshots.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        *,
+        pool_size: int = 4,
+        timeout: float = 5.0,
+        sync: bool = True,
+    ) -> None:
+        """Opens (creating if needed) a database file.
+
+        Args:
+            path: Database file path.
+            pool_size: Maximum number of concurrent reader connections.
+            timeout: Seconds to wait for a lock or a free reader connection.
+            sync: Whether commits wait for the WAL to reach the disk
+                (``synchronous=NORMAL``). False trades durability of the
+                last transactions on power loss for write speed.
+
+        Raises:
+            InvalidFileFormatError: If the file is not a SQLite database.
+            UnsupportedFormatVersionError: If the schema is newer than this
+                build supports.
+        """
+        self.path = fspath(path)
+        self._pool = ConnectionPool(self.path, pool_size, timeout=timeout, sync=sync)
+        try:
+            self._migrate()
+        except BaseException:
+            self._pool.close()
+            raise
+        self.assets = SqliteAssetRepository(self._pool)
+        self.targets = SqliteTargetRepository(self._pool)
+        self.holdings = SqliteHoldingsRepository(self._pool)
+
+    def _migrate(self) -> None:
+        try:
+            with self._pool.writer() as conn:
+                (version,) = conn.execute("PRAGMA user_version").fetchone()
+                if version > SCHEMA_VERSION:
+                    raise UnsupportedFormatVersionError(
+                        path=self.path, version=version, supported=SCHEMA_VERSION
+                    )
+                if version < SCHEMA_VERSION:
+                    for statement in _SCHEMA.split(";"):
+                        if statement.strip():
+                            conn.execute(statement)
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except sqlite3.DatabaseError as e:
+            raise InvalidFileFormatError(path=self.path, reason=str(e), cause=e) from e
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """The connection pool, for queries the repositories do not cover."""
+        return self._pool
+
+    def close(self) -> None:
+        """Closes every connection."""
+        self._pool.close()
+
+    def __enter__(self) -> "SqliteStorage":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
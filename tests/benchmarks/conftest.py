@@ -0,0 +1,128 @@
+"""
+Fixtures of the benchmark suite.
+
+The suite only runs with ``--benchmark``::
+
+    pytest tests/benchmarks --benchmark --benchmark-max-size 100000
+    pytest tests/benchmarks --benchmark --benchmark-save baseline.json
+    pytest tests/benchmarks --benchmark --benchmark-compare baseline.json
+
+Each benchmark records the best time of several rounds under its test id.
+With ``--benchmark-compare`` a benchmark fails when it is slower than
+its baseline by more than ``--benchmark-threshold``; benchmarks missing
+from the baseline are recorded but not compared.
+"""
+
+import gc
+import json
+import platform
+import time
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+SIZES = (10, 1_000, 100_000, 1_000_000)
+
+_RESULTS = pytest.StashKey[dict[str, float]]()
+
+
+class Benchmark:
+    """Times a callable and checks it against the stored baseline."""
+
+    def __init__(
+        self,
+        name: str,
+        results: dict[str, float],
+        baseline: dict[str, float],
+        threshold: float,
+    ) -> None:
+        self.name = name
+        self._results = results
+        self._baseline = baseline
+        self._threshold = threshold
+
+    def __call__(
+        self,
+        fn: Callable[..., Any],
+        *,
+        setup: Callable[[], tuple[Any, ...]] | None = None,
+        rounds: int = 5,
+    ) -> float:
+        """Runs ``fn`` and records its best time in seconds.
+
+        Without ``setup`` the call is repeated as often as needed for a
+        stable reading (as ``timeit`` does) and the time per call is
+        recorded. With ``setup`` each round calls ``setup()`` untimed and
+        then times a single ``fn(*setup())``, for operations that consume
+        their input (e.g. filling an empty allocation).
+        """
+        if setup is None:
+            timer = timeit.Timer(fn)
+            number, _ = timer.autorange()
+            best = min(timer.repeat(rounds, number)) / number
+        else:
+            best = float("inf")
+            for _ in range(rounds):
+                args = setup()
+                gc.collect()
+                gc.disable()
+                try:
+                    start = time.perf_counter()
+                    fn(*args)
+                    best = min(best, time.perf_counter() - start)
+                finally:
+                    gc.enable()
+
+        self._results[self.name] = best
+        baseline = self._baseline.get(self.name)
+        if baseline is not None and best > baseline * (1 + self._threshold):
+            pytest.fail(
+                f"{self.name} regressed: {best:.3g}s vs baseline {baseline:.3g}s "
+                f"(+{best / baseline - 1:.0%}, threshold {self._threshold:.0%})"
+            )
+        return best
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[_RESULTS] = {}
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "size" in metafunc.fixturenames:
+        max_size = metafunc.config.getoption("--benchmark-max-size")
+        sizes = [size for size in SIZES if size <= max_size]
+        metafunc.parametrize("size", sizes, ids=[f"n={size}" for size in sizes])
+
+
+@pytest.fixture(scope="session")
+def baseline(pytestconfig: pytest.Config) -> dict[str, float]:
+    path = pytestconfig.getoption("--benchmark-compare")
+    if path is None:
+        return {}
+    return json.loads(Path(path).read_text(encoding="utf-8"))["results"]
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest, baseline: dict[str, float]) -> Benchmark:
+    return Benchmark(
+        request.node.nodeid,
+        request.config.stash[_RESULTS],
+        baseline,
+        request.config.getoption("--benchmark-threshold"),
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    path = session.config.getoption("--benchmark-save")
+    results = session.config.stash[_RESULTS]
+    if path is None or not results:
+        return
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": dict(sorted(results.items())),
+    }
+    Path(path).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
@@ -0,0 +1,34 @@
+from portfotrack.cli.state import ReplState
+from portfotrack.cli.target_cli.target import handle_command
+
+
+def _initialized() -> tuple[ReplState]:
+    state = ReplState()
+    handle_command("init-target", state)
+    return (state,)
+
+
+def test_handle_command_add_asset(benchmark, size: int) -> None:
+    lines = [
+        f'add-asset asset-{i} "Asset {i}" core --ratio {1.0 / size} '
+        "--lower 0 --upper 1"
+        for i in range(size)
+    ]
+
+    def run(state: ReplState) -> None:
+        for line in lines:
+            handle_command(line, state)
+
+    benchmark(run, setup=_initialized, rounds=3)
+
+
+def test_handle_command_dispatch_error(benchmark) -> None:
+    state = ReplState()
+
+    def run() -> None:
+        try:
+            handle_command("unknown-command --flag", state)
+        except Exception:
+            pass
+
+    benchmark(run)
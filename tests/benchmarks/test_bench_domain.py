@@ -0,0 +1,60 @@
+from functools import cache
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation import TargetAllocation
+
+BAND = {"lower": 0.0, "upper": 1.0}
+
+
+@cache
+def _assets(size: int) -> list[Asset]:
+    return [Asset(f"asset-{i}", f"Asset {i}", "core") for i in range(size)]
+
+
+@cache
+def _target(size: int) -> TargetAllocation:
+    target = TargetAllocation()
+    target.add_assets((asset, 1.0 / size, 0.0, 1.0) for asset in _assets(size))
+    return target
+
+
+def test_asset_hash_and_equality(benchmark, size: int) -> None:
+    assets = _assets(size)
+    # equal but not identical keys, so lookups exercise __hash__ and __eq__
+    probes = [Asset(a.id, a.name, a.purpose) for a in assets]
+    table = dict.fromkeys(assets)
+
+    def run() -> int:
+        return sum(1 for probe in probes if probe in table)
+
+    benchmark(run, rounds=3)
+
+
+def test_target_add_asset(benchmark, size: int) -> None:
+    assets = _assets(size)
+    ratio = 1.0 / size
+
+    def run(target: TargetAllocation) -> None:
+        add = target.add_asset
+        for asset in assets:
+            add(asset, ratio, BAND)
+
+    benchmark(run, setup=lambda: (TargetAllocation(),), rounds=3)
+
+
+def test_target_add_assets_bulk(benchmark, size: int) -> None:
+    entries = [(asset, 1.0 / size, 0.0, 1.0) for asset in _assets(size)]
+
+    benchmark(
+        lambda target: target.add_assets(entries),
+        setup=lambda: (TargetAllocation(),),
+        rounds=3,
+    )
+
+
+def test_target_total_ratio(benchmark, size: int) -> None:
+    benchmark(_target(size).total_ratio)
+
+
+def test_target_validate_total(benchmark, size: int) -> None:
+    benchmark(_target(size).validate_total)
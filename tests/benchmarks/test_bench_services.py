@@ -0,0 +1,14 @@
+from portfotrack.domain.asset import AssetRegistry
+from portfotrack.services.target_services import add_asset_to_target, init_target
+
+
+def test_add_asset_to_target(benchmark, size: int) -> None:
+    rows = [
+        (f"asset-{i}", f"Asset {i}", "core", 1.0 / size, 0.0, 1.0) for i in range(size)
+    ]
+
+    def run(target, registry: AssetRegistry) -> None:
+        for row in rows:
+            add_asset_to_target(target, *row, registry=registry)
+
+    benchmark(run, setup=lambda: (init_target(), AssetRegistry()), rounds=3)
@@ -0,0 +1,241 @@
+import io
+import json
+
+import pytest
+
+from portfotrack.cli.main import main
+from portfotrack.cli.state import ReplState
+from portfotrack.cli.target_cli import run_batch
+from portfotrack.cli.target_cli.error_codes import CliErrorCode
+from portfotrack.domain.target_allocation.error_codes import TargetErrorCode
+from portfotrack.services.error_codes import ServiceErrorCode
+
+
+def _records(out: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_run_batch_reports_each_command_and_summary() -> None:
+    script = [
+        "# comment\n",
+        "add-asset a b c --ratio 1 --lower 0 --upper 1\n",
+        "\n",
+        "init-target\n",
+        "nope\n",
+    ]
+    out = io.StringIO()
+    state = ReplState()
+
+    code = run_batch(script, out, state=state)
+
+    records = _records(out)
+    assert code == 1
+    assert state.target is not None
+    assert [(r["line"], r["command"], r["ok"]) for r in records[:-1]] == [
+        (2, "add-asset", False),
+        (4, "init-target", True),
+        (5, "nope", False),
+    ]
+    assert records[0]["error"]["code"] == CliErrorCode.CLI_NO_TARGET
+    assert records[1]["message"] == "Target initialized."
+    assert records[-1] == {"summary": {"commands": 3, "ok": 1, "failed": 2}}
+
+
+def test_run_batch_all_ok_and_exit_stops() -> None:
+    out = io.StringIO()
+
+    code = run_batch(["init-target", "exit", "nope"], out)
+
+    assert code == 0
+    assert _records(out)[-1] == {"summary": {"commands": 1, "ok": 1, "failed": 0}}
+
+
+def test_run_batch_fail_fast() -> None:
+    out = io.StringIO()
+
+    code = run_batch(["nope", "init-target"], out, fail_fast=True)
+
+    assert code == 1
+    assert _records(out)[-1]["summary"]["commands"] == 1
+
+
+def test_run_batch_records_unexpected_exception_as_failed(monkeypatch) -> None:
+    from portfotrack.cli.target_cli import batch
+
+    def handle_command(raw: str, state: ReplState) -> str:
+        if raw == "boom":
+            raise RuntimeError("kaput")
+        return "ok"
+
+    monkeypatch.setattr(batch, "handle_command", handle_command)
+    out = io.StringIO()
+
+    code = run_batch(["init-target", "boom", "init-target"], out)
+
+    records = _records(out)
+    assert code == 1
+    assert [r["ok"] for r in records[:-1]] == [True, False, True]
+    assert records[1]["error"]["code"] == CliErrorCode.CLI_COMMAND_FAILED
+    assert "RuntimeError: kaput" in records[1]["error"]["message"]
+    assert records[-1] == {"summary": {"commands": 3, "ok": 2, "failed": 1}}
+
+
+def test_run_batch_flushes_results_when_reading_fails() -> None:
+    def lines():
+        yield "init-target"
+        yield "init-target"
+        raise OSError("read error")
+
+    out = io.StringIO()
+
+    with pytest.raises(OSError):
+        run_batch(lines(), out)
+
+    assert [r["ok"] for r in _records(out)] == [True, True]
+
+
+def test_run_batch_reports_unreadable_import_file(tmp_path) -> None:
+    out = io.StringIO()
+    missing = tmp_path / "missing.csv"
+
+    code = run_batch(["init-target", f"import-target {missing}", "exit"], out)
+
+    records = _records(out)
+    assert code == 1
+    assert records[1]["ok"] is False
+    assert records[1]["error"]["code"] == ServiceErrorCode.IMPORT_INVALID_FILE
+    assert records[-1] == {"summary": {"commands": 2, "ok": 1, "failed": 1}}
+
+
+def test_main_script_file(tmp_path, capsys) -> None:
+    script = tmp_path / "commands.txt"
+    script.write_text("init-target\ninit-target\n", encoding="utf-8")
+
+    code = main(["--script", str(script)])
+
+    assert code == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records[-1]["summary"]["ok"] == 2
+
+
+def test_main_script_writes_collected_errors(tmp_path, capsys) -> None:
+    data = tmp_path / "targets.csv"
+    data.write_text(
+        "asset_id,asset_name,purpose,target_ratio,lower,upper\n"
+        "a,A,core,1.0,0.9,1.0\n"
+        "a,A,core,1.0,0.9,1.0\n",
+        encoding="utf-8",
+    )
+    script = tmp_path / "commands.txt"
+    script.write_text(f"nope\ninit-target\nimport-target {data}\n", encoding="utf-8")
+    errors = tmp_path / "errors.jsonl"
+
+    code = main(["--script", str(script), "--errors", str(errors)])
+
+    assert code == 1
+    summary = json.loads(capsys.readouterr().out.splitlines()[-1])["summary"]
+    assert summary["errors_by_code"] == {
+        CliErrorCode.CLI_INVALID_COMMAND: 1,
+        TargetErrorCode.TARGET_DUPLICATE_ASSET: 1,
+    }
+    records = [json.loads(line) for line in errors.read_text().splitlines()]
+    assert [(r["code"], r.get("source"), r["line"]) for r in records] == [
+        (CliErrorCode.CLI_INVALID_COMMAND, None, 1),
+        (TargetErrorCode.TARGET_DUPLICATE_ASSET, str(data), 3),
+    ]
+
+
+@pytest.mark.parametrize("flag", [["--errors", "errors.jsonl"], ["--fail-fast"]])
+def test_main_batch_flags_require_script(flag, capsys) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        main(flag)
+
+    assert exc_info.value.code == 2
+    assert "require --script" in capsys.readouterr().err
+
+
+def test_main_reports_unreadable_journal(tmp_path, capsys) -> None:
+    session = tmp_path / "session"
+    session.mkdir()
+    (session / "journal-00000000.pfjl").write_bytes(b"NOPE" + bytes(12))
+    script = tmp_path / "commands.txt"
+    script.write_text("init-target\n", encoding="utf-8")
+
+    code = main(["--script", str(script), "--journal", str(session)])
+
+    assert code == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "[STORAGE.INVALID_FORMAT]" in captured.err
+
+
+def test_main_journal_restores_session(tmp_path, capsys) -> None:
+    session = tmp_path / "session"
+    first = tmp_path / "first.txt"
+    first.write_text(
+        "init-target\n" "add-asset a A core --ratio 0.5 --lower 0.4 --upper 0.6\n",
+        encoding="utf-8",
+    )
+    second = tmp_path / "second.txt"
+    second.write_text(
+        "add-asset a A core --ratio 0.5 --lower 0.4 --upper 0.6\n"
+        "add-asset b B income --ratio 0.5 --lower 0.4 --upper 0.6\n",
+        encoding="utf-8",
+    )
+
+    assert main(["--script", str(first), "--journal", str(session)]) == 0
+    code = main(["--script", str(second), "--journal", str(session)])
+
+    assert code == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records[-3]["error"]["code"] == TargetErrorCode.TARGET_DUPLICATE_ASSET
+    assert records[-2]["ok"]
+
+
+def test_journaled_commands_survive_a_crash(tmp_path) -> None:
+    from portfotrack.cli.target_cli.target import handle_command
+    from portfotrack.storage.journal import open_session
+
+    journal, _ = open_session(tmp_path, sync=False)
+    state = ReplState(journal=journal)
+    handle_command("init-target", state)
+    handle_command("add-asset a A core --ratio 1 --lower 0.9 --upper 1", state)
+    journal.commit()
+
+    recovered, recovery = open_session(tmp_path, sync=False)
+    recovered.close()
+    journal.close()
+
+    assert recovery.target is not None
+    assert recovery.target.target_assets == state.target.target_assets
+
+
+def test_rows_before_a_failed_import_survive_a_crash(tmp_path) -> None:
+    from portfotrack.storage.journal import open_session
+
+    data = tmp_path / "targets.csv"
+    # Decoding is buffered, so the bad byte must lie past the first chunk.
+    rows = b"".join(b"a%d,A,core,0.0001,0,1\n" % i for i in range(2000))
+    data.write_bytes(
+        b"asset_id,asset_name,purpose,target_ratio,lower,upper\n"
+        + rows
+        + b"c,\xff,core,0.5,0,1\n"
+    )
+    session = tmp_path / "session"
+    journal, _ = open_session(session, sync=False, max_delay=60.0)
+    state = ReplState(journal=journal)
+    out = io.StringIO()
+
+    run_batch(["init-target", f"import-target {data}"], out, state=state)
+    # Recover as after a crash, before the journal is closed.
+    recovered, recovery = open_session(session, sync=False)
+    recovered.close()
+    journal.close()
+
+    error = _records(out)[1]["error"]
+    imported = error["details"]["imported"]
+    assert error["code"] == ServiceErrorCode.IMPORT_INVALID_FILE
+    assert 0 < imported < 2000
+    assert f"after {imported:,} rows were imported" in error["message"]
+    assert recovery.target is not None
+    assert len(recovery.target.target_assets) == imported
@@ -0,0 +1,128 @@
+import pytest
+
+from portfotrack.cli.state import ReplState
+from portfotrack.cli.target_cli.error_codes import CliErrorCode
+from portfotrack.cli.target_cli.errors import (
+    InvalidArgumentsError,
+    InvalidCommandError,
+    NoActiveTargetError,
+)
+from portfotrack.cli.target_cli.target import COMMAND_DICT, handle_command
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation.errors import DuplicateAssetError
+
+ADD_US = 'add-asset us-stock "US Equity" core --ratio 0.4 --lower 0.35 --upper 0.45'
+
+
+def test_add_asset_documented_example() -> None:
+    state = ReplState()
+    handle_command("init-target", state)
+
+    message = handle_command(ADD_US, state)
+
+    assert message.startswith("Added asset 'us-stock'")
+    assert state.target is not None
+    assert state.target.target_assets[Asset("us-stock", "", "")] == (
+        0.4,
+        {"lower": 0.35, "upper": 0.45},
+    )
+    assert state.registry.get("us-stock").name == "US Equity"
+
+
+def test_add_asset_echoes_normalized_id() -> None:
+    state = ReplState()
+    handle_command("init-target", state)
+
+    message = handle_command(ADD_US.replace("us-stock", " US-Stock"), state)
+
+    assert message.startswith("Added asset 'us-stock'")
+
+
+def test_init_target_resets_registry() -> None:
+    state = ReplState()
+    handle_command("init-target", state)
+    handle_command(ADD_US, state)
+    handle_command("init-target", state)
+
+    handle_command(ADD_US.replace("US Equity", "US Stocks"), state)
+
+    assert state.registry.get("us-stock").name == "US Stocks"
+
+
+def test_add_asset_domain_error_propagates() -> None:
+    state = ReplState()
+    handle_command("init-target", state)
+    handle_command(ADD_US, state)
+
+    with pytest.raises(DuplicateAssetError):
+        handle_command(ADD_US, state)
+
+
+def test_add_asset_without_target_raise() -> None:
+    with pytest.raises(NoActiveTargetError, match=CliErrorCode.CLI_NO_TARGET):
+        handle_command(ADD_US, ReplState())
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "add-asset us-stock core --ratio 0.4 --lower 0.35 --upper 0.45",
+        "add-asset a b c --ratio nan --lower 0.35 --upper 0.45",
+        "init-target extra",
+    ],
+)
+def test_invalid_arguments_raise(raw: str) -> None:
+    state = ReplState()
+    handle_command("init-target", state)
+
+    with pytest.raises(InvalidArgumentsError, match=CliErrorCode.CLI_INVALID_ARGUMENTS):
+        handle_command(raw, state)
+
+
+@pytest.mark.parametrize("raw", ["", "unknown-command"])
+def test_invalid_command_raise(raw: str) -> None:
+    with pytest.raises(InvalidCommandError, match=CliErrorCode.CLI_INVALID_COMMAND):
+        handle_command(raw, ReplState())
+
+
+def test_instrument_records_command_latency() -> None:
+    state = ReplState()
+    try:
+        assert handle_command("instrument on", state) == "Instrumentation enabled."
+        handle_command("init-target", state)
+        handle_command(ADD_US, state)
+
+        report = handle_command("instrument report", state)
+    finally:
+        handle_command("instrument off", state)
+        handle_command("instrument reset", state)
+
+    for operation in (
+        "cli.handle_command",
+        "cli.add-asset",
+        "services.add_asset_to_target",
+        "TargetAllocation.add_asset",
+    ):
+        assert operation in report
+
+
+def test_instrument_unknown_action() -> None:
+    with pytest.raises(InvalidArgumentsError) as exc:
+        handle_command("instrument maybe", ReplState())
+
+    assert exc.value.details["usage"] == "instrument <action>"
+
+
+def test_profile_and_trace_memory_commands() -> None:
+    state = ReplState()
+    assert handle_command("profile start", state) == "Profiler started."
+    handle_command("init-target", state)
+    assert "function calls" in handle_command("profile stop", state)
+
+    assert handle_command("trace-memory start", state) == "Memory tracing started."
+    assert handle_command("trace-memory stop", state).startswith("Traced memory:")
+
+
+@pytest.mark.parametrize("name", sorted(COMMAND_DICT))
+def test_every_command_handler_is_instrumented(name: str) -> None:
+    assert hasattr(COMMAND_DICT[name], "__wrapped__")
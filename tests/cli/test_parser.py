@@ -0,0 +1,67 @@
+import pytest
+
+from portfotrack.cli.target_cli.error_codes import CliErrorCode
+from portfotrack.cli.target_cli.errors import InvalidArgumentsError
+from portfotrack.cli.target_cli.parser import CommandSpec, tokenize
+
+
+@pytest.fixture
+def spec() -> CommandSpec:
+    return CommandSpec(
+        "add-asset",
+        positionals=("id", "name", "purpose"),
+        options={"ratio": float, "lower": float},
+    )
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("", []),
+        ("init-target", ["init-target"]),
+        ('add-asset us "US Equity" core', ["add-asset", "us", "US Equity", "core"]),
+        ("a 'it''s' b", ["a", "it", "s", "b"]),
+        (r'a "say \"hi\"" ""', ["a", 'say "hi"', ""]),
+        ("  a   b  ", ["a", "b"]),
+    ],
+)
+def test_tokenize(raw: str, expected: list[str]) -> None:
+    assert tokenize(raw) == expected
+
+
+def test_tokenize_unterminated_quote_raise() -> None:
+    with pytest.raises(InvalidArgumentsError, match=CliErrorCode.CLI_INVALID_ARGUMENTS):
+        tokenize('add-asset "US Equity')
+
+
+def test_spec_usage(spec: CommandSpec) -> None:
+    assert spec.usage == "add-asset <id> <name> <purpose> --ratio <r> --lower <l>"
+
+
+def test_spec_parse(spec: CommandSpec) -> None:
+    parsed = spec.parse(["us", "--ratio", "0.4", "US Equity", "--lower=0.35", "core"])
+
+    assert parsed.name == "add-asset"
+    assert parsed.args == ("us", "US Equity", "core")
+    assert parsed.options == {"ratio": 0.4, "lower": 0.35}
+
+
+@pytest.mark.parametrize(
+    "tokens, reason",
+    [
+        (["us", "n", "--ratio", "0.4", "--lower", "0.3"], "Expected 3 argument(s)"),
+        (["us", "n", "p", "--ratio", "0.4"], "Missing option(s) --lower"),
+        (["us", "n", "p", "--ratio", "x", "--lower", "0"], "Invalid value"),
+        (["us", "n", "p", "--ratio", "1", "--ratio", "1"], "Repeated option"),
+        (["us", "n", "p", "--upper", "1"], "Unknown option --upper"),
+        (["us", "n", "p", "--ratio"], "Missing value for --ratio"),
+    ],
+)
+def test_spec_parse_errors(spec: CommandSpec, tokens: list[str], reason: str) -> None:
+    with pytest.raises(
+        InvalidArgumentsError, match=CliErrorCode.CLI_INVALID_ARGUMENTS
+    ) as exc_info:
+        spec.parse(tokens)
+
+    assert exc_info.value.details["reason"].startswith(reason)
+    assert exc_info.value.details["usage"] == spec.usage
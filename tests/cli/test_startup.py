@@ -0,0 +1,70 @@
+import subprocess
+import sys
+
+STARTUP_BUDGET_MS = 250
+"""Budget for importing everything the REPL needs, measured with -X importtime.
+
+Loose on purpose, to catch a heavy module being pulled into startup
+rather than small drifts."""
+
+LAZY_MODULES = (
+    "portfotrack.pricing",
+    "portfotrack.storage",
+    "portfotrack.services.batch_runner",
+    "portfotrack.services.import_services",
+    "asyncio",
+    "concurrent",
+    "cProfile",
+    "csv",
+    "mmap",
+    "pstats",
+    "tracemalloc",
+)
+"""Modules that only some commands need and that must not load at startup."""
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Returns the cumulative import time (us) of each module ``statement`` loads."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_entry_point_defers_command_modules() -> None:
+    loaded = _import_times("import portfotrack.cli.main")
+
+    assert {m for m in loaded if m.startswith("portfotrack")} == {
+        "portfotrack",
+        "portfotrack.cli",
+        "portfotrack.cli.main",
+    }
+
+
+def test_repl_startup_skips_lazy_modules() -> None:
+    loaded = _import_times("import portfotrack.cli.target_cli")
+
+    eager = [
+        name
+        for name in loaded
+        if any(name == lazy or name.startswith(f"{lazy}.") for lazy in LAZY_MODULES)
+    ]
+    assert eager == []
+
+
+def test_repl_startup_within_budget() -> None:
+    elapsed_us = min(
+        _import_times("import portfotrack.cli.target_cli")["portfotrack.cli.target_cli"]
+        for _ in range(3)
+    )
+
+    assert elapsed_us / 1e3 < STARTUP_BUDGET_MS
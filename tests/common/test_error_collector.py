@@ -0,0 +1,80 @@
+import io
+import json
+
+from portfotrack.common.error_collector import ErrorCollector
+from portfotrack.common.errors import AppError
+
+
+def _error(code: str, asset_id: str) -> AppError:
+    return AppError(
+        code=code, message=f"bad {asset_id}", details={"asset_id": asset_id}
+    )
+
+
+def test_counts_and_groups_by_code() -> None:
+    collector = ErrorCollector()
+    for i in range(3):
+        collector.add(_error("A", f"x{i}"), line=i + 1)
+    collector.add(_error("B", "y"))
+
+    assert len(collector) == 4
+    assert collector.count_by_code() == {"A": 3, "B": 1}
+    groups = collector.group_by_code()
+    assert [r.line for r in groups["A"]] == [1, 2, 3]
+    assert groups["B"][0].details == {"asset_id": "y"}
+
+
+def test_records_share_interned_keys() -> None:
+    collector = ErrorCollector()
+    collector.add(_error("A", "x"))
+    collector.add(_error("A", "y"))
+
+    first, second = collector.records
+    assert first.keys is second.keys
+    assert first.code is second.code
+
+
+def test_max_records_keeps_counts_exact() -> None:
+    collector = ErrorCollector(max_records=2)
+    for i in range(5):
+        collector.add(_error("A", str(i)))
+
+    assert len(collector.records) == 2
+    assert collector.dropped == 3
+    assert collector.count_by_code() == {"A": 5}
+
+
+def test_write_jsonl_in_batches() -> None:
+    collector = ErrorCollector()
+    for i in range(5):
+        collector.add(_error("A", str(i)), line=i)
+
+    class CountingStream(io.StringIO):
+        writes = 0
+
+        def write(self, s: str) -> int:
+            self.writes += 1
+            return super().write(s)
+
+    out = CountingStream()
+    written = collector.write_jsonl(out, batch_size=2)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert written == 5
+    assert out.writes == 3
+    assert records[4] == {
+        "code": "A",
+        "message": "bad 4",
+        "details": {"asset_id": "4"},
+        "line": 4,
+    }
+
+
+def test_clear() -> None:
+    collector = ErrorCollector()
+    collector.add(_error("A", "x"))
+
+    collector.clear()
+
+    assert not collector
+    assert collector.records == []
@@ -0,0 +1,127 @@
+import pytest
+
+from portfotrack.common.instrumentation import (
+    INSTRUMENTATION,
+    Histogram,
+    Profiler,
+    instrumented,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_instrumentation():
+    INSTRUMENTATION.disable()
+    INSTRUMENTATION.reset()
+    yield
+    INSTRUMENTATION.disable()
+    INSTRUMENTATION.reset()
+
+
+@instrumented("test.double")
+def _double(x: int) -> int:
+    return 2 * x
+
+
+@instrumented("test.fail")
+def _fail() -> None:
+    raise RuntimeError("boom")
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.n = 0
+
+    @instrumented("test.bump")
+    def bump(self) -> int:
+        self.n += 1
+        return self.n
+
+
+def test_histogram_statistics() -> None:
+    histogram = Histogram()
+    for ns in (1_000, 2_000, 3_000, 1_000_000):
+        histogram.record(ns)
+
+    assert histogram.count == 4
+    assert histogram.min_ns == 1_000
+    assert histogram.max_ns == 1_000_000
+    assert histogram.mean_ns == pytest.approx(251_500)
+    assert 2_000 <= histogram.percentile(50) <= 2_000 * 1.2
+    assert histogram.percentile(100) == 1_000_000
+
+
+def test_histogram_empty_and_bounds() -> None:
+    histogram = Histogram()
+
+    assert histogram.percentile(99) == 0.0
+    assert histogram.mean_ns == 0.0
+    with pytest.raises(ValueError):
+        histogram.percentile(101)
+
+
+def test_disabled_records_nothing() -> None:
+    assert _double(3) == 6
+    assert INSTRUMENTATION.histograms == {}
+
+
+def test_enabled_records_calls_and_errors() -> None:
+    INSTRUMENTATION.enable()
+    _double(1)
+    _double(2)
+    with pytest.raises(RuntimeError):
+        _fail()
+
+    snapshot = INSTRUMENTATION.snapshot()
+    assert snapshot["test.double"]["count"] == 2
+    assert snapshot["test.double"]["errors"] == 0
+    assert snapshot["test.fail"]["errors"] == 1
+    assert "test.double" in INSTRUMENTATION.report()
+
+
+def test_method_is_only_wrapped_while_enabled() -> None:
+    raw = _Counter.__dict__["bump"]
+    assert not hasattr(raw, "__wrapped__")
+
+    INSTRUMENTATION.enable()
+    assert _Counter.__dict__["bump"].__wrapped__ is raw
+    assert _Counter().bump() == 1
+    INSTRUMENTATION.disable()
+
+    assert _Counter.__dict__["bump"] is raw
+    assert INSTRUMENTATION.snapshot()["test.bump"]["count"] == 1
+
+
+def test_wrapper_preserves_metadata() -> None:
+    assert _double.__name__ == "_double"
+    assert _double.__wrapped__(4) == 8  # type: ignore[attr-defined]
+
+
+def test_report_when_empty() -> None:
+    assert INSTRUMENTATION.report() == "No operations recorded."
+
+
+def test_profiler_capture() -> None:
+    profiler = Profiler()
+    assert profiler.stop_profile() == "Profiler is not running."
+
+    profiler.start_profile()
+    assert profiler.profiling
+    sum(_double(i) for i in range(100))
+    report = profiler.stop_profile()
+
+    assert not profiler.profiling
+    assert "_double" in report
+
+
+def test_tracemalloc_capture() -> None:
+    profiler = Profiler()
+    assert profiler.stop_tracemalloc() == "Memory tracing is not running."
+
+    profiler.start_tracemalloc()
+    assert profiler.tracing_memory
+    kept = [bytes(1_000) for _ in range(100)]
+    report = profiler.stop_tracemalloc()
+
+    assert not profiler.tracing_memory
+    assert report.startswith("Traced memory:")
+    assert kept
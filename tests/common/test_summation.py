@@ -0,0 +1,40 @@
+import math
+import random
+
+from portfotrack.common.summation import ExactSum
+
+
+def test_exact_sum_empty() -> None:
+    assert ExactSum().value == 0.0
+
+
+def test_exact_sum_matches_fsum_with_cancellation() -> None:
+    values = [0.1] * 10 + [1e100, 1.0, -1e100]
+
+    assert ExactSum(values).value == math.fsum(values) == 2.0
+
+
+def test_exact_sum_copy_is_independent() -> None:
+    total = ExactSum([0.5])
+    clone = total.copy()
+    clone.add(0.25)
+
+    assert total.value == 0.5
+    assert clone.value == 0.75
+
+
+def test_exact_sum_stress_matches_fsum_after_millions_of_mutations() -> None:
+    rng = random.Random(20261017)
+    uniform = rng.random
+    total = ExactSum()
+    live: list[float] = []
+
+    for _ in range(2_000_000):
+        if live and uniform() < 0.45:
+            total.subtract(live.pop())
+        else:
+            value = uniform() * 1e-3
+            live.append(value)
+            total.add(value)
+
+    assert total.value == math.fsum(live)
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_DIR = Path(__file__).parent / "benchmarks"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmark", "performance benchmarks (tests/benchmarks)")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="run the benchmark suite; it is not collected otherwise",
+    )
+    group.addoption(
+        "--benchmark-max-size",
+        type=int,
+        default=1_000_000,
+        metavar="N",
+        help="skip benchmark sizes above N (default: 1000000)",
+    )
+    group.addoption(
+        "--benchmark-save",
+        metavar="PATH",
+        help="write the benchmark results to a JSON baseline file",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        metavar="PATH",
+        help="fail benchmarks that are slower than this JSON baseline",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=0.25,
+        metavar="FRACTION",
+        help="allowed slowdown against the baseline (default: 0.25 = 25%%)",
+    )
+
+
+def pytest_ignore_collect(collection_path: Path, config: pytest.Config) -> bool | None:
+    if collection_path == BENCHMARK_DIR and not config.getoption("--benchmark"):
+        return True
+    return None
@@ -0,0 +1,126 @@
+import pytest
+
+from portfotrack.domain.allocation_tree import (
+    AllocationGroup,
+    AllocationLeaf,
+    AllocationTree,
+)
+from portfotrack.domain.allocation_tree.error_codes import AllocationTreeErrorCode
+from portfotrack.domain.allocation_tree.errors import (
+    GroupRatioMismatchError,
+    NodeConflictError,
+    NodeNotFoundError,
+)
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation import TargetAllocation
+from portfotrack.domain.target_allocation.errors import (
+    AssetNotFoundError,
+    DuplicateAssetError,
+    TotalRatioMismatchError,
+)
+
+BAND = {"lower": 0.0, "upper": 1.0}
+
+
+@pytest.fixture
+def tree() -> AllocationTree:
+    tree = AllocationTree()
+    tree.set_group_target(["equity"], 0.6, BAND)
+    tree.set_group_target(["equity", "us"], 0.4, BAND)
+    tree.add_asset(["equity", "us"], Asset("spy", "S&P 500", "core"), 0.3, BAND)
+    tree.add_asset(["equity", "us"], Asset("qqq", "Nasdaq", "growth"), 0.1, BAND)
+    tree.add_asset(["equity", "kr"], Asset("kospi", "KOSPI", "core"), 0.2, BAND)
+    tree.add_asset(["bond"], Asset("agg", "Agg", "income"), 0.4, BAND)
+    return tree
+
+
+def test_aggregated_ratios(tree: AllocationTree) -> None:
+    assert tree.node(["equity"]).ratio == pytest.approx(0.6)
+    assert tree.node(["equity", "us"]).ratio == pytest.approx(0.4)
+    assert tree.total_ratio() == pytest.approx(1.0)
+    assert len(tree) == 4
+    assert "spy" in tree
+    tree.validate()
+    tree.validate_total()
+
+
+def test_node_types(tree: AllocationTree) -> None:
+    group = tree.node(["equity", "us"])
+    leaf = tree.node(["equity", "us", "spy"])
+
+    assert isinstance(group, AllocationGroup) and not group.is_leaf
+    assert isinstance(leaf, AllocationLeaf) and leaf.is_leaf
+    assert leaf is tree.leaf("spy")
+    assert [node.key for node in group.leaves()] == ["spy", "qqq"]
+    with pytest.raises(NodeNotFoundError):
+        tree.node(["equity", "us", "spy", "below"])
+
+
+def test_update_reaggregates_ancestors(tree: AllocationTree) -> None:
+    tree.update_ratio("qqq", 0.2)
+
+    assert tree.node(["equity", "us"]).ratio == pytest.approx(0.5)
+    assert tree.node(["equity"]).ratio == pytest.approx(0.7)
+    assert tree.node(["bond"]).ratio == pytest.approx(0.4)
+    assert [e.details["path"] for e in tree.mismatches()] == [
+        [],
+        ["equity"],
+        ["equity", "us"],
+    ]
+    with pytest.raises(
+        GroupRatioMismatchError, match=AllocationTreeErrorCode.TREE_GROUP_RATIO_MISMATCH
+    ) as exc_info:
+        tree.validate()
+    assert exc_info.value.details["path"] == []
+
+    tree.update_ratio("spy", 0.2)
+    tree.validate()
+
+
+def test_remove_asset_prunes_undeclared_groups(tree: AllocationTree) -> None:
+    tree.remove_asset("kospi")
+
+    with pytest.raises(NodeNotFoundError):
+        tree.node(["equity", "kr"])
+    assert tree.node(["equity"]).ratio == pytest.approx(0.4)
+    assert len(tree.mismatches()) == 2
+    with pytest.raises(AssetNotFoundError):
+        tree.remove_asset("kospi")
+
+
+def test_remove_asset_keeps_declared_groups(tree: AllocationTree) -> None:
+    tree.remove_asset("spy")
+    tree.remove_asset("qqq")
+
+    assert tree.node(["equity", "us"]).ratio == 0.0
+
+
+def test_conflicts_raise(tree: AllocationTree) -> None:
+    with pytest.raises(DuplicateAssetError):
+        tree.add_asset(["bond"], Asset("spy", "S&P 500", "core"), 0.1, BAND)
+    with pytest.raises(NodeConflictError):
+        tree.add_asset(["bond", "agg"], Asset("x", "X", "core"), 0.1, BAND)
+    with pytest.raises(NodeConflictError):
+        tree.add_asset(["equity"], Asset("us", "US", "core"), 0.1, BAND)
+
+
+def test_from_target_groups_by_purpose() -> None:
+    target = TargetAllocation()
+    target.add_asset(Asset("a", "A", "growth"), 0.5, BAND)
+    target.add_asset(Asset("b", "B", "income"), 0.2, BAND)
+    target.add_asset(Asset("c", "C", "growth"), 0.3, BAND)
+
+    tree = AllocationTree.from_target(target)
+
+    assert tree.node(["growth"]).ratio == pytest.approx(0.8)
+    assert list(tree.columns().ids) == ["a", "c", "b"]
+    assert tree.to_target().target_assets == target.target_assets
+
+
+def test_empty_tree_is_invalid() -> None:
+    tree = AllocationTree()
+
+    with pytest.raises(GroupRatioMismatchError):
+        tree.validate()
+    with pytest.raises(TotalRatioMismatchError):
+        tree.validate_total()
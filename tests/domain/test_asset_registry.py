@@ -0,0 +1,76 @@
+import pytest
+
+from portfotrack.domain.asset import Asset, AssetRegistry, normalize_asset_id
+from portfotrack.domain.asset.error_codes import AssetErrorCode
+from portfotrack.domain.asset.errors import AliasConflictError, UnknownAssetError
+from portfotrack.domain.asset.factory import create_asset
+
+
+@pytest.fixture
+def registry() -> AssetRegistry:
+    registry = AssetRegistry()
+    registry.intern("us-stock", "US Equity", "core")
+    return registry
+
+
+def test_normalize_asset_id() -> None:
+    assert normalize_asset_id("  US-Stock ") == "us-stock"
+
+
+def test_intern_returns_canonical_instance(registry: AssetRegistry) -> None:
+    asset = registry.intern(" US-STOCK", "Other Name", "other")
+
+    assert asset is registry.get("us-stock")
+    assert asset.name == "US Equity"
+    assert len(registry) == 1
+
+
+def test_create_asset_with_registry_interns(registry: AssetRegistry) -> None:
+    asset = create_asset("us-stock", "US Equity", "core", registry)
+
+    assert asset is registry.get("us-stock")
+
+
+def test_create_asset_without_registry_keeps_raw_id() -> None:
+    asset = create_asset("US-Stock", "US Equity", "core")
+
+    assert asset == Asset("US-Stock", "US Equity", "core")
+
+
+def test_alias_resolves_to_canonical(registry: AssetRegistry) -> None:
+    registry.add_alias("VTI", "us-stock")
+
+    assert registry.intern("vti", "Vanguard", "core") is registry.get("us-stock")
+    assert "VTI" in registry
+
+
+def test_get_unknown_raise(registry: AssetRegistry) -> None:
+    with pytest.raises(UnknownAssetError, match=AssetErrorCode.ASSET_UNKNOWN):
+        registry.get("kr-bond")
+
+
+def test_alias_unknown_target_raise(registry: AssetRegistry) -> None:
+    with pytest.raises(UnknownAssetError, match=AssetErrorCode.ASSET_UNKNOWN):
+        registry.add_alias("x", "kr-bond")
+
+
+@pytest.mark.parametrize("alias", ["kr-bond", "bnd"])
+def test_alias_conflict_raise(registry: AssetRegistry, alias: str) -> None:
+    registry.intern("kr-bond", "KR Bond", "income")
+    registry.add_alias("bnd", "kr-bond")
+
+    with pytest.raises(AliasConflictError, match=AssetErrorCode.ASSET_ALIAS_CONFLICT):
+        registry.add_alias(alias, "us-stock")
+
+
+def test_rollback_unregisters_later_assets(registry: AssetRegistry) -> None:
+    registry.intern("kr-bond", "KR Bond", "income")
+    registry.add_alias("bnd", "kr-bond")
+    registry.add_alias("VTI", "us-stock")
+
+    registry.rollback(1)
+
+    assert len(registry) == 1
+    assert "kr-bond" not in registry
+    assert "bnd" not in registry
+    assert registry.get("vti") is registry.get("us-stock")
@@ -0,0 +1,129 @@
+import pytest
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+    Tolerance,
+)
+from portfotrack.domain.target_allocation.error_codes import TargetErrorCode
+from portfotrack.domain.target_allocation.errors import (
+    AssetNotFoundError,
+    DuplicateAssetError,
+    InvalidTargetRatioError,
+    InvalidToleranceBoundsError,
+    TotalRatioMismatchError,
+)
+
+
+@pytest.fixture
+def tol_ok() -> Tolerance:
+    return {"lower": 0.25, "upper": 0.35}
+
+
+def test_columnar_add_asset_correctly(tol_ok: Tolerance) -> None:
+    target_allocation = ColumnarTargetAllocation()
+
+    asset_a = Asset("a", "Asset A", "growth")
+    target_allocation.add_asset(asset_a, 0.30, tol_ok)
+
+    assert len(target_allocation) == 1
+    assert asset_a in target_allocation
+    assert "a" in target_allocation
+    assert target_allocation.row_of("a") == 0
+    assert target_allocation.get(asset_a) == (0.30, tol_ok)
+    assert target_allocation.target_assets == {asset_a: (0.30, tol_ok)}
+
+
+def test_columnar_duplicated_asset_raise(tol_ok: Tolerance) -> None:
+    target_allocation = ColumnarTargetAllocation()
+    target_allocation.add_asset(Asset("a", "Asset A", "growth"), 0.30, tol_ok)
+
+    with pytest.raises(
+        DuplicateAssetError, match=TargetErrorCode.TARGET_DUPLICATE_ASSET
+    ):
+        target_allocation.add_asset(Asset("a", "Asset A2", "other"), 0.6, tol_ok)
+
+
+@pytest.mark.parametrize("target_ratio", [-0.1, 1.01])
+def test_columnar_malform_target_ratio_raise(
+    target_ratio: float, tol_ok: Tolerance
+) -> None:
+    target_allocation = ColumnarTargetAllocation()
+
+    with pytest.raises(
+        InvalidTargetRatioError, match=TargetErrorCode.TARGET_INVALID_RATIO
+    ):
+        target_allocation.add_asset(
+            Asset("a", "Asset A", "growth"), target_ratio, tol_ok
+        )
+    assert len(target_allocation) == 0
+
+
+@pytest.mark.parametrize(
+    "tolerance",
+    [
+        {"lower": 0.4, "upper": 0.3},
+        {"lower": -0.1, "upper": 0.2},
+        {"lower": 0.2, "upper": 1.1},
+    ],
+)
+def test_columnar_bad_tolerance_raise(tolerance: Tolerance) -> None:
+    target_allocation = ColumnarTargetAllocation()
+
+    with pytest.raises(
+        InvalidToleranceBoundsError,
+        match=TargetErrorCode.TARGET_INVALID_TOLERANCE_BOUNDS,
+    ):
+        target_allocation.add_asset(Asset("a", "Asset A", "growth"), 0.3, tolerance)
+
+
+def test_columnar_total_and_validate(tol_ok: Tolerance) -> None:
+    target_allocation = ColumnarTargetAllocation()
+    target_allocation.add_asset(Asset("a", "Asset A", "growth"), 0.1, tol_ok)
+    target_allocation.add_asset(Asset("b", "Asset B", "growth"), 0.2, tol_ok)
+
+    assert target_allocation.total_ratio() == pytest.approx(0.3)
+    with pytest.raises(
+        TotalRatioMismatchError, match=TargetErrorCode.TARGET_TOTAL_MISMATCH
+    ):
+        target_allocation.validate_total()
+
+    target_allocation.add_asset(Asset("c", "Asset C", "growth"), 0.7, tol_ok)
+
+    # no raises
+    target_allocation.validate_total()
+
+
+def test_columnar_round_trip_with_target_allocation(tol_ok: Tolerance) -> None:
+    target = TargetAllocation()
+    target.add_asset(Asset("a", "Asset A", "growth"), 0.4, tol_ok)
+    target.add_asset(Asset("b", "Asset B", "income"), 0.6, tol_ok)
+
+    columnar = ColumnarTargetAllocation.from_target(target)
+
+    assert list(columnar.ids) == ["a", "b"]
+    assert list(columnar.ratios) == [0.4, 0.6]
+    assert columnar.asset_at(1).purpose == "income"
+    assert columnar.to_target().target_assets == target.target_assets
+
+
+def test_columnar_remove_asset_moves_last_row(tol_ok: Tolerance) -> None:
+    target_allocation = ColumnarTargetAllocation()
+    for asset_id, ratio in [("a", 0.2), ("b", 0.3), ("c", 0.5)]:
+        target_allocation.add_asset(Asset(asset_id, asset_id, "growth"), ratio, tol_ok)
+
+    target_allocation.remove_asset(Asset("a", "a", "growth"))
+
+    assert list(target_allocation.ids) == ["c", "b"]
+    assert list(target_allocation.ratios) == [0.5, 0.3]
+    assert target_allocation.row_of("c") == 0
+    assert "a" not in target_allocation
+    assert target_allocation.total_ratio() == pytest.approx(0.8)
+
+
+def test_columnar_remove_asset_missing_raise() -> None:
+    with pytest.raises(
+        AssetNotFoundError, match=TargetErrorCode.TARGET_ASSET_NOT_FOUND
+    ):
+        ColumnarTargetAllocation().remove_asset(Asset("a", "a", "growth"))
@@ -0,0 +1,89 @@
+import pytest
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.drift import (
+    compute_drift,
+    detect_drift,
+    detect_drift_batch,
+)
+from portfotrack.domain.drift.error_codes import DriftErrorCode
+from portfotrack.domain.drift.errors import (
+    EmptyPortfolioError,
+    SnapshotShapeMismatchError,
+    UnknownHoldingAssetError,
+)
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+)
+
+
+@pytest.fixture(params=[TargetAllocation, ColumnarTargetAllocation])
+def target(request) -> TargetAllocation | ColumnarTargetAllocation:
+    target = request.param()
+    target.add_asset(Asset("a", "Asset A", "growth"), 0.6, {"lower": 0.5, "upper": 0.7})
+    target.add_asset(Asset("b", "Asset B", "income"), 0.4, {"lower": 0.3, "upper": 0.5})
+    return target
+
+
+def test_detect_drift_in_band(target) -> None:
+    report = detect_drift(target, {"a": 550.0, "b": 450.0})
+
+    assert list(report.ids) == ["a", "b"]
+    assert report.total == pytest.approx(1000.0)
+    assert list(report.actual) == pytest.approx([0.55, 0.45])
+    assert list(report.deviation) == pytest.approx([-0.05, 0.05])
+    assert report.in_band == [True, True]
+    assert report.out_of_band() == []
+
+
+def test_detect_drift_out_of_band(target) -> None:
+    report = detect_drift(target, {"a": 800.0, "b": 200.0})
+
+    assert report.in_band == [False, False]
+    assert report.out_of_band() == ["a", "b"]
+
+
+def test_detect_drift_band_edges_are_inclusive(target) -> None:
+    report = detect_drift(target, {"a": 0.5, "b": 0.5})
+
+    assert report.in_band == [True, True]
+
+
+def test_detect_drift_missing_holding_counts_as_zero(target) -> None:
+    report = detect_drift(target, {"a": 100.0})
+
+    assert list(report.actual) == pytest.approx([1.0, 0.0])
+    assert report.out_of_band() == ["a", "b"]
+
+
+def test_detect_drift_unknown_asset_raise(target) -> None:
+    with pytest.raises(
+        UnknownHoldingAssetError, match=DriftErrorCode.DRIFT_UNKNOWN_ASSET
+    ) as exc_info:
+        detect_drift(target, {"a": 1.0, "z": 1.0, "y": 1.0})
+
+    assert exc_info.value.details["asset_ids"] == ["y", "z"]
+
+
+@pytest.mark.parametrize("holdings", [{}, {"a": 0.0, "b": 0.0}])
+def test_detect_drift_empty_portfolio_raise(target, holdings) -> None:
+    with pytest.raises(EmptyPortfolioError, match=DriftErrorCode.DRIFT_EMPTY_PORTFOLIO):
+        detect_drift(target, holdings)
+
+
+def test_compute_drift_shape_mismatch_raise(target) -> None:
+    with pytest.raises(
+        SnapshotShapeMismatchError, match=DriftErrorCode.DRIFT_SHAPE_MISMATCH
+    ):
+        compute_drift(target.columns(), [1.0])
+
+
+def test_detect_drift_batch_matches_single(target) -> None:
+    snapshots = [{"a": 60.0, "b": 40.0}, {"a": 90.0, "b": 10.0}]
+
+    reports = list(detect_drift_batch(target, snapshots))
+
+    assert [r.in_band for r in reports] == [
+        detect_drift(target, s).in_band for s in snapshots
+    ]
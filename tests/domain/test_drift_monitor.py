@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.drift import BandEvent, BandState, DriftMonitor
+from portfotrack.domain.drift.errors import UnknownHoldingAssetError
+from portfotrack.domain.target_allocation import TargetAllocation
+
+
+@pytest.fixture
+def target() -> TargetAllocation:
+    target = TargetAllocation()
+    target.add_asset(Asset("a", "A", "growth"), 0.5, {"lower": 0.45, "upper": 0.55})
+    target.add_asset(Asset("b", "B", "income"), 0.3, {"lower": 0.25, "upper": 0.35})
+    target.add_asset(Asset("c", "C", "hedge"), 0.2, {"lower": 0.15, "upper": 0.25})
+    return target
+
+
+def _monitor(target: TargetAllocation, hysteresis: float = 0.0) -> DriftMonitor:
+    return DriftMonitor(
+        target,
+        {"a": 50.0, "b": 30.0, "c": 20.0},
+        {"a": 1.0, "b": 1.0, "c": 1.0},
+        hysteresis=hysteresis,
+    )
+
+
+def test_initial_state(target: TargetAllocation) -> None:
+    monitor = _monitor(target)
+
+    assert monitor.total == 100.0
+    assert monitor.ratio("a") == 0.5
+    assert monitor.out_of_band() == []
+
+
+def test_tick_emits_crossing_events(target: TargetAllocation) -> None:
+    monitor = _monitor(target)
+
+    events = monitor.tick("a", 1.5)  # a: 75 of 125
+
+    assert monitor.total == 125.0
+    assert events == [
+        BandEvent("a", BandState.IN_BAND, BandState.ABOVE, 0.6, 125.0),
+        BandEvent("b", BandState.IN_BAND, BandState.BELOW, 0.24, 125.0),
+    ]
+    assert monitor.state("c") is BandState.IN_BAND
+    assert sorted(monitor.out_of_band()) == ["a", "b"]
+
+    events = monitor.tick("a", 1.0)
+    assert {(e.asset_id, e.state) for e in events} == {
+        ("a", BandState.IN_BAND),
+        ("b", BandState.IN_BAND),
+    }
+
+
+def test_hysteresis_prevents_flapping(target: TargetAllocation) -> None:
+    monitor = _monitor(target, hysteresis=0.01)
+
+    assert [e.state for e in monitor.tick("c", 1.4)] == [BandState.ABOVE]  # 28/108
+    # back to 0.245: inside the band but not by the hysteresis margin
+    assert monitor.tick("c", 1.3) == []
+    assert monitor.state("c") is BandState.ABOVE
+    assert [e.state for e in monitor.tick("c", 1.2)] == [BandState.IN_BAND]
+
+
+def test_set_quantity(target: TargetAllocation) -> None:
+    monitor = _monitor(target)
+
+    events = monitor.set_quantity("b", 0.0)
+
+    assert ("b", BandState.BELOW) in {(e.asset_id, e.state) for e in events}
+    assert monitor.total == 70.0
+
+
+def test_matches_full_recompute_under_random_ticks(target: TargetAllocation) -> None:
+    monitor = _monitor(target)
+    rng = random.Random(7)
+
+    for _ in range(2_000):
+        monitor.tick(rng.choice("abc"), rng.uniform(0.5, 1.5))
+        report = monitor.report()
+        assert monitor.total == report.total
+        expected = [
+            i for i, ok in zip(report.ids, report.in_band, strict=True) if not ok
+        ]
+        assert monitor.out_of_band() == expected
+
+
+def test_empty_portfolio_then_priced(target: TargetAllocation) -> None:
+    monitor = DriftMonitor(target, {"a": 1.0, "b": 1.0, "c": 1.0}, {})
+
+    assert monitor.total == 0.0
+    assert monitor.ratio("a") == 0.0
+
+    events = monitor.tick("a", 10.0)
+    assert {(e.asset_id, e.state) for e in events} == {
+        ("a", BandState.ABOVE),
+        ("b", BandState.BELOW),
+        ("c", BandState.BELOW),
+    }
+
+
+def test_unknown_asset_raise(target: TargetAllocation) -> None:
+    monitor = _monitor(target)
+
+    with pytest.raises(UnknownHoldingAssetError):
+        monitor.tick("zz", 1.0)
+    with pytest.raises(UnknownHoldingAssetError):
+        DriftMonitor(target, {"zz": 1.0}, {})
+
+
+def test_negative_hysteresis_raise(target: TargetAllocation) -> None:
+    with pytest.raises(ValueError):
+        _monitor(target, hysteresis=-0.1)
@@ -0,0 +1,120 @@
+import math
+from datetime import date
+
+import pytest
+
+from portfotrack.domain.performance import (
+    UNCLASSIFIED,
+    PerformanceHistory,
+    report_batch,
+)
+from portfotrack.domain.performance.errors import (
+    InvalidPeriodError,
+    NonPositiveValueError,
+    UnorderedHistoryError,
+)
+from portfotrack.domain.snapshot import HoldingsSnapshot
+
+D0, D1, D2, D3 = (date(2025, 1, day) for day in (6, 7, 8, 9))
+
+SNAPSHOTS = [
+    HoldingsSnapshot(D0, {"a": 100.0, "b": 100.0}),
+    HoldingsSnapshot(D1, {"a": 110.0, "b": 100.0}),
+    HoldingsSnapshot(D2, {"a": 110.0, "b": 205.0}),
+    HoldingsSnapshot(D3, {"a": 121.0, "b": 205.0}),
+]
+FLOWS = {D2: {"b": 100.0}}
+R1, R2, R3 = 10 / 200, 5 / 210, 11 / 315
+
+
+@pytest.fixture
+def history() -> PerformanceHistory:
+    return PerformanceHistory(SNAPSHOTS, FLOWS, purposes={"a": "growth"})
+
+
+def test_twr_chains_daily_returns(history) -> None:
+    assert history.twr() == pytest.approx((1 + R1) * (1 + R2) * (1 + R3) - 1)
+    assert history.twr(D1, D3) == pytest.approx((1 + R2) * (1 + R3) - 1)
+    assert history.twr(D2, D2) == 0.0
+
+
+def test_contributions_sum_to_twr(history) -> None:
+    for start, end in ((None, None), (D1, D3), (D2, D3)):
+        contributions = history.contributions(start, end)
+        assert math.fsum(contributions.values()) == pytest.approx(
+            history.twr(start, end)
+        )
+
+    contributions = history.contributions()
+    assert contributions["a"] == pytest.approx(R1 + R3 * (1 + R1) * (1 + R2))
+    assert contributions["b"] == pytest.approx(R2 * (1 + R1))
+
+
+def test_contributions_by_purpose(history) -> None:
+    by_purpose = history.contributions_by_purpose()
+
+    assert by_purpose.keys() == {"growth", UNCLASSIFIED}
+    assert by_purpose[UNCLASSIFIED] == pytest.approx(history.contributions()["b"])
+
+
+def test_modified_dietz_weights_flows_by_remaining_time(history) -> None:
+    # 100 deposited 2 days into a 3-day period is weighted 1/3.
+    assert history.mwr() == pytest.approx(26 / (200 + 100 / 3))
+    assert history.mwr(D2, D3) == pytest.approx(11 / 315)
+    assert history.mwr(D3, D3) == 0.0
+
+
+def test_period_bounds_resolve_to_previous_snapshot(history) -> None:
+    report = history.report(date(2025, 1, 7), date(2025, 2, 1))
+
+    assert (report.start, report.end) == (D1, D3)
+    assert report.twr == pytest.approx(history.twr(D1, D3))
+    assert report.mwr == pytest.approx(history.mwr(D1, D3))
+
+
+def test_flow_between_snapshots_applies_to_next_snapshot() -> None:
+    snapshots = [SNAPSHOTS[0], HoldingsSnapshot(D3, {"a": 100.0, "b": 150.0})]
+
+    history = PerformanceHistory(snapshots, {D1: {"b": 50.0}, D0: {"a": 1e6}})
+
+    assert history.twr() == 0.0
+    assert history.contributions() == {"a": 0.0, "b": 0.0}
+
+
+def test_funding_from_zero_value() -> None:
+    history = PerformanceHistory(
+        [
+            HoldingsSnapshot(D0, {}),
+            HoldingsSnapshot(D1, {"cash": 100.0}),
+            HoldingsSnapshot(D2, {"cash": 102.0}),
+        ],
+        {D1: {"cash": 100.0}},
+    )
+
+    assert history.twr() == pytest.approx(0.02)
+    assert history.twr(D1) == pytest.approx(0.02)
+
+
+def test_gain_on_empty_portfolio_rejected() -> None:
+    with pytest.raises(NonPositiveValueError):
+        PerformanceHistory([HoldingsSnapshot(D0, {}), HoldingsSnapshot(D1, {"a": 1.0})])
+
+
+def test_invalid_histories_and_periods(history) -> None:
+    with pytest.raises(InvalidPeriodError):
+        PerformanceHistory([])
+    with pytest.raises(UnorderedHistoryError):
+        PerformanceHistory([SNAPSHOTS[1], SNAPSHOTS[0]])
+    with pytest.raises(InvalidPeriodError, match="start precedes"):
+        history.twr(date(2024, 12, 31))
+    with pytest.raises(InvalidPeriodError, match="end precedes"):
+        history.contributions(D2, D1)
+
+
+def test_report_batch(history) -> None:
+    other = PerformanceHistory(SNAPSHOTS[:2])
+
+    reports = list(report_batch([history, other], start=D0, end=D1))
+
+    assert [r.twr for r in reports] == pytest.approx([R1, R1])
+    assert reports[1].contributions == pytest.approx({"a": R1, "b": 0.0})
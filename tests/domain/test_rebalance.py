@@ -0,0 +1,159 @@
+import math
+
+import pytest
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.rebalance import RebalancePolicy, rebalance, rebalance_batch
+from portfotrack.domain.rebalance.error_codes import RebalanceErrorCode
+from portfotrack.domain.rebalance.errors import (
+    CashFlowCountMismatchError,
+    InsufficientFundsError,
+)
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+)
+from portfotrack.domain.target_allocation.errors import TotalRatioMismatchError
+
+
+@pytest.fixture(params=[TargetAllocation, ColumnarTargetAllocation])
+def target(request) -> TargetAllocation | ColumnarTargetAllocation:
+    target = request.param()
+    target.add_asset(Asset("a", "A", "growth"), 0.5, {"lower": 0.4, "upper": 0.6})
+    target.add_asset(Asset("b", "B", "income"), 0.3, {"lower": 0.25, "upper": 0.35})
+    target.add_asset(Asset("c", "C", "hedge"), 0.2, {"lower": 0.15, "upper": 0.25})
+    return target
+
+
+def _trades(plan) -> dict[str, float]:
+    return dict(zip(plan.ids, plan.trades, strict=True))
+
+
+def test_to_target(target) -> None:
+    plan = rebalance(target, {"a": 70.0, "b": 20.0, "c": 10.0})
+
+    assert _trades(plan) == pytest.approx({"a": -20.0, "b": 10.0, "c": 10.0})
+    assert plan.total == pytest.approx(100.0)
+    assert plan.turnover == pytest.approx(40.0)
+
+
+def test_to_target_with_inflow(target) -> None:
+    plan = rebalance(target, {"a": 50.0, "b": 30.0, "c": 20.0}, cash_flow=100.0)
+
+    assert _trades(plan) == pytest.approx({"a": 50.0, "b": 30.0, "c": 20.0})
+
+
+def test_to_band_edge_trades_only_out_of_band(target) -> None:
+    plan = rebalance(
+        target,
+        {"a": 70.0, "b": 20.0, "c": 10.0},
+        policy=RebalancePolicy.TO_BAND_EDGE,
+    )
+
+    trades = _trades(plan)
+    assert trades["a"] == pytest.approx(-10.0)
+    assert trades["b"] + trades["c"] == pytest.approx(10.0)
+    # b and c end inside their bands
+    assert 25.0 <= 20.0 + trades["b"] <= 35.0
+    assert 15.0 <= 10.0 + trades["c"] <= 25.0
+    assert plan.turnover == pytest.approx(20.0)
+
+
+def test_to_band_edge_in_band_is_noop(target) -> None:
+    plan = rebalance(
+        target,
+        {"a": 55.0, "b": 27.0, "c": 18.0},
+        policy=RebalancePolicy.TO_BAND_EDGE,
+    )
+
+    assert plan.nonzero() == []
+
+
+def test_cash_only_inflow_buys_underweight_first(target) -> None:
+    plan = rebalance(
+        target,
+        {"a": 60.0, "b": 20.0, "c": 10.0},
+        cash_flow=10.0,
+        policy=RebalancePolicy.CASH_ONLY,
+    )
+
+    trades = _trades(plan)
+    assert trades["a"] == pytest.approx(0.0)
+    assert trades["b"] == pytest.approx(10.0 * 10.0 / 20.0)
+    assert trades["c"] == pytest.approx(10.0 * 10.0 / 20.0)
+    assert min(plan.trades) >= 0.0
+
+
+def test_cash_only_large_inflow_spreads_by_target(target) -> None:
+    plan = rebalance(
+        target,
+        {"a": 50.0, "b": 30.0, "c": 20.0},
+        cash_flow=100.0,
+        policy=RebalancePolicy.CASH_ONLY,
+    )
+
+    assert _trades(plan) == pytest.approx({"a": 50.0, "b": 30.0, "c": 20.0})
+
+
+def test_cash_only_outflow_only_sells(target) -> None:
+    plan = rebalance(
+        target,
+        {"a": 70.0, "b": 20.0, "c": 10.0},
+        cash_flow=-40.0,
+        policy=RebalancePolicy.CASH_ONLY,
+    )
+
+    assert max(plan.trades) <= 0.0
+    assert math.fsum(plan.trades) == pytest.approx(-40.0)
+    assert all(h + t >= 0.0 for h, t in zip([70, 20, 10], plan.trades, strict=True))
+
+
+@pytest.mark.parametrize("policy", list(RebalancePolicy))
+def test_trades_net_to_cash_flow(target, policy: RebalancePolicy) -> None:
+    plan = rebalance(
+        target, {"a": 10.0, "b": 80.0, "c": 30.0}, cash_flow=-20.0, policy=policy
+    )
+
+    assert math.fsum(plan.trades) == pytest.approx(-20.0)
+    assert plan.total == pytest.approx(100.0)
+
+
+def test_insufficient_funds_raise(target) -> None:
+    with pytest.raises(
+        InsufficientFundsError, match=RebalanceErrorCode.REBALANCE_INSUFFICIENT_FUNDS
+    ):
+        rebalance(target, {"a": 10.0}, cash_flow=-11.0)
+
+
+def test_incomplete_target_raise() -> None:
+    target = TargetAllocation()
+    target.add_asset(Asset("a", "A", "growth"), 0.5, {"lower": 0.4, "upper": 0.6})
+
+    with pytest.raises(TotalRatioMismatchError):
+        rebalance(target, {"a": 10.0})
+
+
+def test_rebalance_batch(target) -> None:
+    plans = list(
+        rebalance_batch(
+            target,
+            [{"a": 100.0}, {"b": 100.0}],
+            cash_flows=[0.0, 100.0],
+        )
+    )
+
+    assert [p.total for p in plans] == pytest.approx([100.0, 200.0])
+    assert _trades(plans[1]) == pytest.approx({"a": 100.0, "b": -40.0, "c": 40.0})
+
+
+@pytest.mark.parametrize("cash_flows", [[0.0], [0.0, 0.0, 0.0]])
+def test_rebalance_batch_mismatched_cash_flows_raise(target, cash_flows) -> None:
+    plans = rebalance_batch(target, [{"a": 100.0}, {"b": 100.0}], cash_flows)
+
+    with pytest.raises(
+        CashFlowCountMismatchError,
+        match=RebalanceErrorCode.REBALANCE_CASH_FLOW_COUNT_MISMATCH,
+    ) as exc_info:
+        next(plans)
+
+    assert exc_info.value.details == {"expected": 2, "actual": len(cash_flows)}
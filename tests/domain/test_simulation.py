@@ -0,0 +1,160 @@
+import math
+
+import pytest
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.simulation import (
+    BandSetting,
+    ReturnModel,
+    absolute_bands,
+    current_bands,
+    plan_simulation,
+    relative_bands,
+    simulate,
+    simulate_batch,
+    summarize,
+)
+from portfotrack.domain.simulation.error_codes import SimulationErrorCode
+from portfotrack.domain.simulation.errors import (
+    InvalidBandSettingError,
+    InvalidReturnModelError,
+    InvalidSimulationSettingError,
+)
+from portfotrack.domain.target_allocation import TargetAllocation
+from portfotrack.domain.target_allocation.errors import TotalRatioMismatchError
+
+
+@pytest.fixture
+def target() -> TargetAllocation:
+    target = TargetAllocation()
+    target.add_asset(Asset("stock", "Stock", "core"), 0.6, {"lower": 0.5, "upper": 0.7})
+    target.add_asset(Asset("bond", "Bond", "income"), 0.4, {"lower": 0.3, "upper": 0.5})
+    return target
+
+
+@pytest.fixture
+def model() -> ReturnModel:
+    return ReturnModel(
+        ["bond", "stock", "gold"],
+        [0.03, 0.08, 0.02],
+        [[0.0025, 0.001, 0.0], [0.001, 0.04, 0.0], [0.0, 0.0, 0.02]],
+    )
+
+
+def _plan(target, model, bands=None, **kwargs):
+    options = {"paths": 40, "years": 2, "steps_per_year": 52, "batch_size": 16}
+    options.update(kwargs)
+    if bands is None:
+        bands = [current_bands(target), absolute_bands(target, 0.02)]
+    return plan_simulation(target, model, bands, **options)
+
+
+def test_simulation_is_reproducible(target, model) -> None:
+    plan = _plan(target, model)
+
+    assert simulate(plan) == simulate(plan)
+    assert simulate(plan) != simulate(_plan(target, model, seed=1))
+
+
+def test_batches_merge_in_any_grouping(target, model) -> None:
+    plan = _plan(target, model)
+    totals = [simulate_batch(plan, b) for b in range(plan.batches)]
+
+    assert plan.batches == 3
+    assert [t.paths for t in totals] == [16, 16, 8]
+    assert summarize(plan, totals) == simulate(plan)
+
+
+def test_tighter_bands_rebalance_more_and_track_closer(target, model) -> None:
+    bands = [absolute_bands(target, 0.01), absolute_bands(target, 0.1)]
+
+    tight, wide = simulate(_plan(target, model, bands, paths=64, batch_size=64)).bands
+
+    assert tight.label == "±0.01"
+    assert tight.rebalances_per_year > wide.rebalances_per_year
+    assert tight.turnover_per_year > wide.turnover_per_year
+    assert tight.tracking_error < wide.tracking_error
+    assert 0.0 <= wide.breach_probability <= tight.breach_probability <= 1.0
+
+
+def test_bands_never_breached_without_volatility(target) -> None:
+    flat = ReturnModel(["stock", "bond"], [0.05, 0.05], [[0.0, 0.0], [0.0, 0.0]])
+
+    (result,) = simulate(_plan(target, flat, [current_bands(target)])).bands
+
+    assert result.rebalances_per_year == 0.0
+    assert result.breach_probability == 0.0
+    assert result.turnover_per_year == 0.0
+    assert result.tracking_error == pytest.approx(0.0, abs=1e-12)
+
+
+def test_plan_aligns_model_to_target_rows(target, model) -> None:
+    plan = _plan(target, model)
+
+    assert plan.ids == ("stock", "bond")
+    assert plan.shocks[0][0] == pytest.approx(math.sqrt(0.04 / 52))
+    assert plan.drifts[0] == pytest.approx((math.log1p(0.08) - 0.02) / 52)
+
+
+def test_relative_bands_scale_with_target(target) -> None:
+    bands = relative_bands(target, 0.25)
+
+    assert bands.lowers == pytest.approx((0.45, 0.3))
+    assert bands.uppers == pytest.approx((0.75, 0.5))
+
+
+def test_model_rejects_indefinite_covariance() -> None:
+    with pytest.raises(InvalidReturnModelError) as exc_info:
+        ReturnModel(["a", "b"], [0.0, 0.0], [[1.0, 2.0], [2.0, 1.0]])
+
+    assert exc_info.value.code == SimulationErrorCode.SIMULATION_INVALID_MODEL
+
+
+@pytest.mark.parametrize(
+    "mean, covariance",
+    [
+        ([0.0], [[1.0, 0.0], [0.0, 1.0]]),
+        ([0.0, 0.0], [[1.0, 0.5], [0.4, 1.0]]),
+        ([0.0, -1.0], [[1.0, 0.0], [0.0, 1.0]]),
+        ([0.0, math.nan], [[1.0, 0.0], [0.0, 1.0]]),
+    ],
+)
+def test_model_rejects_invalid_parameters(mean, covariance) -> None:
+    with pytest.raises(InvalidReturnModelError):
+        ReturnModel(["a", "b"], mean, covariance)
+
+
+def test_plan_rejects_asset_missing_from_model(target) -> None:
+    model = ReturnModel(["stock"], [0.05], [[0.04]])
+
+    with pytest.raises(InvalidReturnModelError) as exc_info:
+        _plan(target, model)
+
+    assert exc_info.value.details["reason"] == "no parameters for asset 'bond'"
+
+
+def test_plan_rejects_band_excluding_target(target, model) -> None:
+    bands = [BandSetting("bad", (0.65, 0.3), (0.7, 0.5))]
+
+    with pytest.raises(InvalidBandSettingError) as exc_info:
+        _plan(target, model, bands)
+
+    assert exc_info.value.code == SimulationErrorCode.SIMULATION_INVALID_BANDS
+    assert exc_info.value.details["label"] == "bad"
+
+
+def test_plan_rejects_incomplete_target(model) -> None:
+    target = TargetAllocation()
+    target.add_asset(Asset("stock", "Stock", "core"), 0.5, {"lower": 0.4, "upper": 0.6})
+
+    with pytest.raises(TotalRatioMismatchError):
+        _plan(target, model, [current_bands(target)])
+
+
+def test_plan_rejects_non_positive_counts(target, model) -> None:
+    with pytest.raises(
+        InvalidSimulationSettingError,
+        match=SimulationErrorCode.SIMULATION_INVALID_SETTING,
+    ) as exc_info:
+        _plan(target, model, paths=0)
+    assert exc_info.value.details == {"name": "paths", "value": 0}
@@ -0,0 +1,17 @@
+from datetime import date
+
+import pytest
+
+from portfotrack.domain.snapshot import HoldingsSnapshot
+
+
+def test_snapshot_total_and_allocation() -> None:
+    snapshot = HoldingsSnapshot(date(2024, 1, 2), {"a": 30.0, "b": 10.0})
+
+    assert len(snapshot) == 2
+    assert snapshot.total() == 40.0
+    assert snapshot.allocation() == pytest.approx({"a": 0.75, "b": 0.25})
+
+
+def test_empty_snapshot_allocation() -> None:
+    assert HoldingsSnapshot(date(2024, 1, 2)).allocation() == {}
@@ -1,9 +1,18 @@
+import math
+import random
+
 import pytest
 
 from portfotrack.domain.asset import Asset
-from portfotrack.domain.target_allocation import TargetAllocation, Tolerance
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+    Tolerance,
+)
 from portfotrack.domain.target_allocation.error_codes import TargetErrorCode
 from portfotrack.domain.target_allocation.errors import (
+    AssetNotFoundError,
+    BulkValidationError,
     DuplicateAssetError,
     InvalidTargetRatioError,
     InvalidToleranceBoundsError,
@@ -206,3 +215,136 @@ def test_validate_total_boundary(tol_ok: Tolerance) -> None:
 
     # no raises
     target_allocation.validate_total()
+
+
+def test_remove_asset_updates_total(tol_ok: Tolerance) -> None:
+    target_allocation = TargetAllocation()
+
+    asset_a = Asset("a", "Asset A", "growth")
+    asset_b = Asset("b", "Asset B", "growth")
+    target_allocation.add_asset(asset_a, 0.3, tol_ok)
+    target_allocation.add_asset(asset_b, 0.7, tol_ok)
+
+    target_allocation.remove_asset(asset_a)
+
+    assert asset_a not in target_allocation.target_assets
+    assert target_allocation.total_ratio() == pytest.approx(0.7)
+
+
+def test_remove_asset_missing_raise() -> None:
+    target_allocation = TargetAllocation()
+
+    with pytest.raises(
+        AssetNotFoundError, match=TargetErrorCode.TARGET_ASSET_NOT_FOUND
+    ):
+        target_allocation.remove_asset(Asset("a", "Asset A", "growth"))
+
+
+def test_total_ratio_init_with_targets(tol_ok: Tolerance) -> None:
+    targets = {
+        Asset("a", "a", "test"): (0.25, tol_ok),
+        Asset("b", "b", "test"): (0.75, tol_ok),
+    }
+
+    target_allocation = TargetAllocation(target_assets=targets)
+
+    # no raises
+    target_allocation.validate_total()
+
+
+@pytest.mark.parametrize("factory", [TargetAllocation, ColumnarTargetAllocation])
+def test_target_total_ratio_matches_fsum_after_mutations(factory) -> None:
+    rng = random.Random(7)
+    target = factory()
+    live: dict[str, float] = {}
+    tolerance: Tolerance = {"lower": 0.0, "upper": 1.0}
+
+    for i in range(200_000):
+        if live and rng.random() < 0.4:
+            asset_id = next(iter(live))
+            del live[asset_id]
+            target.remove_asset(Asset(asset_id, asset_id, "core"))
+        else:
+            ratio = rng.random() * 1e-4
+            live[str(i)] = ratio
+            target.add_asset(Asset(str(i), str(i), "core"), ratio, tolerance)
+
+    assert target.total_ratio() == math.fsum(live.values())
+
+
+@pytest.mark.parametrize("factory", [TargetAllocation, ColumnarTargetAllocation])
+def test_add_assets_correctly(factory) -> None:
+    target_allocation = factory()
+    asset_a = Asset("a", "Asset A", "growth")
+    asset_b = Asset("b", "Asset B", "income")
+
+    target_allocation.add_assets([(asset_a, 0.4, 0.3, 0.5), (asset_b, 0.6, 0.5, 0.7)])
+
+    assert target_allocation.target_assets == {
+        asset_a: (0.4, {"lower": 0.3, "upper": 0.5}),
+        asset_b: (0.6, {"lower": 0.5, "upper": 0.7}),
+    }
+    # no raises
+    target_allocation.validate_total()
+
+
+@pytest.mark.parametrize("factory", [TargetAllocation, ColumnarTargetAllocation])
+def test_add_assets_reports_every_bad_row_and_adds_nothing(
+    factory, tol_ok: Tolerance
+) -> None:
+    target_allocation = factory()
+    target_allocation.add_asset(Asset("x", "Asset X", "growth"), 0.1, tol_ok)
+
+    with pytest.raises(
+        BulkValidationError, match=TargetErrorCode.TARGET_BULK_VALIDATION_FAILED
+    ) as exc_info:
+        target_allocation.add_assets(
+            [
+                (Asset("a", "Asset A", "growth"), 0.2, 0.1, 0.3),
+                (Asset("x", "Asset X", "growth"), 0.2, 0.1, 0.3),
+                (Asset("b", "Asset B", "growth"), 1.5, 0.1, 0.3),
+                (Asset("c", "Asset C", "growth"), 0.2, 0.4, 0.3),
+                (Asset("a", "Asset A", "growth"), 0.2, 0.1, 0.3),
+                (Asset("d", "Asset D", "growth"), 0.2, 0.1, 1.3),
+            ]
+        )
+
+    details = exc_info.value.details
+    assert details["error_count"] == 5
+    assert [(r["row"], r["code"]) for r in details["rows"]] == [
+        (1, TargetErrorCode.TARGET_DUPLICATE_ASSET),
+        (2, TargetErrorCode.TARGET_INVALID_RATIO),
+        (3, TargetErrorCode.TARGET_INVALID_TOLERANCE_BOUNDS),
+        (4, TargetErrorCode.TARGET_DUPLICATE_ASSET),
+        (5, TargetErrorCode.TARGET_INVALID_TOLERANCE_BOUNDS),
+    ]
+    assert len(target_allocation.target_assets) == 1
+    assert target_allocation.total_ratio() == pytest.approx(0.1)
+
+
+@pytest.mark.parametrize("factory", [TargetAllocation, ColumnarTargetAllocation])
+def test_add_assets_empty_batch(factory) -> None:
+    target_allocation = factory()
+
+    target_allocation.add_assets([])
+
+    assert target_allocation.total_ratio() == 0
+
+
+@pytest.mark.parametrize("factory", [TargetAllocation, ColumnarTargetAllocation])
+@pytest.mark.parametrize("lower, upper", [(math.nan, 0.5), (0.1, math.nan)])
+def test_nan_tolerance_bound_rejected_by_single_and_bulk_add(
+    factory, lower: float, upper: float
+) -> None:
+    target_allocation = factory()
+    asset_a = Asset("a", "Asset A", "growth")
+
+    with pytest.raises(InvalidToleranceBoundsError):
+        target_allocation.add_asset(asset_a, 0.3, {"lower": lower, "upper": upper})
+    with pytest.raises(BulkValidationError) as exc_info:
+        target_allocation.add_assets([(asset_a, 0.3, lower, upper)])
+
+    assert [r["code"] for r in exc_info.value.details["rows"]] == [
+        TargetErrorCode.TARGET_INVALID_TOLERANCE_BOUNDS
+    ]
+    assert target_allocation.target_assets == {}
@@ -0,0 +1,79 @@
+import pytest
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+)
+from portfotrack.domain.target_allocation.errors import DuplicateAssetError
+
+A = Asset("a", "A", "growth")
+B = Asset("b", "B", "income")
+C = Asset("c", "C", "growth")
+
+
+@pytest.fixture(params=[TargetAllocation, ColumnarTargetAllocation])
+def target(request) -> TargetAllocation | ColumnarTargetAllocation:
+    target = request.param()
+    target.add_asset(A, 0.5, {"lower": 0.4, "upper": 0.6})
+    target.add_asset(B, 0.3, {"lower": 0.25, "upper": 0.35})
+    target.add_asset(C, 0.2, {"lower": 0.15, "upper": 0.25})
+    return target
+
+
+def test_builtin_views(target) -> None:
+    views = target.views
+
+    assert dict(views.purpose_groups()) == {"growth": ("a", "c"), "income": ("b",)}
+    assert views.purpose_totals()["growth"] == pytest.approx(0.7)
+    assert views.ratios_descending() == (("a", 0.5), ("b", 0.3), ("c", 0.2))
+    assert views.band_widths()["b"] == pytest.approx(0.1)
+
+
+def test_repeated_reads_hit_the_cache(target) -> None:
+    views = target.views
+
+    first = views.purpose_totals()
+    second = views.purpose_totals()
+
+    assert second is first
+    assert views.stats() == {"hits": 1, "misses": 1, "invalidations": 0}
+    with pytest.raises(TypeError):
+        first["growth"] = 1.0  # type: ignore[index]
+
+
+def test_mutators_invalidate(target) -> None:
+    views = target.views
+    views.ratios_descending()
+
+    target.remove_asset(A)
+    assert views.ratios_descending()[0] == ("b", 0.3)
+    target.add_assets([(A, 0.6, 0.5, 0.7)])
+    assert views.ratios_descending()[0] == ("a", 0.6)
+
+    assert views.stats() == {"hits": 0, "misses": 3, "invalidations": 2}
+
+
+def test_failed_mutation_keeps_cache(target) -> None:
+    views = target.views
+    views.band_widths()
+    version = target.version
+
+    with pytest.raises(DuplicateAssetError):
+        target.add_asset(A, 0.1, {"lower": 0.0, "upper": 0.2})
+
+    assert target.version == version
+    assert len(views) == 1
+
+
+def test_custom_view(target) -> None:
+    def asset_count(t) -> int:
+        return len(t.target_assets)
+
+    assert target.views.get(asset_count) == 3
+    assert target.views.get(asset_count) == 3
+    assert target.views.hits == 1
+
+    target.views.reset_stats()
+    assert target.views.stats()["hits"] == 0
+    assert len(target.views) == 1
@@ -0,0 +1,125 @@
+import weakref
+
+import pytest
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.drift import detect_drift
+from portfotrack.domain.target_allocation import (
+    AllocationVersion,
+    TargetAllocation,
+    versioned,
+)
+from portfotrack.domain.target_allocation.errors import (
+    AssetNotFoundError,
+    InvalidTargetRatioError,
+    TotalRatioMismatchError,
+)
+
+A = Asset("a", "A", "growth")
+B = Asset("b", "B", "income")
+C = Asset("c", "C", "hedge")
+BAND = {"lower": 0.0, "upper": 1.0}
+
+
+@pytest.fixture
+def base() -> AllocationVersion:
+    target = TargetAllocation()
+    target.add_asset(A, 0.5, BAND)
+    target.add_asset(B, 0.5, BAND)
+    return AllocationVersion.from_target(target)
+
+
+def test_derive_leaves_parent_unchanged(base: AllocationVersion) -> None:
+    middle = base.with_asset(B, 0.3, BAND)
+    variant = middle.with_asset(C, 0.2, BAND)
+
+    assert base.target_assets == {A: (0.5, BAND), B: (0.5, BAND)}
+    assert variant.target_assets == {A: (0.5, BAND), B: (0.3, BAND), C: (0.2, BAND)}
+    assert variant.parent is middle
+    assert middle.parent is base
+    assert len(variant) == 3
+    assert variant.total_ratio() == 1.0
+    variant.validate_total()
+
+
+def test_versions_do_not_keep_ancestors_alive() -> None:
+    target = TargetAllocation()
+    target.add_asset(A, 1.0, BAND)
+    root = AllocationVersion.from_target(target)
+    ancestor = weakref.ref(root)
+    variant = root.with_asset(C, 0.0, BAND)
+    del root
+
+    assert ancestor() is None
+    assert variant.parent is None
+    assert variant.get(A) == (1.0, BAND)
+
+
+def test_unchanged_entries_are_shared(base: AllocationVersion) -> None:
+    variant = base.with_asset(C, 0.0, BAND)
+
+    assert variant.get(A) is base.get(A)
+
+
+def test_without_asset(base: AllocationVersion) -> None:
+    variant = base.without_asset(A)
+
+    assert A not in variant
+    assert list(variant.columns().ids) == ["b"]
+    assert variant.total_ratio() == 0.5
+    with pytest.raises(TotalRatioMismatchError):
+        variant.validate_total()
+    with pytest.raises(AssetNotFoundError):
+        variant.without_asset(A)
+
+
+def test_readd_after_remove_keeps_base_order(base: AllocationVersion) -> None:
+    variant = base.without_asset(A).with_asset(A, 0.4, BAND)
+
+    assert list(variant.columns().ids) == ["a", "b"]
+    assert variant.get(A) == (0.4, BAND)
+
+
+def test_invalid_entry_raise(base: AllocationVersion) -> None:
+    with pytest.raises(InvalidTargetRatioError):
+        base.with_assets([(C, 0.1, 0.0, 1.0), (A, 1.5, 0.0, 1.0)])
+
+
+def test_diff(base: AllocationVersion) -> None:
+    left = base.with_asset(C, 0.1, BAND)
+    right = base.without_asset(A).with_asset(B, 0.6, BAND)
+
+    diff = left.diff(right)
+
+    assert diff.added == {}
+    assert diff.removed == {A: (0.5, BAND), C: (0.1, BAND)}
+    assert diff.changed == {B: ((0.5, BAND), (0.6, BAND))}
+    assert len(diff) == 3
+    assert not base.diff(base.with_asset(A, 0.5, BAND))
+
+
+def test_diff_across_bases(base: AllocationVersion) -> None:
+    other = AllocationVersion.from_target(base.with_asset(C, 0.2, BAND).to_target())
+
+    assert base.diff(other).added == {C: (0.2, BAND)}
+
+
+def test_rebase_flattens_large_overlays(
+    base: AllocationVersion, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(versioned, "REBASE_MIN", 2)
+    variant = base.with_assets(
+        (Asset(f"x{i}", "X", "core"), 0.0, 0.0, 1.0) for i in range(3)
+    )
+
+    assert variant._overlay == {}
+    assert len(variant) == 5
+    assert variant.diff(base).removed.keys() == {
+        Asset(f"x{i}", "X", "core") for i in range(3)
+    }
+
+
+def test_version_works_with_drift(base: AllocationVersion) -> None:
+    report = detect_drift(base.with_asset(B, 0.3, BAND), {"a": 60.0, "b": 40.0})
+
+    assert list(report.deviation) == pytest.approx([0.1, 0.1])
@@ -0,0 +1,185 @@
+import asyncio
+import json
+from collections.abc import Sequence
+
+import pytest
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation import TargetAllocation
+from portfotrack.pricing import FixturePriceProvider, PriceFeed, PriceProvider, Quote
+from portfotrack.pricing.error_codes import PricingErrorCode
+from portfotrack.pricing.errors import (
+    InvalidPriceFixtureError,
+    PriceProviderError,
+    QuoteNotFoundError,
+)
+
+PRICES = {f"a{i}": float(i + 1) for i in range(10)}
+
+
+class TrackingProvider(FixturePriceProvider):
+    """Fixture provider that records the peak number of concurrent requests."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.active = 0
+        self.peak = 0
+        self.fail = False
+
+    async def fetch_quotes(self, asset_ids: Sequence[str]) -> dict[str, Quote]:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            quotes = await super().fetch_quotes(asset_ids)
+            if self.fail:
+                raise ConnectionError("upstream unavailable")
+            return quotes
+        finally:
+            self.active -= 1
+
+
+def _provider(**kwargs) -> TrackingProvider:
+    return TrackingProvider(
+        (Quote(k, v) for k, v in PRICES.items()), latency=0.01, **kwargs
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_fixture_provider_is_price_provider() -> None:
+    assert isinstance(FixturePriceProvider([]), PriceProvider)
+
+
+def test_fetch_target() -> None:
+    target = TargetAllocation()
+    for asset_id in ("a1", "a2", "unknown"):
+        target.add_asset(
+            Asset(asset_id, asset_id, "core"), 0.1, {"lower": 0, "upper": 1}
+        )
+    feed = PriceFeed(_provider())
+
+    quotes = asyncio.run(feed.fetch_target(target))
+
+    assert quotes == {"a1": Quote("a1", 2.0), "a2": Quote("a2", 3.0)}
+
+
+def test_get_quotes_batches_concurrently_within_limit() -> None:
+    provider = _provider(max_batch_size=2)
+    feed = PriceFeed(provider, max_concurrency=3)
+
+    quotes = asyncio.run(feed.get_quotes(list(PRICES) * 2))
+
+    assert {k: q.price for k, q in quotes.items()} == PRICES
+    assert provider.requests == 5
+    assert provider.peak == 3
+    assert feed.stats.fetched == 10
+
+
+def test_duplicate_requests_are_coalesced() -> None:
+    provider = _provider()
+    feed = PriceFeed(provider)
+
+    async def run() -> list[dict[str, Quote]]:
+        return await asyncio.gather(
+            feed.get_quotes(["a1", "a2"]), feed.get_quotes(["a2", "a1", "a3"])
+        )
+
+    first, second = asyncio.run(run())
+
+    assert first["a1"] is second["a1"]
+    assert provider.requests == 2
+    assert feed.stats.coalesced == 2
+    assert feed.stats.fetched == 3
+
+
+def test_ttl_cache() -> None:
+    clock = FakeClock()
+    provider = _provider()
+    feed = PriceFeed(provider, ttl=30.0, clock=clock)
+
+    async def run() -> None:
+        await feed.get_quotes(["a1", "a2"])
+        await feed.get_quotes(["a1", "a2"])
+        assert provider.requests == 1
+        assert feed.stats.cache_hits == 2
+
+        clock.now = 30.0
+        assert feed.cached("a1") is None
+        await feed.get_quote("a1")
+        assert provider.requests == 2
+
+        feed.invalidate(["a1"])
+        await feed.get_quote("a1")
+        assert provider.requests == 3
+
+    asyncio.run(run())
+
+
+def test_get_quote_unknown_raise() -> None:
+    feed = PriceFeed(_provider())
+
+    with pytest.raises(
+        QuoteNotFoundError, match=PricingErrorCode.PRICING_QUOTE_NOT_FOUND
+    ):
+        asyncio.run(feed.get_quote("missing"))
+
+
+def test_provider_failure_raise_and_clears_inflight() -> None:
+    provider = _provider()
+    provider.fail = True
+    feed = PriceFeed(provider)
+
+    async def run() -> None:
+        with pytest.raises(PriceProviderError) as exc_info:
+            await feed.get_quotes(["a1", "a2"])
+        assert exc_info.value.details["batch_size"] == 2
+        assert exc_info.value.details["reason"] == "upstream unavailable"
+
+        provider.fail = False
+        assert (await feed.get_quote("a1")).price == 2.0
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("kwargs", [{"max_concurrency": 0}, {"batch_size": -1}])
+def test_feed_invalid_arguments_raise(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        PriceFeed(_provider(), **kwargs)
+
+
+def test_fixture_from_json(tmp_path) -> None:
+    path = tmp_path / "prices.json"
+    path.write_text(json.dumps({"a": 1.5, "b": {"price": "2", "currency": "EUR"}}))
+
+    provider = FixturePriceProvider.from_file(path)
+    quotes = asyncio.run(provider.fetch_quotes(["a", "b", "c"]))
+
+    assert quotes == {"a": Quote("a", 1.5), "b": Quote("b", 2.0, "EUR")}
+
+
+def test_fixture_from_csv(tmp_path) -> None:
+    path = tmp_path / "prices.csv"
+    path.write_text("asset_id,price,currency\na,1.5,\nb,2,EUR\n")
+
+    provider = FixturePriceProvider.from_file(path)
+
+    assert len(provider) == 2
+    assert asyncio.run(provider.fetch_quotes(["b"])) == {"b": Quote("b", 2.0, "EUR")}
+
+
+@pytest.mark.parametrize(
+    ("name", "content"),
+    [("prices.json", '{"a": "abc"}'), ("prices.csv", "asset_id\na\n"), ("p.txt", "")],
+)
+def test_invalid_fixture_raise(tmp_path, name: str, content: str) -> None:
+    path = tmp_path / name
+    path.write_text(content)
+
+    with pytest.raises(InvalidPriceFixtureError):
+        FixturePriceProvider.from_file(path)
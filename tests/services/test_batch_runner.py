@@ -0,0 +1,112 @@
+import pytest
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.drift import detect_drift
+from portfotrack.domain.drift.error_codes import DriftErrorCode
+from portfotrack.domain.rebalance import RebalancePolicy, rebalance
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+)
+from portfotrack.domain.target_allocation.error_codes import TargetErrorCode
+from portfotrack.services.batch_runner import (
+    Mandate,
+    evaluate_mandates,
+    iter_mandate_results,
+)
+
+
+def _target(n: int, columnar: bool = False) -> TargetAllocation:
+    target = ColumnarTargetAllocation() if columnar else TargetAllocation()
+    for i in range(n):
+        target.add_asset(
+            Asset(f"a{i}", f"Asset {i}", "core"), 1.0 / n, {"lower": 0.0, "upper": 1.0}
+        )
+    return target
+
+
+def _mandates() -> list[Mandate]:
+    return [
+        Mandate(f"m{i}", _target(i % 4 + 1, columnar=i % 2 == 0), h, cash_flow=i)
+        for i, h in enumerate(
+            [
+                {"a0": 10.0 * (i + 1), "a1": 5.0} if i % 4 else {"a0": 7.0}
+                for i in range(9)
+            ]
+        )
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_evaluate_mandates_matches_in_process(max_workers: int) -> None:
+    mandates = _mandates()
+
+    report = evaluate_mandates(
+        mandates,
+        policy=RebalancePolicy.TO_TARGET,
+        max_workers=max_workers,
+        shard_size=2,
+    )
+
+    assert report.failed == 0
+    assert [r.mandate_id for r in report.results] == [m.mandate_id for m in mandates]
+    for mandate, result in zip(mandates, report.results, strict=True):
+        drift = detect_drift(mandate.target, mandate.holdings)
+        plan = rebalance(mandate.target, mandate.holdings, mandate.cash_flow)
+        assert result.ok
+        assert list(result.drift.ids) == list(drift.ids)
+        assert result.drift.total == drift.total
+        assert list(result.drift.deviation) == list(drift.deviation)
+        assert result.drift.in_band == drift.in_band
+        assert result.plan.total == plan.total
+        assert list(result.plan.trades) == list(plan.trades)
+
+
+def test_failed_mandates_are_isolated() -> None:
+    incomplete = TargetAllocation()
+    incomplete.add_asset(Asset("x", "X", "core"), 0.5, {"lower": 0.0, "upper": 1.0})
+    mandates = [
+        Mandate("ok", _target(2), {"a0": 1.0}),
+        Mandate("total", incomplete, {"x": 1.0}),
+        Mandate("unknown", _target(2), {"zz": 1.0}),
+        Mandate("empty", _target(2), {}),
+        Mandate("ok2", _target(3), {"a2": 1.0}),
+    ]
+
+    report = evaluate_mandates(mandates, max_workers=1, shard_size=2)
+
+    assert report.failed == 3
+    assert [r.ok for r in report.results] == [True, False, False, False, True]
+    assert [r.error.code for r in report.errors()] == [
+        TargetErrorCode.TARGET_TOTAL_MISMATCH,
+        DriftErrorCode.DRIFT_UNKNOWN_ASSET,
+        DriftErrorCode.DRIFT_EMPTY_PORTFOLIO,
+    ]
+    assert report.errors()[1].error.details["asset_ids"] == ["zz"]
+    assert list(report.results[4].plan.trades) == pytest.approx([1 / 3, 1 / 3, -2 / 3])
+
+
+def test_evaluate_mandates_empty() -> None:
+    assert len(evaluate_mandates([], max_workers=2)) == 0
+
+
+@pytest.mark.parametrize("kwargs", [{"shard_size": 0}, {"max_workers": 0}])
+def test_evaluate_mandates_invalid_arguments_raise(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        evaluate_mandates([], **kwargs)
+
+
+def test_iter_mandate_results_streams_shards_lazily() -> None:
+    consumed = 0
+
+    def mandates():
+        nonlocal consumed
+        for mandate in _mandates():
+            consumed += 1
+            yield mandate
+
+    results = iter_mandate_results(mandates(), max_workers=1, shard_size=2)
+
+    assert next(results).mandate_id == "m0"
+    assert consumed == 2
+    assert [r.mandate_id for r in results] == [f"m{i}" for i in range(1, 9)]
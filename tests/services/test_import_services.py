@@ -0,0 +1,161 @@
+from pathlib import Path
+
+import pytest
+
+from portfotrack.common.error_collector import ErrorCollector
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.target_allocation.error_codes import TargetErrorCode
+from portfotrack.services.error_codes import ServiceErrorCode
+from portfotrack.services.errors import InvalidImportFileError
+from portfotrack.services.import_services import ImportReport, import_target_file
+from portfotrack.services.target_services import init_target
+
+CSV_CONTENT = """\
+asset_id,asset_name,purpose,target_ratio,lower,upper,comment
+us-stock,US Equity,core,0.4,0.35,0.45,ok
+kr-bond,"Korea
+Bond",income,abc,0.5,0.7,multi-line name and bad ratio
+
+gold,Gold,hedge,0.6,0.5,0.7,ok
+us-stock,US Equity,core,0.1,0.0,0.2,duplicate
+short,row
+"""
+
+JSONL_CONTENT = """\
+{"asset_id": "us-stock", "asset_name": "US Equity", "purpose": "core", "target_ratio": 0.4, "lower": 0.35, "upper": 0.45}
+{"asset_id": "gold", "asset_name": "Gold", "purpose": "hedge", "target_ratio": 1.4, "lower": 0.5, "upper": 0.7}
+not json
+
+{"asset_id": "bond", "asset_name": "Bond", "purpose": "income", "target_ratio": null, "lower": 0.5, "upper": 0.7}
+{"asset_id": "cash", "asset_name": "Cash", "purpose": "liquidity", "target_ratio": "0.6", "lower": "0.5", "upper": "0.7"}
+"""
+
+
+def test_import_csv_reports_line_numbers(tmp_path: Path) -> None:
+    path = tmp_path / "targets.csv"
+    path.write_text(CSV_CONTENT, encoding="utf-8")
+    target = init_target()
+
+    report = import_target_file(target, path)
+
+    assert (report.imported, report.rejected) == (2, 3)
+    assert [e.details["line"] for e in report.errors] == [3, 7, 8]
+    assert report.errors[1].details["cause_code"] == (
+        TargetErrorCode.TARGET_DUPLICATE_ASSET
+    )
+    assert all(e.code == ServiceErrorCode.IMPORT_INVALID_ROW for e in report.errors)
+    assert Asset("gold", "", "") in target.target_assets
+    # no raises
+    target.validate_total()
+
+
+def test_import_jsonl_reports_line_numbers(tmp_path: Path) -> None:
+    path = tmp_path / "targets.jsonl"
+    path.write_text(JSONL_CONTENT, encoding="utf-8")
+    target = init_target()
+
+    report = import_target_file(target, path)
+
+    assert (report.imported, report.rejected) == (2, 3)
+    assert [e.details["line"] for e in report.errors] == [2, 3, 5]
+    assert report.errors[0].details["cause_code"] == (
+        TargetErrorCode.TARGET_INVALID_RATIO
+    )
+    assert str(report.errors[0]).startswith(f"[IMPORT.INVALID_ROW] {path}:2: ")
+
+
+def test_import_rejects_boolean_and_non_finite_numbers(tmp_path: Path) -> None:
+    path = tmp_path / "targets.jsonl"
+    path.write_text(
+        '{"asset_id": "a", "asset_name": "A", "purpose": "core", '
+        '"target_ratio": true, "lower": 0, "upper": 1}\n'
+        '{"asset_id": "b", "asset_name": "B", "purpose": "core", '
+        '"target_ratio": "nan", "lower": 0, "upper": 1}\n'
+        '{"asset_id": "c", "asset_name": "C", "purpose": "core", '
+        '"target_ratio": 1, "lower": 0, "upper": "inf"}\n',
+        encoding="utf-8",
+    )
+    target = init_target()
+
+    report = import_target_file(target, path)
+
+    assert (report.imported, report.rejected) == (0, 3)
+    assert [e.details["line"] for e in report.errors] == [1, 2, 3]
+    assert "got bool" in report.errors[0].details["reason"]
+    assert "finite" in report.errors[1].details["reason"]
+    assert target.target_assets == {}
+
+
+def test_import_progress_and_error_cap(tmp_path: Path) -> None:
+    path = tmp_path / "targets.csv"
+    rows = [f"a{i},A,core,{'x' if i % 2 else 0.001},0,1" for i in range(10)]
+    path.write_text(
+        "asset_id,asset_name,purpose,target_ratio,lower,upper\n" + "\n".join(rows),
+        encoding="utf-8",
+    )
+    progress: list[int] = []
+
+    def on_progress(report: ImportReport) -> None:
+        progress.append(report.processed)
+
+    report = import_target_file(
+        init_target(), path, on_progress=on_progress, progress_every=4, max_errors=2
+    )
+
+    assert progress == [4, 8, 10]
+    assert (report.imported, report.rejected, len(report.errors)) == (5, 5, 2)
+
+
+@pytest.mark.parametrize(
+    "name, content",
+    [
+        ("targets.txt", ""),
+        ("targets.csv", "asset_id,asset_name\nx,y\n"),
+    ],
+)
+def test_import_invalid_file_raise(tmp_path: Path, name: str, content: str) -> None:
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(
+        InvalidImportFileError, match=ServiceErrorCode.IMPORT_INVALID_FILE
+    ):
+        import_target_file(init_target(), path)
+
+
+def test_import_missing_file_raise(tmp_path: Path) -> None:
+    path = tmp_path / "missing.csv"
+
+    with pytest.raises(
+        InvalidImportFileError, match=ServiceErrorCode.IMPORT_INVALID_FILE
+    ) as exc_info:
+        import_target_file(init_target(), path)
+    assert isinstance(exc_info.value.__cause__, FileNotFoundError)
+    assert exc_info.value.details["path"] == str(path)
+
+
+@pytest.mark.parametrize("name", ["targets.csv", "targets.jsonl"])
+def test_import_non_utf8_file_raise(tmp_path: Path, name: str) -> None:
+    path = tmp_path / name
+    path.write_bytes(b"asset_id,asset_name\n\xff\xfe\xfa\n")
+
+    with pytest.raises(
+        InvalidImportFileError, match=ServiceErrorCode.IMPORT_INVALID_FILE
+    ) as exc_info:
+        import_target_file(init_target(), path)
+    assert isinstance(exc_info.value.__cause__, UnicodeDecodeError)
+
+
+def test_import_collects_every_rejection(tmp_path: Path) -> None:
+    path = tmp_path / "targets.csv"
+    path.write_text(CSV_CONTENT, encoding="utf-8")
+    errors = ErrorCollector()
+
+    report = import_target_file(init_target(), path, max_errors=1, errors=errors)
+
+    assert len(report.errors) == 1
+    assert [r.line for r in errors.records] == [3, 7, 8]
+    assert errors.count_by_code() == {
+        ServiceErrorCode.IMPORT_INVALID_ROW: 2,
+        TargetErrorCode.TARGET_DUPLICATE_ASSET: 1,
+    }
@@ -0,0 +1,37 @@
+import pytest
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.simulation import (
+    ReturnModel,
+    absolute_bands,
+    current_bands,
+    plan_simulation,
+    simulate,
+)
+from portfotrack.domain.simulation.errors import InvalidSimulationSettingError
+from portfotrack.domain.target_allocation import TargetAllocation
+from portfotrack.services.simulation_runner import run_simulation
+
+
+@pytest.fixture
+def plan():
+    target = TargetAllocation()
+    target.add_asset(Asset("stock", "Stock", "core"), 0.6, {"lower": 0.5, "upper": 0.7})
+    target.add_asset(Asset("bond", "Bond", "income"), 0.4, {"lower": 0.3, "upper": 0.5})
+    model = ReturnModel(
+        ["stock", "bond"], [0.08, 0.03], [[0.04, 0.001], [0.001, 0.0025]]
+    )
+    bands = [current_bands(target), absolute_bands(target, 0.02)]
+    return plan_simulation(
+        target, model, bands, paths=30, years=1, steps_per_year=52, batch_size=8
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_simulation_matches_in_process(plan, max_workers: int) -> None:
+    assert run_simulation(plan, max_workers=max_workers) == simulate(plan)
+
+
+def test_run_simulation_rejects_non_positive_workers(plan) -> None:
+    with pytest.raises(InvalidSimulationSettingError):
+        run_simulation(plan, max_workers=0)
@@ -0,0 +1,83 @@
+import pytest
+
+from portfotrack.domain.asset import Asset, AssetRegistry
+from portfotrack.domain.target_allocation.error_codes import TargetErrorCode
+from portfotrack.domain.target_allocation.errors import BulkValidationError
+from portfotrack.services.target_services import (
+    add_asset_to_target,
+    add_assets_to_target,
+    fetch_target,
+    init_target,
+    store_target,
+)
+from portfotrack.storage.sqlite import SqliteStorage
+
+
+def test_add_asset_to_target() -> None:
+    target = add_asset_to_target(init_target(), "a", "Asset A", "growth", 1.0, 0.9, 1.0)
+
+    assert target.target_assets[Asset("a", "Asset A", "growth")] == (
+        1.0,
+        {"lower": 0.9, "upper": 1.0},
+    )
+
+
+def test_add_assets_to_target() -> None:
+    target = add_assets_to_target(
+        init_target(),
+        [
+            ("a", "Asset A", "growth", 0.3, 0.2, 0.4),
+            ("b", "Asset B", "income", 0.7, 0.6, 0.8),
+        ],
+    )
+
+    assert len(target.target_assets) == 2
+    # no raises
+    target.validate_total()
+
+
+def test_add_assets_to_target_is_all_or_nothing() -> None:
+    target = init_target()
+
+    with pytest.raises(
+        BulkValidationError, match=TargetErrorCode.TARGET_BULK_VALIDATION_FAILED
+    ) as exc_info:
+        add_assets_to_target(
+            target,
+            [
+                ("a", "Asset A", "growth", 0.3, 0.2, 0.4),
+                ("b", "Asset B", "income", -0.7, 0.6, 0.8),
+            ],
+        )
+
+    assert [r["row"] for r in exc_info.value.details["rows"]] == [1]
+    assert target.target_assets == {}
+
+
+def test_rejected_batch_leaves_registry_untouched() -> None:
+    registry = AssetRegistry()
+    registry.intern("a", "Asset A", "growth")
+    target = init_target()
+
+    with pytest.raises(BulkValidationError):
+        add_assets_to_target(
+            target,
+            [
+                ("a", "Asset A", "growth", 0.3, 0.2, 0.4),
+                ("b", "Asset B", "income", -0.7, 0.6, 0.8),
+            ],
+            registry,
+        )
+
+    assert len(registry) == 1
+    assert "b" not in registry
+
+
+def test_store_and_fetch_target(tmp_path) -> None:
+    target = add_asset_to_target(init_target(), "a", "Asset A", "growth", 1.0, 0.9, 1.0)
+
+    with SqliteStorage(tmp_path / "portfotrack.db", sync=False) as storage:
+        store_target(storage.targets, "main", target)
+        loaded = fetch_target(storage.targets, "main")
+
+    assert loaded.target_assets == target.target_assets
@@ -0,0 +1,180 @@
+import os
+import stat
+import struct
+from pathlib import Path
+
+import pytest
+
+from portfotrack.domain.asset import Asset
+from portfotrack.domain.drift import detect_drift
+from portfotrack.domain.target_allocation import (
+    ColumnarTargetAllocation,
+    TargetAllocation,
+)
+from portfotrack.storage.binary import load_target, open_target, save_target
+from portfotrack.storage.error_codes import StorageErrorCode
+from portfotrack.storage.errors import (
+    InvalidFileFormatError,
+    UnsupportedFormatVersionError,
+)
+
+
+@pytest.fixture
+def target() -> TargetAllocation:
+    target = TargetAllocation()
+    target.add_asset(
+        Asset("us-stock", "US Equity", "core"), 0.4, {"lower": 0.35, "upper": 0.45}
+    )
+    target.add_asset(
+        Asset("kr-bond", "한국 채권", "income"), 0.6, {"lower": 0.5, "upper": 0.7}
+    )
+    return target
+
+
+def test_round_trip(tmp_path: Path, target: TargetAllocation) -> None:
+    path = tmp_path / "target.pfta"
+    save_target(target, path)
+
+    loaded = load_target(path)
+
+    assert isinstance(loaded, ColumnarTargetAllocation)
+    assert loaded.target_assets == target.target_assets
+    assert [a.name for a in loaded.target_assets] == ["US Equity", "한국 채권"]
+    assert loaded.total_ratio() == pytest.approx(1.0)
+
+
+def test_save_syncs_file_before_replacing_it(
+    tmp_path: Path, target: TargetAllocation, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    events: list[str] = []
+    fsync, replace = os.fsync, os.replace
+
+    def record_fsync(fd: int) -> None:
+        events.append("fsync-dir" if stat.S_ISDIR(os.fstat(fd).st_mode) else "fsync")
+        fsync(fd)
+
+    def record_replace(src: str, dst: str) -> None:
+        events.append("replace")
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "fsync", record_fsync)
+    monkeypatch.setattr(os, "replace", record_replace)
+    save_target(target, tmp_path / "target.pfta")
+
+    assert events == ["fsync", "replace", "fsync-dir"]
+
+
+def test_round_trip_empty(tmp_path: Path) -> None:
+    path = tmp_path / "empty.pfta"
+    save_target(TargetAllocation(), path)
+
+    assert len(load_target(path)) == 0
+
+
+def test_open_target_is_lazy_view(tmp_path: Path, target: TargetAllocation) -> None:
+    path = tmp_path / "target.pfta"
+    save_target(ColumnarTargetAllocation.from_target(target), path)
+
+    with open_target(path) as mapped:
+        assert len(mapped) == 2
+        assert isinstance(mapped.ratios, memoryview)
+        assert list(mapped.ids) == ["us-stock", "kr-bond"]
+        assert mapped.ids[-1] == "kr-bond"
+        assert mapped.names[1:] == ["한국 채권"]
+        assert mapped.purposes[::-1] == ["income", "core"]
+        assert mapped.row_of("kr-bond") == 1
+        assert Asset("us-stock", "", "") in mapped
+        assert mapped.asset_at(1).purpose == "income"
+        assert mapped.get(Asset("kr-bond", "", "")) == (
+            0.6,
+            {"lower": 0.5, "upper": 0.7},
+        )
+        # no raises
+        mapped.validate_total()
+        assert detect_drift(mapped, {"us-stock": 50.0, "kr-bond": 50.0}).in_band == [
+            False,
+            True,
+        ]
+
+
+def test_open_target_bad_magic_raise(tmp_path: Path) -> None:
+    path = tmp_path / "bad.pfta"
+    path.write_bytes(b"X" * 64)
+
+    with pytest.raises(
+        InvalidFileFormatError, match=StorageErrorCode.STORAGE_INVALID_FORMAT
+    ):
+        open_target(path)
+
+
+@pytest.mark.parametrize("content", [b"", b"PFTA"])
+def test_open_target_truncated_raise(tmp_path: Path, content: bytes) -> None:
+    path = tmp_path / "short.pfta"
+    path.write_bytes(content)
+
+    with pytest.raises(
+        InvalidFileFormatError, match=StorageErrorCode.STORAGE_INVALID_FORMAT
+    ):
+        open_target(path)
+
+
+def test_open_target_size_mismatch_raise(
+    tmp_path: Path, target: TargetAllocation
+) -> None:
+    path = tmp_path / "target.pfta"
+    save_target(target, path)
+    path.write_bytes(path.read_bytes()[:-8])
+
+    with pytest.raises(
+        InvalidFileFormatError, match=StorageErrorCode.STORAGE_INVALID_FORMAT
+    ):
+        open_target(path)
+
+
+def test_open_target_unsupported_version_raise(
+    tmp_path: Path, target: TargetAllocation
+) -> None:
+    path = tmp_path / "target.pfta"
+    save_target(target, path)
+    data = bytearray(path.read_bytes())
+    struct.pack_into("<H", data, 4, 99)
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(
+        UnsupportedFormatVersionError,
+        match=StorageErrorCode.STORAGE_UNSUPPORTED_VERSION,
+    ) as exc_info:
+        open_target(path)
+
+    assert exc_info.value.details["version"] == 99
+
+
+@pytest.mark.parametrize("k, value", [(0, 1), (2, 1 << 40), (6, 3)])
+def test_open_target_bad_offsets_raise(
+    tmp_path: Path, target: TargetAllocation, k: int, value: int
+) -> None:
+    path = tmp_path / "target.pfta"
+    save_target(target, path)
+    data = bytearray(path.read_bytes())
+    # Offsets follow the 32-byte header and three float64 columns of 2 rows.
+    struct.pack_into("<Q", data, 32 + 24 * 2 + 8 * k, value)
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(
+        InvalidFileFormatError, match=StorageErrorCode.STORAGE_INVALID_FORMAT
+    ):
+        open_target(path)
+
+
+def test_close_with_exported_view_closes_file(
+    tmp_path: Path, target: TargetAllocation
+) -> None:
+    path = tmp_path / "target.pfta"
+    save_target(target, path)
+    mapped = open_target(path)
+    head = mapped.ratios[:1]
+
+    mapped.close()
+
+    assert mapped._file.closed
+    assert head[0] == 0.4
@@ -0,0 +1,256 @@
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+
+import pytest
+
+from portfotrack.domain.asset import Asset, AssetRegistry
+from portfotrack.storage.error_codes import StorageErrorCode
+from portfotrack.storage.errors import InvalidFileFormatError
+from portfotrack.storage.journal import open_session
+
+CORE = Asset("us-stock", "US Equity", "core")
+INCOME = Asset("kr-bond", "한국 채권", "income")
+
+
+def _journal_files(directory: Path) -> list[str]:
+    return sorted(os.listdir(directory))
+
+
+def test_empty_directory_recovers_no_target(tmp_path: Path) -> None:
+    journal, recovery = open_session(tmp_path / "session", sync=False)
+    journal.close()
+
+    assert recovery.target is None
+    assert recovery.generation == 0
+    assert recovery.replayed == 0
+    assert _journal_files(tmp_path / "session") == ["journal-00000000.pfjl"]
+
+
+def test_replays_committed_operations(tmp_path: Path) -> None:
+    with open_session(tmp_path, sync=False)[0] as journal:
+        journal.log_init_target()
+        journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+        journal.log_add_asset(INCOME, 0.6, 0.5, 0.7)
+
+    registry = AssetRegistry()
+    journal, recovery = open_session(tmp_path, registry, sync=False)
+    journal.close()
+
+    assert recovery.replayed == 3
+    assert recovery.discarded_bytes == 0
+    assert recovery.target is not None
+    assert recovery.target.target_assets == {
+        CORE: (0.4, {"lower": 0.35, "upper": 0.45}),
+        INCOME: (0.6, {"lower": 0.5, "upper": 0.7}),
+    }
+    assert registry.get("kr-bond").name == "한국 채권"
+
+
+def test_init_target_replaces_previous_target(tmp_path: Path) -> None:
+    with open_session(tmp_path, sync=False)[0] as journal:
+        journal.log_init_target()
+        journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+        journal.log_init_target()
+        journal.log_add_asset(INCOME, 1.0, 0.9, 1.0)
+
+    journal, recovery = open_session(tmp_path, sync=False)
+    journal.close()
+
+    assert recovery.target is not None
+    assert list(recovery.target.target_assets) == [INCOME]
+
+
+def test_init_target_record_clears_registry(tmp_path: Path) -> None:
+    renamed = Asset("us-stock", "US Stocks", "core")
+    with open_session(tmp_path, sync=False)[0] as journal:
+        journal.log_init_target()
+        journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+        journal.log_init_target()
+        journal.log_add_asset(renamed, 1.0, 0.9, 1.0)
+
+    registry = AssetRegistry()
+    journal, _ = open_session(tmp_path, registry, sync=False)
+    journal.close()
+
+    assert registry.get("us-stock").name == "US Stocks"
+
+
+def test_group_commit_writes_once_per_group(tmp_path: Path) -> None:
+    journal, _ = open_session(tmp_path, sync=False, group_size=3, max_delay=60.0)
+    journal.log_init_target()
+    journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+    assert journal.commits == 0
+
+    journal.log_add_asset(INCOME, 0.6, 0.5, 0.7)
+    assert journal.commits == 1
+    journal.close()
+
+
+def test_pending_group_commits_after_max_delay(tmp_path: Path) -> None:
+    journal, _ = open_session(tmp_path, sync=False, group_size=100, max_delay=0.01)
+    journal.log_init_target()
+    journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+
+    # No further record or commit follows; the delay timer writes the group.
+    deadline = time.monotonic() + 5.0
+    while journal.commits == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert journal.commits == 1
+
+    recovered, recovery = open_session(tmp_path, sync=False)
+    recovered.close()
+    journal.close()
+    assert recovery.replayed == 2
+    assert recovery.target is not None
+    assert list(recovery.target.target_assets) == [CORE]
+
+
+def test_uncommitted_records_are_lost_on_crash(tmp_path: Path) -> None:
+    journal, _ = open_session(tmp_path, sync=False, group_size=100, max_delay=60.0)
+    journal.log_init_target()
+    journal.commit()
+    journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+    # Simulate a crash: pending records are lost and the file is closed.
+    journal._pending.clear()
+    journal.close()
+
+    _, recovery = open_session(tmp_path, sync=False)
+
+    assert recovery.replayed == 1
+    assert recovery.target is not None
+    assert len(recovery.target.target_assets) == 0
+
+
+@pytest.mark.parametrize("cut", [1, 5, 9, 20])
+def test_torn_tail_is_discarded_and_truncated(tmp_path: Path, cut: int) -> None:
+    with open_session(tmp_path, sync=False)[0] as journal:
+        journal.log_init_target()
+        journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+    path = tmp_path / "journal-00000000.pfjl"
+    size = path.stat().st_size
+    with open(path, "r+b") as f:
+        f.truncate(size - cut)
+
+    journal, recovery = open_session(tmp_path, sync=False)
+    journal.log_add_asset(INCOME, 0.6, 0.5, 0.7)
+    journal.close()
+
+    assert recovery.replayed == 1
+    # Header (16 bytes) plus the init-target frame (8 + 1 bytes) survive.
+    assert recovery.discarded_bytes == size - cut - 25
+    _, recovery = open_session(tmp_path, sync=False)
+    assert recovery.target is not None
+    assert list(recovery.target.target_assets) == [INCOME]
+
+
+def test_zero_filled_tail_is_discarded(tmp_path: Path) -> None:
+    with open_session(tmp_path, sync=False)[0] as journal:
+        journal.log_init_target()
+        journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+    path = tmp_path / "journal-00000000.pfjl"
+    size = path.stat().st_size
+    with open(path, "ab") as f:
+        f.write(bytes(64))
+
+    journal, recovery = open_session(tmp_path, sync=False)
+    journal.close()
+
+    assert recovery.replayed == 2
+    assert recovery.discarded_bytes == 64
+    assert path.stat().st_size == size
+    assert recovery.target is not None
+    assert list(recovery.target.target_assets) == [CORE]
+
+
+def test_add_asset_record_with_bad_lengths_ends_replay(tmp_path: Path) -> None:
+    with open_session(tmp_path, sync=False)[0] as journal:
+        journal.log_init_target()
+    path = tmp_path / "journal-00000000.pfjl"
+    size = path.stat().st_size
+    # A CRC-valid add-asset payload whose string lengths overrun it.
+    payload = struct.pack("<BdddIII", 2, 0.4, 0.35, 0.45, 100, 0, 0) + b"x"
+    with open(path, "ab") as f:
+        f.write(struct.pack("<II", len(payload), zlib.crc32(payload)) + payload)
+
+    journal, recovery = open_session(tmp_path, sync=False)
+    journal.close()
+
+    assert recovery.replayed == 1
+    assert path.stat().st_size == size
+
+
+def test_corrupt_record_ends_replay(tmp_path: Path) -> None:
+    with open_session(tmp_path, sync=False)[0] as journal:
+        journal.log_init_target()
+        journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+    path = tmp_path / "journal-00000000.pfjl"
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    _, recovery = open_session(tmp_path, sync=False)
+
+    assert recovery.replayed == 1
+    assert recovery.discarded_bytes > 0
+
+
+def test_checkpoint_starts_new_generation(tmp_path: Path) -> None:
+    with open_session(tmp_path, sync=False)[0] as journal:
+        journal.log_init_target()
+        journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+    journal, recovery = open_session(tmp_path, sync=False)
+    assert recovery.target is not None
+
+    journal.checkpoint(recovery.target)
+    journal.log_add_asset(INCOME, 0.6, 0.5, 0.7)
+    journal.close()
+
+    assert _journal_files(tmp_path) == [
+        "checkpoint-00000001.pfta",
+        "journal-00000001.pfjl",
+    ]
+    _, recovery = open_session(tmp_path, sync=False)
+    assert recovery.generation == 1
+    assert recovery.checkpoint_rows == 1
+    assert recovery.replayed == 1
+    assert recovery.target is not None
+    assert list(recovery.target.target_assets) == [CORE, INCOME]
+
+
+def test_checkpoint_without_target_recovers_none(tmp_path: Path) -> None:
+    journal, _ = open_session(tmp_path, sync=False)
+    journal.checkpoint(None)
+    journal.close()
+
+    _, recovery = open_session(tmp_path, sync=False)
+
+    assert recovery.generation == 1
+    assert recovery.target is None
+
+
+def test_checkpoint_due_after_checkpoint_every(tmp_path: Path) -> None:
+    journal, _ = open_session(tmp_path, sync=False, checkpoint_every=2)
+    journal.log_init_target()
+    assert not journal.checkpoint_due
+    journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+    assert journal.checkpoint_due
+    journal.close()
+
+
+def test_add_before_init_is_invalid(tmp_path: Path) -> None:
+    with open_session(tmp_path, sync=False)[0] as journal:
+        journal.log_add_asset(CORE, 0.4, 0.35, 0.45)
+
+    with pytest.raises(InvalidFileFormatError) as exc_info:
+        open_session(tmp_path, sync=False)
+    assert exc_info.value.code == StorageErrorCode.STORAGE_INVALID_FORMAT
+
+
+def test_bad_header_is_rejected(tmp_path: Path) -> None:
+    (tmp_path / "journal-00000000.pfjl").write_bytes(b"NOPE" + bytes(12))
+
+    with pytest.raises(InvalidFileFormatError):
+        open_session(tmp_path, sync=False)
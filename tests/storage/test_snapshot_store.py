@@ -0,0 +1,138 @@
+import os
+import shutil
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from portfotrack.domain.snapshot import HoldingsSnapshot
+from portfotrack.storage.error_codes import StorageErrorCode
+from portfotrack.storage.errors import InvalidFileFormatError, SnapshotOrderError
+from portfotrack.storage.snapshots import SEGMENT_SUFFIX, SnapshotStore
+
+START = date(2020, 1, 1)
+
+
+def _snapshot(day: int) -> HoldingsSnapshot:
+    holdings = {"stock": 100.0 + day, "bond": 50.0 - day / 10}
+    if day % 3 == 0:
+        holdings["cash"] = float(day)
+    return HoldingsSnapshot(START + timedelta(days=day), holdings)
+
+
+def test_append_and_query_across_segments_and_buffer(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path, segment_days=10) as store:
+        store.extend(map(_snapshot, range(25)))
+
+        assert len(store) == 25
+        assert [s.days for s in store.segments] == [10, 10]
+        assert store.last_date() == START + timedelta(days=24)
+
+        history = store.history(
+            "cash", START + timedelta(days=5), START + timedelta(days=22)
+        )
+        assert history == [
+            (START + timedelta(days=d), float(d)) for d in (6, 9, 12, 15, 18, 21)
+        ]
+
+        snapshots = store.snapshots(
+            START + timedelta(days=8), START + timedelta(days=21)
+        )
+        assert snapshots == [_snapshot(d) for d in range(8, 22)]
+
+
+def test_history_reads_only_overlapping_segments(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path, segment_days=10) as store:
+        store.extend(map(_snapshot, range(30)))
+        store.flush()
+        os.remove(store.segments[0].path)  # never touched by the query below
+
+        history = store.history("stock", START + timedelta(days=12))
+
+        assert [value for _, value in history] == [100.0 + d for d in range(12, 30)]
+
+
+def test_reopen(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path, segment_days=4) as store:
+        store.extend(map(_snapshot, range(10)))
+
+    with SnapshotStore(tmp_path) as store:
+        assert len(store) == 10
+        assert store.snapshots() == [_snapshot(d) for d in range(10)]
+        store.append(_snapshot(10))
+        assert store.history("stock")[-1] == (START + timedelta(days=10), 110.0)
+
+
+def test_append_out_of_order_raise(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path) as store:
+        store.append(_snapshot(5))
+        with pytest.raises(
+            SnapshotOrderError, match=StorageErrorCode.STORAGE_OUT_OF_ORDER
+        ):
+            store.append(_snapshot(5))
+        with pytest.raises(SnapshotOrderError):
+            store.append(_snapshot(1))
+
+
+def test_compact_merges_small_segments(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path, segment_days=5, compact_days=12) as store:
+        store.extend(map(_snapshot, range(30)))
+
+        removed = store.compact()
+
+        assert removed == 3
+        assert [s.days for s in store.segments] == [10, 10, 10]
+        assert sorted(os.listdir(tmp_path)) == sorted(
+            os.path.basename(s.path) for s in store.segments
+        )
+        assert store.snapshots() == [_snapshot(d) for d in range(30)]
+        assert store.compact() == 0
+
+
+def test_compact_while_a_reader_holds_a_column(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path, segment_days=5, compact_days=12) as store:
+        store.extend(map(_snapshot, range(10)))
+        # What a query's locals may still reference after it left the lock.
+        column = store._segments[0].column("stock")
+
+        assert store.compact() == 1
+        assert column is not None
+        assert list(column) == [100.0 + d for d in range(5)]
+        assert store.history("stock")[-1] == (START + timedelta(days=9), 109.0)
+
+
+def test_background_compaction(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path, segment_days=2, compact_days=100) as store:
+        store.start_compaction(interval=0.01)
+        store.extend(map(_snapshot, range(20)))
+        store.stop_compaction()
+        store.compact()
+
+        assert len(store.segments) == 1
+        assert store.history("stock") == [
+            (START + timedelta(days=d), 100.0 + d) for d in range(20)
+        ]
+
+
+def test_reopen_discards_segments_covered_by_compaction(tmp_path: Path) -> None:
+    backup = tmp_path / "backup"
+    data = tmp_path / "data"
+    with SnapshotStore(data, segment_days=5) as store:
+        store.extend(map(_snapshot, range(10)))
+    shutil.copytree(data, backup)
+    with SnapshotStore(data) as store:
+        store.compact()
+    # simulate a crash after the merged segment was written
+    for name in os.listdir(backup):
+        shutil.copy(backup / name, data / name)
+
+    with SnapshotStore(data) as store:
+        assert [s.days for s in store.segments] == [10]
+        assert store.snapshots() == [_snapshot(d) for d in range(10)]
+
+
+def test_invalid_segment_raise(tmp_path: Path) -> None:
+    (tmp_path / f"bad{SEGMENT_SUFFIX}").write_bytes(b"nope")
+
+    with pytest.raises(InvalidFileFormatError):
+        SnapshotStore(tmp_path)
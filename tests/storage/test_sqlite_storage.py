@@ -0,0 +1,213 @@
+import sqlite3
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from portfotrack.domain.asset import Asset, AssetRegistry
+from portfotrack.domain.snapshot import HoldingsSnapshot
+from portfotrack.domain.target_allocation import TargetAllocation
+from portfotrack.storage.error_codes import StorageErrorCode
+from portfotrack.storage.errors import (
+    InvalidFileFormatError,
+    StorageUnavailableError,
+    TargetNotFoundError,
+    UnsupportedFormatVersionError,
+)
+from portfotrack.storage.sqlite import SqliteStorage
+
+START = date(2024, 1, 1)
+
+
+@pytest.fixture
+def storage(tmp_path: Path):
+    with SqliteStorage(tmp_path / "portfotrack.db", sync=False) as storage:
+        yield storage
+
+
+@pytest.fixture
+def target() -> TargetAllocation:
+    target = TargetAllocation()
+    target.add_asset(
+        Asset("us-stock", "US Equity", "core"), 0.4, {"lower": 0.35, "upper": 0.45}
+    )
+    target.add_asset(
+        Asset("kr-bond", "한국 채권", "income"), 0.6, {"lower": 0.5, "upper": 0.7}
+    )
+    return target
+
+
+def test_target_round_trip_keeps_order(
+    storage: SqliteStorage, target: TargetAllocation
+) -> None:
+    storage.targets.save("main", target)
+
+    registry = AssetRegistry()
+    loaded = storage.targets.load("main", registry)
+
+    assert loaded.target_assets == target.target_assets
+    assert [a.id for a in loaded.target_assets] == ["us-stock", "kr-bond"]
+    assert next(iter(loaded.target_assets)) is registry.get("us-stock")
+    assert storage.targets.names() == ["main"]
+
+
+def test_save_replaces_previous_allocation(
+    storage: SqliteStorage, target: TargetAllocation
+) -> None:
+    storage.targets.save("main", target)
+    cash = Asset("cash", "Cash", "reserve")
+    smaller = TargetAllocation()
+    smaller.add_asset(cash, 1.0, {"lower": 0.9, "upper": 1.0})
+
+    storage.targets.save("main", smaller)
+
+    assert list(storage.targets.load("main").target_assets) == [cash]
+    assert storage.targets.holding("us-stock") == []
+    assert storage.targets.holding("cash") == ["main"]
+
+
+def test_load_missing_target_raises(storage: SqliteStorage) -> None:
+    with pytest.raises(TargetNotFoundError) as exc_info:
+        storage.targets.load("nope")
+
+    assert exc_info.value.code == StorageErrorCode.STORAGE_NOT_FOUND
+    assert exc_info.value.details == {"name": "nope"}
+
+
+def test_delete_target(storage: SqliteStorage, target: TargetAllocation) -> None:
+    storage.targets.save("main", target)
+
+    assert storage.targets.delete("main")
+    assert not storage.targets.delete("main")
+    assert storage.targets.names() == []
+    # Assets outlive the allocations that referenced them.
+    assert storage.assets.get("kr-bond") == Asset("kr-bond", "", "")
+
+
+def test_asset_upsert_and_lookups(storage: SqliteStorage) -> None:
+    count = storage.assets.upsert_many(
+        [Asset("b", "B", "core"), Asset("a", "A", "core"), Asset("c", "C", "income")]
+    )
+    storage.assets.upsert_many([Asset("c", "C2", "core")])
+
+    assert count == 3
+    assert len(storage.assets) == 3
+    assert storage.assets.get("c").name == "C2"
+    assert storage.assets.get("missing") is None
+    assert [a.id for a in storage.assets.by_purpose("core")] == ["a", "b", "c"]
+
+
+def test_failed_write_rolls_back(storage: SqliteStorage) -> None:
+    rows = [Asset("a", "A", "core"), Asset("b", None, "core")]  # type: ignore[arg-type]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        storage.assets.upsert_many(rows)
+
+    assert len(storage.assets) == 0
+
+
+def test_holdings_round_trip(storage: SqliteStorage) -> None:
+    snapshots = [
+        HoldingsSnapshot(START + timedelta(days=d), {"a": 1.0 + d, "b": 2.0 * d})
+        for d in range(5)
+    ]
+    storage.holdings.extend(reversed(snapshots))
+    storage.holdings.extend([HoldingsSnapshot(START, {"a": 7.0})])
+
+    assert storage.holdings.last_date() == START + timedelta(days=4)
+    assert storage.holdings.history("a", START, START + timedelta(days=1)) == [
+        (START, 7.0),
+        (START + timedelta(days=1), 2.0),
+    ]
+    assert storage.holdings.snapshots(START, START) == [
+        HoldingsSnapshot(START, {"a": 7.0})
+    ]
+    assert storage.holdings.snapshots(START + timedelta(days=1)) == snapshots[1:]
+
+
+def test_concurrent_readers_see_committed_writes(
+    storage: SqliteStorage, target: TargetAllocation
+) -> None:
+    storage.targets.save("main", target)
+    results: list[int] = []
+
+    def read() -> None:
+        for _ in range(20):
+            results.append(len(storage.targets.load("main").target_assets))
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [2] * 160
+    assert len(storage.pool._readers) <= storage.pool.size
+
+
+def test_exhausted_pool_raises_storage_error(tmp_path: Path) -> None:
+    with SqliteStorage(tmp_path / "p.db", pool_size=1, timeout=0.01) as storage:
+        with storage.pool.reader():
+            with pytest.raises(
+                StorageUnavailableError, match=StorageErrorCode.STORAGE_UNAVAILABLE
+            ):
+                with storage.pool.reader():
+                    pass
+
+
+def test_closed_pool_hands_out_no_connection(storage: SqliteStorage) -> None:
+    with storage.pool.reader():
+        pass
+    storage.pool.close()
+
+    assert storage.pool._idle.empty()
+    with pytest.raises(StorageUnavailableError):
+        with storage.pool.reader():
+            pass
+
+
+def test_snapshot_reads_one_committed_state(
+    storage: SqliteStorage, target: TargetAllocation
+) -> None:
+    storage.targets.save("main", target)
+
+    with storage.pool.snapshot() as conn:
+        before = conn.execute("SELECT count(*) FROM targets").fetchone()
+        storage.targets.delete("main")
+        after = conn.execute("SELECT count(*) FROM targets").fetchone()
+
+    assert before == after == (1,)
+    with pytest.raises(TargetNotFoundError):
+        storage.targets.load("main")
+
+
+def test_reopen_uses_wal_and_keeps_data(
+    tmp_path: Path, target: TargetAllocation
+) -> None:
+    path = tmp_path / "portfotrack.db"
+    with SqliteStorage(path) as storage:
+        storage.targets.save("main", target)
+
+    with SqliteStorage(path) as storage:
+        assert storage.targets.names() == ["main"]
+        with storage.pool.reader() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+def test_not_a_database_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "bogus.db"
+    path.write_bytes(b"not a database" * 100)
+
+    with pytest.raises(InvalidFileFormatError):
+        SqliteStorage(path)
+
+
+def test_newer_schema_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "future.db"
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA user_version = 99")
+    conn.close()
+
+    with pytest.raises(UnsupportedFormatVersionError):
+        SqliteStorage(path)